@@ -16,8 +16,11 @@ from typing import List, Optional, Union, Tuple, Callable
 import logging
 import numpy as np
 from scipy import sparse as scisparse
+from scipy.sparse.linalg import eigsh
 
 from qiskit.opflow import OperatorBase, I, StateFn, ListOp
+from qiskit.opflow.state_fns.pauli_evaluation import pauli_terms
+from qiskit.quantum_info import PauliTable, SparsePauliOp
 from qiskit.utils.validation import validate_min
 from .eigen_solver import Eigensolver, EigensolverResult
 from ..exceptions import AlgorithmError
@@ -39,6 +42,9 @@ class NumPyEigensolver(Eigensolver):
         Operators are automatically converted to SciPy's ``spmatrix``
         as needed and this conversion can be costly in terms of memory and performance as the
         operator size, mostly in terms of number of qubits it represents, gets larger.
+        Sums of Paulis, such as a :class:`~qiskit.opflow.PauliSumOp`, are instead applied
+        to vectors without building their matrix, using ``scipy.sparse.linalg.eigsh`` for
+        Hermitian operators, unless all eigenvalues are requested.
     """
 
     def __init__(self,
@@ -105,22 +111,25 @@ class NumPyEigensolver(Eigensolver):
 
     def _solve(self,
                operator: OperatorBase) -> None:
-        sp_mat = operator.to_spmatrix()
-        # If matrix is diagonal, the elements on the diagonal are the eigenvalues. Solve by sorting.
-        if scisparse.csr_matrix(sp_mat.diagonal()).nnz == sp_mat.nnz:
-            diag = sp_mat.diagonal()
-            eigval = np.sort(diag)[:self._k]
-            temp = np.argsort(diag)[:self._k]
-            eigvec = np.zeros((sp_mat.shape[0], self._k))
-            for i, idx in enumerate(temp):
-                eigvec[idx, i] = 1.0
+        linear_op = None
+        if self._k < 2 ** operator.num_qubits - 1:
+            linear_op = self._linear_operator(operator)
+        if linear_op is not None:
+            eigval, eigvec = self._solve_linear_operator(linear_op)
         else:
-            if self._k >= 2 ** (operator.num_qubits) - 1:
-                logger.debug("SciPy doesn't support to get all eigenvalues, using NumPy instead.")
-                eigval, eigvec = np.linalg.eig(operator.to_matrix())
+            sp_mat = operator.to_spmatrix()
+            # If matrix is diagonal, the elements on the diagonal are the eigenvalues. Solve by
+            # sorting.
+            if scisparse.csr_matrix(sp_mat.diagonal()).nnz == sp_mat.nnz:
+                eigval, eigvec = self._solve_diagonal(sp_mat.diagonal())
             else:
-                eigval, eigvec = scisparse.linalg.eigs(operator.to_spmatrix(),
-                                                       k=self._k, which='SR')
+                if self._k >= 2 ** (operator.num_qubits) - 1:
+                    logger.debug("SciPy doesn't support to get all eigenvalues, "
+                                 "using NumPy instead.")
+                    eigval, eigvec = np.linalg.eig(operator.to_matrix())
+                else:
+                    eigval, eigvec = scisparse.linalg.eigs(operator.to_spmatrix(),
+                                                           k=self._k, which='SR')
         if self._k > 1:
             idx = eigval.argsort()
             eigval = eigval[idx]
@@ -128,6 +137,35 @@ class NumPyEigensolver(Eigensolver):
         self._ret.eigenvalues = eigval
         self._ret.eigenstates = eigvec.T
 
+    def _solve_diagonal(self, diag: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        eigval = np.sort(diag)[:self._k]
+        temp = np.argsort(diag)[:self._k]
+        eigvec = np.zeros((len(diag), self._k))
+        for i, idx in enumerate(temp):
+            eigvec[idx, i] = 1.0
+        return eigval, eigvec
+
+    def _solve_linear_operator(self, linear_op) -> Tuple[np.ndarray, np.ndarray]:
+        """Solve with the matrix-free linear operator of a sum of Paulis."""
+        op = linear_op.op
+        if not op.table.X.any():
+            return self._solve_diagonal(linear_op.diagonal())
+        if np.allclose(op.simplify().coeffs.imag, 0):
+            eigval, eigvec = eigsh(linear_op, k=self._k, which='SA')
+            return eigval.astype(complex), eigvec
+        return scisparse.linalg.eigs(linear_op, k=self._k, which='SR')
+
+    @staticmethod
+    def _linear_operator(operator: OperatorBase):
+        """Return the matrix-free linear operator of a sum of Paulis, or None for other
+        operators."""
+        terms = pauli_terms(operator)
+        if terms is None:
+            return None
+        x_bits, z_bits, coeffs = terms
+        table = PauliTable(np.hstack([x_bits, z_bits]))
+        return SparsePauliOp(table, coeffs).to_linear_operator()
+
     def _get_ground_state_energy(self,
                                  operator: OperatorBase) -> None:
         if self._ret.eigenvalues is None or self._ret.eigenstates is None:
@@ -156,7 +194,11 @@ class NumPyEigensolver(Eigensolver):
                 values.append(None)
                 continue
             value = 0.0
-            if operator.coeff != 0:
+            linear_op = NumPyEigensolver._linear_operator(operator)
+            if linear_op is not None:
+                value = np.vdot(wavefn, linear_op.matvec(wavefn))
+                value = value.real if abs(value.real) > threshold else 0.0
+            elif operator.coeff != 0:
                 mat = operator.to_spmatrix()
                 # Terra doesn't support sparse yet, so do the matmul directly if so
                 # This is necessary for the particle_hole and other chemistry tests because the
@@ -123,7 +123,9 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
                 potentially the expectation values can be computed in parallel. Typically this is
                 possible when a finite difference gradient is used by the optimizer such that
                 multiple points to compute the gradient can be passed and if computed in parallel
-                improve overall execution time. Deprecated if a gradient operator or function is
+                improve overall execution time, or when :class:`~qiskit.algorithms.optimizers.SPSA`
+                evaluates all perturbations of an iteration. The points passed at once are
+                evaluated in a single backend job. Deprecated if a gradient operator or function is
                 given.
             callback: a callback that can access the intermediate data during the optimization.
                 Four parameter values are passed to the callback as follows during each evaluation
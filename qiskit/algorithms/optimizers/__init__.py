@@ -58,6 +58,15 @@ Local Optimizers
    SPSA
    TNC
 
+Multi-start Optimizers
+======================
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   MultiStart
+
 Qiskit also provides the following optimizers, which are built-out using the optimizers from
 the `scikit-quant` package. The `scikit-quant` package is not installed by default but must be
 explicitly installed, if desired, by the user - the optimizers therein are provided under various
@@ -111,6 +120,7 @@ from .spsa import SPSA
 from .tnc import TNC
 from .aqgd import AQGD
 from .nft import NFT
+from .multistart import MultiStart
 from .nlopts.crs import CRS
 from .nlopts.direct_l import DIRECT_L
 from .nlopts.direct_l_rand import DIRECT_L_RAND
@@ -128,6 +138,7 @@ __all__ = ['Optimizer',
            'COBYLA',
            'GSLS',
            'L_BFGS_B',
+           'MultiStart',
            'NELDER_MEAD',
            'NFT',
            'P_BFGS',
@@ -0,0 +1,303 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Multi-start wrapper running independent optimizations in a shared pool."""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional, Set, Tuple
+import copy
+import threading
+import logging
+
+import numpy as np
+
+from qiskit.utils import aqua_globals
+from qiskit.utils.validation import validate_min
+from .optimizer import Optimizer, OptimizerSupportLevel
+
+logger = logging.getLogger(__name__)
+
+
+class MultiStart(Optimizer):
+    """Multi-start optimizer running independent optimizations of a wrapped optimizer.
+
+    Each run uses its own copy of the wrapped optimizer, which is started from the given
+    initial point and from ``num_starts - 1`` random points within the variable bounds, or
+    within :math:`[-2\\pi, 2\\pi]` for unbounded variables, and the best of all results is
+    returned. The runs are executed in a pool, which is created once and reused for all
+    optimizations until :meth:`close` is called, or in an executor given by the user that may be
+    shared between several optimizers. The optimizer can be used as a context manager which
+    closes its pool on exit.
+
+    With a thread pool and ``batch_objective=True`` the objective function evaluations of all
+    concurrent runs are combined: the points requested by the runs are concatenated and passed
+    to the objective function at once, in the same way as the points of a numerical gradient
+    grouped by ``max_evals_grouped``, and the objective function returns one value per point.
+    The energy evaluation of :class:`~qiskit.algorithms.VQE` handles such batches in a single
+    backend job. Otherwise the objective function evaluations of the concurrent runs are
+    serialized, since objective functions such as the energy evaluation of
+    :class:`~qiskit.algorithms.VQE` are not thread-safe. Gradient evaluations are always
+    serialized.
+
+    With a :class:`~concurrent.futures.ProcessPoolExecutor` the runs are fully independent and
+    the optimizer, objective and gradient functions must be picklable.
+    """
+
+    def __init__(self,
+                 optimizer: Optimizer,
+                 num_starts: int = 4,
+                 executor: Optional[Executor] = None,
+                 max_workers: Optional[int] = None,
+                 batch_objective: bool = False,
+                 batch_timeout: float = 0.1) -> None:
+        """
+        Args:
+            optimizer: The optimizer used for each run.
+            num_starts: The number of independent runs, has a min. value of 1.
+            executor: The executor to run the optimizations in. If None, a thread pool with
+                ``max_workers`` threads is created on the first optimization and reused.
+            max_workers: The maximum number of threads of the default thread pool. If None,
+                one thread per run is used.
+            batch_objective: If True, the objective function evaluations of concurrent runs
+                are passed to the objective function at once. Not supported with a process pool.
+            batch_timeout: The time in seconds a run waits for the other runs to request an
+                objective function evaluation before the points requested so far are evaluated.
+
+        Raises:
+            ValueError: If ``batch_objective`` is requested with a process pool.
+        """
+        validate_min('num_starts', num_starts, 1)
+        if max_workers is not None:
+            validate_min('max_workers', max_workers, 1)
+        if batch_objective and isinstance(executor, ProcessPoolExecutor):
+            raise ValueError('Batched objective evaluation requires a thread pool.')
+        self._optimizer = optimizer
+        super().__init__()
+        self._num_starts = num_starts
+        self._executor = executor
+        self._owns_executor = False
+        self._max_workers = max_workers
+        self._batch_objective = batch_objective
+        self._batch_timeout = batch_timeout
+        self._results = []  # type: List[Tuple[np.ndarray, float, int]]
+
+    @property
+    def optimizer(self) -> Optimizer:
+        """Returns the optimizer used for each run."""
+        return self._optimizer
+
+    @property
+    def num_starts(self) -> int:
+        """Returns the number of independent runs."""
+        return self._num_starts
+
+    @property
+    def executor(self) -> Executor:
+        """Returns the executor running the optimizations, creating the default pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers or self._num_starts)
+            self._owns_executor = True
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the default pool, which is created again by the next optimization.
+
+        An executor given by the user is not shut down.
+        """
+        if self._owns_executor:
+            self._executor.shutdown()
+            self._executor = None
+            self._owns_executor = False
+
+    def __enter__(self) -> 'MultiStart':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, '_owns_executor', False):
+            self._executor.shutdown(wait=False)
+
+    @property
+    def results(self) -> List[Tuple[np.ndarray, float, int]]:
+        """Returns the point, value and number of evaluations of each run of the last
+        optimization."""
+        return self._results
+
+    def get_support_level(self):
+        """ return support level dictionary """
+        support_level = {
+            'gradient': self._optimizer.gradient_support_level,
+            'bounds': self._optimizer.bounds_support_level,
+            'initial_point': self._optimizer.initial_point_support_level
+        }
+        # Random starting points are drawn for every run
+        if support_level['initial_point'] == OptimizerSupportLevel.required:
+            support_level['initial_point'] = OptimizerSupportLevel.supported
+        return support_level
+
+    def set_max_evals_grouped(self, limit):
+        """ Set max evals grouped of the optimizer used for each run """
+        super().set_max_evals_grouped(limit)
+        self._optimizer.set_max_evals_grouped(limit)
+
+    def optimize(self, num_vars, objective_function, gradient_function=None,
+                 variable_bounds=None, initial_point=None):
+        super().optimize(num_vars, objective_function, gradient_function,
+                         variable_bounds, initial_point)
+
+        # bounds for additional initial points in case bounds has any None values
+        threshold = 2 * np.pi
+        bounds = variable_bounds if variable_bounds is not None else [(None, None)] * num_vars
+        low = [(l if l is not None else -threshold) for (l, u) in bounds]
+        high = [(u if u is not None else threshold) for (l, u) in bounds]
+        points = [] if initial_point is None else [np.asarray(initial_point, dtype=float)]
+        while len(points) < self._num_starts:
+            points.append(aqua_globals.random.uniform(low, high))
+
+        # Optimizers such as ADAM keep the state of a run in their attributes
+        optimizers = [copy.deepcopy(self._optimizer) for _ in points]
+        executor = self.executor
+        if isinstance(executor, ProcessPoolExecutor):
+            futures = [executor.submit(_optimize, optimizer, num_vars, objective_function,
+                                       gradient_function, variable_bounds, point)
+                       for optimizer, point in zip(optimizers, points)]
+        else:
+            batcher = None
+            if self._batch_objective:
+                batcher = _ObjectiveBatcher(objective_function, num_vars, self._batch_timeout)
+                objective_function = batcher.evaluate
+            else:
+                objective_function = _serialized(objective_function)
+            if gradient_function is not None:
+                gradient_function = _serialized(gradient_function)
+            futures = [executor.submit(_optimize, optimizer, num_vars, objective_function,
+                                       gradient_function, variable_bounds, point, batcher)
+                       for optimizer, point in zip(optimizers, points)]
+
+        self._results = [future.result() for future in futures]
+        best = min(range(len(self._results)), key=lambda i: self._results[i][1])
+        sol, opt, _ = self._results[best]
+        nfev = sum(run_nfev for _, _, run_nfev in self._results if run_nfev is not None)
+        logger.debug('Best of %s runs: %s', len(self._results), opt)
+        return sol, opt, nfev
+
+
+def _optimize(optimizer, num_vars, objective_function, gradient_function, variable_bounds,
+              initial_point, batcher=None):
+    """Run a single optimization, registering it with the objective batcher."""
+    if batcher is None:
+        return optimizer.optimize(num_vars, objective_function, gradient_function,
+                                  variable_bounds, initial_point)
+    batcher.start()
+    try:
+        return optimizer.optimize(num_vars, objective_function, gradient_function,
+                                  variable_bounds, initial_point)
+    finally:
+        batcher.stop()
+
+
+def _serialized(function: Callable) -> Callable:
+    """Return a function calling ``function`` from one thread at a time."""
+    lock = threading.Lock()
+
+    def serialized_function(*args):
+        with lock:
+            return function(*args)
+
+    return serialized_function
+
+
+class _ObjectiveBatcher:
+    """Combine the objective function evaluations requested by concurrent runs.
+
+    A run requesting an evaluation waits until every running optimization has requested one,
+    or has finished, and the last of them evaluates all requested points in one call. A run
+    waiting longer than ``timeout`` seconds evaluates the points requested so far, and the
+    runs which did not request an evaluation, for example because the optimizer serializes
+    its runs, are not waited for until their next request.
+    """
+
+    def __init__(self, objective_function: Callable, num_vars: int, timeout: float) -> None:
+        self._objective_function = objective_function
+        self._num_vars = num_vars
+        self._timeout = timeout
+        self._condition = threading.Condition()
+        self._running = set()  # type: Set[int]
+        self._absent = set()  # type: Set[int]
+        self._pending = []  # type: List[_Request]
+        self.num_calls = 0
+
+    def start(self) -> None:
+        """Register a running optimization."""
+        with self._condition:
+            self._running.add(threading.get_ident())
+
+    def stop(self) -> None:
+        """Unregister a finished optimization, evaluating the points the others wait for."""
+        with self._condition:
+            self._running.discard(threading.get_ident())
+            self._absent.discard(threading.get_ident())
+            if self._pending and self._is_complete():
+                self._flush()
+
+    def evaluate(self, x: np.ndarray):
+        """Return the objective function values of one or several concatenated points."""
+        request = _Request(threading.get_ident(), np.reshape(x, (-1, self._num_vars)))
+        with self._condition:
+            self._absent.discard(request.thread)
+            self._pending.append(request)
+            if self._is_complete():
+                self._flush()
+            while not request.done:
+                if not self._condition.wait(self._timeout) and not request.done:
+                    self._absent = self._running - {req.thread for req in self._pending}
+                    self._flush()
+        if request.error is not None:
+            raise request.error
+        return request.values[0] if len(request.values) == 1 else request.values
+
+    def _is_complete(self) -> bool:
+        """Return whether every running optimization which is waited for has a request."""
+        return len(self._pending) >= len(self._running - self._absent)
+
+    def _flush(self) -> None:
+        """Evaluate all pending points in one objective function call."""
+        pending, self._pending = self._pending, []
+        points = np.concatenate([request.points for request in pending])
+        try:
+            values = self._objective_function(points.ravel() if len(points) > 1 else points[0])
+            values = np.reshape(values, (len(points),))
+            error = None
+        except Exception as ex:  # pylint: disable=broad-except
+            values, error = None, ex
+        self.num_calls += 1
+        start = 0
+        for request in pending:
+            if error is None:
+                request.values = values[start:start + len(request.points)]
+                start += len(request.points)
+            request.error = error
+            request.done = True
+        self._condition.notify_all()
+
+
+class _Request:
+    """Points of an objective function evaluation waiting for their batch."""
+
+    def __init__(self, thread: int, points: np.ndarray) -> None:
+        self.thread = thread
+        self.points = points
+        self.values = np.empty(0)
+        self.error = None
+        self.done = False
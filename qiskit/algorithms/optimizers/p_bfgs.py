@@ -12,6 +12,7 @@
 
 """Parallelized Limited-memory BFGS optimizer"""
 
+from concurrent.futures import Executor
 from typing import Optional
 import multiprocessing
 import platform
@@ -23,6 +24,8 @@ from scipy import optimize as sciopt
 from qiskit.utils import aqua_globals
 from qiskit.utils.validation import validate_min
 from .optimizer import Optimizer, OptimizerSupportLevel
+from .l_bfgs_b import L_BFGS_B
+from .multistart import MultiStart
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +51,8 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
                  maxfun: int = 1000,
                  factr: float = 10,
                  iprint: int = -1,
-                 max_processes: Optional[int] = None) -> None:
+                 max_processes: Optional[int] = None,
+                 executor: Optional[Executor] = None) -> None:
         r"""
         Args:
             maxfun: Maximum number of function evaluations.
@@ -66,6 +70,10 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
                 changes of active set and final x; iprint > 100 print details of
                 every iteration including x and g.
             max_processes: maximum number of processes allowed, has a min. value of 1 if not None.
+            executor: A thread or process pool executor to run the optimizations in. If given,
+                the optimizations are run by a :class:`MultiStart` optimizer in this pool, which
+                may be reused across optimizations and shared with other optimizers, instead of
+                new processes forked for every optimization.
         """
         if max_processes:
             validate_min('max_processes', max_processes, 1)
@@ -74,6 +82,7 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
             if k in self._OPTIONS:
                 self._options[k] = v
         self._max_processes = max_processes
+        self._executor = executor
 
     def get_support_level(self):
         """ return support level dictionary """
@@ -90,6 +99,12 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
             num_procs if self._max_processes is None else min(num_procs, self._max_processes)
         num_procs = num_procs if num_procs >= 0 else 0
 
+        if self._executor is not None:
+            multistart = MultiStart(L_BFGS_B(**self._options), num_starts=num_procs + 1,
+                                    executor=self._executor)
+            return multistart.optimize(num_vars, objective_function, gradient_function,
+                                       variable_bounds, initial_point)
+
         if platform.system() == 'Darwin':
             # Changed in version 3.8: On macOS, the spawn start method is now the
             # default. The fork start method should be considered unsafe as it can
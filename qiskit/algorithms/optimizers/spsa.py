@@ -17,6 +17,7 @@ from typing import Optional, List, Callable
 import logging
 
 import numpy as np
+import scipy.linalg
 
 from qiskit.utils import aqua_globals
 from qiskit.utils.validation import validate_min
@@ -53,11 +54,32 @@ class SPSA(Optimizer):
     The optimization process includes a calibration phase, which requires additional
     functional evaluations.
 
+    The gradient can be averaged over several random perturbations per iteration
+    (``resamplings``), and with ``second_order=True`` the second-order SPSA (2-SPSA) also
+    estimates the Hessian from two additional perturbations per sample and preconditions the
+    update with a smoothed and regularized Hessian estimate [2]. The preconditioned updates are
+    damped Newton steps, whose step size decays like that of the first-order updates from 0.5
+    instead of the calibrated ``c0``.
+
+    All points of an iteration, and all points of the calibration, are evaluated together. If
+    ``max_evals_grouped`` is larger than 1, they are concatenated and passed to the objective
+    function in groups of up to ``max_evals_grouped`` points, which the objective function
+    evaluates at once, returning one value per point. :class:`~qiskit.algorithms.VQE`
+    evaluates such a group in a single backend job.
+
     For further details, please refer to https://arxiv.org/pdf/1704.05018v2.pdf#section*.11
     (Supplementary information Section IV.)
+
+    References:
+
+        [1]: J. C. Spall (1998). An Overview of the Simultaneous Perturbation Method for
+            Efficient Optimization.
+        [2]: J. C. Spall (2000). Adaptive stochastic approximation by the simultaneous
+            perturbation method. IEEE Transactions on Automatic Control, 45(10), 1839-1853.
     """
 
     _C0 = 2 * np.pi * 0.1
+    _NEWTON_STEP = 0.5
     _OPTIONS = ['save_steps', 'last_avg']
 
     # pylint: disable=unused-argument
@@ -71,7 +93,11 @@ class SPSA(Optimizer):
                  c3: float = 0.101,
                  c4: float = 0,
                  skip_calibration: bool = False,
-                 max_trials: Optional[int] = None) -> None:
+                 max_trials: Optional[int] = None,
+                 resamplings: int = 1,
+                 second_order: bool = False,
+                 regularization: float = 0.01,
+                 hessian_delay: int = 0) -> None:
         """
         Args:
             maxiter: Maximum number of iterations to perform.
@@ -85,9 +111,19 @@ class SPSA(Optimizer):
             c4: The parameter used to control a as well.
             skip_calibration: Skip calibration and use provided c(s) as is.
             max_trials: Deprecated, use maxiter.
+            resamplings: The number of random perturbations the gradient, and Hessian, estimate
+                of each iteration is averaged over. It has a min. value of 1.
+            second_order: If True, use the second-order SPSA (2-SPSA), which estimates the
+                Hessian and uses it to precondition the gradient.
+            regularization: The multiple of the identity added to the Hessian estimate of
+                2-SPSA to ensure it is positive definite.
+            hessian_delay: The number of iterations of 2-SPSA in which the Hessian is estimated
+                but not yet used to precondition the gradient.
         """
         validate_min('save_steps', save_steps, 1)
         validate_min('last_avg', last_avg, 1)
+        validate_min('resamplings', resamplings, 1)
+        validate_min('hessian_delay', hessian_delay, 0)
         super().__init__()
         if max_trials is not None:
             warnings.warn('The max_trials parameter is deprecated as of '
@@ -101,6 +137,11 @@ class SPSA(Optimizer):
         self._maxiter = maxiter
         self._parameters = np.array([c0, c1, c2, c3, c4])
         self._skip_calibration = skip_calibration
+        self._resamplings = resamplings
+        self._second_order = second_order
+        self._regularization = regularization
+        self._hessian_delay = hessian_delay
+        self._nfev = 0
 
     def get_support_level(self):
         """ return support level dictionary """
@@ -119,6 +160,7 @@ class SPSA(Optimizer):
             initial_point = np.asarray(initial_point)
 
         logger.debug('Parameters: %s', self._parameters)
+        self._nfev = 0
         if not self._skip_calibration:
             # at least one calibration, at most 25 calibrations
             num_steps_calibration = min(25, max(1, self._maxiter // 5))
@@ -130,7 +172,36 @@ class SPSA(Optimizer):
                                                   initial_point,
                                                   maxiter=self._maxiter,
                                                   **self._options)
-        return sol, opt, None
+        return sol, opt, self._nfev
+
+    def _evaluate(self, obj_fun: Callable, points: List[np.ndarray]) -> np.ndarray:
+        """Evaluate the objective function at several points.
+
+        The points are passed to the objective function in groups of up to
+        ``max_evals_grouped`` points, concatenated into one array.
+
+        Args:
+            obj_fun: the function to minimize
+            points: the points to evaluate
+
+        Returns:
+            the value of the function at each point
+        """
+        values = []
+        group_size = max(1, self._max_evals_grouped)
+        for start in range(0, len(points), group_size):
+            group = points[start:start + group_size]
+            if len(group) == 1:
+                values.append(obj_fun(group[0]))
+            else:
+                values.extend(np.reshape(obj_fun(np.concatenate(group)), (len(group),)))
+        self._nfev += len(points)
+        return np.real(np.asarray(values, dtype=complex))
+
+    def _perturbations(self, num_vars: int) -> np.ndarray:
+        """Return ``resamplings`` random perturbation directions with entries +-1."""
+        return np.array([2 * aqua_globals.random.integers(2, size=num_vars) - 1
+                         for _ in range(self._resamplings)])
 
     def _optimization(self,
                       obj_fun: Callable,
@@ -171,25 +242,50 @@ class SPSA(Optimizer):
         cost_minus_save = []
         theta = initial_theta
         theta_best = np.zeros(initial_theta.shape)
+        num_vars = np.shape(initial_theta)[0]
+        smoothed_hessian = np.identity(num_vars)
         for k in range(maxiter):
             # SPSA Parameters
             a_spsa = float(self._parameters[0]) / np.power(k + 1 + self._parameters[4],
                                                            self._parameters[2])
             c_spsa = float(self._parameters[1]) / np.power(k + 1, self._parameters[3])
-            delta = 2 * aqua_globals.random.integers(2, size=np.shape(initial_theta)[0]) - 1
+            deltas = self._perturbations(num_vars)
             # plus and minus directions
-            theta_plus = theta + c_spsa * delta
-            theta_minus = theta - c_spsa * delta
-            # cost function for the two directions
-            if self._max_evals_grouped > 1:
-                cost_plus, cost_minus = obj_fun(np.concatenate((theta_plus, theta_minus)))
-            else:
-                cost_plus = obj_fun(theta_plus)
-                cost_minus = obj_fun(theta_minus)
+            points = [theta + c_spsa * delta for delta in deltas] \
+                + [theta - c_spsa * delta for delta in deltas]
+            if self._second_order:
+                deltas2 = self._perturbations(num_vars)
+                points += [point + c_spsa * delta2
+                           for point, delta2 in zip(points, np.concatenate((deltas2, deltas2)))]
+            # cost function for all directions in one evaluation
+            values = self._evaluate(obj_fun, points)
+            costs_plus = values[:self._resamplings]
+            costs_minus = values[self._resamplings:2 * self._resamplings]
             # derivative estimate
-            g_spsa = (cost_plus - cost_minus) * delta / (2.0 * c_spsa)
+            g_spsa = np.mean([(cost_plus - cost_minus) * delta / (2.0 * c_spsa)
+                              for cost_plus, cost_minus, delta
+                              in zip(costs_plus, costs_minus, deltas)], axis=0)
+            if self._second_order:
+                costs_plus2 = values[2 * self._resamplings:3 * self._resamplings]
+                costs_minus2 = values[3 * self._resamplings:]
+                hessian = np.zeros((num_vars, num_vars))
+                for i, (delta, delta2) in enumerate(zip(deltas, deltas2)):
+                    diff = (costs_plus2[i] - costs_plus[i]) - (costs_minus2[i] - costs_minus[i])
+                    rank_one = np.outer(delta, delta2)
+                    hessian += diff / (2 * c_spsa ** 2) * (rank_one + rank_one.T) / 2
+                hessian /= self._resamplings
+                smoothed_hessian = (k + 1) / (k + 2) * smoothed_hessian + hessian / (k + 2)
+                if k >= self._hessian_delay:
+                    spd_hessian = _make_spd(smoothed_hessian, self._regularization)
+                    g_spsa = np.real(np.linalg.solve(spd_hessian, g_spsa))
+                    # The preconditioned step is a damped Newton step, which does not
+                    # use the step size calibrated for the gradient
+                    a_spsa = self._NEWTON_STEP / np.power(k + 1 + self._parameters[4],
+                                                          self._parameters[2])
             # updated theta
             theta = theta - a_spsa * g_spsa
+            cost_plus, cost_minus = costs_plus[0], costs_minus[0]
+            theta_plus, theta_minus = points[0], points[self._resamplings]
             # saving
             if k % save_steps == 0:
                 logger.debug('Objective function at theta+ for step # %s: %1.7f', k, cost_plus)
@@ -202,7 +298,7 @@ class SPSA(Optimizer):
             if k >= maxiter - last_avg:
                 theta_best += theta / last_avg
         # final cost update
-        cost_final = obj_fun(theta_best)
+        cost_final = self._evaluate(obj_fun, [theta_best])[0]
         logger.debug('Final objective function is: %.7f', cost_final)
 
         return [cost_final, theta_best, cost_plus_save, cost_minus_save,
@@ -229,20 +325,14 @@ class SPSA(Optimizer):
 
         target_update = self._parameters[0]
         initial_c = self._parameters[1]
-        delta_obj = 0
-        logger.debug("Calibration...")
-        for i in range(stat):
-            if i % 5 == 0:
-                logger.debug('calibration step # %s of %s', str(i), str(stat))
-            delta = 2 * aqua_globals.random.integers(2, size=np.shape(initial_theta)[0]) - 1
-            theta_plus = initial_theta + initial_c * delta
-            theta_minus = initial_theta - initial_c * delta
-            if self._max_evals_grouped > 1:
-                obj_plus, obj_minus = obj_fun(np.concatenate((theta_plus, theta_minus)))
-            else:
-                obj_plus = obj_fun(theta_plus)
-                obj_minus = obj_fun(theta_minus)
-            delta_obj += np.absolute(obj_plus - obj_minus) / stat
+        logger.debug("Calibration with %s steps...", stat)
+        deltas = [2 * aqua_globals.random.integers(2, size=np.shape(initial_theta)[0]) - 1
+                  for _ in range(stat)]
+        # all calibration steps are evaluated together
+        points = [initial_theta + initial_c * delta for delta in deltas] \
+            + [initial_theta - initial_c * delta for delta in deltas]
+        values = self._evaluate(obj_fun, points)
+        delta_obj = np.sum(np.absolute(values[:stat] - values[stat:])) / stat
 
         # only calibrate if delta_obj is larger than 0
         if delta_obj > 0:
@@ -251,3 +341,10 @@ class SPSA(Optimizer):
             logger.debug('delta_obj is 0, not calibrating (since this would set c0 to inf)')
 
         logger.debug('Calibrated SPSA parameter c0 is %.7f', self._parameters[0])
+
+
+def _make_spd(matrix: np.ndarray, bias: float) -> np.ndarray:
+    """Return the symmetric positive definite matrix :math:`\\sqrt{M^2} + bI`."""
+    identity = np.identity(matrix.shape[0])
+    psd = np.real(scipy.linalg.sqrtm(matrix.dot(matrix)))
+    return psd + bias * identity
@@ -16,7 +16,7 @@ from typing import Dict, List, Optional, Tuple
 
 from qiskit.assembler.run_config import RunConfig
 from qiskit.assembler.assemble_schedules import _assemble_instructions as _assemble_schedule
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import Gate, Instruction, QuantumCircuit
 from qiskit.exceptions import QiskitError
 from qiskit.qobj import (QasmQobj, QobjExperimentHeader,
                          QasmQobjInstruction, QasmQobjExperimentConfig, QasmQobjExperiment,
@@ -27,6 +27,8 @@ from qiskit.tools.parallel import parallel_map
 
 PulseLibrary = Dict[str, List[complex]]
 
+_DEFAULT_ASSEMBLE = (Instruction.assemble, Gate.assemble)
+
 
 def _assemble_circuit(
         circuit: QuantumCircuit,
@@ -95,23 +97,24 @@ def _assemble_circuit(
     # their clbit_index, create a new register slot for every conditional gate
     # and add a bfunc to map the creg=val mask onto the gating register bit.
 
-    is_conditional_experiment = any(op.condition for (op, qargs, cargs) in circuit.data)
+    is_conditional_experiment = any(op.condition for (op, qargs, cargs) in circuit._data)
     max_conditional_idx = 0
 
+    # Precompute the qobj index of every circuit bit
+    qubit_index_map = {qubit: index for index, qubit in
+                       enumerate(qubit for qreg in circuit.qregs for qubit in qreg)}
+    clbit_index_map = {clbit: index for index, clbit in
+                       enumerate(clbit for creg in circuit.cregs for clbit in creg)}
+
     instructions = []
-    for op_context in circuit.data:
-        instruction = op_context[0].assemble()
+    for op, qargs, cargs in circuit._data:
+        instruction = _assemble_instruction(op)
 
         # Add register attributes to the instruction
-        qargs = op_context[1]
-        cargs = op_context[2]
         if qargs:
-            qubit_indices = [qubit_labels.index([qubit.register.name, qubit.index])
-                             for qubit in qargs]
-            instruction.qubits = qubit_indices
+            instruction.qubits = [qubit_index_map[qubit] for qubit in qargs]
         if cargs:
-            clbit_indices = [clbit_labels.index([clbit.register.name, clbit.index])
-                             for clbit in cargs]
+            clbit_indices = [clbit_index_map[clbit] for clbit in cargs]
             instruction.memory = clbit_indices
             # If the experiment has conditional instructions, assume every
             # measurement result may be needed for a conditional gate.
@@ -148,6 +151,35 @@ def _assemble_circuit(
             pulse_library)
 
 
+def _assemble_instruction(operation):
+    """Return the ``QasmQobjInstruction`` of a circuit instruction.
+
+    This is equivalent to ``operation.assemble()`` for instructions using the
+    default ``Instruction.assemble`` or ``Gate.assemble`` methods, without
+    the overhead of the method call chain. The ``qubits`` and ``memory``
+    fields are left for the caller to set.
+
+    Args:
+        operation (Instruction): the circuit instruction.
+
+    Returns:
+        QasmQobjInstruction: the assembled instruction.
+    """
+    assemble_method = type(operation).assemble
+    if assemble_method not in _DEFAULT_ASSEMBLE:
+        return operation.assemble()
+    fields = {'name': operation.name}
+    if operation.params:
+        fields['params'] = [param.evalf(param) if hasattr(param, 'evalf') else param
+                            for param in operation.params]
+    if assemble_method is Gate.assemble and operation.label:
+        fields['label'] = operation.label
+    instruction = QasmQobjInstruction(**fields)
+    if operation.condition:
+        instruction._condition = operation.condition
+    return instruction
+
+
 def _assemble_pulse_gates(
         circuit: QuantumCircuit,
         run_config: RunConfig
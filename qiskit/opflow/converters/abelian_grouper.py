@@ -13,11 +13,13 @@
 """AbelianGrouper Class"""
 
 import warnings
-from typing import List, Tuple, Dict, cast, Optional
+from typing import List, Tuple, Optional, Union
 
 import numpy as np
 import retworkx as rx
 
+from qiskit.quantum_info import Pauli, SparsePauliOp
+
 from .converter_base import ConverterBase
 from ..list_ops.list_op import ListOp
 from ..list_ops.summed_op import SummedOp
@@ -38,15 +40,41 @@ class AbelianGrouper(ConverterBase):
     similarly, as in the case of Pauli Expectations, where commuting Paulis have the same
     diagonalizing circuit rotation, or Pauli Evolutions, where commuting Paulis can be
     diagonalized together.
+
+    The grouping works directly on the symplectic ``x`` and ``z`` bit arrays of the Paulis,
+    packed into 64-bit words, and never expands a ``PauliSumOp`` into ``PauliOp`` objects to
+    determine the groups. The following coloring strategies are available:
+
+    * ``'greedy'``: build the conflict graph of non-commuting pairs chunk by chunk and color
+      it with ``retworkx.graph_greedy_color``. The temporary arrays and edge lists of a chunk
+      are bounded, but the graph itself stores every conflict edge, so the memory grows with
+      the number of non-commuting pairs, which is up to quadratic in the number of Paulis.
+    * ``'largest_degree_first'``: assign each Pauli, in order of decreasing number of
+      non-commuting Paulis, to the first group it commutes with. The conflict graph is never
+      stored, so the memory is linear in the number of Paulis.
+    * ``'sorted_insertion'``: assign each Pauli, in order of decreasing coefficient magnitude,
+      to the first group it commutes with. This is the fastest strategy and does not compute
+      the conflict graph at all.
     """
 
-    def __init__(self, traverse: bool = True) -> None:
+    STRATEGIES = ('greedy', 'largest_degree_first', 'sorted_insertion')
+
+    def __init__(self, traverse: bool = True, strategy: str = 'greedy') -> None:
         """
         Args:
             traverse: Whether to convert only the Operator passed to ``convert``, or traverse
                 down that Operator.
+            strategy: The coloring strategy used to group the Paulis, one of ``'greedy'``,
+                ``'largest_degree_first'`` or ``'sorted_insertion'``.
+
+        Raises:
+            OpflowError: If the strategy is invalid.
         """
+        if strategy not in self.STRATEGIES:
+            raise OpflowError('Invalid grouping strategy {}, must be one of {}.'.format(
+                strategy, self.STRATEGIES))
         self._traverse = traverse
+        self._strategy = strategy
 
     def convert(self, operator: OperatorBase) -> OperatorBase:
         """Check if operator is a SummedOp, in which case covert it into a sum of mutually
@@ -62,19 +90,16 @@ class AbelianGrouper(ConverterBase):
         # pylint: disable=cyclic-import,import-outside-toplevel
         from ..evolutions.evolved_op import EvolvedOp
 
-        # TODO: implement direct way
-        if isinstance(operator, PauliSumOp):
+        if isinstance(operator, PauliSumOp) and len(operator.primitive) == 1:
             operator = operator.to_pauli_op()
 
-        if isinstance(operator, ListOp):
-            if isinstance(operator, SummedOp) and all(isinstance(op, PauliOp)
-                                                      for op in operator.oplist):
-                # For now, we only support graphs over Paulis.
-                return self.group_subops(operator)
-            elif self._traverse:
-                return operator.traverse(self.convert)
-            else:
-                return operator
+        # For now, we only support graphs over Paulis.
+        if isinstance(operator, PauliSumOp) or (
+                isinstance(operator, SummedOp) and all(isinstance(op, PauliOp)
+                                                       for op in operator.oplist)):
+            return self.group_subops(operator, strategy=self._strategy)
+        elif isinstance(operator, ListOp) and self._traverse:
+            return operator.traverse(self.convert)
         elif isinstance(operator, OperatorStateFn) and self._traverse:
             return OperatorStateFn(self.convert(operator.primitive),
                                    is_measurement=operator.is_measurement,
@@ -85,14 +110,15 @@ class AbelianGrouper(ConverterBase):
             return operator
 
     @classmethod
-    def group_subops(cls, list_op: ListOp, fast: Optional[bool] = None,
-                     use_nx: Optional[bool] = None) -> ListOp:
+    def group_subops(cls, list_op: Union[ListOp, PauliSumOp], fast: Optional[bool] = None,
+                     use_nx: Optional[bool] = None, strategy: str = 'greedy') -> ListOp:
         """Given a ListOp, attempt to group into Abelian ListOps of the same type.
 
         Args:
             list_op: The Operator to group into Abelian groups
             fast: Ignored - parameter will be removed in future release
             use_nx: Ignored - parameter will be removed in future release
+            strategy: The coloring strategy used to group the Paulis.
 
         Returns:
             The grouped Operator.
@@ -105,34 +131,75 @@ class AbelianGrouper(ConverterBase):
                           'no longer used and are now deprecated and will be removed no '
                           'sooner than 3 months following the 0.8.0 release.')
 
-        # TODO: implement direct way
         if isinstance(list_op, PauliSumOp):
-            list_op = list_op.to_pauli_op()
+            groups = cls.group_indices(list_op, strategy=strategy)
+            group_ops = [SummedOp(_pauli_ops(list_op.primitive, group), abelian=True)
+                         for group in groups]
+            if len(group_ops) == 1:
+                return group_ops[0] * list_op.coeff  # type: ignore
+            return SummedOp(group_ops, coeff=list_op.coeff)  # type: ignore
+        else:
+            for op in list_op.oplist:
+                if not isinstance(op, PauliOp):
+                    raise OpflowError(
+                        'Cannot determine Abelian groups if any Operator in list_op is not '
+                        '`PauliOp`. E.g., {} ({})'.format(op, type(op)))
+            groups = cls.group_indices(list_op, strategy=strategy)
 
-        for op in list_op.oplist:
-            if not isinstance(op, PauliOp):
-                raise OpflowError(
-                    'Cannot determine Abelian groups if any Operator in list_op is not '
-                    '`PauliOp`. E.g., {} ({})'.format(op, type(op)))
+        group_ops = [list_op.__class__([list_op.oplist[idx] for idx in group], abelian=True)
+                     for group in groups]
+        if len(group_ops) == 1:
+            return group_ops[0] * list_op.coeff  # type: ignore
+        return list_op.__class__(group_ops, coeff=list_op.coeff)  # type: ignore
 
-        edges = cls._commutation_graph(list_op)
-        nodes = range(len(list_op))
+    @classmethod
+    def group_indices(cls, operator: Union[SparsePauliOp, PauliSumOp, ListOp],
+                      qubit_wise: bool = True, strategy: str = 'greedy',
+                      max_chunk_bytes: int = 2 ** 26) -> List[np.ndarray]:
+        """Partition the Paulis of an operator into mutually commuting groups.
 
-        graph = rx.PyGraph()
-        graph.add_nodes_from(nodes)
-        graph.add_edges_from_no_data(edges)
-        # Keys in coloring_dict are nodes, values are colors
-        coloring_dict = rx.graph_greedy_color(graph)
+        Args:
+            operator: A ``SparsePauliOp``, ``PauliSumOp`` or a ``ListOp`` of ``PauliOp``.
+            qubit_wise: If True group qubit-wise commuting Paulis, which can be measured in a
+                single tensor product basis. Otherwise group Paulis that commute.
+            strategy: The coloring strategy, one of ``'greedy'``, ``'largest_degree_first'``
+                or ``'sorted_insertion'``.
+            max_chunk_bytes: The maximum size in bytes of the temporary arrays used to compute
+                commutation between blocks of Paulis. This does not bound the conflict graph
+                of the ``'greedy'`` strategy.
 
-        groups = {}  # type: Dict
-        # sort items so that the output is consistent with all options (fast and use_nx)
-        for idx, color in sorted(coloring_dict.items()):
-            groups.setdefault(color, []).append(list_op[idx])
+        Returns:
+            The groups as sorted arrays of indices into the Paulis of ``operator``, ordered by
+            their first index.
 
-        group_ops = [list_op.__class__(group, abelian=True) for group in groups.values()]
-        if len(group_ops) == 1:
-            return group_ops[0] * list_op.coeff  # type: ignore
-        return list_op.__class__(group_ops, coeff=list_op.coeff)  # type: ignore
+        Raises:
+            OpflowError: If the strategy is invalid.
+        """
+        if strategy not in cls.STRATEGIES:
+            raise OpflowError('Invalid grouping strategy {}, must be one of {}.'.format(
+                strategy, cls.STRATEGIES))
+        x_words, z_words, coeffs = _packed_paulis(operator)
+        num_paulis = len(x_words)
+        if strategy == 'greedy':
+            graph = rx.PyGraph()
+            graph.add_nodes_from(range(num_paulis))
+            # Only the edges of one chunk are held as Python objects at a time
+            for edges in _conflict_edges(x_words, z_words, qubit_wise, max_chunk_bytes):
+                graph.add_edges_from_no_data(edges)
+            # Keys in coloring_dict are nodes, values are colors
+            coloring_dict = rx.graph_greedy_color(graph)
+            colors = np.array([coloring_dict[idx] for idx in range(num_paulis)], dtype=int)
+        else:
+            if strategy == 'largest_degree_first':
+                degrees = _conflict_degrees(x_words, z_words, qubit_wise, max_chunk_bytes)
+                order = np.argsort(-degrees, kind='stable')
+            else:
+                order = np.argsort(-np.abs(coeffs), kind='stable')
+            if qubit_wise:
+                colors = _first_fit_qubit_wise(x_words, z_words, order)
+            else:
+                colors = _first_fit(x_words, z_words, order)
+        return _color_groups(colors)
 
     @staticmethod
     def _commutation_graph(list_op: ListOp) -> List[Tuple[int, int]]:
@@ -147,10 +214,151 @@ class AbelianGrouper(ConverterBase):
         Returns:
             A list of pairs of indices of the operators that are not commutable
         """
-        # convert a Pauli operator into int vector where {I: 0, X: 2, Y: 3, Z: 1}
-        mat1 = np.array([op.primitive.z + 2 * op.primitive.x for op in list_op], dtype=np.int8)
-        mat2 = mat1[:, None]
-        # mat3[i, j] is True if i and j are commutable with TPB
-        mat3 = (((mat1 * mat2) * (mat1 - mat2)) == 0).all(axis=2)
-        # return [(i, j) if mat3[i, j] is False and i < j]
-        return cast(List[Tuple[int, int]], list(zip(*np.where(np.triu(np.logical_not(mat3), k=1)))))
+        x_words, z_words, _ = _packed_paulis(list_op)
+        return [edge for edges in _conflict_edges(x_words, z_words, True, 2 ** 26)
+                for edge in edges]
+
+
+def _pauli_ops(sparse_op, indices):
+    """Return the ``PauliOp`` of the terms ``indices`` of a ``SparsePauliOp``.
+
+    This is equivalent to the terms of ``PauliSumOp.to_pauli_op``, without building a
+    ``SparsePauliOp`` view of every term.
+    """
+    x_bits, z_bits = sparse_op.table.X, sparse_op.table.Z
+    ops = []
+    for idx in indices:
+        coeff = sparse_op.coeffs[idx]
+        coeff = coeff.real if np.isreal(coeff) else coeff
+        ops.append(PauliOp(Pauli((z_bits[idx], x_bits[idx])), coeff.item()))
+    return ops
+
+
+def _packed_paulis(operator):
+    """Return the x and z bits of the Paulis of an operator packed into uint64 words.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: the ``(N, W)`` packed x and z words and the
+        ``N`` coefficients.
+    """
+    if isinstance(operator, PauliSumOp):
+        operator = operator.primitive
+    if isinstance(operator, SparsePauliOp):
+        x_bits, z_bits = operator.table.X, operator.table.Z
+        coeffs = operator.coeffs
+    else:
+        x_bits = np.array([op.primitive.x for op in operator.oplist], dtype=bool)
+        z_bits = np.array([op.primitive.z for op in operator.oplist], dtype=bool)
+        coeffs = np.array([op.coeff for op in operator.oplist], dtype=complex)
+    return _pack_words(x_bits), _pack_words(z_bits), coeffs
+
+
+def _pack_words(bits):
+    """Pack an (N, n) boolean array into an (N, ceil(n / 64)) uint64 array."""
+    num_words = max(1, -(-bits.shape[1] // 64))
+    packed = np.zeros((bits.shape[0], 8 * num_words), dtype=np.uint8)
+    packed[:, :-(-bits.shape[1] // 8) or None] = np.packbits(bits, axis=1)
+    return packed.view(np.uint64)
+
+
+def _anticommuting_words(x_words, z_words, rows):
+    """Return the words whose set bits mark qubits where Paulis ``rows`` anticommute.
+
+    Returns:
+        np.ndarray: a ``(len(rows), N, W)`` uint64 array.
+    """
+    x_rows = x_words[rows, None, :]
+    z_rows = z_words[rows, None, :]
+    return (x_rows & z_words[None, :, :]) ^ (z_rows & x_words[None, :, :])
+
+
+def _conflicts(x_words, z_words, rows, qubit_wise):
+    """Return the ``(len(rows), N)`` boolean matrix of non-commuting pairs."""
+    words = _anticommuting_words(x_words, z_words, rows)
+    if qubit_wise:
+        return words.any(axis=2)
+    # Paulis anticommute if they anticommute on an odd number of qubits
+    parity = np.bitwise_xor.reduce(words, axis=2)
+    for shift in (32, 16, 8, 4, 2, 1):
+        parity ^= parity >> np.uint64(shift)
+    return (parity & np.uint64(1)).astype(bool)
+
+
+def _row_chunks(x_words, max_chunk_bytes):
+    """Yield slices of rows whose conflict blocks fit in max_chunk_bytes."""
+    num_paulis, num_words = x_words.shape
+    size = max(1, max_chunk_bytes // max(1, 8 * num_paulis * num_words))
+    for start in range(0, num_paulis, size):
+        yield slice(start, min(start + size, num_paulis))
+
+
+def _conflict_edges(x_words, z_words, qubit_wise, max_chunk_bytes):
+    """Yield the lists of index pairs ``(i, j)``, ``i < j``, of non-commuting Paulis of each
+    chunk of rows."""
+    for rows in _row_chunks(x_words, max_chunk_bytes):
+        conflicts = _conflicts(x_words, z_words, rows, qubit_wise)
+        conflicts = np.triu(conflicts, k=rows.start + 1)
+        row_idx, col_idx = np.nonzero(conflicts)
+        yield list(zip((row_idx + rows.start).tolist(), col_idx.tolist()))
+
+
+def _conflict_degrees(x_words, z_words, qubit_wise, max_chunk_bytes):
+    """Return the number of non-commuting Paulis of each Pauli."""
+    degrees = np.zeros(len(x_words), dtype=int)
+    for rows in _row_chunks(x_words, max_chunk_bytes):
+        degrees[rows] = _conflicts(x_words, z_words, rows, qubit_wise).sum(axis=1)
+    return degrees
+
+
+def _first_fit_qubit_wise(x_words, z_words, order):
+    """Assign each Pauli in order to the first qubit-wise commuting group.
+
+    Every group of qubit-wise commuting Paulis acts on each qubit with at most one
+    non-identity Pauli, so a Pauli can be checked against the union of the group instead of
+    against each member.
+    """
+    num_paulis = len(x_words)
+    group_x = np.zeros_like(x_words)
+    group_z = np.zeros_like(z_words)
+    colors = np.empty(num_paulis, dtype=int)
+    num_groups = 0
+    for idx in order:
+        x_row, z_row = x_words[idx], z_words[idx]
+        support = x_row | z_row
+        if num_groups:
+            shared = support & (group_x[:num_groups] | group_z[:num_groups])
+            differs = (group_x[:num_groups] ^ x_row) | (group_z[:num_groups] ^ z_row)
+            conflict = (shared & differs).any(axis=1)
+            color = int(np.argmin(conflict)) if not conflict.all() else num_groups
+        else:
+            color = 0
+        if color == num_groups:
+            num_groups += 1
+        group_x[color] |= x_row
+        group_z[color] |= z_row
+        colors[idx] = color
+    return colors
+
+
+def _first_fit(x_words, z_words, order):
+    """Assign each Pauli in order to the first group whose members all commute with it."""
+    num_paulis = len(x_words)
+    colors = np.full(num_paulis, -1, dtype=int)
+    num_groups = 0
+    for idx in order:
+        conflicts = _conflicts(x_words, z_words, [idx], False)[0]
+        used = np.zeros(num_groups + 1, dtype=bool)
+        used[colors[conflicts & (colors >= 0)]] = True
+        color = int(np.argmin(used))
+        num_groups = max(num_groups, color + 1)
+        colors[idx] = color
+    return colors
+
+
+def _color_groups(colors):
+    """Return the sorted index arrays of each color ordered by their first index."""
+    order = np.argsort(colors, kind='stable')
+    _, starts = np.unique(colors[order], return_index=True)
+    groups = np.split(order, starts[1:])
+    groups.sort(key=lambda group: group[0])
+    return groups
@@ -12,7 +12,7 @@
 
 """ CircuitSampler Class """
 
-from typing import Optional, Dict, List, Union, cast, Any, Tuple
+from typing import Optional, Dict, List, Union, cast, Any
 import logging
 from functools import partial
 from time import time
@@ -20,9 +20,10 @@ import numpy as np
 
 from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
-from qiskit.circuit import QuantumCircuit, Parameter, ParameterExpression
+from qiskit.circuit import Parameter
 from qiskit import QiskitError
 from qiskit.utils.quantum_instance import QuantumInstance
+from qiskit.utils.execution_cache import CircuitTemplate
 from qiskit.utils.backend_utils import is_aer_provider, is_statevector_backend
 from ..operator_base import OperatorBase
 from ..list_ops.list_op import ListOp
@@ -48,6 +49,12 @@ class CircuitSampler(ConverterBase):
     The CircuitSampler aggressively caches transpiled circuits to handle re-parameterization of
     the same circuit efficiently. If you are converting multiple different Operators,
     you are better off using a different CircuitSampler for each Operator to avoid cache thrashing.
+
+    When binding parameters, each transpiled circuit is used as a template: the circuit is
+    assembled once per call with the first parameter binding, and the instructions of every
+    other binding reuse that assembled skeleton, with only the parameter values that vary
+    replaced. The values of all bindings are evaluated at once as numeric arrays. With
+    ``param_qobj`` the same arrays are passed to Aer as parameterizations instead.
     """
 
     def __init__(self,
@@ -85,6 +92,7 @@ class CircuitSampler(ConverterBase):
         self._circuit_ops_cache = {}  # type: Dict[int, CircuitStateFn]
         self._transpiled_circ_cache = None  # type: Optional[List[Any]]
         self._transpiled_circ_templates = None  # type: Optional[List[Any]]
+        self._circuit_templates = None  # type: Optional[List[CircuitTemplate]]
         self._transpile_before_bind = True
         self._binding_mappings = None
 
@@ -242,6 +250,7 @@ class CircuitSampler(ConverterBase):
 
         if circuit_sfns:
             self._transpiled_circ_templates = None
+            self._circuit_templates = None
             if self._statevector:
                 circuits = [op_c.to_circuit(meas=False) for op_c in circuit_sfns]
             else:
@@ -258,12 +267,17 @@ class CircuitSampler(ConverterBase):
         else:
             circuit_sfns = list(self._circuit_ops_cache.values())
 
+        execute_bindings = None
         if param_bindings is not None:
             if self._param_qobj:
                 start_time = time()
                 ready_circs = self._prepare_parameterized_run_config(param_bindings)
                 end_time = time()
                 logger.debug('Parameter conversion %.5f (ms)', (end_time - start_time) * 1000)
+            elif self._transpile_before_bind:
+                # the quantum instance binds the assembled transpiled circuits
+                ready_circs = self._transpiled_circ_cache
+                execute_bindings = param_bindings
             else:
                 start_time = time()
                 ready_circs = [circ.assign_parameters(_filter_params(circ, binding))
@@ -275,7 +289,8 @@ class CircuitSampler(ConverterBase):
             ready_circs = self._transpiled_circ_cache
 
         results = self.quantum_instance.execute(ready_circs,
-                                                had_transpiled=self._transpile_before_bind)
+                                                had_transpiled=self._transpile_before_bind,
+                                                parameter_bindings=execute_bindings)
 
         if param_bindings is not None and self._param_qobj:
             self._clean_parameterized_run_config()
@@ -319,35 +334,13 @@ class CircuitSampler(ConverterBase):
             sampled_statefn_dicts[id(op_c)] = c_statefns
         return sampled_statefn_dicts
 
-    def _build_aer_params(self,
-                          circuit: QuantumCircuit,
-                          building_param_tables: Dict[Tuple[int, int], List[float]],
-                          input_params: Dict[Parameter, float]
-                          ) -> None:
-
-        def resolve_param(inst_param):
-            if not isinstance(inst_param, ParameterExpression):
-                return None
-            param_mappings = {}
-            for param in inst_param._parameter_symbols.keys():
-                if param not in input_params:
-                    raise ValueError('unexpected parameter: {0}'.format(param))
-                param_mappings[param] = input_params[param]
-            return float(inst_param.bind(param_mappings))
-
-        gate_index = 0
-        for inst, _, _ in circuit.data:
-            param_index = 0
-            for inst_param in inst.params:
-                val = resolve_param(inst_param)
-                if val is not None:
-                    param_key = (gate_index, param_index)
-                    if param_key in building_param_tables:
-                        building_param_tables[param_key].append(val)
-                    else:
-                        building_param_tables[param_key] = [val]
-                param_index += 1
-            gate_index += 1
+    def _get_circuit_templates(self) -> List['CircuitTemplate']:
+        """Return the parameter templates of the transpiled circuits, building them once."""
+        if self._circuit_templates is None \
+                or len(self._circuit_templates) != len(self._transpiled_circ_cache):
+            self._circuit_templates = [CircuitTemplate(circ)
+                                       for circ in self._transpiled_circ_cache]
+        return self._circuit_templates
 
     def _prepare_parameterized_run_config(self, param_bindings:
                                           List[Dict[Parameter, float]]) -> List[Any]:
@@ -364,16 +357,9 @@ class CircuitSampler(ConverterBase):
                 for circ in self._transpiled_circ_cache
             ]
 
-        for circ in self._transpiled_circ_cache:
-            building_param_tables = {}  # type: Dict[Tuple[int, int], List[float]]
-            for param_binding in param_bindings:
-                self._build_aer_params(circ, building_param_tables, param_binding)
-            param_tables = []
-            for gate_and_param_indices in building_param_tables:
-                gate_index = gate_and_param_indices[0]
-                param_index = gate_and_param_indices[1]
-                param_tables.append([
-                    [gate_index, param_index], building_param_tables[(gate_index, param_index)]])
+        for template in self._get_circuit_templates():
+            param_tables = [[list(indices), values]
+                            for indices, values in template.parameter_tables(param_bindings)]
             self.quantum_instance._run_config.parameterizations.append(param_tables)
 
         return self._transpiled_circ_templates
@@ -15,11 +15,14 @@
 from collections.abc import Iterable
 from copy import deepcopy
 from functools import partial
-from typing import List, Union, Tuple, Dict
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from qiskit import transpile, QuantumCircuit
-from qiskit.circuit import Parameter, ParameterExpression, ParameterVector
+from qiskit.circuit import Instruction, Parameter, ParameterExpression, ParameterVector
+from qiskit.providers import BaseBackend
+from qiskit.utils.quantum_instance import QuantumInstance
+from qiskit.utils.execution_cache import compile_expression
 from .circuit_gradient import CircuitGradient
 from ...operator_base import OperatorBase
 from ...state_fns.state_fn import StateFn
@@ -393,3 +396,198 @@ class ParamShift(CircuitGradient):
         if hasattr(operator, 'primitive') and isinstance(operator.primitive, ListOp):
             return [operator.__class__(op) for op in operator.primitive]
         return operator
+
+    def _plan(self,
+              operator: OperatorBase,
+              params: Union[ParameterExpression, ParameterVector, List[ParameterExpression]],
+              backend: Optional[Union[BaseBackend, QuantumInstance]] = None
+              ) -> Optional['_ShiftPlan']:
+        """Plan the batched evaluation of the first order gradient of an expectation value.
+
+        Args:
+            operator: The expectation value ``~StateFn(O) @ CircuitStateFn(circuit)``.
+            params: The parameters we are taking the gradient with respect to.
+            backend: The backend or QuantumInstance used to evaluate the shifted circuits.
+
+        Returns:
+            The gradient plan, or None if the operator or parameters are not supported by it.
+        """
+        return _ShiftPlan.from_operator(self, operator, params, backend)
+
+
+class _ShiftPlan:
+    """Gradient execution plan of an expectation value of a single parameterized circuit.
+
+    Every parameterized gate argument of the circuit is replaced with its own occurrence
+    parameter :math:`\\theta_k`. For the values :math:`v_k(\\omega)` of the original
+    argument expressions the gradient is
+
+    .. math::
+
+        \\frac{\\partial f}{\\partial \\omega_j} = \\sum_k
+        \\frac{\\partial v_k}{\\partial \\omega_j} c \\left(f(v + s e_k) - f(v - s e_k)\\right)
+
+    with the shift :math:`s` and constant :math:`c` of the parameter shift rule or the
+    finite difference. The distinct shifted vectors of all occurrences needed by any of the
+    gradient parameters are evaluated as bindings of the one template circuit, so each
+    occurrence is shifted once however many parameters its expression depends on, and a
+    backend transpiles the template only once for all gradient evaluations.
+    """
+
+    def __init__(self, template_op, occurrences, expressions, coefficients, grad_params, shift,
+                 shift_constant, sampler):
+        self._template_op = template_op
+        self._occurrences = occurrences
+        self._expressions = [compile_expression(expr) for expr in expressions]
+        # (grad param index, occurrence index, float or compiled chain rule coefficient)
+        self._coefficients = [(j, k, coeff if isinstance(coeff, float)
+                               else compile_expression(coeff))
+                              for j, k, coeff in coefficients]
+        self._grad_params = grad_params
+        self._shift = shift
+        self._shift_constant = shift_constant
+        self._sampler = sampler
+        # Occurrences shifted for at least one gradient parameter
+        self._shifted = sorted({k for _, k, _ in coefficients})
+
+    @classmethod
+    def from_operator(cls, param_shift, operator, params, backend=None):
+        """Build the plan, or return None if the operator is not a supported expectation."""
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from ...converters.circuit_sampler import CircuitSampler
+        from ...expectations.pauli_expectation import PauliExpectation
+
+        if isinstance(params, ParameterExpression):
+            grad_params = [params]
+        elif isinstance(params, (ParameterVector, list)) \
+                and all(isinstance(param, ParameterExpression) for param in params):
+            grad_params = list(params)
+        else:
+            return None
+        if not _is_circuit_expectation(operator):
+            return None
+        circuit = operator.oplist[-1].primitive
+        if not set(grad_params).issubset(circuit.parameters):
+            return None
+        if param_shift.analytic:
+            circuit = ParamShift._unroll_to_supported_operations(circuit)
+
+        # Replace every parameterized gate argument with its own occurrence parameter
+        slots = [(i, k) for i, (inst, _, _) in enumerate(circuit.data)
+                 for k, param in enumerate(inst.params)
+                 if isinstance(param, ParameterExpression) and param.parameters]
+        occurrences = ParameterVector('θ', len(slots))
+        expressions = []
+        global_phase = circuit.global_phase
+        template = QuantumCircuit(*circuit.qregs, *circuit.cregs, name=circuit.name,
+                                  global_phase=0 if isinstance(global_phase, ParameterExpression)
+                                  else global_phase)
+        data = list(circuit.data)
+        for occurrence, (i, k) in zip(occurrences, slots):
+            inst, qargs, cargs = data[i]
+            if inst is circuit.data[i][0]:
+                inst = inst.copy()
+                if type(inst)._define is not Instruction._define:
+                    # Let standard gates define themselves for their new arguments
+                    inst._definition = None
+                data[i] = (inst, qargs, cargs)
+            expressions.append(inst.params[k])
+            inst.params[k] = occurrence
+        for inst, qargs, cargs in data:
+            template.append(inst, qargs, cargs)
+        if template.parameters != set(occurrences):
+            return None
+
+        coefficients = []
+        for k, expr in enumerate(expressions):
+            for j, param in enumerate(grad_params):
+                if param not in expr.parameters:
+                    continue
+                if isinstance(expr, Parameter):
+                    coefficients.append((j, k, 1.0))
+                else:
+                    coeff = DerivativeBase.parameter_expression_grad(expr, param)
+                    if not isinstance(coeff, ParameterExpression) and coeff == 0:
+                        continue
+                    coefficients.append((j, k, coeff if isinstance(coeff, ParameterExpression)
+                                         else float(coeff)))
+
+        template_op = ParamShift._replace_operator_circuit(operator, template)
+        sampler = None
+        if backend is not None:
+            template_op = PauliExpectation().convert(template_op)
+            sampler = CircuitSampler(backend)
+        if param_shift.analytic:
+            shift, shift_constant = np.pi / 2, 0.5
+        else:
+            shift, shift_constant = param_shift.epsilon, 1. / (2 * param_shift.epsilon)
+        return cls(template_op, occurrences, expressions, coefficients, grad_params, shift,
+                   shift_constant, sampler)
+
+    @property
+    def num_occurrences(self) -> int:
+        """Return the number of parameterized gate arguments of the template circuit."""
+        return len(self._expressions)
+
+    def shifted_vectors(self, param_values: Dict[Parameter, float]
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the distinct shifted occurrence vectors for the given parameter values.
+
+        Returns:
+            The ``(U, K)`` distinct vectors, and for every shifted occurrence the indices of
+            its plus and minus shifted vectors as an array of shape ``(2, S)``.
+        """
+        base = np.array([_evaluate(expr, param_values) for expr in self._expressions],
+                        dtype=float)
+        num_shifted = len(self._shifted)
+        vectors = np.tile(base, (2 * num_shifted, 1))
+        rows = np.arange(num_shifted)
+        vectors[rows, self._shifted] += self._shift
+        vectors[num_shifted + rows, self._shifted] -= self._shift
+        vectors, inverse = np.unique(vectors, axis=0, return_inverse=True)
+        return vectors, np.reshape(inverse, (2, num_shifted))
+
+    def evaluate(self, vectors: np.ndarray) -> np.ndarray:
+        """Return the expectation values of the template bound to each occurrence vector."""
+        if self._sampler is not None:
+            bindings = {param: vectors[:, k].tolist()
+                        for k, param in enumerate(self._occurrences)}
+            results = self._sampler.convert(self._template_op, params=bindings).eval()
+        else:
+            results = [self._template_op.assign_parameters(
+                dict(zip(self._occurrences, vector))).eval() for vector in vectors.tolist()]
+        return np.real(np.asarray(results, dtype=complex))
+
+    def gradient(self, param_values: Dict[Parameter, float]) -> np.ndarray:
+        """Return the gradient with respect to the planned parameters at the given values."""
+        grad = np.zeros(len(self._grad_params))
+        if not self._shifted:
+            return grad
+        vectors, index = self.shifted_vectors(param_values)
+        values = self.evaluate(vectors)
+        diffs = dict(zip(self._shifted,
+                         self._shift_constant * (values[index[0]] - values[index[1]])))
+        for j, k, coeff in self._coefficients:
+            if not isinstance(coeff, float):
+                coeff = _evaluate(coeff, param_values)
+            grad[j] += coeff * diffs[k]
+        return grad
+
+
+def _is_circuit_expectation(operator: OperatorBase) -> bool:
+    """Return whether an operator is the expectation value of an observable with constant
+    coefficients in the state of a single parameterized circuit."""
+    if not isinstance(operator, ComposedOp) or len(operator.oplist) != 2:
+        return False
+    measurement, state = operator.oplist
+    coeffs = [operator.coeff, measurement.coeff, state.coeff]
+    return isinstance(measurement, StateFn) and measurement.is_measurement \
+        and not isinstance(measurement, CircuitStateFn) and not measurement.parameters \
+        and isinstance(state, CircuitStateFn) and not state.is_measurement \
+        and not any(isinstance(coeff, ParameterExpression) for coeff in coeffs)
+
+
+def _evaluate(function, param_values):
+    """Return the value of a compiled parameter expression."""
+    params, func = function
+    return float(np.real(func(*[param_values[param] for param in params])))
@@ -12,13 +12,16 @@
 
 """The base interface for Opflow's gradient."""
 
-from typing import Union, List
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 from qiskit.exceptions import MissingOptionalLibraryError
 from qiskit.circuit import ParameterExpression, ParameterVector
+from qiskit.providers import BaseBackend
+from qiskit.utils.quantum_instance import QuantumInstance
 from ..expectations.pauli_expectation import PauliExpectation
 from .gradient_base import GradientBase
+from .circuit_gradients.param_shift import ParamShift
 from ..list_ops.composed_op import ComposedOp
 from ..list_ops.list_op import ListOp
 from ..list_ops.summed_op import SummedOp
@@ -72,6 +75,50 @@ class Gradient(GradientBase):
         cleaned_op = self._factor_coeffs_out_of_composed_op(expec_op)
         return self.get_gradient(cleaned_op, param)
 
+    def gradient_wrapper(self,
+                         operator: OperatorBase,
+                         bind_params: Union[ParameterExpression, ParameterVector,
+                                            List[ParameterExpression]],
+                         grad_params: Optional[Union[ParameterExpression, ParameterVector,
+                                                     List[ParameterExpression],
+                                                     Tuple[ParameterExpression,
+                                                           ParameterExpression],
+                                                     List[Tuple[ParameterExpression,
+                                                                ParameterExpression]]]] = None,
+                         backend: Optional[Union[BaseBackend, QuantumInstance]] = None) \
+            -> Callable[[Iterable], np.ndarray]:
+        """Get a callable function which provides the gradient for given parameter values.
+
+        The parameter shift and finite difference gradients of the expectation value of an
+        observable in the state of a single circuit are planned once: all shifted circuits of
+        a gradient evaluation are bindings of one template circuit, evaluated in one batch,
+        and the template is only transpiled for the first evaluation. Other operators and
+        methods use :meth:`~qiskit.opflow.gradients.DerivativeBase.gradient_wrapper`.
+
+        Args:
+            operator: The operator for which we want to get the gradient.
+            bind_params: The operator parameters to which the parameter values are assigned.
+            grad_params: The parameters with respect to which we are taking the gradient.
+                If grad_params = None, then grad_params = bind_params
+            backend: The quantum backend or QuantumInstance to use to evaluate the gradient.
+
+        Returns:
+            callable(param_values): Function to compute the gradient. The function takes an
+            iterable as argument which holds the parameter values.
+        """
+        params = grad_params if grad_params else bind_params
+        plan = None
+        if isinstance(self.grad_method, ParamShift):
+            plan = self.grad_method._plan(operator, params, backend)
+        if plan is None:
+            return super().gradient_wrapper(operator, bind_params, grad_params, backend)
+
+        def gradient_fn(p_values):
+            gradient = plan.gradient(dict(zip(bind_params, p_values)))
+            return gradient[0] if isinstance(params, ParameterExpression) else gradient
+
+        return gradient_fn
+
     # pylint: disable=too-many-return-statements
     def get_gradient(self,
                      operator: OperatorBase,
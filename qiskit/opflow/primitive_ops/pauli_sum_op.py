@@ -17,6 +17,7 @@ from typing import Dict, List, Optional, Set, Tuple, Union, cast
 
 import numpy as np
 from scipy.sparse import spmatrix
+from scipy.sparse.linalg import LinearOperator
 
 from qiskit.circuit import Instruction, ParameterExpression
 from qiskit.quantum_info import Pauli, SparsePauliOp
@@ -124,7 +125,7 @@ class PauliSumOp(PrimitiveOp):
 
     def adjoint(self) -> OperatorBase:
         return PauliSumOp(
-            self.primitive.conjugate(), coeff=self.coeff.conjugate()  # type:ignore
+            self.primitive.adjoint(), coeff=self.coeff.conjugate()  # type:ignore
         )
 
     def equals(self, other: OperatorBase) -> bool:
@@ -260,7 +261,10 @@ class PauliSumOp(PrimitiveOp):
         from ..list_ops.list_op import ListOp
         from ..state_fns.circuit_state_fn import CircuitStateFn
         from ..state_fns.dict_state_fn import DictStateFn
+        from ..state_fns.pauli_evaluation import (pauli_terms, outcome_bits, dict_apply,
+                                                  vector_apply)
         from ..state_fns.state_fn import StateFn
+        from ..state_fns.vector_state_fn import VectorStateFn
         from .circuit_op import CircuitOp
         from .pauli_op import PauliOp
 
@@ -281,33 +285,24 @@ class PauliSumOp(PrimitiveOp):
                     "{} and {}, respectively.".format(self.num_qubits, front.num_qubits)
                 )
 
-            if isinstance(front, DictStateFn):
-
-                new_dict = {}  # type: Dict
-                corrected_x_bits = self.primitive.table.X[::-1]  # type: ignore
-                corrected_z_bits = self.primitive.table.Z[::-1]  # type: ignore
-                coeffs = self.primitive.coeffs  # type:ignore
-
-                for bstr, v in front.primitive.items():
-                    bitstr = np.asarray(list(bstr)).astype(np.int).astype(np.bool)
-                    new_b_str = np.logical_xor(bitstr, corrected_x_bits)
-                    new_str = ["".join(map(str, 1 * bs)) for bs in new_b_str]
-                    z_factor = np.product(1 - 2 * np.logical_and(bitstr, corrected_z_bits), axis=1)
-                    y_factor = np.product(
-                        np.sqrt(1 - 2 * np.logical_and(corrected_x_bits, corrected_z_bits) + 0j),
-                        axis=1,
-                    )
-                    for i, n_str in enumerate(new_str):
-                        new_dict[n_str] = (
-                            v * z_factor[i] * y_factor[i] * coeffs[i]
-                        ) + new_dict.get(n_str, 0)
-                    return DictStateFn(new_dict, coeff=self.coeff * front.coeff)
-
-            elif isinstance(front, StateFn) and front.is_measurement:
+            terms = pauli_terms(self)
+            if isinstance(front, DictStateFn) and not front.is_measurement:
+                bits = outcome_bits(front.primitive.keys())
+                if terms is not None and bits is not None:
+                    # The coefficient of self is already included in the terms
+                    amplitudes = np.array(list(front.primitive.values()), dtype=complex)
+                    return DictStateFn(dict_apply(terms, bits, amplitudes), coeff=front.coeff)
+
+            if isinstance(front, VectorStateFn) and not front.is_measurement \
+                    and terms is not None:
+                return VectorStateFn(vector_apply(terms, front.primitive.data),
+                                     coeff=front.coeff)
+
+            if isinstance(front, StateFn) and front.is_measurement:
                 raise ValueError("Operator composed with a measurement is undefined.")
 
             # Composable types with PauliOp
-            elif isinstance(front, (PauliSumOp, PauliOp, CircuitOp, CircuitStateFn)):
+            if isinstance(front, (PauliSumOp, PauliOp, CircuitOp, CircuitStateFn)):
                 return self.compose(front).eval()  # type: ignore
 
         # Covers VectorStateFn and OperatorStateFn
@@ -394,6 +389,23 @@ class PauliSumOp(PrimitiveOp):
         """
         return self.primitive.to_matrix(sparse=True) * self.coeff  # type: ignore
 
+    def to_linear_operator(self) -> LinearOperator:
+        """Returns a matrix-free SciPy linear operator of the ``PauliSumOp``.
+
+        The operator is applied to vectors without building its matrix, see
+        :meth:`~qiskit.quantum_info.SparsePauliOp.to_linear_operator`.
+
+        Returns:
+            The linear operator of the ``PauliSumOp``.
+
+        Raises:
+            ValueError: invalid parameters.
+        """
+        if isinstance(self.coeff, ParameterExpression):
+            raise ValueError("The coefficient of the PauliSumOp is not bound: {}".format(
+                self.coeff))
+        return (self.coeff * self.primitive).to_linear_operator()  # type: ignore
+
     @classmethod
     def from_list(
             cls,
@@ -191,6 +191,14 @@ class OperatorStateFn(StateFn):
         if not isinstance(front, OperatorBase):
             front = StateFn(front)
 
+        # Evaluate sums of Paulis on bitstring dicts and statevectors in one vectorized pass
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from .pauli_evaluation import pauli_expectation
+        if isinstance(front, StateFn):
+            expectation = pauli_expectation(self.primitive, front)
+            if expectation is not None:
+                return expectation * self.coeff
+
         if isinstance(self.primitive, ListOp) and self.primitive.distributive:
             coeff = self.coeff * self.primitive.coeff
             evals = [OperatorStateFn(op, coeff=coeff, is_measurement=self.is_measurement).eval(
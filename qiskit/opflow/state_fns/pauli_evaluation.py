@@ -0,0 +1,225 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Vectorized evaluation of sums of Paulis on DictStateFns and VectorStateFns.
+
+A Pauli with symplectic bits ``(x, z)`` acts on a basis state as
+:math:`P|b\\rangle = i^{|x \\wedge z|} (-1)^{z \\cdot b} |b \\oplus x\\rangle`. The functions
+below group the terms of a sum by their ``x`` bits, so every group permutes the basis states
+in the same way, and evaluate the signs :math:`(-1)^{z \\cdot b}` of all terms of a group at once:
+
+* For the bitstrings of a ``DictStateFn`` the parities :math:`z \\cdot b` are the matrix
+  product of the outcome bit-matrix with the ``z`` masks.
+* For a statevector the diagonal :math:`\\sum_k c_k (-1)^{z_k \\cdot b}` of a group over all
+  basis states is computed by ``group_diagonal`` of the SparsePauliOp linear operator.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from qiskit.circuit import ParameterExpression
+from qiskit.quantum_info.operators.symplectic.sparse_pauli_linear_operator import (
+    pauli_groups, group_diagonal)
+
+# Maximum number of elements of the temporary outcome x term sign matrices.
+_MAX_BLOCK_SIZE = 2 ** 22
+
+
+def pauli_terms(operator) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Return the symplectic bits and coefficients of a sum of Paulis.
+
+    Args:
+        operator (OperatorBase): a ``PauliSumOp``, ``PauliOp`` or ``SummedOp`` of ``PauliOp``.
+
+    Returns:
+        The ``(K, n)`` boolean ``x`` and ``z`` arrays and the ``K`` complex coefficients,
+        including all operator coefficients and Pauli phases, or ``None`` if the operator is
+        not a sum of Paulis with numeric coefficients.
+    """
+    # pylint: disable=cyclic-import,import-outside-toplevel
+    from ..list_ops.summed_op import SummedOp
+    from ..primitive_ops.pauli_op import PauliOp
+    from ..primitive_ops.pauli_sum_op import PauliSumOp
+
+    if isinstance(operator, PauliSumOp):
+        if isinstance(operator.coeff, ParameterExpression) \
+                or operator.primitive.coeffs.dtype == object:
+            return None
+        table = operator.primitive.table
+        return table.X, table.Z, operator.coeff * operator.primitive.coeffs
+    if isinstance(operator, PauliOp):
+        operator = SummedOp([operator])
+    if not isinstance(operator, SummedOp) or isinstance(operator.coeff, ParameterExpression) \
+            or not all(isinstance(op, PauliOp) for op in operator.oplist) \
+            or any(isinstance(op.coeff, ParameterExpression) for op in operator.oplist):
+        return None
+    x_bits = np.array([op.primitive.x for op in operator.oplist], dtype=bool)
+    z_bits = np.array([op.primitive.z for op in operator.oplist], dtype=bool)
+    coeffs = np.array([op.coeff * (-1j) ** op.primitive.phase for op in operator.oplist],
+                      dtype=complex)
+    return x_bits, z_bits, operator.coeff * coeffs
+
+
+def pauli_expectation(operator, front) -> Optional[complex]:
+    """Return the expectation value of a sum of Paulis in a DictStateFn or VectorStateFn.
+
+    Args:
+        operator (OperatorBase): a ``PauliSumOp``, ``PauliOp`` or ``SummedOp`` of ``PauliOp``.
+        front (StateFn): a ``DictStateFn`` or ``VectorStateFn`` state.
+
+    Returns:
+        The expectation value, or ``None`` if it cannot be evaluated by this module.
+    """
+    # pylint: disable=cyclic-import,import-outside-toplevel
+    from ..operator_globals import EVAL_SIG_DIGITS
+    from .dict_state_fn import DictStateFn
+    from .vector_state_fn import VectorStateFn
+
+    if not isinstance(front, (DictStateFn, VectorStateFn)) or front.is_measurement \
+            or isinstance(front.coeff, ParameterExpression):
+        return None
+    terms = pauli_terms(operator)
+    if terms is None or terms[0].shape[1] != front.num_qubits:
+        return None
+    if isinstance(front, DictStateFn):
+        bits = outcome_bits(front.primitive.keys())
+        if bits is None:
+            return None
+        amplitudes = np.array(list(front.primitive.values()), dtype=complex)
+        value = dict_expectation(terms, bits, amplitudes)
+    else:
+        vector = front.primitive.data
+        value = np.vdot(vector, vector_apply(terms, vector))
+    return np.round(value * np.abs(front.coeff) ** 2, decimals=EVAL_SIG_DIGITS)
+
+
+def outcome_bits(outcomes) -> Optional[np.ndarray]:
+    """Return the ``(M, n)`` bit-matrix of bitstrings, with column ``i`` for qubit ``i``.
+
+    Returns:
+        The bit-matrix, or ``None`` if the bitstrings are not all ``n`` characters of 0 and 1.
+    """
+    outcomes = list(outcomes)
+    if not outcomes:
+        return None
+    num_qubits = len(outcomes[0])
+    chars = np.frombuffer(''.join(outcomes).encode(), dtype=np.uint8)
+    if chars.size != num_qubits * len(outcomes) or np.any((chars != 48) & (chars != 49)):
+        return None
+    return chars.reshape(len(outcomes), num_qubits)[:, ::-1] - 48
+
+
+def dict_expectation(terms: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                     bits: np.ndarray, amplitudes: np.ndarray) -> complex:
+    """Return :math:`\\langle\\psi|H|\\psi\\rangle` for a state given by its non-zero amplitudes.
+
+    Args:
+        terms: the ``x``, ``z`` and coefficients of :math:`H` from :func:`pauli_terms`.
+        bits: the ``(M, n)`` bit-matrix of the basis states of :math:`\\psi`.
+        amplitudes: the ``M`` amplitudes of :math:`\\psi`.
+
+    Returns:
+        The expectation value.
+    """
+    keys = _row_keys(bits)
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    total = 0j
+    for x_row, group_z, group_coeffs in pauli_groups(*terms):
+        if x_row.any():
+            # Find the amplitude of the flipped bitstring b ^ x of every outcome b
+            flipped = _row_keys(bits ^ x_row)
+            pos = np.minimum(np.searchsorted(sorted_keys, flipped), len(keys) - 1)
+            found = sorted_keys[pos] == flipped
+            if not found.any():
+                continue
+            weights = np.conj(amplitudes[order[pos[found]]]) * amplitudes[found]
+            group_bits = bits[found]
+        else:
+            weights = np.abs(amplitudes) ** 2
+            group_bits = bits
+        total += np.dot(weights, _signs_dot(group_bits, group_z, group_coeffs))
+    return total
+
+
+def dict_apply(terms: Tuple[np.ndarray, np.ndarray, np.ndarray],
+               bits: np.ndarray, amplitudes: np.ndarray) -> Dict[str, complex]:
+    """Return the bitstring dict of :math:`H|\\psi\\rangle`.
+
+    Args:
+        terms: the ``x``, ``z`` and coefficients of :math:`H` from :func:`pauli_terms`.
+        bits: the ``(M, n)`` bit-matrix of the basis states of :math:`\\psi`.
+        amplitudes: the ``M`` amplitudes of :math:`\\psi`.
+
+    Returns:
+        The amplitudes of :math:`H|\\psi\\rangle` keyed by bitstring.
+    """
+    new_bits = []
+    new_values = []
+    for x_row, group_z, group_coeffs in pauli_groups(*terms):
+        new_bits.append(bits ^ x_row)
+        new_values.append(amplitudes * _signs_dot(bits, group_z, group_coeffs))
+    new_bits = np.concatenate(new_bits)
+    new_values = np.concatenate(new_values)
+    _, index, inverse = np.unique(_row_keys(new_bits), return_index=True, return_inverse=True)
+    values = np.zeros(len(index), dtype=complex)
+    np.add.at(values, inverse, new_values)
+    num_qubits = bits.shape[1]
+    strings = np.ascontiguousarray(new_bits[index, ::-1] + 48, dtype=np.uint8)
+    strings = strings.view('S{}'.format(num_qubits)).ravel().astype(str)
+    return dict(zip(strings.tolist(), values.tolist()))
+
+
+def vector_apply(terms: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                 vector: np.ndarray) -> np.ndarray:
+    """Return :math:`H|\\psi\\rangle` for a statevector :math:`\\psi`.
+
+    Args:
+        terms: the ``x``, ``z`` and coefficients of :math:`H` from :func:`pauli_terms`.
+        vector: the statevector of :math:`\\psi`.
+
+    Returns:
+        The statevector of :math:`H|\\psi\\rangle`.
+    """
+    x_bits, z_bits, coeffs = terms
+    num_qubits = x_bits.shape[1]
+    powers = 1 << np.arange(num_qubits, dtype=np.int64)
+    indices = np.arange(2 ** num_qubits, dtype=np.int64)
+    result = np.zeros(2 ** num_qubits, dtype=complex)
+    for x_row, group_z, group_coeffs in pauli_groups(x_bits, z_bits, coeffs):
+        x_int = int(x_row.astype(np.int64) @ powers) if num_qubits else 0
+        result[indices ^ x_int] += group_diagonal(group_z, group_coeffs, num_qubits) * vector
+    return result
+
+
+def _row_keys(bits):
+    """Return a sortable fixed-size bytes key of each row of a bit-matrix."""
+    packed = np.ascontiguousarray(np.packbits(bits.astype(bool), axis=1))
+    return packed.view('S{}'.format(packed.shape[1])).ravel()
+
+
+def _signs_dot(bits, z_bits, coeffs):
+    """Return :math:`\\sum_k c_k (-1)^{z_k \\cdot b}` for each row ``b`` of a bit-matrix.
+
+    The parities are computed as the matrix product of the bits with the ``z`` masks, in
+    blocks of terms that bound the size of the temporary sign matrix.
+    """
+    bits = bits.astype(np.float32)
+    z_bits = z_bits.astype(np.float32)
+    block = max(1, _MAX_BLOCK_SIZE // max(1, len(bits)))
+    result = np.zeros(len(bits), dtype=complex)
+    for start in range(0, len(coeffs), block):
+        parities = bits @ z_bits[start:start + block].T
+        signs = 1 - 2 * np.fmod(parities, 2)
+        result += signs @ coeffs[start:start + block]
+    return result
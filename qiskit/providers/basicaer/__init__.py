@@ -36,6 +36,8 @@ Simulators
    QasmSimulatorPy
    StatevectorSimulatorPy
    UnitarySimulatorPy
+   DensityMatrixSimulatorPy
+   StabilizerSimulatorPy
 
 Provider
 ========
@@ -67,6 +69,8 @@ from .basicaerjob import BasicAerJob
 from .qasm_simulator import QasmSimulatorPy
 from .statevector_simulator import StatevectorSimulatorPy
 from .unitary_simulator import UnitarySimulatorPy
+from .density_matrix_simulator import DensityMatrixSimulatorPy
+from .stabilizer_simulator import StabilizerSimulatorPy
 from .exceptions import BasicAerError
 
 # Global instance to be used as the entry point for convenience.
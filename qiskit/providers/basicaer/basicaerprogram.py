@@ -0,0 +1,352 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Compact program representation of circuits for the basic aer simulators.
+
+A :class:`BasicAerProgram` is a :class:`~qiskit.circuit.QuantumCircuit`
+lowered to flat integer opcode and float parameter arrays. The simulators
+execute these directly, skipping the construction and validation of an
+intermediate :class:`~qiskit.qobj.QasmQobj`.
+"""
+
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit, ParameterExpression
+from .exceptions import BasicAerError
+from .basicaertools import u_gate_matrices, cx_gate_matrix
+
+# Opcodes of the basic aer program instruction set
+OP_U = 0
+OP_CX = 1
+OP_UNITARY = 2
+OP_MEASURE = 3
+OP_RESET = 4
+OP_KRAUS = 5
+OP_SUPEROP = 6
+
+# Opcodes of non-unitary quantum channels
+CHANNEL_OPCODES = (OP_KRAUS, OP_SUPEROP)
+
+# Instructions that have no effect on the simulation and are dropped
+_SKIPPED_INSTRUCTIONS = ('id', 'u0', 'barrier')
+
+_U_GATES = ('U', 'u3', 'u2', 'u1')
+
+
+class BasicAerProgram:
+    """A circuit compiled to flat arrays for the basic aer simulators.
+
+    Every instruction ``i`` of the program is described by:
+
+    * ``opcodes[i]``: one of the ``OP_*`` integer opcodes.
+    * ``qargs[qarg_offsets[i]:qarg_offsets[i + 1]]``: the qubit indices.
+    * ``params[i]``: the ``(theta, phi, lambda)`` angles of ``OP_U`` gates.
+    * ``clbits[i]``: the memory slot of ``OP_MEASURE`` instructions.
+    * ``matrix_index[i]``: the index in ``matrices`` of the matrix of
+      ``OP_UNITARY`` and ``OP_SUPEROP`` instructions, or of the stacked Kraus
+      matrices of ``OP_KRAUS`` instructions.
+
+    Classically conditioned instructions are stored sparsely in ``conditions``
+    as a mapping from the instruction index to a ``(mask, value)`` pair on the
+    classical memory.
+    """
+
+    __slots__ = ('name', 'num_qubits', 'num_clbits', 'global_phase', 'header',
+                 'opcodes', 'qargs', 'qarg_offsets', 'params', 'clbits',
+                 'matrix_index', 'matrices', 'conditions')
+
+    def __init__(self, name, num_qubits, num_clbits, global_phase, header,
+                 opcodes, qargs, qarg_offsets, params, clbits, matrix_index,
+                 matrices, conditions):
+        self.name = name
+        self.num_qubits = num_qubits
+        self.num_clbits = num_clbits
+        self.global_phase = global_phase
+        self.header = header
+        self.opcodes = opcodes
+        self.qargs = qargs
+        self.qarg_offsets = qarg_offsets
+        self.params = params
+        self.clbits = clbits
+        self.matrix_index = matrix_index
+        self.matrices = matrices
+        self.conditions = conditions
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def __repr__(self):
+        return '{}(name={!r}, num_qubits={}, num_clbits={}, size={})'.format(
+            type(self).__name__, self.name, self.num_qubits, self.num_clbits,
+            len(self))
+
+    def __getstate__(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    def instructions(self):
+        """Return the program as a list of ``(opcode, qubits)`` tuples."""
+        offsets = self.qarg_offsets.tolist()
+        qargs = self.qargs.tolist()
+        return [(opcode, qargs[offsets[i]:offsets[i + 1]])
+                for i, opcode in enumerate(self.opcodes.tolist())]
+
+    def gate_matrices(self):
+        """Return the matrix of every gate instruction in the program.
+
+        The matrices of all ``OP_U`` gates are computed in a single vectorized
+        pass so that they can be reused for every shot of a simulation.
+
+        Returns:
+            list: the gate matrix for each instruction, or ``None`` for
+            non-gate instructions.
+        """
+        gates = [None] * len(self.opcodes)
+        u_ops = np.flatnonzero(self.opcodes == OP_U)
+        for i, mat in zip(u_ops.tolist(), u_gate_matrices(self.params[u_ops])):
+            gates[i] = mat
+        cx_mat = cx_gate_matrix()
+        for i in np.flatnonzero(self.opcodes == OP_CX).tolist():
+            gates[i] = cx_mat
+        for i in np.flatnonzero(self.opcodes == OP_UNITARY).tolist():
+            gates[i] = self.matrices[self.matrix_index[i]]
+        return gates
+
+    def allows_measure_sampling(self):
+        """Return True if all measurements can be sampled from the final state.
+
+        This is the case when the program contains no resets and only
+        unconditional measurements follow the first measurement.
+        """
+        opcodes = self.opcodes
+        if np.any(opcodes == OP_RESET):
+            return False
+        measures = np.flatnonzero(opcodes == OP_MEASURE)
+        if measures.size == 0:
+            return True
+        first = measures[0]
+        if any(idx >= first for idx in self.conditions):
+            return False
+        return bool(np.all(opcodes[first:] == OP_MEASURE))
+
+
+def is_circuit_input(experiments):
+    """Return True if ``experiments`` is a circuit or a list of circuits.
+
+    Raises:
+        BasicAerError: if ``experiments`` is an empty list.
+    """
+    if isinstance(experiments, QuantumCircuit):
+        return True
+    if isinstance(experiments, list) and not experiments:
+        raise BasicAerError('No circuits to run: the list of experiments is empty.')
+    return (isinstance(experiments, list) and
+            all(isinstance(exp, QuantumCircuit) for exp in experiments))
+
+
+def compile_circuits(circuits):
+    """Compile circuits into basic aer programs.
+
+    Args:
+        circuits (QuantumCircuit or list[QuantumCircuit]): the circuits to compile.
+
+    Returns:
+        list[BasicAerProgram]: the compiled programs.
+    """
+    if isinstance(circuits, QuantumCircuit):
+        circuits = [circuits]
+    return [compile_circuit(circuit) for circuit in circuits]
+
+
+def compile_circuit(circuit):
+    """Compile a single circuit into a basic aer program.
+
+    Args:
+        circuit (QuantumCircuit): a circuit in the simulator basis gates.
+
+    Returns:
+        BasicAerProgram: the compiled program.
+
+    Raises:
+        BasicAerError: if the circuit contains unbound parameters or
+            instructions not supported by the basic aer simulators.
+    """
+    qubit_indices = {bit: idx for idx, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: idx for idx, bit in enumerate(circuit.clbits)}
+    builder = _ProgramBuilder(circuit.name)
+
+    for instruction, inst_qargs, inst_cargs in circuit._data:
+        condition = None
+        if instruction.condition:
+            creg, value = instruction.condition
+            mask = 0
+            cond_val = 0
+            for pos, bit in enumerate(creg):
+                idx = clbit_indices[bit]
+                mask |= 1 << idx
+                cond_val |= ((value >> pos) & 1) << idx
+            condition = (mask, cond_val)
+        params = instruction.params
+        if instruction.name in _U_GATES:
+            params = [_bound_param(circuit.name, param) for param in params]
+        builder.append(instruction.name,
+                       [qubit_indices[qubit] for qubit in inst_qargs],
+                       [clbit_indices[clbit] for clbit in inst_cargs],
+                       params, condition)
+
+    global_phase = _bound_param(circuit.name, circuit.global_phase)
+    return builder.build(circuit.num_qubits, circuit.num_clbits, global_phase,
+                         _experiment_header(circuit, global_phase))
+
+
+def compile_experiment(experiment):
+    """Compile a qobj experiment into a basic aer program.
+
+    Args:
+        experiment (QasmQobjExperiment): an experiment from a qobj.
+
+    Returns:
+        BasicAerProgram: the compiled program.
+
+    Raises:
+        BasicAerError: if the experiment contains classically conditioned or
+            other unsupported instructions.
+    """
+    name = experiment.header.name
+    builder = _ProgramBuilder(name)
+    for instruction in experiment.instructions:
+        if instruction.name == 'bfunc' or hasattr(instruction, 'conditional'):
+            raise BasicAerError('basic aer programs do not support conditional '
+                                'qobj instructions in experiment "{}"'.format(name))
+        builder.append(instruction.name,
+                       getattr(instruction, 'qubits', []),
+                       getattr(instruction, 'memory', []),
+                       getattr(instruction, 'params', []))
+    return builder.build(experiment.config.n_qubits,
+                         experiment.config.memory_slots,
+                         float(getattr(experiment.header, 'global_phase', 0)),
+                         experiment.header.to_dict())
+
+
+class _ProgramBuilder:
+    """Accumulate instructions into the flat arrays of a program."""
+
+    def __init__(self, name):
+        self.name = name
+        self.opcodes = []
+        self.qargs = []
+        self.qarg_offsets = [0]
+        self.params = []
+        self.clbits = []
+        self.matrix_index = []
+        self.matrices = []
+        self.conditions = {}
+
+    def append(self, name, qubits, clbits, params, condition=None):
+        """Append an instruction given by name, bit indices and parameters."""
+        if name in _SKIPPED_INSTRUCTIONS:
+            return
+        angles = (0., 0., 0.)
+        clbit = -1
+        matrix = None
+        if name in _U_GATES:
+            opcode = OP_U
+            angles = _u_angles(name, [float(param) for param in params])
+        elif name in ('CX', 'cx'):
+            opcode = OP_CX
+        elif name == 'unitary':
+            opcode = OP_UNITARY
+            matrix = np.asarray(params[0], dtype=complex)
+        elif name == 'kraus':
+            opcode = OP_KRAUS
+            matrix = np.array(params, dtype=complex)
+        elif name == 'superop':
+            opcode = OP_SUPEROP
+            matrix = np.asarray(params[0], dtype=complex)
+        elif name == 'measure':
+            opcode = OP_MEASURE
+            clbit = clbits[0]
+        elif name == 'reset':
+            opcode = OP_RESET
+        else:
+            raise BasicAerError(
+                'basic aer programs do not support the "{}" instruction in '
+                'circuit "{}"'.format(name, self.name))
+
+        if condition is not None:
+            self.conditions[len(self.opcodes)] = condition
+        if matrix is not None:
+            self.matrix_index.append(len(self.matrices))
+            self.matrices.append(matrix)
+        else:
+            self.matrix_index.append(-1)
+        self.opcodes.append(opcode)
+        self.qargs.extend(qubits)
+        self.qarg_offsets.append(len(self.qargs))
+        self.params.append(angles)
+        self.clbits.append(clbit)
+
+    def build(self, num_qubits, num_clbits, global_phase, header):
+        """Return the accumulated instructions as a program."""
+        return BasicAerProgram(
+            name=self.name,
+            num_qubits=num_qubits,
+            num_clbits=num_clbits,
+            global_phase=global_phase,
+            header=header,
+            opcodes=np.array(self.opcodes, dtype=np.int8),
+            qargs=np.array(self.qargs, dtype=np.int32),
+            qarg_offsets=np.array(self.qarg_offsets, dtype=np.int32),
+            params=np.array(self.params, dtype=float).reshape(len(self.opcodes), 3),
+            clbits=np.array(self.clbits, dtype=np.int32),
+            matrix_index=np.array(self.matrix_index, dtype=np.int32),
+            matrices=self.matrices,
+            conditions=self.conditions)
+
+
+def _u_angles(name, params):
+    """Return the (theta, phi, lambda) angles of a U-type gate."""
+    if name in ('U', 'u3'):
+        return params[0], params[1], params[2]
+    if name == 'u2':
+        return np.pi / 2, params[0], params[1]
+    return 0., 0., params[0]
+
+
+def _bound_param(name, param):
+    """Return a bound parameter as a float."""
+    if isinstance(param, ParameterExpression) and param.parameters:
+        raise BasicAerError('circuit "{}" contains unbound parameters {}'.format(
+            name, param.parameters))
+    return float(param)
+
+
+def _experiment_header(circuit, global_phase):
+    """Return the experiment result header dict for a circuit."""
+    qubit_labels = []
+    clbit_labels = []
+    for qreg in circuit.qregs:
+        qubit_labels.extend([qreg.name, j] for j in range(qreg.size))
+    for creg in circuit.cregs:
+        clbit_labels.extend([creg.name, j] for j in range(creg.size))
+    return {'qubit_labels': qubit_labels,
+            'n_qubits': circuit.num_qubits,
+            'qreg_sizes': [[qreg.name, qreg.size] for qreg in circuit.qregs],
+            'clbit_labels': clbit_labels,
+            'memory_slots': circuit.num_clbits,
+            'creg_sizes': [[creg.name, creg.size] for creg in circuit.cregs],
+            'name': circuit.name,
+            'global_phase': global_phase,
+            'metadata': circuit.metadata if circuit.metadata is not None else {}}
@@ -24,6 +24,8 @@ from qiskit.providers.providerutils import resolve_backend_name, filter_backends
 from .qasm_simulator import QasmSimulatorPy
 from .statevector_simulator import StatevectorSimulatorPy
 from .unitary_simulator import UnitarySimulatorPy
+from .density_matrix_simulator import DensityMatrixSimulatorPy
+from .stabilizer_simulator import StabilizerSimulatorPy
 
 
 logger = logging.getLogger(__name__)
@@ -31,7 +33,9 @@ logger = logging.getLogger(__name__)
 SIMULATORS = [
     QasmSimulatorPy,
     StatevectorSimulatorPy,
-    UnitarySimulatorPy
+    UnitarySimulatorPy,
+    DensityMatrixSimulatorPy,
+    StabilizerSimulatorPy
 ]
 
 
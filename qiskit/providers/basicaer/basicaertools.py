@@ -61,6 +61,26 @@ def single_gate_matrix(gate, params=None):
                       np.exp(1j * phi + 1j * lam) * np.cos(theta / 2)]])
 
 
+def u_gate_matrices(params):
+    """Get the matrices for a stack of single qubit U gates.
+
+    Args:
+        params(array): an array of shape (k, 3) of (theta, phi, lam) angles.
+    Returns:
+        array: A numpy array of shape (k, 2, 2) of gate matrices
+    """
+    params = np.asarray(params, dtype=float).reshape(-1, 3)
+    theta, phi, lam = params[:, 0], params[:, 1], params[:, 2]
+    cos = np.cos(theta / 2)
+    sin = np.sin(theta / 2)
+    mats = np.empty((len(params), 2, 2), dtype=complex)
+    mats[:, 0, 0] = cos
+    mats[:, 0, 1] = -np.exp(1j * lam) * sin
+    mats[:, 1, 0] = np.exp(1j * phi) * sin
+    mats[:, 1, 1] = np.exp(1j * (phi + lam)) * cos
+    return mats
+
+
 def cx_gate_matrix():
     """Get the matrix for a controlled-NOT gate."""
     return np.array([[1, 0, 0, 0],
@@ -69,6 +89,29 @@ def cx_gate_matrix():
                      [0, 1, 0, 0]], dtype=complex)
 
 
+def kraus_superop_matrix(kraus):
+    """Get the column-stacking superoperator matrix of a Kraus channel.
+
+    Args:
+        kraus(array): an array of shape (k, d, d) of Kraus matrices.
+    Returns:
+        array: A numpy array of shape (d**2, d**2)
+    """
+    kraus = np.asarray(kraus, dtype=complex)
+    dim = kraus.shape[-1]
+    # sum_k conj(K_k) (x) K_k as a single contraction over the Kraus index
+    superop = np.einsum('kab,kcd->acbd', np.conj(kraus), kraus)
+    return np.reshape(superop, (dim ** 2, dim ** 2))
+
+
+def reset_superop_matrix():
+    """Get the superoperator matrix of a single qubit reset."""
+    return np.array([[1, 0, 0, 1],
+                     [0, 0, 0, 0],
+                     [0, 0, 0, 0],
+                     [0, 0, 0, 0]], dtype=complex)
+
+
 def einsum_matmul_index(gate_indices, number_of_qubits):
     """Return the index string for Numpy.einsum matrix-matrix multiplication.
 
@@ -0,0 +1,498 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=arguments-differ
+
+"""Contains a (slow) Python density matrix simulator.
+
+It simulates a noisy quantum circuit by evolving the full density matrix of
+the circuit through its gates and Kraus or superoperator noise channels.
+It is exponential (4**n) in the number of qubits.
+
+.. code-block:: python
+
+    DensityMatrixSimulatorPy().run(qobj)
+
+Where the input is a Qobj object, or a circuit or list of circuits, and the
+output is a BasicAerJob object, which can later be queried for the Result
+object. The result will contain 'counts' and optionally 'memory' data fields
+for circuits with measurements, or the final 'density_matrix' for circuits
+without measurements.
+
+Noise channels are added to circuits as ``kraus`` or ``superop`` instructions,
+for example with ``circuit.append(Kraus(ops).to_instruction(), qubits)``.
+"""
+
+import uuid
+import time
+import logging
+import functools
+
+from math import log2, sqrt
+from collections import Counter
+import numpy as np
+
+from qiskit.utils.multiprocessing import local_hardware_info
+from qiskit.providers.models import QasmBackendConfiguration
+from qiskit.result import Result
+from qiskit.providers import BaseBackend
+from qiskit.providers.basicaer.basicaerjob import BasicAerJob
+from .exceptions import BasicAerError
+from .basicaertools import kraus_superop_matrix, reset_superop_matrix
+from .basicaerprogram import OP_MEASURE, OP_RESET, OP_KRAUS, OP_SUPEROP
+from .basicaerprogram import compile_circuits, compile_experiment, is_circuit_input
+
+logger = logging.getLogger(__name__)
+
+
+class DensityMatrixSimulatorPy(BaseBackend):
+    """Python implementation of a noisy density matrix simulator."""
+
+    MAX_QUBITS_MEMORY = int(log2(sqrt(local_hardware_info()['memory'] * (1024 ** 3) / 32)))
+
+    DEFAULT_CONFIGURATION = {
+        'backend_name': 'density_matrix_simulator',
+        'backend_version': '1.0.0',
+        'n_qubits': min(24, MAX_QUBITS_MEMORY),
+        'url': 'https://github.com/Qiskit/qiskit-terra',
+        'simulator': True,
+        'local': True,
+        'conditional': False,
+        'open_pulse': False,
+        'memory': True,
+        'max_shots': 65536,
+        'coupling_map': None,
+        'description': 'A python density matrix simulator for noisy qasm experiments',
+        'basis_gates': ['u1', 'u2', 'u3', 'cx', 'id', 'unitary', 'kraus', 'superop'],
+        'gates': [
+            {
+                'name': 'u1',
+                'parameters': ['lambda'],
+                'qasm_def': 'gate u1(lambda) q { U(0,0,lambda) q; }'
+            },
+            {
+                'name': 'u2',
+                'parameters': ['phi', 'lambda'],
+                'qasm_def': 'gate u2(phi,lambda) q { U(pi/2,phi,lambda) q; }'
+            },
+            {
+                'name': 'u3',
+                'parameters': ['theta', 'phi', 'lambda'],
+                'qasm_def': 'gate u3(theta,phi,lambda) q { U(theta,phi,lambda) q; }'
+            },
+            {
+                'name': 'cx',
+                'parameters': ['c', 't'],
+                'qasm_def': 'gate cx c,t { CX c,t; }'
+            },
+            {
+                'name': 'id',
+                'parameters': ['a'],
+                'qasm_def': 'gate id a { U(0,0,0) a; }'
+            },
+            {
+                'name': 'unitary',
+                'parameters': ['matrix'],
+                'qasm_def': 'unitary(matrix) q1, q2,...'
+            },
+            {
+                'name': 'kraus',
+                'parameters': ['matrices'],
+                'qasm_def': 'kraus(matrices) q1, q2,...'
+            },
+            {
+                'name': 'superop',
+                'parameters': ['matrix'],
+                'qasm_def': 'superop(matrix) q1, q2,...'
+            }
+        ]
+    }
+
+    DEFAULT_OPTIONS = {
+        "chop_threshold": 1e-15
+    }
+
+    def __init__(self, configuration=None, provider=None):
+        super().__init__(configuration=(
+            configuration or QasmBackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
+                         provider=provider)
+
+        # Define attributes in __init__.
+        self._local_random = np.random.RandomState()
+        self._densitymatrix = None
+        self._buffer = None
+        self._classical_memory = 0
+        self._number_of_qubits = 0
+        self._shots = 0
+        self._memory = False
+        self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+
+    def _contract(self, mat, indices):
+        """Left multiply density matrix tensor indices by a matrix in place.
+
+        The result is written into the preallocated work buffer, which is
+        then swapped with the density matrix so that no arrays are allocated.
+
+        Args:
+            mat (np.array): a matrix reshaped to a rank-2M tensor.
+            indices (list[int]): the density matrix tensor indices to contract.
+        """
+        rank = 2 * self._number_of_qubits
+        indices_rho = list(range(rank))
+        for j, index in enumerate(indices):
+            indices_rho[index] = rank + j
+        mat_contract = list(reversed(range(rank, rank + len(indices))))
+        mat_free = list(reversed(indices))
+        np.einsum(mat, mat_free + mat_contract, self._densitymatrix, indices_rho,
+                  list(range(rank)), out=self._buffer)
+        self._densitymatrix, self._buffer = self._buffer, self._densitymatrix
+
+    def _row_indices(self, qubits):
+        """Return the density matrix row tensor indices of qubits"""
+        return [self._number_of_qubits - 1 - qubit for qubit in qubits]
+
+    def _col_indices(self, qubits):
+        """Return the density matrix column tensor indices of qubits"""
+        return [2 * self._number_of_qubits - 1 - qubit for qubit in qubits]
+
+    def _add_unitary(self, gate, qubits):
+        """Apply an N-qubit matrix ``rho -> U.rho.U^dagger``.
+
+        Args:
+            gate (matrix_like): an N-qubit matrix
+            qubits (list): the list of N-qubits.
+        """
+        gate_tensor = np.reshape(np.asarray(gate, dtype=complex),
+                                 len(qubits) * [2, 2])
+        self._contract(gate_tensor, self._row_indices(qubits))
+        self._contract(np.conj(gate_tensor), self._col_indices(qubits))
+
+    def _add_superop(self, superop, qubits):
+        """Apply an N-qubit column-stacking superoperator matrix.
+
+        Args:
+            superop (matrix_like): a 4**N x 4**N superoperator matrix
+            qubits (list): the list of N-qubits.
+        """
+        superop_tensor = np.reshape(np.asarray(superop, dtype=complex),
+                                    len(qubits) * [2, 2, 2, 2])
+        self._contract(superop_tensor,
+                       self._row_indices(qubits) + self._col_indices(qubits))
+
+    def _probabilities(self):
+        """Return the measurement probabilities as a rank-N tensor"""
+        dim = 2 ** self._number_of_qubits
+        diag = np.real(np.diagonal(np.reshape(self._densitymatrix, (dim, dim))))
+        return np.reshape(diag, self._number_of_qubits * [2])
+
+    def _add_qasm_measure(self, qubit, cmembit):
+        """Apply a measure instruction to a qubit.
+
+        Args:
+            qubit (int): qubit is the qubit measured.
+            cmembit (int): is the classical memory bit to store outcome in.
+        """
+        axis = list(range(self._number_of_qubits))
+        axis.remove(self._number_of_qubits - 1 - qubit)
+        probabilities = np.sum(self._probabilities(), axis=tuple(axis))
+        outcome = int(self._local_random.rand() >= probabilities[0])
+        probability = probabilities[outcome]
+        membit = 1 << cmembit
+        self._classical_memory = (self._classical_memory & (~membit)) | (outcome << cmembit)
+        # Project onto the outcome and renormalize
+        update = np.zeros((2, 2))
+        update[outcome, outcome] = 1 / np.sqrt(probability)
+        self._add_unitary(update, [qubit])
+
+    def _add_sample_measure(self, measure_params, num_samples):
+        """Generate memory samples from the current density matrix.
+
+        Args:
+            measure_params (list): List of (qubit, cmembit) values for
+                                   measure instructions to sample.
+            num_samples (int): The number of memory samples to generate.
+
+        Returns:
+            list: A list of memory values in hex format.
+        """
+        measured_qubits = sorted({qubit for qubit, _ in measure_params})
+        num_measured = len(measured_qubits)
+        axis = list(range(self._number_of_qubits))
+        for qubit in reversed(measured_qubits):
+            axis.remove(self._number_of_qubits - 1 - qubit)
+        probabilities = np.reshape(np.sum(self._probabilities(), axis=tuple(axis)),
+                                   2 ** num_measured)
+        probabilities = np.clip(probabilities, 0, None)
+        probabilities /= np.sum(probabilities)
+        samples = self._local_random.choice(2 ** num_measured, num_samples,
+                                            p=probabilities)
+        # Map each sampled outcome onto the classical memory once, then look
+        # up the hex strings of the samples
+        outcomes = np.arange(2 ** num_measured)
+        values = np.zeros(2 ** num_measured, dtype=object)
+        for qubit, cmembit in measure_params:
+            pos = measured_qubits.index(qubit)
+            bits = (outcomes >> pos) & 1
+            values = (values & ~(1 << cmembit)) | (bits.astype(object) << cmembit)
+        hex_values = [hex(value) for value in values]
+        return [hex_values[sample] for sample in samples]
+
+    def _initialize_densitymatrix(self):
+        """Set the initial density matrix and work buffer for simulation"""
+        shape = 2 * self._number_of_qubits * [2]
+        self._densitymatrix = np.zeros(shape, dtype=complex)
+        self._densitymatrix.reshape(-1)[0] = 1
+        self._buffer = np.empty(shape, dtype=complex)
+
+    def _get_densitymatrix(self):
+        """Return the current density matrix"""
+        dim = 2 ** self._number_of_qubits
+        mat = np.reshape(self._densitymatrix, (dim, dim)).copy()
+        mat[abs(mat) < self._chop_threshold] = 0.0
+        return mat
+
+    def _set_options(self, qobj_config=None, backend_options=None):
+        """Set the backend options for all experiments in a qobj"""
+        self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        if backend_options is None:
+            backend_options = {}
+        if 'chop_threshold' in backend_options:
+            self._chop_threshold = backend_options['chop_threshold']
+        elif hasattr(qobj_config, 'chop_threshold'):
+            self._chop_threshold = qobj_config.chop_threshold
+
+    def run(self, qobj, backend_options=None, **run_options):
+        """Run qobj asynchronously.
+
+        Args:
+            qobj (Qobj or QuantumCircuit or list): payload of the experiment.
+                If a circuit or list of circuits is given they are compiled
+                directly into simulator programs without assembling a qobj.
+            backend_options (dict): backend options
+            run_options (dict): run configuration used when running circuits
+                directly. It may contain ``shots`` (default 1024), ``memory``
+                (default False) and ``seed_simulator``, as well as any of the
+                backend options.
+
+        Returns:
+            BasicAerJob: derived from BaseJob
+
+        Additional Information:
+            backend_options: Is a dict of options for the backend. It may contain
+                * "chop_threshold": double
+
+            The "chop_threshold" option specifies a truncation value for
+            setting small values to zero in the output density matrix. The
+            default value is 1e-15.
+        """
+        if is_circuit_input(qobj):
+            options = dict(run_options)
+            options.update(backend_options or {})
+            self._set_options(backend_options=options)
+            run_config = {'shots': options.get('shots', 1024),
+                          'memory': options.get('memory', False),
+                          'seed_simulator': options.get('seed_simulator')}
+            job_id = str(uuid.uuid4())
+            job = BasicAerJob(self, job_id,
+                              functools.partial(self._run_programs, run_config=run_config),
+                              compile_circuits(qobj))
+            job.submit()
+            return job
+        self._set_options(qobj_config=qobj.config,
+                          backend_options=backend_options)
+        job_id = str(uuid.uuid4())
+        job = BasicAerJob(self, job_id, self._run_job, qobj)
+        job.submit()
+        return job
+
+    def _run_job(self, job_id, qobj):
+        """Run experiments in qobj
+
+        Args:
+            job_id (str): unique id for the job.
+            qobj (Qobj): job description
+
+        Returns:
+            Result: Result object
+        """
+        programs = [compile_experiment(experiment) for experiment in qobj.experiments]
+        run_config = {'shots': qobj.config.shots,
+                      'memory': getattr(qobj.config, 'memory', False),
+                      'seed_simulator': getattr(qobj.config, 'seed_simulator', None)}
+        return self._run_programs(job_id, programs, run_config,
+                                  qobj_id=qobj.qobj_id, header=qobj.header.to_dict())
+
+    def _run_programs(self, job_id, programs, run_config, qobj_id=None, header=None):
+        """Run compiled circuit programs.
+
+        Args:
+            job_id (str): unique id for the job.
+            programs (list[BasicAerProgram]): the compiled circuits.
+            run_config (dict): the ``shots``, ``memory`` and
+                ``seed_simulator`` run options.
+            qobj_id (str): the id of the qobj the programs were compiled from.
+            header (dict): the header of the qobj the programs were compiled from.
+
+        Returns:
+            Result: Result object
+        """
+        self._validate_programs(programs)
+        self._shots = run_config['shots']
+        self._memory = run_config['memory']
+        start = time.time()
+        result_list = [self.run_program(program, run_config['seed_simulator'])
+                       for program in programs]
+        end = time.time()
+        result = {'backend_name': self.name(),
+                  'backend_version': self._configuration.backend_version,
+                  'qobj_id': qobj_id or str(uuid.uuid4()),
+                  'job_id': job_id,
+                  'results': result_list,
+                  'status': 'COMPLETED',
+                  'success': True,
+                  'time_taken': (end - start),
+                  'header': header or {
+                      'backend_name': self.name(),
+                      'backend_version': self._configuration.backend_version}}
+
+        return Result.from_dict(result)
+
+    def run_program(self, program, seed_simulator=None):
+        """Run a compiled circuit program and return a single experiment result.
+
+        Circuits whose measurements are all at the end are evolved once and
+        all shots are sampled from the final density matrix. Otherwise the
+        evolution up to the first measurement is shared by all shots and
+        only the remainder of the circuit is simulated per shot.
+
+        Args:
+            program (BasicAerProgram): the compiled circuit.
+            seed_simulator (int or None): the simulator seed.
+
+        Returns:
+             dict: A result dictionary which looks something like::
+
+                {
+                "name": name of this experiment (obtained from qobj.experiment header)
+                "seed": random seed used for simulation
+                "shots": number of shots used in the simulation
+                "data":
+                    {
+                    "counts": {'0x9: 5, ...},
+                    "memory": ['0x9', '0xF', '0x1D', ..., '0x9'],
+                    "density_matrix": array for circuits without measurements
+                    },
+                "status": status string for the simulation
+                "success": boolean
+                "time_taken": simulation time of this single experiment
+                }
+        """
+        start = time.time()
+        self._number_of_qubits = program.num_qubits
+        self._classical_memory = 0
+        if seed_simulator is None:
+            # For compatibility on Windows force dyte to be int32
+            # and set the maximum value to be (2 ** 31) - 1
+            seed_simulator = np.random.randint(2147483647, dtype='int32')
+        self._local_random.seed(seed=seed_simulator)
+
+        # Decode the program once into per-instruction kernels
+        instructions = program.instructions()
+        clbits = program.clbits.tolist()
+        kernels = self._decode_kernels(program)
+        measures = [i for i, (opcode, _) in enumerate(instructions) if opcode == OP_MEASURE]
+        first_measure = measures[0] if measures else len(instructions)
+
+        # Evolve the common prefix of all shots up to the first measurement
+        self._initialize_densitymatrix()
+        for i in range(first_measure):
+            self._apply_kernel(kernels[i], instructions[i][1])
+
+        memory = []
+        data = {}
+        if not measures:
+            data['density_matrix'] = self._get_densitymatrix()
+        elif all(opcode == OP_MEASURE for opcode, _ in instructions[first_measure:]):
+            if program.num_clbits > 0:
+                measure_params = [(instructions[i][1][0], clbits[i]) for i in measures]
+                memory = self._add_sample_measure(measure_params, self._shots)
+        else:
+            prefix = self._densitymatrix.copy()
+            for _ in range(self._shots):
+                np.copyto(self._densitymatrix, prefix)
+                self._classical_memory = 0
+                for i in range(first_measure, len(instructions)):
+                    qubits = instructions[i][1]
+                    if kernels[i] is None:
+                        self._add_qasm_measure(qubits[0], clbits[i])
+                    else:
+                        self._apply_kernel(kernels[i], qubits)
+                if program.num_clbits > 0:
+                    memory.append(hex(self._classical_memory))
+
+        if measures:
+            data['counts'] = dict(Counter(memory))
+            if self._memory:
+                data['memory'] = memory
+        end = time.time()
+        return {'name': program.name,
+                'seed_simulator': seed_simulator,
+                'shots': self._shots,
+                'data': data,
+                'status': 'DONE',
+                'success': True,
+                'time_taken': (end - start),
+                'header': program.header}
+
+    @staticmethod
+    def _decode_kernels(program):
+        """Return a ``(is_superop, matrix)`` kernel for each instruction.
+
+        Gates are applied as ``U.rho.U^dagger`` and channels as superoperators,
+        with Kraus channels converted to superoperators once per program.
+        Measurements have a ``None`` kernel.
+        """
+        kernels = []
+        gates = program.gate_matrices()
+        for i, opcode in enumerate(program.opcodes.tolist()):
+            if opcode == OP_MEASURE:
+                kernels.append(None)
+            elif opcode == OP_RESET:
+                kernels.append((True, reset_superop_matrix()))
+            elif opcode == OP_KRAUS:
+                kraus = program.matrices[program.matrix_index[i]]
+                kernels.append((True, kraus_superop_matrix(kraus)))
+            elif opcode == OP_SUPEROP:
+                kernels.append((True, program.matrices[program.matrix_index[i]]))
+            else:
+                kernels.append((False, gates[i]))
+        return kernels
+
+    def _apply_kernel(self, kernel, qubits):
+        """Apply a decoded gate or channel kernel to qubits."""
+        is_superop, mat = kernel
+        if is_superop:
+            self._add_superop(mat, qubits)
+        else:
+            self._add_unitary(mat, qubits)
+
+    def _validate_programs(self, programs):
+        """Semantic validations of compiled circuit programs."""
+        max_qubits = self.configuration().n_qubits
+        for program in programs:
+            if program.num_qubits > max_qubits:
+                raise BasicAerError('Number of qubits {} '.format(program.num_qubits) +
+                                    'is greater than maximum ({}) '.format(max_qubits) +
+                                    'for "{}".'.format(self.name()))
+            if program.conditions:
+                raise BasicAerError('Unsupported conditional instruction '
+                                    'in circuit "{}"'.format(program.name))
@@ -31,6 +31,7 @@ field, which is a result of measurements for each shot.
 import uuid
 import time
 import logging
+import functools
 
 from math import log2
 from collections import Counter
@@ -45,6 +46,8 @@ from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
 from .basicaertools import einsum_vecmul_index
+from .basicaerprogram import OP_MEASURE, OP_RESET, CHANNEL_OPCODES
+from .basicaerprogram import compile_circuits, is_circuit_input
 
 logger = logging.getLogger(__name__)
 
@@ -143,7 +146,7 @@ class QasmSimulatorPy(BaseBackend):
         # Compute einsum index string for 1-qubit matrix multiplication
         indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
         # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
+        gate_tensor = np.reshape(np.asarray(gate, dtype=complex),
                                  num_qubits * [2, 2])
         # Apply matrix multiplication
         self._statevector = np.einsum(indexes, gate_tensor, self._statevector,
@@ -361,12 +364,18 @@ class QasmSimulatorPy(BaseBackend):
             # measure sampling is allowed
             self._sample_measure = True
 
-    def run(self, qobj, backend_options=None):
+    def run(self, qobj, backend_options=None, **run_options):
         """Run qobj asynchronously.
 
         Args:
-            qobj (Qobj): payload of the experiment
+            qobj (Qobj or QuantumCircuit or list): payload of the experiment.
+                If a circuit or list of circuits is given they are compiled
+                directly into simulator programs without assembling a qobj.
             backend_options (dict): backend options
+            run_options (dict): run configuration used when running circuits
+                directly. It may contain ``shots`` (default 1024), ``memory``
+                (default False) and ``seed_simulator``, as well as any of the
+                backend options.
 
         Returns:
             BasicAerJob: derived from BaseJob
@@ -385,7 +394,13 @@ class QasmSimulatorPy(BaseBackend):
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
                 }
+
+            Circuits can be run directly, for example::
+
+                job = backend.run(circuits, shots=2048, memory=True)
         """
+        if is_circuit_input(qobj):
+            return self._run_circuits(qobj, backend_options, run_options)
         self._set_options(qobj_config=qobj.config,
                           backend_options=backend_options)
         job_id = str(uuid.uuid4())
@@ -393,6 +408,22 @@ class QasmSimulatorPy(BaseBackend):
         job.submit()
         return job
 
+    def _run_circuits(self, circuits, backend_options, run_options):
+        """Compile circuits into programs and run them asynchronously."""
+        options = dict(run_options)
+        options.update(backend_options or {})
+        self._set_options(backend_options=options)
+        run_config = {'shots': options.get('shots', 1024),
+                      'memory': options.get('memory', False),
+                      'seed_simulator': options.get('seed_simulator')}
+        programs = compile_circuits(circuits)
+        job_id = str(uuid.uuid4())
+        job = BasicAerJob(self, job_id,
+                          functools.partial(self._run_programs, run_config=run_config),
+                          programs)
+        job.submit()
+        return job
+
     def _run_job(self, job_id, qobj):
         """Run experiments in qobj
 
@@ -593,6 +624,19 @@ class QasmSimulatorPy(BaseBackend):
                     outcome = bin(self._classical_memory)[2:]
                     memory.append(hex(int(outcome, 2)))
 
+        data = self._get_data(memory)
+        end = time.time()
+        return {'name': experiment.header.name,
+                'seed_simulator': seed_simulator,
+                'shots': self._shots,
+                'data': data,
+                'status': 'DONE',
+                'success': True,
+                'time_taken': (end - start),
+                'header': experiment.header.to_dict()}
+
+    def _get_data(self, memory):
+        """Return the experiment result data for the simulated memory."""
         # Add data
         data = {'counts': dict(Counter(memory))}
         # Optionally add memory list
@@ -606,15 +650,139 @@ class QasmSimulatorPy(BaseBackend):
                 data.pop('counts')
             if 'memory' in data and not data['memory']:
                 data.pop('memory')
+        return data
+
+    def _run_programs(self, job_id, programs, run_config):
+        """Run compiled circuit programs.
+
+        Args:
+            job_id (str): unique id for the job.
+            programs (list[BasicAerProgram]): the compiled circuits.
+            run_config (dict): the ``shots``, ``memory`` and
+                ``seed_simulator`` run options.
+
+        Returns:
+            Result: Result object
+        """
+        self._validate_programs(programs, run_config)
+        self._shots = run_config['shots']
+        self._memory = run_config['memory']
+        self._qobj_config = None
+        start = time.time()
+        result_list = [self.run_program(program, run_config['seed_simulator'])
+                       for program in programs]
         end = time.time()
-        return {'name': experiment.header.name,
+        result = {'backend_name': self.name(),
+                  'backend_version': self._configuration.backend_version,
+                  'qobj_id': str(uuid.uuid4()),
+                  'job_id': job_id,
+                  'results': result_list,
+                  'status': 'COMPLETED',
+                  'success': True,
+                  'time_taken': (end - start),
+                  'header': {'backend_name': self.name(),
+                             'backend_version': self._configuration.backend_version}}
+
+        return Result.from_dict(result)
+
+    def run_program(self, program, seed_simulator=None):
+        """Run a compiled circuit program and return a single experiment result.
+
+        This is the counterpart of :meth:`run_experiment` for circuits compiled
+        with :func:`~qiskit.providers.basicaer.basicaerprogram.compile_circuit`.
+
+        Args:
+            program (BasicAerProgram): the compiled circuit.
+            seed_simulator (int or None): the simulator seed.
+
+        Returns:
+            dict: A result dictionary in the format of :meth:`run_experiment`.
+        """
+        start = time.time()
+        self._number_of_qubits = program.num_qubits
+        self._number_of_cmembits = program.num_clbits
+        self._statevector = 0
+        self._classical_memory = 0
+        self._classical_register = 0
+        # Validate the dimension of initial statevector if set
+        self._validate_initial_statevector()
+        if seed_simulator is None:
+            # For compatibility on Windows force dyte to be int32
+            # and set the maximum value to be (2 ** 31) - 1
+            seed_simulator = np.random.randint(2147483647, dtype='int32')
+        self._local_random.seed(seed=seed_simulator)
+        # If shots=1 we disable measure sampling so the statevector simulator
+        # returns the final state without silently dropping final measurements.
+        self._sample_measure = self._shots > 1 and program.allows_measure_sampling()
+
+        # Decode the program once for all shots
+        gates = program.gate_matrices()
+        instructions = program.instructions()
+        clbits = program.clbits.tolist()
+        conditions = program.conditions
+        phase = np.exp(1j * program.global_phase)
+
+        memory = []
+        if self._sample_measure:
+            shots = 1
+            measure_sample_ops = [(qubits[0], clbits[i])
+                                  for i, (opcode, qubits) in enumerate(instructions)
+                                  if opcode == OP_MEASURE]
+        else:
+            shots = self._shots
+        for _ in range(shots):
+            self._initialize_statevector()
+            self._statevector *= phase
+            self._classical_memory = 0
+            for i, (opcode, qubits) in enumerate(instructions):
+                if conditions and i in conditions:
+                    mask, val = conditions[i]
+                    if self._classical_memory & mask != val:
+                        continue
+                if opcode == OP_MEASURE:
+                    if not self._sample_measure:
+                        self._add_qasm_measure(qubits[0], clbits[i])
+                elif opcode == OP_RESET:
+                    self._add_qasm_reset(qubits[0])
+                else:
+                    self._add_unitary(gates[i], qubits)
+
+            # Add final creg data to memory list
+            if self._number_of_cmembits > 0:
+                if self._sample_measure:
+                    memory = self._add_sample_measure(measure_sample_ops, self._shots)
+                else:
+                    memory.append(hex(self._classical_memory))
+
+        data = self._get_data(memory)
+        end = time.time()
+        return {'name': program.name,
                 'seed_simulator': seed_simulator,
                 'shots': self._shots,
                 'data': data,
                 'status': 'DONE',
                 'success': True,
                 'time_taken': (end - start),
-                'header': experiment.header.to_dict()}
+                'header': program.header}
+
+    def _validate_programs(self, programs, run_config):
+        """Semantic validations of compiled circuit programs."""
+        # pylint: disable=unused-argument
+        max_qubits = self.configuration().n_qubits
+        for program in programs:
+            if program.num_qubits > max_qubits:
+                raise BasicAerError('Number of qubits {} '.format(program.num_qubits) +
+                                    'is greater than maximum ({}) '.format(max_qubits) +
+                                    'for "{}".'.format(self.name()))
+            if np.any(np.isin(program.opcodes, CHANNEL_OPCODES)):
+                raise BasicAerError('Unsupported quantum channel instruction '
+                                    'in circuit "{}"'.format(program.name))
+            if program.num_clbits == 0:
+                logger.warning('No classical registers in circuit "%s", '
+                               'counts will be empty.', program.name)
+            elif not np.any(program.opcodes == OP_MEASURE):
+                logger.warning('No measurements in circuit "%s", '
+                               'classical register will remain all zeros.', program.name)
 
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas."""
@@ -0,0 +1,372 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=arguments-differ,protected-access
+
+"""Contains a Python stabilizer simulator for Clifford circuits.
+
+It simulates circuits of Clifford gates, measurements and resets with a
+:class:`~qiskit.quantum_info.StabilizerState`, whose bit-packed tableau is
+quadratic in the number of qubits, so that circuits of thousands of qubits
+can be simulated.
+
+.. code-block:: python
+
+    StabilizerSimulatorPy().run(qobj)
+
+Where the input is a Qobj object, or a circuit or list of circuits, and the
+output is a BasicAerJob object, which can later be queried for the Result
+object. The result will contain 'counts' and optionally 'memory' data fields
+for circuits with measurements, or the final 'stabilizer' generators for
+circuits without measurements.
+"""
+
+import uuid
+import time
+import logging
+import functools
+
+from collections import Counter, namedtuple
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.providers.models import QasmBackendConfiguration
+from qiskit.quantum_info.states.stabilizerstate import StabilizerState, _append_instruction
+from qiskit.result import Result
+from qiskit.providers import BaseBackend
+from qiskit.providers.basicaer.basicaerjob import BasicAerJob
+from .exceptions import BasicAerError
+from .basicaerprogram import is_circuit_input, _experiment_header
+
+logger = logging.getLogger(__name__)
+
+# A circuit as a list of (name, qubits, clbits) instructions
+_Experiment = namedtuple('_Experiment', ['name', 'num_qubits', 'num_clbits', 'header',
+                                         'instructions'])
+
+
+class StabilizerSimulatorPy(BaseBackend):
+    """Python implementation of a stabilizer simulator for Clifford circuits."""
+
+    DEFAULT_CONFIGURATION = {
+        'backend_name': 'stabilizer_simulator',
+        'backend_version': '1.0.0',
+        'n_qubits': 5000,
+        'url': 'https://github.com/Qiskit/qiskit-terra',
+        'simulator': True,
+        'local': True,
+        'conditional': False,
+        'open_pulse': False,
+        'memory': True,
+        'max_shots': 65536,
+        'coupling_map': None,
+        'description': 'A python stabilizer simulator for Clifford qasm experiments',
+        'basis_gates': ['id', 'x', 'y', 'z', 'h', 's', 'sdg', 'cx', 'cz', 'swap'],
+        'gates': [
+            {
+                'name': 'id',
+                'parameters': ['a'],
+                'qasm_def': 'gate id a { U(0,0,0) a; }'
+            },
+            {
+                'name': 'x',
+                'parameters': ['a'],
+                'qasm_def': 'gate x a { u3(pi,0,pi) a; }'
+            },
+            {
+                'name': 'y',
+                'parameters': ['a'],
+                'qasm_def': 'gate y a { u3(pi,pi/2,pi/2) a; }'
+            },
+            {
+                'name': 'z',
+                'parameters': ['a'],
+                'qasm_def': 'gate z a { u1(pi) a; }'
+            },
+            {
+                'name': 'h',
+                'parameters': ['a'],
+                'qasm_def': 'gate h a { u2(0,pi) a; }'
+            },
+            {
+                'name': 's',
+                'parameters': ['a'],
+                'qasm_def': 'gate s a { u1(pi/2) a; }'
+            },
+            {
+                'name': 'sdg',
+                'parameters': ['a'],
+                'qasm_def': 'gate sdg a { u1(-pi/2) a; }'
+            },
+            {
+                'name': 'cx',
+                'parameters': ['c', 't'],
+                'qasm_def': 'gate cx c,t { CX c,t; }'
+            },
+            {
+                'name': 'cz',
+                'parameters': ['a', 'b'],
+                'qasm_def': 'gate cz a,b { h b; cx a,b; h b; }'
+            },
+            {
+                'name': 'swap',
+                'parameters': ['a', 'b'],
+                'qasm_def': 'gate swap a,b { cx a,b; cx b,a; cx a,b; }'
+            }
+        ]
+    }
+
+    def __init__(self, configuration=None, provider=None):
+        super().__init__(configuration=(
+            configuration or QasmBackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
+                         provider=provider)
+        self._shots = 0
+        self._memory = False
+
+    def run(self, qobj, backend_options=None, **run_options):
+        """Run qobj asynchronously.
+
+        Args:
+            qobj (Qobj or QuantumCircuit or list): payload of the experiment.
+                If a circuit or list of circuits is given they are simulated
+                directly without assembling a qobj.
+            backend_options (dict): backend options, which are not used by this
+                simulator.
+            run_options (dict): run configuration used when running circuits
+                directly. It may contain ``shots`` (default 1024), ``memory``
+                (default False) and ``seed_simulator``.
+
+        Returns:
+            BasicAerJob: derived from BaseJob
+        """
+        # pylint: disable=unused-argument
+        job_id = str(uuid.uuid4())
+        if is_circuit_input(qobj):
+            circuits = [qobj] if isinstance(qobj, QuantumCircuit) else qobj
+            run_config = {'shots': run_options.get('shots', 1024),
+                          'memory': run_options.get('memory', False),
+                          'seed_simulator': run_options.get('seed_simulator')}
+            job = BasicAerJob(self, job_id,
+                              functools.partial(self._run_experiments, run_config=run_config),
+                              [_circuit_experiment(circuit) for circuit in circuits])
+        else:
+            job = BasicAerJob(self, job_id, self._run_job, qobj)
+        job.submit()
+        return job
+
+    def _run_job(self, job_id, qobj):
+        """Run experiments in qobj
+
+        Args:
+            job_id (str): unique id for the job.
+            qobj (Qobj): job description
+
+        Returns:
+            Result: Result object
+        """
+        experiments = [_qobj_experiment(experiment) for experiment in qobj.experiments]
+        run_config = {'shots': qobj.config.shots,
+                      'memory': getattr(qobj.config, 'memory', False),
+                      'seed_simulator': getattr(qobj.config, 'seed_simulator', None)}
+        return self._run_experiments(job_id, experiments, run_config,
+                                     qobj_id=qobj.qobj_id, header=qobj.header.to_dict())
+
+    def _run_experiments(self, job_id, experiments, run_config, qobj_id=None, header=None):
+        """Run experiments given as lists of instructions.
+
+        Args:
+            job_id (str): unique id for the job.
+            experiments (list[_Experiment]): the experiments to run.
+            run_config (dict): the ``shots``, ``memory`` and
+                ``seed_simulator`` run options.
+            qobj_id (str): the id of the qobj of the experiments.
+            header (dict): the header of the qobj of the experiments.
+
+        Returns:
+            Result: Result object
+        """
+        self._validate_experiments(experiments)
+        self._shots = run_config['shots']
+        self._memory = run_config['memory']
+        start = time.time()
+        result_list = [self.run_experiment(experiment, run_config['seed_simulator'])
+                       for experiment in experiments]
+        end = time.time()
+        result = {'backend_name': self.name(),
+                  'backend_version': self._configuration.backend_version,
+                  'qobj_id': qobj_id or str(uuid.uuid4()),
+                  'job_id': job_id,
+                  'results': result_list,
+                  'status': 'COMPLETED',
+                  'success': True,
+                  'time_taken': (end - start),
+                  'header': header or {
+                      'backend_name': self.name(),
+                      'backend_version': self._configuration.backend_version}}
+
+        return Result.from_dict(result)
+
+    def run_experiment(self, experiment, seed_simulator=None):
+        """Run a single experiment and return its result.
+
+        Circuits whose measurements are all at the end are simulated once and
+        all shots are sampled together from the final stabilizer state. Otherwise
+        the circuit up to the first measurement is shared by all shots and only
+        the remainder of the circuit is simulated per shot.
+
+        Args:
+            experiment (_Experiment): the experiment to run.
+            seed_simulator (int or None): the simulator seed.
+
+        Returns:
+             dict: A result dictionary which looks something like::
+
+                {
+                "name": name of this experiment (obtained from qobj.experiment header)
+                "seed": random seed used for simulation
+                "shots": number of shots used in the simulation
+                "data":
+                    {
+                    "counts": {'0x9: 5, ...},
+                    "memory": ['0x9', '0xF', '0x1D', ..., '0x9'],
+                    "stabilizer": stabilizer labels for circuits without measurements
+                    },
+                "status": status string for the simulation
+                "success": boolean
+                "time_taken": simulation time of this single experiment
+                }
+        """
+        start = time.time()
+        if seed_simulator is None:
+            # For compatibility on Windows force dyte to be int32
+            # and set the maximum value to be (2 ** 31) - 1
+            seed_simulator = np.random.randint(2147483647, dtype='int32')
+        instructions = experiment.instructions
+        measures = [i for i, (name, _, _) in enumerate(instructions) if name == 'measure']
+        first_measure = measures[0] if measures else len(instructions)
+
+        # Simulate the common prefix of all shots up to the first measurement
+        rng = np.random.default_rng(seed_simulator)
+        state = StabilizerState(experiment.num_qubits)
+        state.seed(rng)
+        for name, qubits, _ in instructions[:first_measure]:
+            _apply_instruction(state, name, qubits)
+
+        data = {}
+        if not measures:
+            data['stabilizer'] = state.clifford.stabilizer.to_labels()
+        elif all(name == 'measure' for name, _, _ in instructions[first_measure:]):
+            measured = sorted({instructions[i][1][0] for i in measures})
+            outcomes = state._sample_outcomes(self._shots, measured)
+            memory = np.zeros((self._shots, experiment.num_clbits), dtype=bool)
+            for i in measures:
+                _, qubits, clbits = instructions[i]
+                memory[:, clbits[0]] = outcomes[:, measured.index(qubits[0])]
+            memory = _hex_memory(memory)
+        else:
+            memory = []
+            for _ in range(self._shots):
+                # The shots share the random number generator of the prefix state
+                shot = StabilizerState(state)
+                shot.seed(rng)
+                classical_memory = np.zeros(experiment.num_clbits, dtype=bool)
+                for name, qubits, clbits in instructions[first_measure:]:
+                    if name == 'measure':
+                        classical_memory[clbits[0]] = shot._measure_qubit(qubits[0])
+                    else:
+                        _apply_instruction(shot, name, qubits)
+                memory.append(classical_memory)
+            memory = _hex_memory(np.array(memory, dtype=bool).reshape(self._shots, -1))
+
+        if measures:
+            data['counts'] = dict(Counter(memory))
+            if self._memory:
+                data['memory'] = memory
+        end = time.time()
+        return {'name': experiment.name,
+                'seed_simulator': seed_simulator,
+                'shots': self._shots,
+                'data': data,
+                'status': 'DONE',
+                'success': True,
+                'time_taken': (end - start),
+                'header': experiment.header}
+
+    def _validate_experiments(self, experiments):
+        """Semantic validations of the experiments."""
+        max_qubits = self.configuration().n_qubits
+        supported = set(self.configuration().basis_gates) | {'measure', 'reset'}
+        for experiment in experiments:
+            if experiment.num_qubits > max_qubits:
+                raise BasicAerError('Number of qubits {} '.format(experiment.num_qubits) +
+                                    'is greater than maximum ({}) '.format(max_qubits) +
+                                    'for "{}".'.format(self.name()))
+            for name, _, _ in experiment.instructions:
+                if name not in supported:
+                    raise BasicAerError('{} encountered unsupported instruction "{}" '
+                                        'in circuit "{}"'.format(self.name(), name,
+                                                                 experiment.name))
+
+
+def _apply_instruction(state, name, qubits):
+    """Apply a Clifford gate or reset by name to a stabilizer state in place."""
+    if name == 'reset':
+        state._reset_qubit(qubits[0])
+    else:
+        _append_instruction(state, name, qubits)
+
+
+def _hex_memory(memory):
+    """Return the hex strings of the rows of a boolean array of memory bits."""
+    packed = np.packbits(memory, axis=1, bitorder='little')
+    return [hex(int.from_bytes(row.tobytes(), 'little')) for row in packed]
+
+
+def _circuit_experiment(circuit):
+    """Return the experiment of a circuit of Clifford gates.
+
+    Raises:
+        BasicAerError: if the circuit contains classically conditioned instructions.
+    """
+    qubit_indices = {bit: idx for idx, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: idx for idx, bit in enumerate(circuit.clbits)}
+    instructions = []
+    for instruction, qargs, cargs in circuit.data:
+        if instruction.condition:
+            raise BasicAerError('Unsupported conditional instruction '
+                                'in circuit "{}"'.format(circuit.name))
+        if instruction.name != 'barrier':
+            instructions.append((instruction.name,
+                                 [qubit_indices[qubit] for qubit in qargs],
+                                 [clbit_indices[clbit] for clbit in cargs]))
+    return _Experiment(circuit.name, circuit.num_qubits, circuit.num_clbits,
+                       _experiment_header(circuit, 0.), instructions)
+
+
+def _qobj_experiment(experiment):
+    """Return the experiment of a qobj experiment of Clifford gates.
+
+    Raises:
+        BasicAerError: if the experiment contains classically conditioned instructions.
+    """
+    name = experiment.header.name
+    instructions = []
+    for instruction in experiment.instructions:
+        if instruction.name == 'bfunc' or hasattr(instruction, 'conditional'):
+            raise BasicAerError('Unsupported conditional instruction '
+                                'in circuit "{}"'.format(name))
+        if instruction.name != 'barrier':
+            instructions.append((instruction.name,
+                                 list(getattr(instruction, 'qubits', [])),
+                                 list(getattr(instruction, 'memory', []))))
+    return _Experiment(name, experiment.config.n_qubits, experiment.config.memory_slots,
+                       experiment.header.to_dict(), instructions)
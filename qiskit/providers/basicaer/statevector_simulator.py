@@ -25,10 +25,12 @@ The input qobj to this simulator has no shots, no measures, no reset, no noise.
 
 import logging
 from math import log2
+import numpy as np
 from qiskit.utils.multiprocessing import local_hardware_info
 from qiskit.providers.basicaer.exceptions import BasicAerError
 from qiskit.providers.models import QasmBackendConfiguration
 from .qasm_simulator import QasmSimulatorPy
+from .basicaerprogram import CHANNEL_OPCODES
 
 logger = logging.getLogger(__name__)
 
@@ -94,12 +96,16 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             configuration or QasmBackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
                          provider=provider)
 
-    def run(self, qobj, backend_options=None):
+    def run(self, qobj, backend_options=None, **run_options):
         """Run qobj asynchronously.
 
         Args:
-            qobj (Qobj): payload of the experiment
+            qobj (Qobj or QuantumCircuit or list): payload of the experiment.
+                If a circuit or list of circuits is given they are compiled
+                directly into simulator programs without assembling a qobj.
             backend_options (dict): backend options
+            run_options (dict): run configuration used when running circuits
+                directly.
 
         Returns:
             BasicAerJob: derived from BaseJob
@@ -126,7 +132,26 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
                     "chop_threshold": 1e-15
                 }
         """
-        return super().run(qobj, backend_options=backend_options)
+        return super().run(qobj, backend_options=backend_options, **run_options)
+
+    def _validate_programs(self, programs, run_config):
+        """Semantic validations of compiled circuit programs.
+
+        1. No shots
+        """
+        max_qubits = self.configuration().n_qubits
+        for program in programs:
+            if program.num_qubits > max_qubits:
+                raise BasicAerError('Number of qubits {} '.format(program.num_qubits) +
+                                    'is greater than maximum ({}) '.format(max_qubits) +
+                                    'for "{}".'.format(self.name()))
+            if np.any(np.isin(program.opcodes, CHANNEL_OPCODES)):
+                raise BasicAerError('Unsupported quantum channel instruction '
+                                    'in circuit "{}"'.format(program.name))
+        if run_config['shots'] != 1:
+            logger.info('"%s" only supports 1 shot. Setting shots=1.',
+                        self.name())
+            run_config['shots'] = 1
 
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas.
@@ -36,10 +36,13 @@ from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from qiskit.result import Result
+from qiskit.quantum_info.operators.unitary_accumulator import UnitaryAccumulator
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
 from .basicaertools import einsum_matmul_index
+from .basicaerprogram import OP_MEASURE, OP_RESET, CHANNEL_OPCODES
+from .basicaerprogram import compile_circuits, is_circuit_input
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +106,8 @@ class UnitarySimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_unitary": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "method": "dense"
     }
 
     def __init__(self, configuration=None, provider=None):
@@ -117,6 +121,9 @@ class UnitarySimulatorPy(BaseBackend):
         self._initial_unitary = None
         self._chop_threshold = 1e-15
         self._global_phase = 0
+        self._method = 'dense'
+        self._accumulator = None
+        self._peak_memory = 0
 
     def _add_unitary(self, gate, qubits):
         """Apply an N-qubit unitary matrix.
@@ -125,12 +132,15 @@ class UnitarySimulatorPy(BaseBackend):
             gate (matrix_like): an N-qubit unitary matrix
             qubits (list): the list of N-qubits.
         """
+        if self._accumulator is not None:
+            self._accumulator.apply(gate, qubits)
+            return
         # Get the number of qubits
         num_qubits = len(qubits)
         # Compute einsum index string for 1-qubit matrix multiplication
         indexes = einsum_matmul_index(qubits, self._number_of_qubits)
         # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
+        gate_tensor = np.reshape(np.asarray(gate, dtype=complex),
                                  num_qubits * [2, 2])
         # Apply matrix multiplication
         self._unitary = np.einsum(indexes, gate_tensor, self._unitary,
@@ -154,6 +164,7 @@ class UnitarySimulatorPy(BaseBackend):
         # Reset default options
         self._initial_unitary = self.DEFAULT_OPTIONS["initial_unitary"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._method = self.DEFAULT_OPTIONS["method"]
         if backend_options is None:
             backend_options = {}
 
@@ -185,9 +196,23 @@ class UnitarySimulatorPy(BaseBackend):
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
 
+        # Check for the unitary accumulation method
+        if 'method' in backend_options:
+            self._method = backend_options['method']
+        elif hasattr(qobj_config, 'method'):
+            self._method = qobj_config.method
+        if self._method not in ('dense', 'sparse'):
+            raise BasicAerError('Invalid unitary simulation method "{}"'.format(self._method))
+
     def _initialize_unitary(self):
         """Set the initial unitary for simulation"""
         self._validate_initial_unitary()
+        self._accumulator = None
+        if self._method == 'sparse':
+            # The initial unitary is applied when the result is returned
+            self._accumulator = UnitaryAccumulator(self._number_of_qubits)
+            self._unitary = None
+            return
         if self._initial_unitary is None:
             # Set to identity matrix
             self._unitary = np.eye(2 ** self._number_of_qubits,
@@ -200,18 +225,54 @@ class UnitarySimulatorPy(BaseBackend):
 
     def _get_unitary(self):
         """Return the current unitary"""
+        if self._accumulator is not None:
+            return self._get_accumulated_unitary()
         unitary = np.reshape(self._unitary, 2 * [2 ** self._number_of_qubits])
         if self._global_phase:
             unitary *= np.exp(1j * float(self._global_phase))
         unitary[abs(unitary) < self._chop_threshold] = 0.0
         return unitary
 
-    def run(self, qobj, backend_options=None):
+    def _get_accumulated_unitary(self):
+        """Return the unitary of the sparse accumulator.
+
+        The unitary is returned as a ``scipy.sparse.csr_matrix`` unless the
+        accumulator had to switch to the dense format or an initial unitary
+        was set.
+        """
+        unitary = self._accumulator.to_matrix(sparse_format=True)
+        if self._initial_unitary is not None:
+            unitary = np.asarray(unitary @ self._initial_unitary)
+        if self._global_phase:
+            unitary *= np.exp(1j * float(self._global_phase))
+        if isinstance(unitary, np.ndarray):
+            unitary[abs(unitary) < self._chop_threshold] = 0.0
+        else:
+            unitary.data[abs(unitary.data) < self._chop_threshold] = 0.0
+            unitary.eliminate_zeros()
+        return unitary
+
+    def _get_metadata(self):
+        """Return the accumulation method, unitary format and peak memory."""
+        if self._accumulator is not None:
+            return {'method': 'sparse',
+                    'unitary_format': self._accumulator.format,
+                    'peak_memory': self._accumulator.peak_memory}
+        # The dense einsum contraction holds the input and output unitaries
+        return {'method': 'dense',
+                'unitary_format': 'dense',
+                'peak_memory': 2 * self._unitary.nbytes}
+
+    def run(self, qobj, backend_options=None, **run_options):
         """Run qobj asynchronously.
 
         Args:
-            qobj (Qobj): payload of the experiment
+            qobj (Qobj or QuantumCircuit or list): payload of the experiment.
+                If a circuit or list of circuits is given they are compiled
+                directly into simulator programs without assembling a qobj.
             backend_options (dict): backend options
+            run_options (dict): backend options used when running circuits
+                directly.
 
         Returns:
             BasicAerJob: derived from BaseJob
@@ -221,6 +282,7 @@ class UnitarySimulatorPy(BaseBackend):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_unitary": matrix_like
                 * "chop_threshold": double
+                * "method": str
 
             The "initial_unitary" option specifies a custom initial unitary
             matrix for the simulator to be used instead of the identity
@@ -231,6 +293,16 @@ class UnitarySimulatorPy(BaseBackend):
             setting small values to zero in the output unitary. The default
             value is 1e-15.
 
+            The "method" option selects how the unitary is accumulated. The
+            default "dense" method stores a dense matrix. The "sparse" method
+            keeps the unitary as a permutation times a diagonal matrix, or as
+            a sparse CSR matrix, while possible and only switches to a dense
+            matrix when the fill-in of the gates requires it. The returned
+            unitary is then a ``scipy.sparse.csr_matrix`` unless it became
+            dense. The result metadata reports the method, the final
+            ``unitary_format`` and the ``peak_memory`` in bytes of the
+            accumulated unitary.
+
             Example::
 
                 backend_options = {
@@ -241,6 +313,15 @@ class UnitarySimulatorPy(BaseBackend):
                     "chop_threshold": 1e-15
                 }
         """
+        if is_circuit_input(qobj):
+            options = dict(run_options)
+            options.update(backend_options or {})
+            self._set_options(backend_options=options)
+            job_id = str(uuid.uuid4())
+            job = BasicAerJob(self, job_id, self._run_programs,
+                              compile_circuits(qobj))
+            job.submit()
+            return job
         self._set_options(qobj_config=qobj.config,
                           backend_options=backend_options)
         job_id = str(uuid.uuid4())
@@ -346,8 +427,84 @@ class UnitarySimulatorPy(BaseBackend):
                 'status': 'DONE',
                 'success': True,
                 'time_taken': (end - start),
+                'metadata': self._get_metadata(),
                 'header': experiment.header.to_dict()}
 
+    def _run_programs(self, job_id, programs):
+        """Run compiled circuit programs.
+
+        Args:
+            job_id (str): unique id for the job.
+            programs (list[BasicAerProgram]): the compiled circuits.
+
+        Returns:
+            Result: Result object
+        """
+        self._validate_programs(programs)
+        start = time.time()
+        result_list = [self.run_program(program) for program in programs]
+        end = time.time()
+        result = {'backend_name': self.name(),
+                  'backend_version': self._configuration.backend_version,
+                  'qobj_id': str(uuid.uuid4()),
+                  'job_id': job_id,
+                  'results': result_list,
+                  'status': 'COMPLETED',
+                  'success': True,
+                  'time_taken': (end - start),
+                  'header': {'backend_name': self.name(),
+                             'backend_version': self._configuration.backend_version}}
+
+        return Result.from_dict(result)
+
+    def run_program(self, program):
+        """Run a compiled circuit program and return a single experiment result.
+
+        Args:
+            program (BasicAerProgram): the compiled circuit.
+
+        Returns:
+            dict: A result dictionary in the format of :meth:`run_experiment`.
+        """
+        start = time.time()
+        self._number_of_qubits = program.num_qubits
+        self._global_phase = program.global_phase
+
+        self._validate_initial_unitary()
+        self._initialize_unitary()
+
+        gates = program.gate_matrices()
+        for gate, (_, qubits) in zip(gates, program.instructions()):
+            self._add_unitary(gate, qubits)
+        data = {'unitary': self._get_unitary()}
+        end = time.time()
+        return {'name': program.name,
+                'shots': 1,
+                'data': data,
+                'status': 'DONE',
+                'success': True,
+                'time_taken': (end - start),
+                'metadata': self._get_metadata(),
+                'header': program.header}
+
+    def _validate_programs(self, programs):
+        """Semantic validations of compiled circuit programs."""
+        max_qubits = self.configuration().n_qubits
+        for program in programs:
+            if program.num_qubits > max_qubits:
+                raise BasicAerError('Number of qubits {} '.format(program.num_qubits) +
+                                    'is greater than maximum ({}) '.format(max_qubits) +
+                                    'for "{}".'.format(self.name()))
+            if np.any(np.isin(program.opcodes, CHANNEL_OPCODES)):
+                raise BasicAerError('Unsupported quantum channel instruction '
+                                    'in circuit "{}"'.format(program.name))
+            if np.any(np.isin(program.opcodes, [OP_MEASURE, OP_RESET])):
+                raise BasicAerError('Unsupported measure or reset instruction '
+                                    'in circuit "{}"'.format(program.name))
+            if program.conditions:
+                raise BasicAerError('Unsupported conditional instruction '
+                                    'in circuit "{}"'.format(program.name))
+
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas.
         Some of these may later move to backend schemas.
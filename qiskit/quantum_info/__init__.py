@@ -23,6 +23,7 @@ Operators
    :toctree: ../stubs/
 
    Operator
+   LazyOperator
    Pauli
    Clifford
    ScalarOp
@@ -40,6 +41,7 @@ States
 
    Statevector
    DensityMatrix
+   StabilizerState
 
 Channels
 ========
@@ -86,11 +88,15 @@ Random
    :toctree: ../stubs/
 
    random_statevector
+   random_statevectors
    random_density_matrix
+   random_density_matrices
    random_unitary
+   random_unitaries
    random_hermitian
    random_pauli
    random_clifford
+   random_cliffords
    random_quantum_channel
    random_pauli_table
    random_stabilizer_table
@@ -115,7 +121,7 @@ Synthesis
    Quaternion
 """
 
-from .operators import (Operator, ScalarOp, Pauli, Clifford, SparsePauliOp)
+from .operators import (Operator, LazyOperator, ScalarOp, Pauli, Clifford, SparsePauliOp)
 from .operators import (PauliTable, StabilizerTable, pauli_basis, pauli_group)
 from .operators.channel import Choi, SuperOp, Kraus, Stinespring, Chi, PTM
 from .operators.measures import (process_fidelity,
@@ -123,16 +129,16 @@ from .operators.measures import (process_fidelity,
                                  gate_error,
                                  diamond_norm)
 
-from .states import Statevector, DensityMatrix
+from .states import Statevector, DensityMatrix, StabilizerState
 from .states import (partial_trace, state_fidelity, purity, entropy,
                      concurrence, entanglement_of_formation,
                      mutual_information, shannon_entropy)
 
-from .random import (random_quantum_channel, random_unitary,
-                     random_clifford, random_pauli, random_pauli_table,
+from .random import (random_quantum_channel, random_unitary, random_unitaries,
+                     random_clifford, random_cliffords, random_pauli, random_pauli_table,
                      random_stabilizer_table,
-                     random_hermitian, random_statevector,
-                     random_density_matrix)
+                     random_hermitian, random_statevector, random_statevectors,
+                     random_density_matrix, random_density_matrices)
 
 from .synthesis import (OneQubitEulerDecomposer, TwoQubitBasisDecomposer,
                         two_qubit_cnot_decompose, Quaternion)
@@ -13,6 +13,7 @@
 """Quantum Operators."""
 
 from .operator import Operator
+from .lazy_operator import LazyOperator
 from .scalar_op import ScalarOp
 from .channel import Choi, SuperOp, Kraus, Stinespring, Chi, PTM
 from .measures import (process_fidelity,
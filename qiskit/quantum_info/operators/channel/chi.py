@@ -24,7 +24,6 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.choi import Choi
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_chi
 
 
 class Chi(QuantumChannel):
@@ -107,8 +106,7 @@ class Chi(QuantumChannel):
                 data = self._init_transformer(data)
             input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a Chi object
-            rep = getattr(data, '_channel_rep', 'Operator')
-            chi_mat = _to_chi(rep, data._data, input_dim, output_dim)
+            chi_mat = self._converted_data(data, 'Chi')
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
@@ -210,7 +208,9 @@ class Chi(QuantumChannel):
         input_dims = other.input_dims() + self.input_dims()
         output_dims = other.output_dims() + self.output_dims()
         data = np.kron(self._data, other.data)
-        return Chi(data, input_dims, output_dims)
+        ret = Chi(data, input_dims, output_dims)
+        ret._set_tensor_factors(self, other)
+        return ret
 
     def expand(self, other):
         """Return the tensor product channel other ⊗ self.
@@ -229,7 +229,9 @@ class Chi(QuantumChannel):
         input_dims = self.input_dims() + other.input_dims()
         output_dims = self.output_dims() + other.output_dims()
         data = np.kron(other.data, self._data)
-        return Chi(data, input_dims, output_dims)
+        ret = Chi(data, input_dims, output_dims)
+        ret._set_tensor_factors(other, self)
+        return ret
 
     def _evolve(self, state, qargs=None):
         """Evolve a quantum state by the quantum channel.
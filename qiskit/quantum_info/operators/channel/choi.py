@@ -24,7 +24,6 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_choi
 from qiskit.quantum_info.operators.channel.transformations import _bipartite_tensor
 
 
@@ -118,10 +117,8 @@ class Choi(QuantumChannel):
                 # other objects into a QuantumChannel or Operator object.
                 data = self._init_transformer(data)
             op_shape = data._op_shape
-            output_dim, input_dim = op_shape.shape
             # Now that the input is an operator we convert it to a Choi object
-            rep = getattr(data, '_channel_rep', 'Operator')
-            choi_mat = _to_choi(rep, data._data, input_dim, output_dim)
+            choi_mat = self._converted_data(data, 'Choi')
         super().__init__(choi_mat, op_shape=op_shape)
 
     def __array__(self, dtype=None):
@@ -239,7 +236,9 @@ class Choi(QuantumChannel):
                                  other.data,
                                  shape1=self._bipartite_shape,
                                  shape2=other._bipartite_shape)
-        return Choi(data, input_dims, output_dims)
+        ret = Choi(data, input_dims, output_dims)
+        ret._set_tensor_factors(self, other)
+        return ret
 
     def expand(self, other):
         """Return the tensor product channel other ⊗ self.
@@ -263,7 +262,9 @@ class Choi(QuantumChannel):
                                  self._data,
                                  shape1=other._bipartite_shape,
                                  shape2=self._bipartite_shape)
-        return Choi(data, input_dims, output_dims)
+        ret = Choi(data, input_dims, output_dims)
+        ret._set_tensor_factors(other, self)
+        return ret
 
     def _evolve(self, state, qargs=None):
         """Evolve a quantum state by the quantum channel.
@@ -27,7 +27,6 @@ from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.channel.choi import Choi
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_kraus
 
 
 class Kraus(QuantumChannel):
@@ -152,10 +151,8 @@ class Kraus(QuantumChannel):
                 # other objects into a QuantumChannel or Operator object.
                 data = self._init_transformer(data)
             op_shape = data._op_shape
-            output_dim, input_dim = op_shape.shape
             # Now that the input is an operator we convert it to a Kraus
-            rep = getattr(data, '_channel_rep', 'Operator')
-            kraus = _to_kraus(rep, data._data, input_dim, output_dim)
+            kraus = self._converted_data(data, 'Kraus')
 
         # Initialize either single or general Kraus
         if kraus[1] is None or np.allclose(kraus[0], kraus[1]):
@@ -442,4 +439,9 @@ class Kraus(QuantumChannel):
             else:
                 kab_r = [np.kron(a, b) for a in ka_r for b in kb_r]
         data = (kab_l, kab_r)
-        return Kraus(data, input_dims, output_dims)
+        ret = Kraus(data, input_dims, output_dims)
+        if reverse:
+            ret._set_tensor_factors(other, self)
+        else:
+            ret._set_tensor_factors(self, other)
+        return ret
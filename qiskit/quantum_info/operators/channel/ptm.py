@@ -23,7 +23,6 @@ from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_ptm
 
 
 class PTM(QuantumChannel):
@@ -112,8 +111,7 @@ class PTM(QuantumChannel):
                 data = self._init_transformer(data)
             input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a PTM object
-            rep = getattr(data, '_channel_rep', 'Operator')
-            ptm = _to_ptm(rep, data._data, input_dim, output_dim)
+            ptm = self._converted_data(data, 'PTM')
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
@@ -227,7 +225,9 @@ class PTM(QuantumChannel):
         input_dims = other.input_dims() + self.input_dims()
         output_dims = other.output_dims() + self.output_dims()
         data = np.kron(self._data, other.data)
-        return PTM(data, input_dims, output_dims)
+        ret = PTM(data, input_dims, output_dims)
+        ret._set_tensor_factors(self, other)
+        return ret
 
     def expand(self, other):
         """Return the tensor product channel other ⊗ self.
@@ -246,7 +246,9 @@ class PTM(QuantumChannel):
         input_dims = self.input_dims() + other.input_dims()
         output_dims = self.output_dims() + other.output_dims()
         data = np.kron(other.data, self._data)
-        return PTM(data, input_dims, output_dims)
+        ret = PTM(data, input_dims, output_dims)
+        ret._set_tensor_factors(other, self)
+        return ret
 
     def _evolve(self, state, qargs=None):
         """Evolve a quantum state by the quantum channel.
@@ -16,6 +16,7 @@ Abstract base class for Quantum Channels.
 
 import copy
 from abc import abstractmethod
+from collections import defaultdict
 from numbers import Number
 import numpy as np
 
@@ -25,14 +26,26 @@ from qiskit.quantum_info.operators.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.predicates import is_identity_matrix
 from qiskit.quantum_info.operators.predicates import is_positive_semidefinite_matrix
-from qiskit.quantum_info.operators.channel.transformations import _to_choi
-from qiskit.quantum_info.operators.channel.transformations import _to_kraus
-from qiskit.quantum_info.operators.channel.transformations import _to_operator
+from qiskit.quantum_info.operators.channel.transformations import _transform
+from qiskit.quantum_info.operators.channel.transformations import _intermediate_rep
+from qiskit.quantum_info.operators.channel.transformations import _batch_transform
+from qiskit.quantum_info.operators.channel.transformations import _MATRIX_REPS
 from qiskit.quantum_info.operators.scalar_op import ScalarOp
 
 
 class QuantumChannel(BaseOperator, TolerancesMixin):
-    """Quantum channel representation base class."""
+    """Quantum channel representation base class.
+
+    The data of a channel converted to other representations is memoized on
+    the channel object, so that repeated conversions, for example by
+    :meth:`compose` or by evolving many states, are only computed once. The
+    cached conversions are discarded whenever the channel data is replaced,
+    or modified in place, which is detected by comparing the data with a copy
+    taken when the first conversion was memoized.
+    The channels returned by :meth:`tensor` and :meth:`expand` also keep
+    their factors, and are converted to other representations by converting
+    the factors and taking their tensor product.
+    """
 
     def __init__(self, data, num_qubits=None, op_shape=None):
         """Initialize a quantum channel Superoperator operator.
@@ -68,11 +81,162 @@ class QuantumChannel(BaseOperator, TolerancesMixin):
         """Return data."""
         return self._data
 
+    @property
+    def _data(self):
+        """Return the channel data in its own representation."""
+        return self._channel_data
+
+    @_data.setter
+    def _data(self, value):
+        # Replacing the data invalidates the memoized conversions
+        self._channel_data = value
+        self._conversions = {}
+        self._tensor_factors = None
+
+    def _cached_conversions(self):
+        """Return the memoized conversions of the channel data.
+
+        The conversions, and the tensor factors, are discarded if the channel
+        data or the data of the factors was modified in place since the
+        snapshot stored under the ``None`` key was taken.
+        """
+        snapshot = self._conversions.get(None)
+        if snapshot is not None and not _data_equal(snapshot, self._snapshot_data()):
+            self._conversions = {}
+            self._tensor_factors = None
+        return self._conversions
+
+    def _memoize(self, rep, data):
+        """Memoize the channel data in another representation."""
+        conversions = self._cached_conversions()
+        if None not in conversions:
+            conversions[None] = copy.deepcopy(self._snapshot_data())
+        conversions[rep] = data
+
+    def _snapshot_data(self):
+        """Return the data the memoized conversions depend on."""
+        data = [self._channel_data]
+        if self._tensor_factors is not None:
+            data += [factor._channel_data for factor in self._tensor_factors]
+        return data
+
     @property
     def _channel_rep(self):
         """Return channel representation string"""
         return type(self).__name__
 
+    def _convert(self, rep):
+        """Return the channel data in another representation.
+
+        Args:
+            rep (str): the QuantumChannel representation name, or ``'Operator'``.
+
+        Returns:
+            object: the memoized data in the representation, which is shared
+            with the cache and must not be modified or handed out.
+
+        Raises:
+            QiskitError: if the channel cannot be converted to the representation.
+        """
+        if rep == self._channel_rep:
+            return self._data
+        conversions = self._cached_conversions()
+        if rep not in conversions:
+            self._memoize(rep, self._transform_data(rep))
+        return self._conversions[rep]
+
+    def _transform_data(self, rep):
+        """Transform the channel data to another representation."""
+        if self._tensor_factors is not None:
+            try:
+                return self._transform_factors(rep)
+            except QiskitError:
+                # The factors of a tensor product of N-qubit channels need
+                # not be N-qubit channels themselves
+                pass
+        via = _intermediate_rep(self._channel_rep, rep)
+        if via is None:
+            return _transform(rep, self._channel_rep, self._data, *self.dim)
+        return _transform(rep, via, self._convert(via), *self.dim)
+
+    def _transform_factors(self, rep):
+        """Return the tensor product of the factors transformed to another representation."""
+        first, second = self._tensor_factors
+        if rep == 'Operator':
+            return np.kron(first._convert(rep), second._convert(rep))
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators import channel
+        cls = getattr(channel, rep)
+        return cls(first).tensor(cls(second))._data
+
+    def _set_tensor_factors(self, first, second):
+        """Record that the channel is the tensor product first ⊗ second."""
+        self._tensor_factors = (copy.copy(first), copy.copy(second))
+        self._conversions = {None: copy.deepcopy(self._snapshot_data())}
+
+    @classmethod
+    def _converted_data(cls, data, rep):
+        """Return the data of a QuantumChannel or Operator in a channel representation."""
+        if isinstance(data, QuantumChannel):
+            if rep == data._channel_rep:
+                return data._data
+            # Copy the memoized data so that the new channel does not share it
+            return copy.deepcopy(data._convert(rep))
+        return _transform(rep, 'Operator', data._data, *data.dim)
+
+    @classmethod
+    def from_channels(cls, channels):
+        """Convert a list of channels to this representation.
+
+        Channels in the Choi, SuperOp, Chi and PTM representations, and
+        completely-positive Kraus channels with the same number of Kraus
+        matrices, are converted with a single transformation of the stack of
+        their matrices for every group of channels with the same
+        representation and dimensions. Other channels are converted
+        individually. The conversions are memoized on the input channels.
+
+        Args:
+            channels (list): a list of quantum channels or objects that can
+                be converted to a quantum channel.
+
+        Returns:
+            list: the channels in this representation.
+
+        Raises:
+            QiskitError: if a channel cannot be converted to this representation.
+        """
+        rep_to = cls.__name__
+        channels = list(channels)
+        groups = defaultdict(list)
+        if rep_to in _MATRIX_REPS:
+            for i, chan in enumerate(channels):
+                key = cls._batch_key(chan, rep_to)
+                if key is not None:
+                    groups[key].append(i)
+        for (rep, input_dim, output_dim, _), indices in groups.items():
+            if rep == 'Kraus':
+                stack = [channels[i]._data[0] for i in indices]
+            else:
+                stack = [channels[i]._data for i in indices]
+            stack = _batch_transform(rep_to, rep, stack, input_dim, output_dim)
+            for i, data in zip(indices, stack):
+                channels[i]._memoize(rep_to, data)
+        return [cls(chan) for chan in channels]
+
+    @staticmethod
+    def _batch_key(chan, rep_to):
+        """Return the batch transformation group of a channel or None."""
+        if not isinstance(chan, QuantumChannel):
+            return None
+        rep = chan._channel_rep
+        if rep == rep_to or rep_to in chan._cached_conversions():
+            return None
+        if rep in _MATRIX_REPS:
+            return (rep,) + chan.dim + (None,)
+        if rep == 'Kraus' and chan._data[1] is None:
+            return (rep,) + chan.dim + (len(chan._data[0]),)
+        return None
+
     @abstractmethod
     def compose(self, other, qargs=None, front=False):
         """Return the composed quantum channel self @ other.
@@ -167,18 +331,18 @@ class QuantumChannel(BaseOperator, TolerancesMixin):
 
     def is_cptp(self, atol=None, rtol=None):
         """Return True if completely-positive trace-preserving (CPTP)."""
-        choi = _to_choi(self._channel_rep, self._data, *self.dim)
+        choi = self._convert('Choi')
         return self._is_cp_helper(choi, atol, rtol) and self._is_tp_helper(
             choi, atol, rtol)
 
     def is_tp(self, atol=None, rtol=None):
         """Test if a channel is completely-positive (CP)"""
-        choi = _to_choi(self._channel_rep, self._data, *self.dim)
+        choi = self._convert('Choi')
         return self._is_tp_helper(choi, atol, rtol)
 
     def is_cp(self, atol=None, rtol=None):
         """Test if Choi-matrix is completely-positive (CP)"""
-        choi = _to_choi(self._channel_rep, self._data, *self.dim)
+        choi = self._convert('Choi')
         return self._is_cp_helper(choi, atol, rtol)
 
     def is_unitary(self, atol=None, rtol=None):
@@ -191,7 +355,7 @@ class QuantumChannel(BaseOperator, TolerancesMixin):
 
     def to_operator(self):
         """Try to convert channel to a unitary representation Operator."""
-        mat = _to_operator(self._channel_rep, self._data, *self.dim)
+        mat = np.array(self._convert('Operator'))
         return Operator(mat, self.input_dims(), self.output_dims())
 
     def to_instruction(self):
@@ -219,7 +383,7 @@ class QuantumChannel(BaseOperator, TolerancesMixin):
             )
         # Next we convert to the Kraus representation. Since channel is CPTP we know
         # that there is only a single set of Kraus operators
-        kraus, _ = _to_kraus(self._channel_rep, self._data, *self.dim)
+        kraus, _ = copy.deepcopy(self._convert('Kraus'))
         # If we only have a single Kraus operator then the channel is
         # a unitary channel so can be converted to a UnitaryGate. We do this by
         # converting to an Operator and using its to_instruction method
@@ -308,3 +472,14 @@ class QuantumChannel(BaseOperator, TolerancesMixin):
         # 'to_quantumchannel' conversion method we try and initialize it as a
         # regular matrix Operator which can be converted into a QuantumChannel.
         return Operator(data)
+
+
+def _data_equal(first, second):
+    """Return True if two channel data snapshots are equal."""
+    if isinstance(first, np.ndarray) or isinstance(second, np.ndarray):
+        return isinstance(first, np.ndarray) and isinstance(second, np.ndarray) \
+            and first.shape == second.shape and np.array_equal(first, second)
+    if isinstance(first, (list, tuple)):
+        return isinstance(second, (list, tuple)) and len(first) == len(second) \
+            and all(_data_equal(a, b) for a, b in zip(first, second))
+    return first is second or first == second
@@ -26,7 +26,6 @@ from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.channel.kraus import Kraus
 from qiskit.quantum_info.operators.channel.choi import Choi
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_stinespring
 
 
 class Stinespring(QuantumChannel):
@@ -121,11 +120,9 @@ class Stinespring(QuantumChannel):
                 # other objects into a QuantumChannel or Operator object.
                 data = self._init_transformer(data)
             op_shape = data._op_shape
-            output_dim, input_dim = op_shape.shape
             # Now that the input is an operator we convert it to a
             # Stinespring operator
-            rep = getattr(data, '_channel_rep', 'Operator')
-            stine = _to_stinespring(rep, data._data, input_dim, output_dim)
+            stine = self._converted_data(data, 'Stinespring')
 
         # Initialize either single or general Stinespring
         if stine[1] is None or (stine[1] == stine[0]).all():
@@ -416,4 +413,9 @@ class Stinespring(QuantumChannel):
             sab_r = np.reshape(
                 np.transpose(np.reshape(sab_r, shape_in), (0, 2, 1, 3, 4)),
                 shape_out)
-        return Stinespring((sab_l, sab_r), input_dims, output_dims)
+        ret = Stinespring((sab_l, sab_r), input_dims, output_dims)
+        if reverse:
+            ret._set_tensor_factors(other, self)
+        else:
+            ret._set_tensor_factors(self, other)
+        return ret
@@ -106,9 +106,7 @@ class SuperOp(QuantumChannel):
             # Now that the input is an operator we convert it to a
             # SuperOp object
             op_shape = data._op_shape
-            input_dim, output_dim = data.dim
-            rep = getattr(data, '_channel_rep', 'Operator')
-            super_mat = _to_superop(rep, data._data, input_dim, output_dim)
+            super_mat = self._converted_data(data, 'SuperOp')
         # Initialize QuantumChannel
         super().__init__(super_mat, op_shape=op_shape)
 
@@ -258,7 +256,9 @@ class SuperOp(QuantumChannel):
                                  other.data,
                                  shape1=self._bipartite_shape,
                                  shape2=other._bipartite_shape)
-        return SuperOp(data, input_dims, output_dims)
+        ret = SuperOp(data, input_dims, output_dims)
+        ret._set_tensor_factors(self, other)
+        return ret
 
     def expand(self, other):
         """Return the tensor product channel other ⊗ self.
@@ -283,7 +283,9 @@ class SuperOp(QuantumChannel):
                                  self._data,
                                  shape1=other._bipartite_shape,
                                  shape2=self._bipartite_shape)
-        return SuperOp(data, input_dims, output_dims)
+        ret = SuperOp(data, input_dims, output_dims)
+        ret._set_tensor_factors(other, self)
+        return ret
 
     def _evolve(self, state, qargs=None):
         """Evolve a quantum state by the quantum channel.
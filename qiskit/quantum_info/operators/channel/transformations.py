@@ -25,6 +25,77 @@ from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
 from qiskit.quantum_info.operators.predicates import ATOL_DEFAULT
 
 
+def _transform(rep_to, rep, data, input_dim, output_dim):
+    """Transform a QuantumChannel to the rep_to representation."""
+    if rep_to not in _TRANSFORMS:
+        raise QiskitError('Invalid QuantumChannel {}'.format(rep_to))
+    return _TRANSFORMS[rep_to](rep, data, input_dim, output_dim)
+
+
+def _intermediate_rep(rep, rep_to):
+    """Return the representation a transformation passes through.
+
+    Returns:
+        str or None: the intermediate representation, or None if rep is
+        transformed to rep_to directly.
+    """
+    if rep_to == 'Choi' and rep == 'PTM':
+        return 'SuperOp'
+    if rep_to == 'SuperOp' and rep == 'Chi':
+        return 'Choi'
+    via = _INTERMEDIATE_REPS.get(rep_to)
+    if via is None or rep in (via, rep_to, 'Operator') or (
+            rep == 'Stinespring' and rep_to in ('Kraus', 'Operator')):
+        return None
+    return via
+
+
+def _batch_transform(rep_to, rep, data, input_dim, output_dim):
+    """Transform a stack of channels to a matrix representation.
+
+    Args:
+        rep_to (str): the Choi, SuperOp, Chi or PTM representation to return.
+        rep (str): the Choi, SuperOp, Chi, PTM or Kraus representation of data.
+        data (np.ndarray): a ``(K, M, N)`` stack of channel matrices or a
+            ``(K, R, output_dim, input_dim)`` stack of sets of ``R`` Kraus
+            matrices of completely-positive channels.
+        input_dim (int): the input dimension of the channels.
+        output_dim (int): the output dimension of the channels.
+
+    Returns:
+        np.ndarray: the stack of channel matrices.
+
+    Raises:
+        QiskitError: if the representations are invalid.
+    """
+    if rep_to not in _MATRIX_REPS or rep not in _MATRIX_REPS + ('Kraus',):
+        raise QiskitError('Cannot batch transform {} to {}'.format(rep, rep_to))
+    if 'Chi' in (rep, rep_to) or 'PTM' in (rep, rep_to):
+        _check_nqubit_dim(input_dim, output_dim)
+    num_qubits = int(np.log2(input_dim))
+    # Transform to the Choi or SuperOp matrices
+    if rep == 'Kraus':
+        kraus = np.asarray(data, dtype=complex)
+        if rep_to in ('Choi', 'Chi'):
+            vecs = np.reshape(np.swapaxes(kraus, 2, 3), kraus.shape[:2] + (-1,))
+            data, rep = np.einsum('kra,krb->kab', vecs, vecs.conj()), 'Choi'
+        else:
+            data = np.einsum('krab,krcd->kacbd', kraus.conj(), kraus)
+            data = np.reshape(data, (len(kraus), output_dim ** 2, input_dim ** 2))
+            rep = 'SuperOp'
+    elif rep == 'Chi':
+        data, rep = _transform_from_pauli(data, num_qubits), 'Choi'
+    elif rep == 'PTM':
+        data, rep = _transform_from_pauli(data, num_qubits), 'SuperOp'
+    if rep_to in ('Choi', 'Chi') and rep == 'SuperOp':
+        data = _reshuffle(data, (output_dim, output_dim, input_dim, input_dim))
+    elif rep_to in ('SuperOp', 'PTM') and rep == 'Choi':
+        data = _reshuffle(data, (input_dim, output_dim, input_dim, output_dim))
+    if rep_to in ('Chi', 'PTM'):
+        data = _transform_to_pauli(data, num_qubits)
+    return data
+
+
 def _to_choi(rep, data, input_dim, output_dim):
     """Transform a QuantumChannel to the Choi representation."""
     if rep == 'Choi':
@@ -406,7 +477,7 @@ def _transform_to_pauli(data, num_qubits):
                 np.reshape(
                     np.kron(basis_mat, cob), (4, dim * dim, 2, 2, dim, dim)),
                 (0, 1, 2, 4, 3, 5)), (4 * dim * dim, 4 * dim * dim))
-    return np.dot(np.dot(cob, data), cob.conj().T) / 2**num_qubits
+    return np.matmul(np.matmul(cob, data), cob.conj().T) / 2**num_qubits
 
 
 def _transform_from_pauli(data, num_qubits):
@@ -425,14 +496,20 @@ def _transform_from_pauli(data, num_qubits):
                 np.reshape(
                     np.kron(basis_mat, cob), (2, 2, dim, dim, 4, dim * dim)),
                 (0, 2, 1, 3, 4, 5)), (4 * dim * dim, 4 * dim * dim))
-    return np.dot(np.dot(cob, data), cob.conj().T) / 2**num_qubits
+    return np.matmul(np.matmul(cob, data), cob.conj().T) / 2**num_qubits
 
 
 def _reshuffle(mat, shape):
-    """Reshuffle the indices of a bipartite matrix A[ij,kl] -> A[lj,ki]."""
+    """Reshuffle the indices of a bipartite matrix A[ij,kl] -> A[lj,ki].
+
+    A stack of bipartite matrices is reshuffled along its last two axes.
+    """
+    batch = np.shape(mat)[:-2]
+    axes = tuple(range(len(batch)))
+    tensor = np.reshape(mat, batch + tuple(shape))
     return np.reshape(
-        np.transpose(np.reshape(mat, shape), (3, 1, 2, 0)),
-        (shape[3] * shape[1], shape[0] * shape[2]))
+        np.transpose(tensor, axes + tuple(len(batch) + i for i in (3, 1, 2, 0))),
+        batch + (shape[3] * shape[1], shape[0] * shape[2]))
 
 
 def _check_nqubit_dim(input_dim, output_dim):
@@ -444,3 +521,25 @@ def _check_nqubit_dim(input_dim, output_dim):
     num_qubits = int(np.log2(input_dim))
     if 2**num_qubits != input_dim:
         raise QiskitError('Not an n-qubit channel: input_dim != 2 ** n')
+
+
+_TRANSFORMS = {
+    'Choi': _to_choi,
+    'SuperOp': _to_superop,
+    'Kraus': _to_kraus,
+    'Chi': _to_chi,
+    'PTM': _to_ptm,
+    'Stinespring': _to_stinespring,
+    'Operator': _to_operator,
+}
+
+# Representations that transformations to each representation pass through
+_INTERMEDIATE_REPS = {
+    'Kraus': 'Choi',
+    'Chi': 'Choi',
+    'PTM': 'SuperOp',
+    'Stinespring': 'Kraus',
+    'Operator': 'Kraus',
+}
+
+_MATRIX_REPS = ('Choi', 'SuperOp', 'Chi', 'PTM')
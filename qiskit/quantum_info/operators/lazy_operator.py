@@ -0,0 +1,456 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Lazy tensor network operator class.
+"""
+
+import copy
+import heapq
+from collections import defaultdict
+from numbers import Number
+
+import numpy as np
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.instruction import Instruction
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.base_operator import BaseOperator
+from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.predicates import matrix_equal
+
+# Operators on more qubits than this are compared by their action on vectors
+_DENSE_EQUIV_QUBITS = 10
+# Number and seed of the random vectors used to compare operators
+_EQUIV_VECTORS = 2
+_EQUIV_SEED = 8123
+
+
+class LazyOperator(Operator):
+    r"""Operator stored as a tensor network of gate matrices.
+
+    A lazy operator records the matrices and qubits of the gates of a
+    circuit, and of the operators it is composed with, instead of
+    multiplying them into a dense :math:`2^N \times 2^N` matrix. The network
+    is only contracted when a result is requested:
+
+    * :attr:`data` contracts the open network into the dense matrix, which is
+      then cached.
+    * :meth:`trace` contracts the network with the outputs of every qubit
+      joined to its inputs.
+    * :meth:`Statevector.evolve` and :meth:`DensityMatrix.evolve` contract
+      the network with the state, which costs :math:`O(2^N)` memory.
+    * :meth:`equiv` compares the action of two operators on a fixed set of
+      random vectors once they act on more than 10 qubits. A pair of
+      inequivalent operators agrees on random vectors with probability zero,
+      so this checks the equivalence of circuits of 20 or more qubits, such
+      as a circuit and its transpiled version, without their matrices.
+
+    Networks are contracted pairwise in a greedy order that always contracts
+    the pair of connected tensors which most reduces the total size of the
+    network, so that runs of gates on few qubits are merged before they are
+    applied to larger tensors.
+
+    Composition, tensor products, conjugation, transposition and integer
+    powers return lazy operators. Other :class:`Operator` methods contract
+    the network and act on the dense matrix.
+    """
+
+    def __init__(self, data):  # pylint: disable=super-init-not-called,non-parent-init-called
+        """Initialize a lazy operator.
+
+        Args:
+            data (QuantumCircuit or Instruction or Operator or matrix): the
+                circuit or qubit operator of the network.
+
+        Raises:
+            QiskitError: if the circuit contains non-unitary instructions or
+                         the operator is not an N-qubit operator.
+        """
+        self._dense = None
+        self._coeff = 1
+        if isinstance(data, LazyOperator):
+            self._gates = data._gates
+            self._coeff = data._coeff
+            num_qubits = data.num_qubits
+        elif isinstance(data, (QuantumCircuit, Instruction)):
+            if isinstance(data, QuantumCircuit):
+                data = data.to_instruction()
+            gates = _GateList()
+            phase = Operator._accumulate_instruction(gates, data)
+            if phase:
+                self._coeff = np.exp(1j * phase)
+            self._gates = tuple(gates)
+            num_qubits = data.num_qubits
+        else:
+            if not isinstance(data, Operator):
+                data = Operator(data)
+            num_qubits = data.num_qubits
+            if num_qubits is None:
+                raise QiskitError("LazyOperator requires an N-qubit operator.")
+            self._gates = ((data.data, tuple(range(num_qubits))),)
+        BaseOperator.__init__(self, num_qubits=num_qubits)
+
+    def __repr__(self):
+        return 'LazyOperator(num_qubits={}, num_gates={})'.format(
+            self.num_qubits, len(self._gates))
+
+    @property
+    def _data(self):
+        """Return the cached contraction of the network."""
+        if self._dense is None:
+            self._dense = self._coeff * self._contract_matrix()
+        return self._dense
+
+    @_data.setter
+    def _data(self, value):
+        # Dense results of inherited Operator methods replace the network
+        value = np.asarray(value, dtype=complex)
+        num_qubits = len(value).bit_length() - 1
+        self._gates = ((value, tuple(range(num_qubits))),)
+        self._coeff = 1
+        self._dense = value
+
+    @property
+    def num_gates(self):
+        """Return the number of gate tensors in the network."""
+        return len(self._gates)
+
+    def to_operator(self):
+        """Contract the network to a dense Operator."""
+        return Operator(self.data)
+
+    def conjugate(self):
+        """Return the conjugate of the operator."""
+        ret = copy.copy(self)
+        ret._gates = tuple((np.conj(mat), qubits) for mat, qubits in self._gates)
+        ret._coeff = np.conj(self._coeff)
+        ret._dense = None
+        return ret
+
+    def transpose(self):
+        """Return the transpose of the operator."""
+        ret = copy.copy(self)
+        ret._gates = tuple((np.transpose(mat), qubits) for mat, qubits in reversed(self._gates))
+        ret._dense = None
+        ret._op_shape = self._op_shape.transpose()
+        return ret
+
+    def compose(self, other, qargs=None, front=False):
+        """Return the lazily composed operator.
+
+        Args:
+            other (LazyOperator or Operator or QuantumCircuit): an operator object.
+            qargs (list or None): a list of subsystem positions to apply
+                                  other on. If None apply on all
+                                  subsystems [default: None].
+            front (bool): If True compose using right operator multiplication,
+                          instead of left multiplication [default: False].
+
+        Returns:
+            LazyOperator: The operator self @ other.
+
+        Raise:
+            QiskitError: if operators have incompatible dimensions for
+                         composition.
+        """
+        if qargs is None:
+            qargs = getattr(other, 'qargs', None)
+        if not isinstance(other, LazyOperator):
+            other = LazyOperator(other)
+        new_shape = self._op_shape.compose(other._op_shape, qargs, front)
+        gates = other._gates
+        if qargs is not None:
+            gates = tuple((mat, tuple(qargs[qubit] for qubit in qubits))
+                          for mat, qubits in gates)
+        ret = copy.copy(self)
+        ret._gates = gates + self._gates if front else self._gates + gates
+        ret._coeff = self._coeff * other._coeff
+        ret._dense = None
+        ret._op_shape = new_shape
+        ret._qargs = None
+        return ret
+
+    def power(self, n):
+        """Return the operator composed with itself n times.
+
+        Args:
+            n (int): the power to raise the operator to.
+
+        Returns:
+            LazyOperator: the n-times composed operator. Negative powers
+            contract the network and return the dense matrix power.
+
+        Raises:
+            QiskitError: if the power is not an integer.
+        """
+        if not isinstance(n, int):
+            raise QiskitError("Can only take integer powers of Operator.")
+        if n < 0:
+            return super().power(n)
+        ret = copy.copy(self)
+        ret._gates = n * self._gates
+        ret._coeff = self._coeff ** n
+        ret._dense = None
+        return ret
+
+    def tensor(self, other):
+        """Return the lazy tensor product operator self ⊗ other."""
+        if not isinstance(other, LazyOperator):
+            other = LazyOperator(other)
+        return self._tensor(self, other)
+
+    def expand(self, other):
+        """Return the lazy tensor product operator other ⊗ self."""
+        if not isinstance(other, LazyOperator):
+            other = LazyOperator(other)
+        return self._tensor(other, self)
+
+    @classmethod
+    def _tensor(cls, a, b):
+        shift = b.num_qubits
+        ret = copy.copy(a)
+        ret._gates = b._gates + tuple(
+            (mat, tuple(shift + qubit for qubit in qubits)) for mat, qubits in a._gates)
+        ret._coeff = a._coeff * b._coeff
+        ret._dense = None
+        ret._op_shape = a._op_shape.tensor(b._op_shape)
+        ret._qargs = None
+        return ret
+
+    def _multiply(self, other):
+        """Return the operator other * self."""
+        if not isinstance(other, Number):
+            raise QiskitError("other is not a number")
+        ret = copy.copy(self)
+        ret._coeff = other * self._coeff
+        if self._dense is not None:
+            ret._dense = other * self._dense
+        return ret
+
+    def trace(self):
+        """Return the trace of the operator.
+
+        Returns:
+            complex: the contraction of the network with the outputs of every
+            qubit joined to its inputs.
+        """
+        num_qubits = self.num_qubits
+        wires = list(range(num_qubits))
+        tensors, labels = [], []
+        _append_gates(tensors, labels, self._gates, wires, num_qubits)
+        # Join the outputs of the qubits to their inputs
+        closure = {wires[qubit]: qubit for qubit in range(num_qubits) if wires[qubit] != qubit}
+        labels = [[closure.get(label, label) for label in legs] for legs in labels]
+        value = _contract(tensors, labels, [])
+        return complex(self._coeff * value * 2 ** (num_qubits - len(closure)))
+
+    def equiv(self, other, rtol=None, atol=None):
+        """Return True if operators are equivalent up to global phase.
+
+        Operators on more than 10 qubits are compared by contracting both
+        networks with the same random vectors instead of their matrices.
+
+        Args:
+            other (Operator): an operator object.
+            rtol (float): relative tolerance value for comparison.
+            atol (float): absolute tolerance value for comparison.
+
+        Returns:
+            bool: True if operators are equivalent up to global phase.
+        """
+        if not isinstance(other, Operator):
+            try:
+                other = LazyOperator(other)
+            except QiskitError:
+                return False
+        if self.dim != other.dim:
+            return False
+        if self.num_qubits is None or self.num_qubits <= _DENSE_EQUIV_QUBITS:
+            return super().equiv(other, rtol=rtol, atol=atol)
+        if not isinstance(other, LazyOperator):
+            other = LazyOperator(other)
+        if atol is None:
+            atol = self.atol
+        if rtol is None:
+            rtol = self.rtol
+        # Random unit vectors, like the columns of a unitary matrix
+        dim = 2 ** self.num_qubits
+        rng = np.random.default_rng(_EQUIV_SEED)
+        vecs = rng.normal(size=(dim, _EQUIV_VECTORS)) + 1j * rng.normal(size=(dim, _EQUIV_VECTORS))
+        vecs /= np.linalg.norm(vecs, axis=0)
+        return matrix_equal(self._evolve_vector(vecs), other._evolve_vector(vecs),
+                            ignore_phase=True, rtol=rtol, atol=atol)
+
+    def _contract_matrix(self):
+        """Return the matrix of the network without the coefficient."""
+        num_qubits = self.num_qubits
+        wires = list(range(num_qubits))
+        tensors, labels = [], []
+        label = _append_gates(tensors, labels, self._gates, wires, num_qubits)
+        # Qubits without gates are identity wires
+        for qubit in range(num_qubits):
+            if wires[qubit] == qubit:
+                tensors.append(np.eye(2, dtype=complex))
+                labels.append([label, qubit])
+                wires[qubit] = label
+                label += 1
+        output = [wires[qubit] for qubit in reversed(range(num_qubits))]
+        output += list(reversed(range(num_qubits)))
+        dim = 2 ** num_qubits
+        return np.reshape(_contract(tensors, labels, output), (dim, dim))
+
+    def _evolve_vector(self, data, qargs=None):
+        """Return the operator applied to the columns of a qubit vector or matrix.
+
+        Args:
+            data (np.ndarray): a ``2 ** M`` vector, or a matrix with ``2 ** M`` rows.
+            qargs (list or None): the qubits of the vector the operator acts on.
+
+        Returns:
+            np.ndarray: the contracted vector or matrix.
+
+        Raises:
+            QiskitError: if qargs does not match the operator qubits.
+        """
+        num_qubits = len(data).bit_length() - 1
+        if qargs is None:
+            qargs = list(range(num_qubits))
+        if len(qargs) != self.num_qubits or max(qargs, default=-1) >= num_qubits:
+            raise QiskitError("Operator qubits do not match the vector qubits.")
+        batch = list(range(num_qubits, data.ndim - 1 + num_qubits))
+        tensors = [np.reshape(data, num_qubits * (2,) + data.shape[1:])]
+        labels = [list(reversed(range(num_qubits))) + batch]
+        gates = tuple((mat, tuple(qargs[qubit] for qubit in qubits))
+                      for mat, qubits in self._gates)
+        wires = list(range(num_qubits))
+        _append_gates(tensors, labels, gates, wires, num_qubits + len(batch))
+        output = [wires[qubit] for qubit in reversed(range(num_qubits))] + batch
+        return self._coeff * np.reshape(_contract(tensors, labels, output), data.shape)
+
+
+class _GateList(list):
+    """Record the gates of an instruction as (matrix, qubits) tuples."""
+
+    def apply(self, mat, qubits):
+        """Append a gate matrix on qubits."""
+        self.append((np.asarray(mat, dtype=complex), tuple(qubits)))
+
+
+def _append_gates(tensors, labels, gates, wires, label):
+    """Append gate tensors to a network.
+
+    The tensor of a ``k``-qubit gate has its ``k`` output legs followed by
+    its ``k`` input legs, each in the order of its qubits from the last.
+
+    Args:
+        tensors (list): the network tensors to append to.
+        labels (list): the index labels of the network tensors.
+        gates (tuple): the (matrix, qubits) gates in the order they act.
+        wires (list): the current open label of every qubit, updated in place.
+        label (int): the first unused index label.
+
+    Returns:
+        int: the next unused index label.
+    """
+    for mat, qubits in gates:
+        qubits = qubits[::-1]
+        tensors.append(np.reshape(mat, 2 * len(qubits) * (2,)))
+        inputs = [wires[qubit] for qubit in qubits]
+        outputs = list(range(label, label + len(qubits)))
+        for qubit, output in zip(qubits, outputs):
+            wires[qubit] = output
+        labels.append(outputs + inputs)
+        label += len(qubits)
+    return label
+
+
+def _contract(tensors, labels, output):
+    """Contract a tensor network in a greedy pairwise order.
+
+    Each index label must belong to one or two legs of the network. Labels
+    shared by two legs are summed over, and the network is contracted by
+    repeatedly contracting the pair of tensors sharing a label whose
+    contraction most reduces the total number of elements.
+
+    Args:
+        tensors (list): the network tensors.
+        labels (list): the list of index labels of each tensor.
+        output (list): the open labels in the order of the returned axes.
+
+    Returns:
+        np.ndarray: the contracted tensor.
+    """
+    tensors = list(tensors)
+    labels = [list(legs) for legs in labels]
+    owners = defaultdict(set)
+    for i, legs in enumerate(labels):
+        tensors[i], labels[i] = _trace_loops(tensors[i], legs)
+        for label in labels[i]:
+            owners[label].add(i)
+
+    heap = []
+
+    def push_pairs(i):
+        neighbours = set().union(*(owners[label] for label in labels[i]))
+        neighbours.discard(i)
+        for j in neighbours:
+            shared = 1
+            for axis, label in enumerate(labels[i]):
+                if label in labels[j]:
+                    shared *= tensors[i].shape[axis]
+            size = tensors[i].size * tensors[j].size // (shared * shared)
+            heapq.heappush(heap, (size - tensors[i].size - tensors[j].size, min(i, j), max(i, j)))
+
+    for i in range(len(tensors)):
+        push_pairs(i)
+    alive = set(range(len(tensors)))
+    while heap:
+        _, i, j = heapq.heappop(heap)
+        if i not in alive or j not in alive:
+            continue
+        shared = [label for label in labels[i] if label in labels[j]]
+        axes = ([labels[i].index(label) for label in shared],
+                [labels[j].index(label) for label in shared])
+        tensor = np.tensordot(tensors[i], tensors[j], axes=axes)
+        legs = [label for label in labels[i] + labels[j] if label not in shared]
+        new = len(tensors)
+        tensors.append(tensor)
+        labels.append(legs)
+        tensors[i] = tensors[j] = None
+        alive.difference_update((i, j))
+        alive.add(new)
+        for label in shared:
+            del owners[label]
+        for label in legs:
+            owners[label].difference_update((i, j))
+            owners[label].add(new)
+        push_pairs(new)
+
+    # Take the outer product of disconnected parts of the network
+    result = np.ones((), dtype=complex)
+    legs = []
+    for i in sorted(alive, key=lambda k: tensors[k].size):
+        result = np.tensordot(result, tensors[i], axes=0)
+        legs += labels[i]
+    return np.transpose(result, [legs.index(label) for label in output])
+
+
+def _trace_loops(tensor, legs):
+    """Trace over pairs of legs of a tensor with the same label."""
+    for label in set(legs):
+        while legs.count(label) > 1:
+            first = legs.index(label)
+            second = legs.index(label, first + 1)
+            tensor = np.trace(tensor, axis1=first, axis2=second)
+            legs = [leg for k, leg in enumerate(legs) if k not in (first, second)]
+    return tensor, legs
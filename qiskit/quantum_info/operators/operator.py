@@ -27,6 +27,7 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.predicates import is_unitary_matrix, matrix_equal
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit.quantum_info.operators.tolerances import TolerancesMixin
+from qiskit.quantum_info.operators.unitary_accumulator import UnitaryAccumulator
 
 
 class Operator(BaseOperator, TolerancesMixin):
@@ -186,6 +187,47 @@ class Operator(BaseOperator, TolerancesMixin):
                 op = op.compose(label_mats[char], qargs=[qubit])
         return op
 
+    @classmethod
+    def from_circuit(cls, circuit, method='dense'):
+        """Return the Operator of a circuit or instruction.
+
+        Args:
+            circuit (QuantumCircuit or Instruction): the circuit to simulate.
+            method (str): the unitary accumulation method. ``'dense'`` is
+                equivalent to ``Operator(circuit)``. ``'sparse'`` keeps the
+                unitary as a permutation times a diagonal matrix, or as a
+                sparse matrix, while the gates allow it and only switches to
+                a dense matrix when their fill-in requires it. This is much
+                faster for circuits of mostly permutation and diagonal gates,
+                such as classical reversible or phase oracle circuits.
+                ``'lazy'`` returns a :class:`LazyOperator` that records the
+                gates as a tensor network and only contracts it when needed
+                [Default: 'dense'].
+
+        Returns:
+            Operator: the N-qubit operator of the circuit.
+
+        Raises:
+            QiskitError: if the method is invalid or the circuit contains
+                         non-unitary instructions.
+        """
+        if method == 'dense':
+            return Operator(circuit)
+        if method == 'lazy':
+            # pylint: disable=cyclic-import
+            from qiskit.quantum_info.operators.lazy_operator import LazyOperator
+            return LazyOperator(circuit)
+        if method != 'sparse':
+            raise QiskitError('Invalid unitary accumulation method "{}"'.format(method))
+        if isinstance(circuit, QuantumCircuit):
+            circuit = circuit.to_instruction()
+        accumulator = UnitaryAccumulator(circuit.num_qubits)
+        phase = cls._accumulate_instruction(accumulator, circuit)
+        mat = accumulator.to_matrix()
+        if phase:
+            mat *= np.exp(1j * phase)
+        return Operator(mat)
+
     def is_unitary(self, atol=None, rtol=None):
         """Return True if operator is a unitary matrix."""
         if atol is None:
@@ -552,3 +594,37 @@ class Operator(BaseOperator, TolerancesMixin):
                 else:
                     new_qargs = [qargs[tup.index] for tup in qregs]
                 self._append_instruction(instr, qargs=new_qargs)
+
+    @classmethod
+    def _accumulate_instruction(cls, accumulator, obj, qargs=None):
+        """Apply an instruction to a UnitaryAccumulator.
+
+        Returns:
+            float: the global phase of the instruction definitions.
+        """
+        from qiskit.circuit.barrier import Barrier
+
+        if qargs is None:
+            qargs = list(range(obj.num_qubits))
+        mat = cls._instruction_to_matrix(obj)
+        if mat is not None:
+            accumulator.apply(mat, qargs)
+            return 0.0
+        if isinstance(obj, Barrier):
+            return 0.0
+        if obj.definition is None:
+            raise QiskitError('Cannot apply Instruction: {}'.format(obj.name))
+        if not isinstance(obj.definition, QuantumCircuit):
+            raise QiskitError('Instruction "{}" '
+                              'definition is {} but expected QuantumCircuit.'.format(
+                                  obj.name, type(obj.definition)))
+        phase = float(obj.definition.global_phase)
+        flat_instr = obj.definition.to_instruction()
+        for instr, qregs, cregs in flat_instr.definition.data:
+            if cregs:
+                raise QiskitError(
+                    'Cannot apply instruction with classical registers: {}'.format(
+                        instr.name))
+            new_qargs = [qargs[tup.index] for tup in qregs]
+            phase += cls._accumulate_instruction(accumulator, instr, qargs=new_qargs)
+        return phase
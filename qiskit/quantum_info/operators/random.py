@@ -14,20 +14,27 @@
 Methods to create random operators.
 """
 
+import functools
+
 import numpy as np
 from numpy.random import default_rng
 
 from qiskit.quantum_info.operators import Operator, Stinespring
+from qiskit.quantum_info.operators.random_batch import RandomBatch
 from qiskit.exceptions import QiskitError
 
 # pylint: disable=unused-import
 from .symplectic.random import random_pauli
 from .symplectic.random import random_clifford
+from .symplectic.random import random_cliffords
 from .symplectic.random import random_pauli_table
 from .symplectic.random import random_stabilizer_table
 
 DEFAULT_RNG = default_rng()
 
+# Maximum dimension of the batched unitaries orthonormalized by vectorized Gram-Schmidt.
+_MAX_GRAM_SCHMIDT_DIM = 8
+
 
 def random_unitary(dims, seed=None):
     """Return a random unitary Operator.
@@ -55,6 +62,77 @@ def random_unitary(dims, seed=None):
     return Operator(mat, input_dims=dims, output_dims=dims)
 
 
+def random_unitaries(dims, size, seed=None):
+    """Return a batch of random unitary Operators.
+
+    The operators are sampled from the unitary Haar measure by orthonormalizing
+    the columns of a stack of complex Gaussian matrices, all at once for small
+    dimensions and by a QR decomposition per matrix for larger ones. The
+    ``(size, dim, dim)`` array of the matrices is the ``data`` of the returned
+    batch, and an :class:`~qiskit.quantum_info.Operator` is only constructed
+    when an element of the batch is accessed.
+
+    The random numbers of each unitary are drawn consecutively, so that for
+    a fixed seed the first ``k`` unitaries of a batch do not depend on its
+    size. They differ from the unitaries returned by :func:`random_unitary`
+    with the same seed.
+
+    Args:
+        dims (int or tuple): the input dimensions of the Operators.
+        size (int): the number of Operators.
+        seed (int or np.random.Generator): Optional. Set a fixed seed or
+                                           generator for RNG.
+
+    Returns:
+        RandomBatch: a batch of unitary operators.
+    """
+    if seed is None:
+        rng = DEFAULT_RNG
+    elif isinstance(seed, np.random.Generator):
+        rng = seed
+    else:
+        rng = default_rng(seed)
+
+    dim = int(np.product(dims))
+    mats = _haar_unitaries(_ginibre_stack(rng, size, dim, dim))
+    constructor = functools.partial(Operator, input_dims=dims, output_dims=dims)
+    return RandomBatch([mats], constructor)
+
+
+def _ginibre_stack(rng, size, nrow, ncol):
+    """Return a stack of complex Gaussian matrices drawn matrix by matrix."""
+    normal = rng.normal(size=(size, nrow, ncol, 2))
+    return normal[..., 0] + 1j * normal[..., 1]
+
+
+def _haar_unitaries(ginibre):
+    """Return the Haar random unitaries of a stack of square Ginibre matrices.
+
+    The columns of small matrices are orthonormalized by classical
+    Gram-Schmidt with one reorthogonalization, vectorized over the stack.
+    Larger matrices are decomposed one by one with :func:`numpy.linalg.qr`,
+    whose ``Q`` columns are multiplied by the phases of the diagonal of ``R``.
+    Both are the QR decomposition with a positive diagonal of ``R`` and so
+    sample the Haar measure.
+    """
+    if ginibre.shape[2] > _MAX_GRAM_SCHMIDT_DIM:
+        mats = np.empty(ginibre.shape, dtype=complex)
+        for mat, gin in zip(mats, ginibre):
+            q_mat, r_mat = np.linalg.qr(gin)
+            diag = np.diag(r_mat)
+            mat[:] = q_mat * (diag / np.abs(diag))
+        return mats
+    mats = np.array(ginibre, dtype=complex)
+    for col in range(mats.shape[2]):
+        vec = mats[:, :, col]
+        basis = mats[:, :, :col]
+        for _ in range(2):
+            overlaps = np.einsum('kij,ki->kj', basis.conj(), vec)
+            vec = vec - np.einsum('kij,kj->ki', basis, overlaps)
+        mats[:, :, col] = vec / np.linalg.norm(vec, axis=1)[:, None]
+    return mats
+
+
 def random_hermitian(dims, traceless=False, seed=None):
     """Return a random hermitian Operator.
 
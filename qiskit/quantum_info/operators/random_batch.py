@@ -0,0 +1,65 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Batches of random objects stored as stacked arrays.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class RandomBatch(Sequence):
+    """A sequence of random objects stored as stacked arrays.
+
+    The objects of the batch are stored in one or more arrays whose first axis
+    is the batch index, and an object is only constructed from its slice of the
+    arrays when it is accessed by an integer index. Slicing a batch returns a
+    batch that shares the arrays.
+    """
+
+    def __init__(self, arrays, constructor):
+        """Initialize a batch.
+
+        Args:
+            arrays (tuple): the arrays of the batch with the same first axis.
+            constructor (callable): a function of the slices of the arrays
+                                    returning an object of the batch.
+        """
+        self._arrays = tuple(arrays)
+        self._constructor = constructor
+
+    @property
+    def data(self):
+        """Return the stacked array, or the tuple of arrays, of the batch."""
+        if len(self._arrays) == 1:
+            return self._arrays[0]
+        return self._arrays
+
+    def __len__(self):
+        """Return the number of objects of the batch."""
+        return len(self._arrays[0])
+
+    def __getitem__(self, key):
+        """Return an object of the batch, or a batch of a slice or index array."""
+        if isinstance(key, (int, np.integer)):
+            return self._constructor(*(array[key] for array in self._arrays))
+        return RandomBatch((array[key] for array in self._arrays), self._constructor)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        shapes = ', '.join(str(array.shape) for array in self._arrays)
+        return 'RandomBatch(size={}, shapes=[{}])'.format(len(self), shapes)
@@ -0,0 +1,135 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Bit-packing helper functions for symplectic tables.
+
+The rows of a boolean array are packed into little-endian 64-bit words, so that bit ``j`` of a
+row is bit ``j % 64`` of word ``j // 64``. The unused bits of the last word are zero.
+"""
+
+import numpy as np
+
+_ONE = np.uint64(1)
+
+# Masks of the SWAR population count of 64-bit words
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0f0f0f0f0f0f0f0f)
+_H01 = np.uint64(0x0101010101010101)
+
+# Masks of the interleaving of the bits of 32-bit integers
+_SPREAD = [(np.uint64(16), np.uint64(0x0000ffff0000ffff)),
+           (np.uint64(8), np.uint64(0x00ff00ff00ff00ff)),
+           (np.uint64(4), np.uint64(0x0f0f0f0f0f0f0f0f)),
+           (np.uint64(2), np.uint64(0x3333333333333333)),
+           (np.uint64(1), np.uint64(0x5555555555555555))]
+_LOW = np.uint64(0xffffffff)
+
+# Bits of every byte in reverse order
+_REVERSED_BYTES = np.array([int('{:08b}'.format(i)[::-1], 2) for i in range(256)],
+                           dtype=np.uint8)
+
+
+def num_words(num_bits):
+    """Return the number of 64-bit words of a packed row of ``num_bits`` bits."""
+    return max(1, -(-num_bits // 64))
+
+
+def pack_bits(bits):
+    """Pack the rows of a 2D boolean array into little-endian uint64 words."""
+    bits = np.asarray(bits, dtype=bool)
+    packed = np.zeros((bits.shape[0], 8 * num_words(bits.shape[1])), dtype=np.uint8)
+    packed[:, :-(-bits.shape[1] // 8)] = np.packbits(bits, axis=1, bitorder='little')
+    return packed.view('<u8').astype(np.uint64)
+
+
+def unpack_bits(words, num_bits):
+    """Unpack rows of uint64 words into a boolean array of ``num_bits`` columns."""
+    return np.unpackbits(np.ascontiguousarray(words, dtype='<u8').view(np.uint8), axis=1,
+                         count=num_bits, bitorder='little').astype(bool)
+
+
+def _word_popcount(words):
+    """Return the number of set bits of every word of a uint64 array."""
+    words = words - ((words >> _ONE) & _M1)
+    words = (words & _M2) + ((words >> np.uint64(2)) & _M2)
+    words = (words + (words >> np.uint64(4))) & _M4
+    return (words * _H01) >> np.uint64(56)
+
+
+def popcount(words):
+    """Return the number of set bits of each row of a uint64 word array."""
+    return _word_popcount(words).sum(axis=-1, dtype=np.int64)
+
+
+def parity(words):
+    """Return the parity of the number of set bits of each row of a uint64 word array."""
+    return (_word_popcount(np.bitwise_xor.reduce(words, axis=-1)) & _ONE).astype(bool)
+
+
+def interleave_bits(high, low):
+    """Interleave the bits of two uint64 word arrays into twice as many words.
+
+    Bit ``j`` of ``low`` and ``high`` become bits ``2j`` and ``2j + 1`` of the output, so that
+    the output words compare in the order of the pairs of bits from the most significant bit.
+    """
+    out = np.empty(high.shape[:-1] + (2 * high.shape[-1],), dtype=np.uint64)
+    for shift, half in [(np.uint64(0), 0), (np.uint64(32), 1)]:
+        spread_high = (high >> shift) & _LOW
+        spread_low = (low >> shift) & _LOW
+        for step, mask in _SPREAD:
+            spread_high = (spread_high | (spread_high << step)) & mask
+            spread_low = (spread_low | (spread_low << step)) & mask
+        out[..., half::2] = (spread_high << _ONE) | spread_low
+    return out
+
+
+def lexicographic_keys(words):
+    """Return keys of packed rows whose order is the lexicographic order of the rows of bits.
+
+    The bits of every word are reversed, so that bit 0 of a row is the most
+    significant bit of its first key.
+    """
+    data = np.ascontiguousarray(words, dtype='<u8').view(np.uint8)
+    return _REVERSED_BYTES[data].view('>u8').astype(np.uint64)
+
+
+def group_rows(words):
+    """Sort packed rows and find the runs of equal rows.
+
+    Args:
+        words (np.ndarray): a 2D uint64 array of packed rows.
+
+    Returns:
+        tuple: the stable order that sorts the rows by their words, and the
+        positions in the sorted rows where every run of equal rows starts.
+    """
+    # np.lexsort is stable so the first row of every run is its first occurrence
+    order = np.lexsort(words.T[::-1])
+    ordered = words[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+    return order, np.flatnonzero(first)
+
+
+def unique_rows(words):
+    """Return the indices of the first occurrences and the counts of unique rows.
+
+    Args:
+        words (np.ndarray): a 2D uint64 array of packed rows.
+
+    Returns:
+        tuple: the indices of the first occurrence of each unique row, in the
+        order of the sorted rows, and the number of occurrences of each row.
+    """
+    order, starts = group_rows(words)
+    return order[starts], np.diff(np.append(starts, len(order)))
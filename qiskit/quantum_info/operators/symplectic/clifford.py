@@ -380,10 +380,6 @@ class Clifford(BaseOperator):
         if not isinstance(circuit, (QuantumCircuit, Instruction)):
             raise QiskitError("Input must be a QuantumCircuit or Instruction")
 
-        # Convert circuit to an instruction
-        if isinstance(circuit, QuantumCircuit):
-            circuit = circuit.to_instruction()
-
         # Initialize an identity Clifford
         clifford = Clifford(np.eye(2 * circuit.num_qubits), validate=False)
         _append_circuit(clifford, circuit)
@@ -554,52 +550,52 @@ class Clifford(BaseOperator):
 
         num_qubits = self.num_qubits
 
-        array1 = table1.array.astype(int)
-        phase1 = table1.phase.astype(int)
-
-        array2 = table2.array.astype(int)
-        phase2 = table2.phase.astype(int)
+        array1 = table1.array
+        array2 = table2.array
 
-        # Update Pauli table
-        pauli = StabilizerTable(array2.dot(array1) % 2)
+        # Row k of the new table is the product of the rows i of table1 with array2[k, i]
+        # set, in increasing order of i
+        pauli = _gf2_matmul(array2, array1)
 
         # Add phases
-        phase = np.mod(array2.dot(phase1) + phase2, 2)
-
-        # Correcting for phase due to Pauli multiplication
-        ifacts = np.zeros(2 * num_qubits, dtype=np.int)
-
-        for k in range(2 * num_qubits):
-
-            row2 = array2[k]
-            x2 = table2.X[k]
-            z2 = table2.Z[k]
+        phase = np.sum(array2 & table1.phase, axis=1) + table2.phase
 
-            # Adding a factor of i for each Y in the image of an operator under the
-            # first operation, since Y=iXZ
+        # Correcting for phase due to Pauli multiplication, in powers of i. Every row
+        # is i^{x.z} X^x Z^z, since Y=iXZ, and moving the Z part of a row a past the
+        # X part of a later row b gives a factor (-1)^{z_a.x_b}.
+        ifacts = np.sum(table2.X & table2.Z, axis=1)
+        ifacts += array2.astype(int).dot(np.sum(table1.X & table1.Z, axis=1))
+        ifacts -= np.sum(pauli[:, :num_qubits] & pauli[:, num_qubits:], axis=1)
+        commute = np.triu(_gf2_matmul(table1.Z, table1.X.T), k=1)
+        ifacts += 2 * np.sum(_gf2_matmul(array2, commute) & array2, axis=1)
 
-            ifacts[k] += np.sum(x2 & z2)
+        p = np.mod(ifacts, 4) // 2
 
-            # Adding factors of i due to qubit-wise Pauli multiplication
+        phase = np.mod(phase + p, 2).astype(bool)
 
-            for j in range(num_qubits):
-                x = 0
-                z = 0
-                for i in range(2 * num_qubits):
-                    if row2[i]:
-                        x1 = array1[i, j]
-                        z1 = array1[i, j + num_qubits]
-                        if (x | z) & (x1 | z1):
-                            val = np.mod(np.abs(3 * z1 - x1) - np.abs(3 * z - x) - 1, 3)
-                            if val == 0:
-                                ifacts[k] += 1
-                            elif val == 1:
-                                ifacts[k] -= 1
-                        x = np.mod(x + x1, 2)
-                        z = np.mod(z + z1, 2)
+        return Clifford(StabilizerTable(pauli, phase), validate=False)
 
-        p = np.mod(ifacts, 4) // 2
 
-        phase = np.mod(phase + p, 2)
+def _gf2_matmul(mat1, mat2):
+    """Return the product of two boolean matrices modulo 2.
 
-        return Clifford(StabilizerTable(pauli, phase), validate=False)
+    The rows of ``mat2`` are packed into 64-bit words. For every 8 columns of ``mat1`` the
+    XOR of all subsets of the corresponding 8 packed rows is tabulated, and the rows of the
+    product accumulate the table entries indexed by the bytes of ``mat1``.
+    """
+    num_rows, num_inner = mat1.shape
+    num_cols = mat2.shape[1]
+    packed = np.packbits(mat2, axis=1)
+    num_words = max(1, -(-packed.shape[1] // 8))
+    packed = np.pad(packed, ((0, 0), (0, 8 * num_words - packed.shape[1])))
+    packed = np.ascontiguousarray(packed).view(np.uint64)
+    indices = np.packbits(mat1, axis=1, bitorder='little')
+    result = np.zeros((num_rows, num_words), dtype=np.uint64)
+    table = np.zeros((256, num_words), dtype=np.uint64)
+    for chunk in range(indices.shape[1]):
+        rows = packed[8 * chunk:min(8 * chunk + 8, num_inner)]
+        for j, row in enumerate(rows):
+            np.bitwise_xor(table[:2 ** j], row, out=table[2 ** j:2 ** (j + 1)])
+        result ^= table[indices[:, chunk]]
+    result = np.ascontiguousarray(result).view(np.uint8)
+    return np.unpackbits(result, axis=1, count=num_cols).astype(bool)
@@ -14,6 +14,8 @@ Circuit simulation for the Clifford class.
 """
 # pylint: disable=invalid-name
 
+import numpy as np
+
 from qiskit.exceptions import QiskitError
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.barrier import Barrier
@@ -22,6 +24,9 @@ from qiskit.circuit.barrier import Barrier
 def _append_circuit(clifford, circuit, qargs=None):
     """Update Clifford inplace by applying a Clifford circuit.
 
+    Circuits and composite gates are lowered to a program of basis gates,
+    which is applied to the whole table at once by :func:`_apply_program`.
+
     Args:
         clifford (Clifford): the Clifford to update.
         circuit (QuantumCircuit or Instruction): the gate or composite gate to apply.
@@ -39,67 +44,253 @@ def _append_circuit(clifford, circuit, qargs=None):
     if qargs is None:
         qargs = list(range(clifford.num_qubits))
 
-    if isinstance(circuit, QuantumCircuit):
-        gate = circuit.to_instruction()
-    else:
-        gate = circuit
-
-    # Basis Clifford Gates
-    basis_1q = {
-        'i': _append_i, 'id': _append_i, 'iden': _append_i,
-        'x': _append_x, 'y': _append_y, 'z': _append_z, 'h': _append_h,
-        's': _append_s, 'sdg': _append_sdg, 'sinv': _append_sdg,
-        'v': _append_v, 'w': _append_w
-    }
-    basis_2q = {
-        'cx': _append_cx, 'cz': _append_cz, 'swap': _append_swap
-    }
-
-    # Non-clifford gates
-    non_clifford = ['t', 'tdg', 'ccx', 'ccz']
-
-    if isinstance(gate, str):
+    if isinstance(circuit, str):
         # Check if gate is a valid Clifford basis gate string
-        if gate not in basis_1q and gate not in basis_2q:
-            raise QiskitError("Invalid Clifford gate name string {}".format(gate))
-        name = gate
+        if circuit not in _BASIS_OPCODES:
+            raise QiskitError("Invalid Clifford gate name string {}".format(circuit))
+        name = circuit
     else:
-        # Assume gate is an Instruction
-        name = gate.name
+        name = circuit.name
 
     # Apply gate if it is a Clifford basis gate
-    if name in non_clifford:
-        raise QiskitError(
-            "Cannot update Clifford with non-Clifford gate {}".format(name))
-    if name in basis_1q:
+    basis = isinstance(circuit, str) or _is_basis_instruction(circuit)
+    if name in _BASIS_1Q and basis:
         if len(qargs) != 1:
             raise QiskitError("Invalid qubits for 1-qubit gate.")
-        return basis_1q[name](clifford, qargs[0])
-    if name in basis_2q:
+        return _BASIS_1Q[name](clifford, qargs[0])
+    if name in _BASIS_2Q and basis:
         if len(qargs) != 2:
             raise QiskitError("Invalid qubits for 2-qubit gate.")
-        return basis_2q[name](clifford, qargs[0], qargs[1])
-
-    # If not a Clifford basis gate we try to unroll the gate and
-    # raise an exception if unrolling reaches a non-Clifford gate.
-    # TODO: We could also check u3 params to see if they
-    # are a single qubit Clifford gate rather than raise an exception.
-    if gate.definition is None:
-        raise QiskitError('Cannot apply Instruction: {}'.format(gate.name))
-    if not isinstance(gate.definition, QuantumCircuit):
+        return _BASIS_2Q[name](clifford, qargs[0], qargs[1])
+
+    return _apply_program(clifford, _circuit_program(circuit, qargs))
+
+
+# ---------------------------------------------------------------------
+# Programs of Clifford basis gates
+# ---------------------------------------------------------------------
+
+# Opcodes of the Clifford basis gates of a program
+_OP_X, _OP_Y, _OP_Z, _OP_H, _OP_S, _OP_SDG, _OP_V, _OP_W, _OP_CX, _OP_CZ, _OP_SWAP = range(11)
+
+_BASIS_OPCODES = {
+    'i': None, 'id': None, 'iden': None,
+    'x': _OP_X, 'y': _OP_Y, 'z': _OP_Z, 'h': _OP_H,
+    's': _OP_S, 'sdg': _OP_SDG, 'sinv': _OP_SDG,
+    'v': _OP_V, 'w': _OP_W,
+    'cx': _OP_CX, 'cz': _OP_CZ, 'swap': _OP_SWAP
+}
+
+# Non-clifford gates
+_NON_CLIFFORD = ('t', 'tdg', 'ccx', 'ccz')
+
+# Programs of the definitions of library gates, which only depend on the
+# gate type and parameters
+_DEFINITION_CACHE = {}
+
+
+def _circuit_program(circuit, qargs=None):
+    """Lower a Clifford circuit or instruction to a program of basis gates.
+
+    Composite instructions are unrolled through their definitions. The
+    program of a definition is built once per library gate type and
+    parameters, or per instruction object, and is then reused with the
+    qubits of every occurrence of the gate.
+
+    Args:
+        circuit (QuantumCircuit or Instruction): the circuit to lower.
+        qargs (list or None): the qubits to apply the circuit to.
+
+    Returns:
+        np.ndarray: a ``(K, 3)`` integer array of rows ``(opcode, qubit0, qubit1)``,
+        where ``qubit1`` is ``qubit0`` for single-qubit gates.
+
+    Raises:
+        QiskitError: if the circuit cannot be decomposed into Clifford gates.
+    """
+    if qargs is None:
+        qargs = list(range(circuit.num_qubits))
+    program = []
+    _lower_instruction(circuit, list(qargs), program, {})
+    return np.array(program, dtype=np.int64).reshape(-1, 3)
+
+
+def _lower_instruction(instruction, qargs, program, cache):
+    """Append the basis gates of an instruction on qargs to a program list."""
+    if not isinstance(instruction, QuantumCircuit):
+        name = instruction.name
+        if name == 'barrier':
+            return
+        if name in _BASIS_OPCODES and _is_basis_instruction(instruction):
+            opcode = _BASIS_OPCODES[name]
+            if len(qargs) != (2 if opcode in (_OP_CX, _OP_CZ, _OP_SWAP) else 1):
+                raise QiskitError("Invalid qubits for {} gate.".format(name))
+            if opcode is not None:
+                program.append((opcode, qargs[0], qargs[-1]))
+            return
+        if name in _NON_CLIFFORD:
+            raise QiskitError(
+                "Cannot update Clifford with non-Clifford gate {}".format(name))
+    fragment = _definition_program(instruction, cache)
+    program.extend([(opcode, qargs[qubit0], qargs[qubit1])
+                    for opcode, qubit0, qubit1 in fragment])
+
+
+def _is_basis_instruction(instruction):
+    """Return True if an instruction is the basis gate of its name."""
+    if isinstance(instruction, QuantumCircuit):
+        return False
+    # Controlled gates with open controls keep the name of the gate
+    num_ctrl_qubits = getattr(instruction, 'num_ctrl_qubits', 0)
+    return not num_ctrl_qubits or instruction.ctrl_state == 2 ** num_ctrl_qubits - 1
+
+
+def _definition_program(instruction, cache):
+    """Return the cached program of an instruction on its local qubits."""
+    key = _definition_key(instruction)
+    fragment = _DEFINITION_CACHE.get(key) if key else cache.get(id(instruction))
+    if fragment is not None:
+        return fragment
+
+    if isinstance(instruction, QuantumCircuit):
+        circuit = instruction
+    elif instruction.definition is None:
+        raise QiskitError('Cannot apply Instruction: {}'.format(instruction.name))
+    elif not isinstance(instruction.definition, QuantumCircuit):
         raise QiskitError('{} instruction definition is {}; expected QuantumCircuit'.format(
-            gate.name, type(gate.definition)))
-    for instr, qregs, cregs in gate.definition:
+            instruction.name, type(instruction.definition)))
+    else:
+        circuit = instruction.definition
+
+    fragment = []
+    indices = {bit: idx for idx, bit in enumerate(circuit.qubits)}
+    for instr, qregs, cregs in circuit.data:
         if cregs:
             raise QiskitError(
                 'Cannot apply Instruction with classical registers: {}'.format(
                     instr.name))
-        # Get the integer position of the flat register
-        new_qubits = [qargs[tup.index] for tup in qregs]
-        _append_circuit(clifford, instr, new_qubits)
+        _lower_instruction(instr, [indices[qubit] for qubit in qregs], fragment, cache)
+
+    if key:
+        _DEFINITION_CACHE[key] = fragment
+    else:
+        cache[id(instruction)] = fragment
+    return fragment
+
+
+def _definition_key(instruction):
+    """Return the cache key of a library gate, or None for other instructions."""
+    if (isinstance(instruction, QuantumCircuit) or
+            not type(instruction).__module__.startswith('qiskit.circuit.library')):
+        return None
+    try:
+        params = tuple(float(param) for param in instruction.params)
+    except (TypeError, ValueError):
+        return None
+    return (type(instruction), instruction.num_qubits, params,
+            getattr(instruction, 'ctrl_state', None))
+
+
+def _apply_program(clifford, program):
+    """Update a Clifford inplace by applying a program of basis gates.
+
+    Args:
+        clifford (Clifford): the Clifford to update.
+        program (np.ndarray): the ``(K, 3)`` program of basis gates.
+
+    Returns:
+        Clifford: the updated Clifford.
+    """
+    table = clifford.table
+    x_cols = _columns_to_ints(table.X)
+    z_cols = _columns_to_ints(table.Z)
+    phase = _columns_to_ints(table.phase[:, None])[0]
+    phase = _evolve_columns(x_cols, z_cols, phase, program)
+    num_rows = len(table.phase)
+    table.X[:] = _ints_to_columns(x_cols, num_rows)
+    table.Z[:] = _ints_to_columns(z_cols, num_rows)
+    table.phase[:] = _ints_to_columns([phase], num_rows)[:, 0]
     return clifford
 
 
+def _evolve_columns(x_cols, z_cols, phase, program):
+    """Apply a program of basis gates to the columns of a table in place.
+
+    Each column of the ``x`` and ``z`` bits, and the phases, of all rows of the
+    table are packed into an integer, so that a gate updates all rows with a
+    few integer bitwise operations on the columns of its qubits.
+
+    Args:
+        x_cols (list[int]): the packed ``x`` columns of the table, one per qubit.
+        z_cols (list[int]): the packed ``z`` columns of the table, one per qubit.
+        phase (int): the packed phases of the table.
+        program (np.ndarray): the ``(K, 3)`` program of basis gates.
+
+    Returns:
+        int: the updated packed phases.
+    """
+    # pylint: disable=too-many-branches
+    for opcode, qubit0, qubit1 in program.tolist():
+        if opcode == _OP_CX:
+            x0 = x_cols[qubit0]
+            z1 = z_cols[qubit1]
+            phase ^= ~(x_cols[qubit1] ^ z_cols[qubit0]) & z1 & x0
+            x_cols[qubit1] ^= x0
+            z_cols[qubit0] ^= z1
+        elif opcode == _OP_H:
+            x0 = x_cols[qubit0]
+            z0 = z_cols[qubit0]
+            phase ^= x0 & z0
+            x_cols[qubit0] = z0
+            z_cols[qubit0] = x0
+        elif opcode == _OP_S:
+            x0 = x_cols[qubit0]
+            phase ^= x0 & z_cols[qubit0]
+            z_cols[qubit0] ^= x0
+        elif opcode == _OP_SDG:
+            x0 = x_cols[qubit0]
+            phase ^= x0 & ~z_cols[qubit0]
+            z_cols[qubit0] ^= x0
+        elif opcode == _OP_X:
+            phase ^= z_cols[qubit0]
+        elif opcode == _OP_Y:
+            phase ^= x_cols[qubit0] ^ z_cols[qubit0]
+        elif opcode == _OP_Z:
+            phase ^= x_cols[qubit0]
+        elif opcode == _OP_CZ:
+            x0 = x_cols[qubit0]
+            x1 = x_cols[qubit1]
+            phase ^= x0 & x1 & (z_cols[qubit0] ^ z_cols[qubit1])
+            z_cols[qubit1] ^= x0
+            z_cols[qubit0] ^= x1
+        elif opcode == _OP_SWAP:
+            x_cols[qubit0], x_cols[qubit1] = x_cols[qubit1], x_cols[qubit0]
+            z_cols[qubit0], z_cols[qubit1] = z_cols[qubit1], z_cols[qubit0]
+        elif opcode == _OP_V:
+            x0 = x_cols[qubit0]
+            x_cols[qubit0] = x0 ^ z_cols[qubit0]
+            z_cols[qubit0] = x0
+        elif opcode == _OP_W:
+            z0 = z_cols[qubit0]
+            z_cols[qubit0] = z0 ^ x_cols[qubit0]
+            x_cols[qubit0] = z0
+    return phase
+
+
+def _columns_to_ints(bits):
+    """Pack the columns of a boolean array into integers, with bit i from row i."""
+    packed = np.packbits(bits.T, axis=1, bitorder='little')
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def _ints_to_columns(ints, num_rows):
+    """Unpack integers of num_rows bits into the columns of a boolean array."""
+    num_bytes = -(-num_rows // 8)
+    data = b''.join(value.to_bytes(num_bytes, 'little') for value in ints)
+    packed = np.frombuffer(data, dtype=np.uint8).reshape(len(ints), num_bytes)
+    return np.unpackbits(packed, axis=1, count=num_rows, bitorder='little').T.astype(bool)
+
+
 # ---------------------------------------------------------------------
 # Helper functions for applying basis gates
 # ---------------------------------------------------------------------
@@ -312,3 +503,15 @@ def _append_swap(clifford, qubit0, qubit1):
     clifford.table.X[:, [qubit0, qubit1]] = clifford.table.X[:, [qubit1, qubit0]]
     clifford.table.Z[:, [qubit0, qubit1]] = clifford.table.Z[:, [qubit1, qubit0]]
     return clifford
+
+
+# Basis Clifford Gates
+_BASIS_1Q = {
+    'i': _append_i, 'id': _append_i, 'iden': _append_i,
+    'x': _append_x, 'y': _append_y, 'z': _append_z, 'h': _append_h,
+    's': _append_s, 'sdg': _append_sdg, 'sinv': _append_sdg,
+    'v': _append_v, 'w': _append_w
+}
+_BASIS_2Q = {
+    'cx': _append_cx, 'cz': _append_cz, 'swap': _append_swap
+}
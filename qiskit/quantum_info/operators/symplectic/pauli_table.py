@@ -20,6 +20,8 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit.quantum_info.operators.scalar_op import ScalarOp
 from qiskit.quantum_info.operators.symplectic.pauli import Pauli
+from qiskit.quantum_info.operators.symplectic.bit_packing import (
+    pack_bits, unpack_bits, num_words, popcount, parity, interleave_bits, unique_rows)
 from qiskit.quantum_info.operators.custom_iterator import CustomIterator
 
 
@@ -111,6 +113,18 @@ class PauliTable(BaseOperator):
     sub-arrays for only the `X` or `Z` blocks can be accessed using the
     :attr:`X` and :attr:`Z` properties respectively.
 
+    **Packed Storage**
+
+    A table can instead store the `X` and `Z` blocks with every row packed
+    into 64-bit words, which uses 8 times less memory than the boolean array.
+    A packed table is constructed with :meth:`from_packed` and the packed
+    words of any table are returned by :meth:`to_packed`. The
+    :meth:`compose`, :meth:`dot`, :meth:`commutes_with_all`,
+    :meth:`anticommutes_with_all`, :meth:`sort` and :meth:`unique` methods
+    operate on the packed words, and return packed tables for packed inputs.
+    The boolean :attr:`array` of a packed table is unpacked on first access,
+    after which the table is stored as a boolean array.
+
     **Iteration**
 
     Rows in the Pauli table can be iterated over like a list. Iteration can
@@ -136,14 +150,16 @@ class PauliTable(BaseOperator):
             The input array is not copied so multiple Pauli tables
             can share the same underlying array.
         """
+        self._packed = None
         if isinstance(data, (np.ndarray, list)):
             self._array = np.asarray(data, dtype=np.bool)
         elif isinstance(data, str):
             # If input is a single Pauli string we convert to table
             self._array = PauliTable._from_label(data)
         elif isinstance(data, PauliTable):
-            # Share underlying array
-            self._array = data._array
+            # Share underlying array or packed words
+            self._bool_array = data._bool_array
+            self._packed = data._packed
         elif isinstance(data, Pauli):
             self._array = np.hstack([data.x, data.z])
         elif isinstance(data, ScalarOp):
@@ -155,6 +171,11 @@ class PauliTable(BaseOperator):
         else:
             raise QiskitError("Invalid input data for PauliTable.")
 
+        if self._packed is not None:
+            self._num_paulis = data.size
+            super().__init__(num_qubits=data.num_qubits)
+            return
+
         # Input must be a (K, 2*N) shape matrix for M N-qubit Paulis.
         if self._array.ndim == 1:
             self._array = np.reshape(self._array, (1, self._array.size))
@@ -170,7 +191,7 @@ class PauliTable(BaseOperator):
         """Display representation."""
         prefix = 'PauliTable('
         return '{}{})'.format(prefix, np.array2string(
-            self._array, separator=',', prefix=prefix))
+            self._as_array(), separator=',', prefix=prefix))
 
     def __str__(self):
         """String representation."""
@@ -179,7 +200,11 @@ class PauliTable(BaseOperator):
     def __eq__(self, other):
         """Test if two Pauli tables are equal."""
         if isinstance(other, PauliTable):
-            return np.all(self._array == other._array)
+            if self._packed is None and other._packed is None:
+                return np.all(self._array == other._array)
+            return self.shape == other.shape and all(
+                np.array_equal(words1, words2)
+                for words1, words2 in zip(self.to_packed(), other.to_packed()))
         return False
 
     # ---------------------------------------------------------------------
@@ -216,6 +241,70 @@ class PauliTable(BaseOperator):
     def Z(self, val):
         self._array[:, self.num_qubits:2*self.num_qubits] = val
 
+    @property
+    def _array(self):
+        """The boolean array, which is unpacked from the packed words on first access."""
+        if self._bool_array is None:
+            self._bool_array = self._as_array()
+            self._packed = None
+        return self._bool_array
+
+    @_array.setter
+    def _array(self, value):
+        self._bool_array = value
+        self._packed = None
+
+    def _as_array(self):
+        """Return the boolean array without changing the storage of the table."""
+        if self._packed is None:
+            return self._bool_array
+        x_words, z_words = self._packed
+        return np.hstack([unpack_bits(x_words, self.num_qubits),
+                          unpack_bits(z_words, self.num_qubits)])
+
+    @classmethod
+    def from_packed(cls, x, z, num_qubits):
+        """Construct a PauliTable stored as packed words.
+
+        Bit ``j`` of row ``i`` of the `X` block is bit ``j % 64`` of the word
+        ``x[i, j // 64]``, and similarly for the `Z` block. The unused bits of
+        the last word of each row must be zero.
+
+        Args:
+            x (array): the ``(K, W)`` uint64 array of the packed `X` block.
+            z (array): the ``(K, W)`` uint64 array of the packed `Z` block.
+            num_qubits (int): the number of qubits ``N``, where
+                              ``W = max(1, ceil(N / 64))``.
+
+        Returns:
+            PauliTable: the packed table. The input arrays are not copied.
+
+        Raises:
+            QiskitError: if the input arrays have an invalid shape.
+        """
+        x = np.asarray(x, dtype=np.uint64)
+        z = np.asarray(z, dtype=np.uint64)
+        if x.ndim != 2 or x.shape != z.shape or x.shape[1] != num_words(num_qubits):
+            raise QiskitError("Invalid shape for packed PauliTable.")
+        ret = PauliTable.__new__(PauliTable)
+        ret._bool_array = None
+        ret._packed = (x, z)
+        ret._num_paulis = x.shape[0]
+        BaseOperator.__init__(ret, num_qubits=num_qubits)
+        return ret
+
+    def to_packed(self):
+        """Return the `X` and `Z` blocks with rows packed into 64-bit words.
+
+        Returns:
+            tuple: the ``(x, z)`` uint64 arrays of the packed blocks. These
+                   share memory with a packed table, and are packed from the
+                   boolean array otherwise.
+        """
+        if self._packed is not None:
+            return self._packed
+        return pack_bits(self.X), pack_bits(self.Z)
+
     # ---------------------------------------------------------------------
     # Size Properties
     # ---------------------------------------------------------------------
@@ -223,7 +312,7 @@ class PauliTable(BaseOperator):
     @property
     def shape(self):
         """The full shape of the :meth:`array`"""
-        return self._array.shape
+        return (self._num_paulis, 2 * self.num_qubits)
 
     @property
     def size(self):
@@ -244,6 +333,9 @@ class PauliTable(BaseOperator):
         # This supports all slicing operations the underlying array supports.
         if isinstance(key, (int, np.int)):
             key = [key]
+        if self._packed is not None:
+            x_words, z_words = self._packed
+            return PauliTable.from_packed(x_words[key], z_words[key], self.num_qubits)
         return PauliTable(self._array[key])
 
     def __setitem__(self, key, value):
@@ -356,30 +448,17 @@ class PauliTable(BaseOperator):
         """
         # Get order of each Pauli using
         # I => 0, X => 1, Y => 2, Z => 3
-        x = self.X
-        z = self.Z
-        order = 1 * (x & ~z) + 2 * (x & z) + 3 * (~x & z)
-        # Optionally get the weight of Pauli
+        # This is the 2-bit integer with high bit z and low bit x ^ z, and the
+        # orders of all qubits are interleaved into 64-bit keys so that qubits
+        # of higher index are more significant
+        x, z = self.to_packed()
+        sort_keys = list(interleave_bits(z, x ^ z).T)
+        # Optionally sort by weight of Pauli
         # This is the number of non identity terms
         if weight:
-            weights = np.sum(x | z, axis=1)
-
-        # Sort by order
-        # To preserve ordering between successive sorts we
-        # are use the 'stable' sort method
-        indices = np.arange(self.size)
-        for i in range(self.num_qubits):
-            sort_inds = order[:, i].argsort(kind='stable')
-            order = order[sort_inds]
-            indices = indices[sort_inds]
-            if weight:
-                weights = weights[sort_inds]
-
-        # If using weights we implement a final sort by total number
-        # of non-identity Paulis
-        if weight:
-            indices = indices[weights.argsort(kind='stable')]
-        return indices
+            sort_keys.append(popcount(x | z))
+        # np.lexsort is stable and sorts by the last key first
+        return np.lexsort(sort_keys)
 
     def sort(self, weight=False):
         """Sort the rows of the table.
@@ -457,11 +536,7 @@ class PauliTable(BaseOperator):
                 The number of times each of the unique values comes up in the
                 original array. Only provided if ``return_counts`` is True.
         """
-        if return_counts:
-            _, index, counts = np.unique(self.array, return_index=True,
-                                         return_counts=True, axis=0)
-        else:
-            _, index = np.unique(self.array, return_index=True, axis=0)
+        index, counts = unique_rows(np.hstack(self.to_packed()))
         # Sort the index so we return unique rows in the original array order
         sort_inds = index.argsort()
         index = index[sort_inds]
@@ -586,19 +661,23 @@ class PauliTable(BaseOperator):
         if qargs and other.num_qubits != len(qargs):
             raise QiskitError("Number of qubits in the other PauliTable does not match qargs.")
 
+        if qargs is None:
+            x1, z1 = self.to_packed()
+            x2, z2 = other.to_packed()
+            x1, x2 = self._block_stack(x1, x2)
+            z1, z2 = self._block_stack(z1, z2)
+            return self._from_words(x1 ^ x2, z1 ^ z2, other)
+
         # Stack X and Z blocks for output size
         x1, x2 = self._block_stack(self.X, other.X)
         z1, z2 = self._block_stack(self.Z, other.Z)
 
-        if qargs is not None:
-            ret_x, ret_z = x1.copy(), z1.copy()
-            x1 = x1[:, qargs]
-            z1 = z1[:, qargs]
-            ret_x[:, qargs] = x1 ^ x2
-            ret_z[:, qargs] = z1 ^ z2
-            pauli = np.hstack([ret_x, ret_z])
-        else:
-            pauli = np.hstack((x1 ^ x2, z1 ^ z2))
+        ret_x, ret_z = x1.copy(), z1.copy()
+        x1 = x1[:, qargs]
+        z1 = z1[:, qargs]
+        ret_x[:, qargs] = x1 ^ x2
+        ret_z[:, qargs] = z1 ^ z2
+        pauli = np.hstack([ret_x, ret_z])
         return PauliTable(pauli)
 
     def dot(self, other, qargs=None):
@@ -655,13 +734,13 @@ class PauliTable(BaseOperator):
 
         if qargs is None or (sorted(qargs) == qargs
                              and len(qargs) == self.num_qubits):
-            return PauliTable(np.vstack((self._array, other._array)))
+            return self._vstack(other)
 
         # Pad other with identity and then add
         padded = PauliTable(
             np.zeros((1, 2 * self.num_qubits), dtype=np.bool))
         padded = padded.compose(other, qargs=qargs)
-        return PauliTable(np.vstack((self._array, padded._array)))
+        return self._vstack(padded)
 
     def conjugate(self):
         """Not implemented."""
@@ -743,15 +822,15 @@ class PauliTable(BaseOperator):
         """
         if not isinstance(other, PauliTable):
             other = PauliTable(other)
-        comms = PauliTable._commutes(self, other[0])
-        inds, = np.where(comms == int(not anti))
-        for pauli in other[1:]:
-            comms = PauliTable._commutes(self[inds], pauli)
-            new_inds, = np.where(comms == int(not anti))
-            if new_inds.size == 0:
+        x1, z1 = self.to_packed()
+        inds = np.arange(self.size)
+        for x2, z2 in zip(*other.to_packed()):
+            # Rows anti-commute if their symplectic product is odd
+            anticomms = parity((x1[inds] & z2) ^ (z1[inds] & x2))
+            inds = inds[anticomms == anti]
+            if inds.size == 0:
                 # No commuting rows
-                return new_inds
-            inds = inds[new_inds]
+                break
         return inds
 
     @staticmethod
@@ -766,17 +845,25 @@ class PauliTable(BaseOperator):
             array: boolean vector of which rows commute (True) or
                    anti-commute (False).
         """
-        # Find positions where self and pauli are not identities
-        non_iden = (pauli_table.X | pauli_table.Z) & (pauli.X | pauli.Z)
-        # Multiply array by Pauli, and set entries where inputs
-        # where I to I
-        tmp = PauliTable(pauli_table.array ^ pauli.array)
-        tmp.X = (tmp.X & non_iden)
-        tmp.Z = (tmp.Z & non_iden)
-        # Find total number of non I pauli's remaining in table
-        # if there are an even number the row commutes with the
-        # input Pauli, otherwise it anti-commutes
-        return np.logical_not(np.sum((tmp.X | tmp.Z), axis=1) % 2)
+        x1, z1 = pauli_table.to_packed()
+        x2, z2 = pauli.to_packed()
+        # Rows anti-commute if their symplectic product is odd
+        return ~parity((x1 & z2) ^ (z1 & x2))
+
+    def _vstack(self, other):
+        """Return the PauliTable of the rows of self followed by the rows of other."""
+        if self._packed is None and other._packed is None:
+            return PauliTable(np.vstack((self._array, other._array)))
+        x1, z1 = self.to_packed()
+        x2, z2 = other.to_packed()
+        return self._from_words(np.vstack((x1, x2)), np.vstack((z1, z2)), other)
+
+    def _from_words(self, x, z, other=None):
+        """Return a PauliTable of packed words, unpacked if self and other are not packed."""
+        if self._packed is None and (other is None or other._packed is None):
+            return PauliTable(np.hstack([unpack_bits(x, self.num_qubits),
+                                         unpack_bits(z, self.num_qubits)]))
+        return PauliTable.from_packed(x, z, self.num_qubits)
 
     @staticmethod
     def _block_stack(array1, array2):
@@ -861,8 +948,9 @@ class PauliTable(BaseOperator):
             list or array: The rows of the PauliTable in label form.
         """
         ret = np.zeros(self.size, dtype='<U{}'.format(self.num_qubits))
+        table = self._as_array()
         for i in range(self.size):
-            ret[i] = self._to_label(self._array[i])
+            ret[i] = self._to_label(table[i])
         if array:
             return ret
         return ret.tolist()
@@ -13,9 +13,13 @@
 Random symplectic operator functions
 """
 
+import functools
+
 import numpy as np
 from numpy.random import default_rng
 
+from ..random_batch import RandomBatch
+from .bit_packing import pack_bits
 from .pauli import Pauli
 from .clifford import Clifford
 from .stabilizer_table import StabilizerTable
@@ -166,6 +170,141 @@ def random_clifford(num_qubits, seed=None):
     return Clifford(StabilizerTable(table, phase))
 
 
+def random_cliffords(num_qubits, size, seed=None):
+    """Return a batch of random Clifford operators.
+
+    The Cliffords are sampled using the method of Reference [1] as in
+    :func:`random_clifford`, vectorized over the batch. The ``data`` of the
+    returned batch is the tuple of the ``(size, 2 * num_qubits, W)`` uint64
+    arrays of the `X` and `Z` blocks of the stabilizer tables packed as in
+    :meth:`~qiskit.quantum_info.PauliTable.from_packed`, and the
+    ``(size, 2 * num_qubits)`` boolean array of their phases. A
+    :class:`Clifford` is only constructed when an element of the batch is
+    accessed.
+
+    The random numbers of each Clifford are drawn consecutively, so that for
+    a fixed seed the first ``k`` Cliffords of a batch do not depend on its
+    size. They differ from the Cliffords returned by :func:`random_clifford`
+    with the same seed.
+
+    Args:
+        num_qubits (int): the number of qubits for the Cliffords.
+        size (int): the number of Cliffords.
+        seed (int or np.random.Generator): Optional. Set a fixed seed or
+                                           generator for RNG.
+
+    Returns:
+        RandomBatch: a batch of random Clifford operators.
+
+    Reference:
+        1. S. Bravyi and D. Maslov, *Hadamard-free circuits expose the
+           structure of the Clifford group*.
+           `arXiv:2003.09412 [quant-ph] <https://arxiv.org/abs/2003.09412>`_
+    """
+    if seed is None:
+        rng = np.random.default_rng()
+    elif isinstance(seed, np.random.Generator):
+        rng = seed
+    else:
+        rng = default_rng(seed)
+
+    num_tril = (num_qubits * (num_qubits - 1)) // 2
+    uniform = rng.random((size, num_qubits + 2 * (num_qubits + 2 * num_tril + num_qubits)))
+    bits = (uniform[:, num_qubits:] < 0.5).astype(np.uint8)
+    splits = np.cumsum([num_qubits, num_qubits, num_tril, num_tril, num_tril, num_tril])
+    # pylint: disable=unbalanced-tuple-unpacking
+    diag1, diag2, tril1, tril2, tril3, tril4, phase = np.split(bits, splits, axis=1)
+    # pylint: enable=unbalanced-tuple-unpacking
+
+    had, perm = _sample_qmallows_batch(num_qubits, uniform[:, :num_qubits])
+    gamma1 = _tril_batch(num_qubits, tril1, diag1, symmetric=True)
+    gamma2 = _tril_batch(num_qubits, tril2, diag2, symmetric=True)
+    ones = np.ones((size, num_qubits), dtype=np.uint8)
+    delta1 = _tril_batch(num_qubits, tril3, ones)
+    delta2 = _tril_batch(num_qubits, tril4, ones)
+
+    # Compute stabilizer tables. Products of uint8 matrices may wrap
+    # around but modulo 256 preserves their parity.
+    zero = np.zeros_like(delta1)
+    prod1 = np.matmul(gamma1, delta1) & 1
+    prod2 = np.matmul(gamma2, delta2) & 1
+    inv1 = np.swapaxes(_inverse_tril_batch(delta1), 1, 2)
+    inv2 = np.swapaxes(_inverse_tril_batch(delta2), 1, 2)
+    table1 = np.concatenate([np.concatenate([delta1, zero], axis=2),
+                             np.concatenate([prod1, inv1], axis=2)], axis=1)
+    table2 = np.concatenate([np.concatenate([delta2, zero], axis=2),
+                             np.concatenate([prod2, inv2], axis=2)], axis=1)
+
+    # Apply qubit permutations
+    rows = np.concatenate([perm, num_qubits + perm], axis=1)
+    table = np.take_along_axis(table2, rows[:, :, None], axis=1)
+
+    # Apply layers of Hadamards
+    swap = np.concatenate([had, had], axis=1)[:, :, None]
+    table = np.where(swap, np.roll(table, num_qubits, axis=1), table)
+
+    # Apply tables
+    table = (np.matmul(table1, table) & 1).astype(bool)
+
+    # Pack the X and Z blocks of all rows
+    num_rows = size * 2 * num_qubits
+    x = pack_bits(table[:, :, :num_qubits].reshape(num_rows, num_qubits))
+    z = pack_bits(table[:, :, num_qubits:].reshape(num_rows, num_qubits))
+    shape = (size, 2 * num_qubits, x.shape[1])
+    return RandomBatch([x.reshape(shape), z.reshape(shape), phase.astype(bool)],
+                       functools.partial(_packed_clifford, num_qubits))
+
+
+def _packed_clifford(num_qubits, x, z, phase):
+    """Return the Clifford of a packed stabilizer table."""
+    table = StabilizerTable.from_packed(x, z, num_qubits, phase)
+    return Clifford(table, validate=False)
+
+
+def _sample_qmallows_batch(n, uniform):
+    """Sample from the quantum Mallows distribution with an (K, n) uniform array"""
+    size = uniform.shape[0]
+    batch = np.arange(size)
+    had = np.zeros((size, n), dtype=bool)
+    perm = np.zeros((size, n), dtype=int)
+    inds = np.tile(np.arange(n), (size, 1))
+    for i in range(n):
+        m = n - i
+        eps = 4 ** (-m)
+        r = uniform[:, i]
+        index = -np.ceil(np.log2(r + (1 - r) * eps)).astype(int)
+        had[:, i] = index < m
+        k = np.where(index < m, index, 2 * m - index - 1)
+        perm[:, i] = inds[batch, k]
+        keep = np.ones((size, m), dtype=bool)
+        keep[batch, k] = False
+        inds = inds[keep].reshape(size, m - 1)
+    return had, perm
+
+
+def _tril_batch(n, tril, diag, symmetric=False):
+    """Return (K, n, n) matrices of lower triangular and diagonal entries"""
+    mats = np.zeros((tril.shape[0], n, n), dtype=np.uint8)
+    rows, cols = np.tril_indices(n, -1)
+    mats[:, rows, cols] = tril
+    if symmetric:
+        mats[:, cols, rows] = tril
+    mats[:, range(n), range(n)] = diag
+    return mats
+
+
+def _inverse_tril_batch(mats):
+    """Invert (K, n, n) lower-triangular binary matrices with unit diagonal."""
+    # Forward substitution of the rows of inv: row i is e_i plus the sum
+    # of the previous rows weighted by row i of mat.
+    inv = np.zeros_like(mats)
+    n = mats.shape[1]
+    for i in range(n):
+        inv[:, i] = np.matmul(mats[:, i:i + 1, :i], inv[:, :i])[:, 0] & 1
+        inv[:, i, i] = 1
+    return inv
+
+
 def _sample_qmallows(n, rng=None):
     """Sample from the quantum Mallows distribution"""
 
@@ -0,0 +1,171 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Matrix-free linear operator of a SparsePauliOp.
+
+A Pauli with symplectic bits ``(x, z)`` acts on a basis state as
+:math:`P|b\\rangle = i^{|x \\wedge z|} (-1)^{z \\cdot b} |b \\oplus x\\rangle`. The terms of a
+SparsePauliOp are grouped by their ``x`` bits, and every group is applied to a vector as the
+product with a diagonal :math:`d(b) = \\sum_k c_k i^{|x \\wedge z_k|} (-1)^{z_k \\cdot b}`
+followed by the permutation :math:`b \\to b \\oplus x`, which flips the axes of the ``x`` qubits
+of the vector reshaped to a tensor of qubits.
+"""
+
+import numpy as np
+from scipy import sparse as scisparse
+from scipy.sparse.linalg import LinearOperator
+
+# Default maximum number of bytes of the diagonals kept between products.
+_MAX_CACHE_SIZE = 2 ** 28
+
+
+class SparsePauliLinearOperator(LinearOperator):
+    """Matrix-free :class:`~scipy.sparse.linalg.LinearOperator` of a SparsePauliOp.
+
+    The linear operator has a real ``dtype`` if the matrix of the operator is real. The memory
+    of a product is a few vectors of the dimension of the operator, which allows
+    iterative solvers such as :func:`scipy.sparse.linalg.eigsh` to be used with operators on
+    more qubits than a sparse matrix would fit in memory. The diagonals of the groups of
+    terms are computed on the first product and kept up to ``max_cache_size`` bytes.
+    """
+
+    def __init__(self, op, max_cache_size: int = _MAX_CACHE_SIZE):
+        """
+        Args:
+            op (SparsePauliOp): the operator.
+            max_cache_size: the maximum number of bytes of the diagonals kept between products.
+        """
+        self._op = op
+        self._num_qubits = op.num_qubits
+        self._max_cache_size = max_cache_size
+        self._groups = pauli_groups(op.table.X, op.table.Z, op.coeffs)
+        self._diagonals = {}
+        dim = 2 ** self._num_qubits
+        # The matrix is real if the coefficients times the phases of the Paulis are real
+        real = all(np.all(coeffs.imag == 0) for _, _, coeffs in self._groups)
+        super().__init__(dtype=float if real else complex, shape=(dim, dim))
+
+    @property
+    def op(self):
+        """Returns the SparsePauliOp of the linear operator."""
+        return self._op
+
+    def diagonal(self) -> np.ndarray:
+        """Return the diagonal of the operator."""
+        for index, (x_row, _, _) in enumerate(self._groups):
+            if not x_row.any():
+                return self._diagonal(index).astype(complex)
+        return np.zeros(self.shape[0], dtype=complex)
+
+    def _diagonal(self, index):
+        diagonal = self._diagonals.get(index)
+        if diagonal is None:
+            _, z_bits, coeffs = self._groups[index]
+            diagonal = group_diagonal(z_bits, coeffs, self._num_qubits)
+            cached = sum(value.nbytes for value in self._diagonals.values())
+            if cached + diagonal.nbytes <= self._max_cache_size:
+                self._diagonals[index] = diagonal
+        return diagonal
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1))).reshape(np.shape(x))
+
+    def _matmat(self, X):
+        X = np.asarray(X)
+        num_vectors = X.shape[1]
+        shape = (2,) * self._num_qubits + (num_vectors,)
+        result = np.zeros((self.shape[0], num_vectors), dtype=np.result_type(X, self.dtype))
+        result_tensor = result.reshape(shape)
+        for index, (x_row, _, _) in enumerate(self._groups):
+            product = self._diagonal(index)[:, None] * X
+            # b -> b ^ x flips the tensor axes of the x qubits, qubit q is axis n - 1 - q
+            axes = tuple(self._num_qubits - 1 - q for q in np.flatnonzero(x_row))
+            if axes:
+                result_tensor += np.flip(product.reshape(shape), axis=axes)
+            else:
+                result += product
+        return result
+
+    def _adjoint(self):
+        return SparsePauliLinearOperator(self._op.adjoint(), self._max_cache_size)
+
+
+def pauli_groups(x_bits, z_bits, coeffs):
+    """Return the terms of a sum of Paulis grouped by their ``x`` bits.
+
+    Args:
+        x_bits (np.ndarray): the ``(K, n)`` boolean ``x`` bits of the terms.
+        z_bits (np.ndarray): the ``(K, n)`` boolean ``z`` bits of the terms.
+        coeffs (np.ndarray): the ``K`` complex coefficients of the Hermitian Paulis.
+
+    Returns:
+        list: a list of tuples of the ``x`` bits of a group, the ``z`` bits of its terms and
+        their coefficients times the phase :math:`i^{|x \\wedge z|}`.
+    """
+    if len(coeffs) == 0:
+        return []
+    coeffs = np.asarray(coeffs, dtype=complex) * 1j ** np.sum(x_bits & z_bits, axis=1)
+    rows, inverse = np.unique(x_bits, axis=0, return_inverse=True)
+    inverse = np.ravel(inverse)
+    return [(row, z_bits[inverse == i], coeffs[inverse == i]) for i, row in enumerate(rows)]
+
+
+def group_diagonal(z_bits, coeffs, num_qubits):
+    """Return :math:`d(b) = \\sum_k c_k (-1)^{z_k \\cdot b}` for all basis states ``b``.
+
+    Groups of more terms than qubits are summed by a Walsh-Hadamard transform, others term by
+    term. The diagonal is real if all coefficients are real.
+    """
+    dtype = float if np.all(np.imag(coeffs) == 0) else complex
+    coeffs = coeffs.real if dtype is float else coeffs
+    if len(coeffs) > num_qubits:
+        powers = 1 << np.arange(num_qubits, dtype=np.int64)
+        diagonal = np.zeros(2 ** num_qubits, dtype=dtype)
+        np.add.at(diagonal, z_bits.astype(np.int64) @ powers, coeffs)
+        for qubit in range(num_qubits):
+            view = diagonal.reshape((-1, 2, 2 ** qubit))
+            low = view[:, 0, :].copy()
+            view[:, 0, :] += view[:, 1, :]
+            view[:, 1, :] = low - view[:, 1, :]
+        return diagonal
+    diagonal = np.zeros(2 ** num_qubits, dtype=dtype)
+    for z_row, coeff in zip(z_bits, coeffs):
+        # The signs are built from qubit 0 upwards, doubling the vector for every qubit
+        signs = np.ones(1, dtype=np.int8)
+        for bit in z_row:
+            signs = np.concatenate([signs, -signs if bit else signs])
+        diagonal += coeff * signs
+    return diagonal
+
+
+def sparse_matrix(op):
+    """Return the CSR matrix of a SparsePauliOp, built with one entry per row and group."""
+    num_qubits = op.num_qubits
+    dim = 2 ** num_qubits
+    groups = pauli_groups(op.table.X, op.table.Z, op.coeffs)
+    if not groups:
+        return scisparse.csr_matrix((dim, dim), dtype=complex)
+    rows = np.arange(dim, dtype=np.int64)
+    powers = 1 << np.arange(num_qubits, dtype=np.int64)
+    indices = np.empty((dim, len(groups)), dtype=np.int64)
+    data = np.empty((dim, len(groups)), dtype=complex)
+    for i, (x_row, z_bits, coeffs) in enumerate(groups):
+        # Row r has the entry d(r ^ x) in column r ^ x
+        x_int = int(x_row.astype(np.int64) @ powers) if num_qubits else 0
+        indices[:, i] = rows ^ x_int
+        data[:, i] = group_diagonal(z_bits, coeffs, num_qubits)[indices[:, i]]
+    matrix = scisparse.csr_matrix((data.ravel(), indices.ravel(),
+                                   np.arange(0, dim * len(groups) + 1, len(groups))),
+                                  shape=(dim, dim))
+    matrix.eliminate_zeros()
+    matrix.sort_indices()
+    return matrix
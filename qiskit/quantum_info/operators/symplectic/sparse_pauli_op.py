@@ -22,6 +22,10 @@ from qiskit.quantum_info.operators.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.symplectic.pauli_table import PauliTable
 from qiskit.quantum_info.operators.symplectic.pauli_utils import pauli_basis
+from qiskit.quantum_info.operators.symplectic.bit_packing import (
+    popcount, lexicographic_keys, group_rows)
+from qiskit.quantum_info.operators.symplectic.sparse_pauli_linear_operator import (
+    SparsePauliLinearOperator, sparse_matrix)
 from qiskit.quantum_info.operators.custom_iterator import CustomIterator
 
 
@@ -196,7 +200,7 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
         ret._coeffs = ret._coeffs.conj()
         return ret
 
-    def compose(self, other, qargs=None, front=False):
+    def compose(self, other, qargs=None, front=False, simplify=False):
         """Return the composition channel self∘other.
 
         Args:
@@ -205,6 +209,12 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
             front (bool or None): If False compose in standard order other(self(input))
                           otherwise compose in reverse order self(other(input))
                           [default: False]
+            simplify (bool): If True return the simplified composition. The
+                             products of the terms are computed in chunks that
+                             are simplified as they are merged, so that the
+                             memory is bounded by the number of simplified
+                             terms rather than the number of products
+                             [default: False].
 
         Returns:
             SparsePauliOp: The composed operator.
@@ -213,7 +223,7 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
             QiskitError: if other cannot be converted to an Operator or has
             incompatible dimensions.
         """
-        # pylint: disable=invalid-name
+        # pylint: disable=invalid-name,arguments-differ
         if qargs is None:
             qargs = getattr(other, 'qargs', None)
 
@@ -223,20 +233,31 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
         # Validate composition dimensions and qargs match
         self._op_shape.compose(other._op_shape, qargs, front)
 
+        if qargs is None:
+            # Implement composition of the packed rows of the Pauli tables
+            x1, z1 = self.table.to_packed()
+            x2, z2 = other.table.to_packed()
+            if simplify:
+                x, z, coeffs = _compose_simplified(x1, z1, self.coeffs,
+                                                   x2, z2, other.coeffs, front)
+                return self._from_words(x, z, coeffs, other).simplify()
+            x, z, coeffs = _compose_words(x1, z1, self.coeffs, x2, z2, other.coeffs, front)
+            return self._from_words(x, z, coeffs, other)
+
+        if simplify:
+            return self.compose(other, qargs=qargs, front=front).simplify()
+
         # Implement composition of the Pauli table
         x1, x2 = PauliTable._block_stack(self.table.X, other.table.X)
         z1, z2 = PauliTable._block_stack(self.table.Z, other.table.Z)
         c1, c2 = PauliTable._block_stack(self.coeffs, other.coeffs)
 
-        if qargs is not None:
-            ret_x, ret_z = x1.copy(), z1.copy()
-            x1 = x1[:, qargs]
-            z1 = z1[:, qargs]
-            ret_x[:, qargs] = x1 ^ x2
-            ret_z[:, qargs] = z1 ^ z2
-            table = np.hstack([ret_x, ret_z])
-        else:
-            table = np.hstack((x1 ^ x2, z1 ^ z2))
+        ret_x, ret_z = x1.copy(), z1.copy()
+        x1 = x1[:, qargs]
+        z1 = z1[:, qargs]
+        ret_x[:, qargs] = x1 ^ x2
+        ret_z[:, qargs] = z1 ^ z2
+        table = np.hstack([ret_x, ret_z])
 
         # Take product of coefficients and add phase correction
         coeffs = c1 * c2
@@ -253,12 +274,14 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
         coeffs *= (-1j) ** np.array(np.sum(minus_i, axis=1), dtype=int)
         return SparsePauliOp(table, coeffs)
 
-    def dot(self, other, qargs=None):
+    def dot(self, other, qargs=None, simplify=False):
         """Return the composition channel self∘other.
 
         Args:
             other (SparsePauliOp): an operator object.
             qargs (list or None): a list of subsystem positions to compose other on.
+            simplify (bool): If True return the simplified composition, see
+                             :meth:`compose` [default: False].
 
         Returns:
             SparsePauliOp: The composed operator.
@@ -267,7 +290,14 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
             QiskitError: if other cannot be converted to an Operator or has
             incompatible dimensions.
         """
-        return self.compose(other, qargs=qargs, front=True)
+        # pylint: disable=arguments-differ
+        return self.compose(other, qargs=qargs, front=True, simplify=simplify)
+
+    def _from_words(self, x, z, coeffs, other=None):
+        """Return a SparsePauliOp of packed rows, unpacked unless an input table is packed."""
+        # pylint: disable=protected-access
+        table = self.table._from_words(x, z, None if other is None else other.table)
+        return SparsePauliOp(table, coeffs)
 
     def tensor(self, other):
         """Return the tensor product operator self ⊗ other.
@@ -383,16 +413,12 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
         if rtol is None:
             rtol = self.rtol
 
-        table, indexes = np.unique(self.table.array,
-                                   return_inverse=True, axis=0)
-        coeffs = np.zeros(len(table), dtype=np.complex)
-        for i, val in zip(indexes, self.coeffs):
-            coeffs[i] += val
+        # Sum the coefficients of equal rows, which are sorted in the
+        # lexicographic order of the rows of the boolean table
+        rows, coeffs = _sum_duplicates(*self.table.to_packed(), self.coeffs)
         # Delete zero coefficient rows
-        # TODO: Add atol/rtol for zero comparison
-        non_zero = [i for i in range(coeffs.size)
-                    if not np.isclose(coeffs[i], 0, atol=atol, rtol=rtol)]
-        table = table[non_zero]
+        non_zero = ~np.isclose(coeffs, 0, atol=atol, rtol=rtol)
+        table = self.table[rows[non_zero]]
         coeffs = coeffs[non_zero]
         # Check edge case that we deleted all Paulis
         # In this case we return an identity Pauli with a zero coefficient
@@ -507,6 +533,8 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
             array: A dense matrix if `sparse=False`.
             csr_matrix: A sparse matrix in CSR format if `sparse=True`.
         """
+        if sparse:
+            return sparse_matrix(self)
         mat = None
         for i in self.matrix_iter(sparse=sparse):
             if mat is None:
@@ -519,6 +547,22 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
         """Convert to a matrix Operator object"""
         return Operator(self.to_matrix())
 
+    def to_linear_operator(self, max_cache_size=2 ** 28):
+        """Convert to a matrix-free SciPy LinearOperator.
+
+        The operator is applied to vectors without building its matrix, for example to
+        compute eigenvalues with :func:`scipy.sparse.linalg.eigsh` of operators on more
+        qubits than their sparse matrix would fit in memory.
+
+        Args:
+            max_cache_size (int): the maximum number of bytes of the diagonals of the groups
+                                  of terms kept between products (Default: 256 MB).
+
+        Returns:
+            SparsePauliLinearOperator: the linear operator.
+        """
+        return SparsePauliLinearOperator(self, max_cache_size=max_cache_size)
+
     # ---------------------------------------------------------------------
     # Custom Iterators
     # ---------------------------------------------------------------------
@@ -573,3 +617,64 @@ class SparsePauliOp(BaseOperator, TolerancesMixin):
                 return coeff * mat
 
         return MatrixIterator(self)
+
+
+# Number of products of terms computed at once by a simplified composition
+_COMPOSE_CHUNK_SIZE = 2 ** 16
+
+# Phases i ** k of the products of Paulis
+_PHASES = np.array([1, 1j, -1, -1j])
+
+
+def _sum_duplicates(x, z, coeffs):
+    """Return the first occurrence of every unique packed row and its summed coefficients.
+
+    The unique rows are in the lexicographic order of the rows of the boolean table.
+    """
+    if len(coeffs) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=complex)
+    order, starts = group_rows(lexicographic_keys(np.hstack([x, z])))
+    return order[starts], np.add.reduceat(coeffs[order], starts)
+
+
+def _compose_words(x1, z1, coeffs1, x2, z2, coeffs2, front):
+    r"""Return the products of all pairs of terms of two sums of packed Paulis.
+
+    The products are ordered by the terms of the first sum and then the terms of
+    the second sum, and the first Pauli is on the left of the matrix product if
+    ``front`` is True. A product of Paulis is
+    :math:`P(x_l, z_l) P(x_r, z_r) = i^k P(x_l \oplus x_r, z_l \oplus z_r)` where
+    :math:`k = |x_l \wedge z_l| + |x_r \wedge z_r| + 2 |z_l \wedge x_r| - |x \wedge z|`.
+    """
+    # pylint: disable=invalid-name
+    x1, x2 = PauliTable._block_stack(x1, x2)
+    z1, z2 = PauliTable._block_stack(z1, z2)
+    coeffs1, coeffs2 = PauliTable._block_stack(coeffs1, coeffs2)
+    x = x1 ^ x2
+    z = z1 ^ z2
+    cross = (z1 & x2) if front else (x1 & z2)
+    phase = popcount(x1 & z1) + popcount(x2 & z2) + 2 * popcount(cross) - popcount(x & z)
+    return x, z, coeffs1 * coeffs2 * _PHASES[phase % 4]
+
+
+def _compose_simplified(x1, z1, coeffs1, x2, z2, coeffs2, front):
+    """Return the sums of the products of equal Paulis of all pairs of terms.
+
+    The products are computed for chunks of the terms of the first sum, and
+    merged into the sums of the previous chunks, where a chunk has at least as
+    many products as the merged terms.
+    """
+    # pylint: disable=invalid-name
+    x, z = x1[:0] ^ x2[:0], z1[:0] ^ z2[:0]
+    coeffs = np.zeros(0, dtype=complex)
+    start = 0
+    while start < len(x1):
+        stop = start + max(1, max(_COMPOSE_CHUNK_SIZE, len(coeffs)) // max(1, len(x2)))
+        x_chunk, z_chunk, coeffs_chunk = _compose_words(
+            x1[start:stop], z1[start:stop], coeffs1[start:stop], x2, z2, coeffs2, front)
+        x = np.vstack([x, x_chunk])
+        z = np.vstack([z, z_chunk])
+        rows, coeffs = _sum_duplicates(x, z, np.hstack([coeffs, coeffs_chunk]))
+        x, z = x[rows], z[rows]
+        start = stop
+    return x, z, coeffs
@@ -19,6 +19,7 @@ import numpy as np
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.custom_iterator import CustomIterator
 from qiskit.quantum_info.operators.symplectic.pauli_table import PauliTable
+from qiskit.quantum_info.operators.symplectic.bit_packing import parity, unique_rows
 
 
 class StabilizerTable(PauliTable):
@@ -186,7 +187,7 @@ class StabilizerTable(PauliTable):
         if isinstance(data, str) and phase is None:
             pauli, phase = StabilizerTable._from_label(data)
         elif isinstance(data, StabilizerTable):
-            pauli = data._array
+            pauli = data
             if phase is None:
                 phase = data._phase
         else:
@@ -206,7 +207,7 @@ class StabilizerTable(PauliTable):
 
     def __repr__(self):
         return 'StabilizerTable(\n{},\nphase={})'.format(
-            repr(self._array), repr(self._phase))
+            repr(self._as_array()), repr(self._phase))
 
     def __str__(self):
         """String representation"""
@@ -220,7 +221,7 @@ class StabilizerTable(PauliTable):
 
     def copy(self):
         """Return a copy of the StabilizerTable."""
-        return StabilizerTable(self._array.copy(),
+        return StabilizerTable(PauliTable(self).copy(),
                                self._phase.copy())
 
     # ---------------------------------------------------------------------
@@ -230,7 +231,7 @@ class StabilizerTable(PauliTable):
     @property
     def pauli(self):
         """Return PauliTable"""
-        return PauliTable(self._array)
+        return PauliTable(self)
 
     @pauli.setter
     def pauli(self, value):
@@ -247,6 +248,27 @@ class StabilizerTable(PauliTable):
     def phase(self, value):
         self._phase[:] = value
 
+    @classmethod
+    def from_packed(cls, x, z, num_qubits, phase=None):
+        """Construct a StabilizerTable stored as packed words.
+
+        See :meth:`PauliTable.from_packed` for the layout of the packed words.
+
+        Args:
+            x (array): the ``(K, W)`` uint64 array of the packed `X` block.
+            z (array): the ``(K, W)`` uint64 array of the packed `Z` block.
+            num_qubits (int): the number of qubits.
+            phase (array or bool or None): optional phase vector (Default: None).
+
+        Returns:
+            StabilizerTable: the packed table. The input arrays are not copied.
+
+        Raises:
+            QiskitError: if the input arrays have an invalid shape.
+        """
+        # pylint: disable=arguments-differ
+        return StabilizerTable(PauliTable.from_packed(x, z, num_qubits), phase)
+
     # ---------------------------------------------------------------------
     # Array methods
     # ---------------------------------------------------------------------
@@ -255,7 +277,7 @@ class StabilizerTable(PauliTable):
         """Return a view of StabilizerTable"""
         if isinstance(key, int):
             key = [key]
-        return StabilizerTable(self._array[key], self._phase[key])
+        return StabilizerTable(super().__getitem__(key), self._phase[key])
 
     def __setitem__(self, key, value):
         """Update StabilizerTable"""
@@ -432,14 +454,10 @@ class StabilizerTable(PauliTable):
                 The number of times each of the unique values comes up in the
                 original array. Only provided if ``return_counts`` is True.
         """
-        # Combine array and phases into single array for sorting
-        stack = np.hstack([self._array,
-                           self._phase.reshape((self.size, 1))])
-        if return_counts:
-            _, index, counts = np.unique(stack, return_index=True,
-                                         return_counts=True, axis=0)
-        else:
-            _, index = np.unique(stack, return_index=True, axis=0)
+        # Combine packed rows and phases into single array for sorting
+        stack = np.hstack(self.to_packed() +
+                          (self._phase.reshape((self.size, 1)).astype(np.uint64), ))
+        index, counts = unique_rows(stack)
         # Sort the index so we return unique rows in the original array order
         sort_inds = index.argsort()
         index = index[sort_inds]
@@ -583,9 +601,14 @@ class StabilizerTable(PauliTable):
         if qargs and other.num_qubits != len(qargs):
             raise QiskitError("Number of qubits in the other StabilizerTable does not match qargs.")
 
-        # Stack X and Z blocks for output size
-        x1, x2 = self._block_stack(self.X, other.X)
-        z1, z2 = self._block_stack(self.Z, other.Z)
+        # Stack X and Z blocks for output size, using the packed words of the
+        # rows if the product is on all qubits
+        if qargs is None:
+            (x1, z1), (x2, z2) = self.to_packed(), other.to_packed()
+        else:
+            (x1, z1), (x2, z2) = (self.X, self.Z), (other.X, other.Z)
+        x1, x2 = self._block_stack(x1, x2)
+        z1, z2 = self._block_stack(z1, z2)
         phase1, phase2 = self._block_stack(self.phase, other.phase)
 
         if qargs is not None:
@@ -596,7 +619,7 @@ class StabilizerTable(PauliTable):
             ret_z[:, qargs] = z1 ^ z2
             pauli = np.hstack([ret_x, ret_z])
         else:
-            pauli = np.hstack((x1 ^ x2, z1 ^ z2))
+            pauli = self._from_words(x1 ^ x2, z1 ^ z2, other)
 
         # We pick up a minus sign for products:
         # Y.Y = -I, X.Y = -Z, Y.Z = -X, Z.X = -Y
@@ -604,7 +627,10 @@ class StabilizerTable(PauliTable):
             minus = (x1 & z2 & (x2 | z1)) | (~x1 & x2 & z1 & ~z2)
         else:
             minus = (x2 & z1 & (x1 | z2)) | (~x2 & x1 & z2 & ~z1)
-        phase_shift = np.array(np.sum(minus, axis=1) % 2, dtype=np.bool)
+        if qargs is None:
+            phase_shift = parity(minus)
+        else:
+            phase_shift = np.array(np.sum(minus, axis=1) % 2, dtype=np.bool)
         phase = phase_shift ^ phase1 ^ phase2
         return StabilizerTable(pauli, phase)
 
@@ -676,7 +702,7 @@ class StabilizerTable(PauliTable):
 
         if qargs is None or (sorted(qargs) == qargs
                              and len(qargs) == self.num_qubits):
-            return StabilizerTable(np.vstack((self._array, other._array)),
+            return StabilizerTable(self._vstack(other),
                                    np.hstack((self._phase, other._phase)))
 
         # Pad other with identity and then add
@@ -685,7 +711,7 @@ class StabilizerTable(PauliTable):
         padded = padded.compose(other, qargs=qargs)
 
         return StabilizerTable(
-            np.vstack((self._array, padded._array)),
+            self._vstack(padded),
             np.hstack((self._phase, padded._phase)))
 
     def _multiply(self, other):
@@ -866,8 +892,9 @@ class StabilizerTable(PauliTable):
             list or array: The rows of the StabilizerTable in label form.
         """
         ret = np.zeros(self.size, dtype='<U{}'.format(1 + self.num_qubits))
+        table = self._as_array()
         for i in range(self.size):
-            ret[i] = self._to_label(self._array[i], self._phase[i])
+            ret[i] = self._to_label(table[i], self._phase[i])
         if array:
             return ret
         return ret.tolist()
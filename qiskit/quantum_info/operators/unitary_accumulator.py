@@ -0,0 +1,252 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Structured accumulation of the unitary matrix of a sequence of gates.
+"""
+
+import numpy as np
+from scipy import sparse
+
+from qiskit.exceptions import QiskitError
+
+
+class UnitaryAccumulator:
+    r"""Accumulate an N-qubit unitary in the sparsest available representation.
+
+    Gates are left-multiplied onto the accumulated unitary :math:`U`, which
+    is stored in one of three formats:
+
+    * ``'permutation'``: :math:`U = P D` is a permutation matrix times a
+      diagonal matrix, stored as the row index and value of the single
+      non-zero entry of each column. Applying a gate with the same structure,
+      such as X, CX, SWAP, Toffoli or any diagonal gate, costs
+      :math:`O(2^N)` time and memory.
+    * ``'sparse'``: a :class:`scipy.sparse.csr_matrix`.
+    * ``'dense'``: a complex :class:`numpy.ndarray`.
+
+    The accumulator starts in the permutation format and only moves to a
+    denser format when a gate requires it: to ``'sparse'`` when a gate
+    with more than one non-zero per column is applied, and to ``'dense'``
+    once the fraction of non-zero entries exceeds ``density_threshold``.
+    A sparse unitary with a single non-zero per column, for example after a
+    Hadamard gate has been undone, is converted back to the permutation
+    format.
+
+    The :attr:`peak_memory` attribute records the largest number of bytes
+    held by the accumulated unitary, including the transient copy made while
+    a gate is applied.
+    """
+
+    FORMATS = ('permutation', 'sparse', 'dense')
+
+    def __init__(self, num_qubits, density_threshold=0.1, atol=1e-15):
+        """Initialize an identity unitary accumulator.
+
+        Args:
+            num_qubits (int): the number of qubits of the unitary.
+            density_threshold (float): the fraction of non-zero entries above
+                which the sparse format is converted to the dense format
+                [Default: 0.1].
+            atol (float): absolute tolerance below which gate matrix entries
+                are treated as zero when classifying gates [Default: 1e-15].
+        """
+        self._num_qubits = num_qubits
+        self._dim = 2 ** num_qubits
+        self._density_threshold = density_threshold
+        self._atol = atol
+        self._format = 'permutation'
+        # Permutation format: U[rows[j], j] = values[j]
+        self._rows = np.arange(self._dim, dtype=np.int64)
+        self._values = np.ones(self._dim, dtype=complex)
+        self._sparse = None
+        self._dense = None
+        self.peak_memory = self.nbytes
+
+    @property
+    def num_qubits(self):
+        """Return the number of qubits of the unitary."""
+        return self._num_qubits
+
+    @property
+    def format(self):
+        """Return the current storage format of the unitary."""
+        return self._format
+
+    @property
+    def nbytes(self):
+        """Return the number of bytes used to store the unitary."""
+        if self._format == 'permutation':
+            return self._rows.nbytes + self._values.nbytes
+        if self._format == 'sparse':
+            return _csr_nbytes(self._sparse)
+        return self._dense.nbytes
+
+    def apply(self, mat, qubits):
+        """Left multiply the unitary by a matrix on a subset of qubits.
+
+        Args:
+            mat (matrix_like): a 2**K x 2**K matrix.
+            qubits (list[int]): the K qubits the matrix acts on.
+
+        Raises:
+            QiskitError: if the matrix does not match the number of qubits.
+        """
+        mat = np.asarray(mat, dtype=complex)
+        if mat.shape != 2 * (2 ** len(qubits),):
+            raise QiskitError('Matrix of shape {} cannot be applied to {} qubits.'.format(
+                mat.shape, len(qubits)))
+        qubits = list(qubits)
+        if self._format == 'permutation':
+            monomial = _monomial_form(mat, self._atol)
+            if monomial is not None:
+                self._apply_monomial(monomial[0], monomial[1], qubits)
+                return
+            self._to_sparse()
+        if self._format == 'sparse':
+            self._apply_sparse(mat, qubits)
+            if self._sparse.nnz == self._dim:
+                self._to_permutation()
+            elif self._sparse.nnz > self._density_threshold * self._dim ** 2:
+                self._to_dense()
+            return
+        self._apply_dense(mat, qubits)
+
+    def to_matrix(self, sparse_format=False):
+        """Return the accumulated unitary.
+
+        Args:
+            sparse_format (bool): if True return a :class:`scipy.sparse.csr_matrix`
+                unless the unitary is stored in the dense format [Default: False].
+
+        Returns:
+            np.ndarray or scipy.sparse.csr_matrix: the unitary matrix.
+        """
+        if self._format == 'dense':
+            return self._dense.copy()
+        if self._format == 'permutation':
+            mat = _permutation_to_csr(self._rows, self._values, self._dim)
+        else:
+            mat = self._sparse.copy()
+        if sparse_format:
+            return mat
+        return mat.toarray()
+
+    def _record_peak(self, transient_bytes=0):
+        """Update the peak memory with the current and transient storage."""
+        self.peak_memory = max(self.peak_memory, self.nbytes + transient_bytes)
+
+    def _apply_monomial(self, gate_rows, gate_values, qubits):
+        """Apply a permutation times diagonal gate to a permutation unitary."""
+        deposit = _deposit_table(qubits)
+        sub = _extract(self._rows, qubits)
+        new_rows = (self._rows & ~deposit[-1]) | deposit[gate_rows[sub]]
+        self._record_peak(new_rows.nbytes + self._values.nbytes)
+        self._values *= gate_values[sub]
+        self._rows = new_rows
+
+    def _apply_sparse(self, mat, qubits):
+        """Left multiply a sparse unitary by an embedded gate matrix."""
+        gate = _embedded_csr(mat, qubits, self._num_qubits, self._atol)
+        new = gate.dot(self._sparse)
+        new.data[np.abs(new.data) <= self._atol] = 0
+        new.eliminate_zeros()
+        self._record_peak(_csr_nbytes(gate) + _csr_nbytes(new))
+        self._sparse = new
+
+    def _apply_dense(self, mat, qubits):
+        """Left multiply a dense unitary by a gate matrix."""
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators.operator import Operator
+        num_qubits = self._num_qubits
+        tensor = np.reshape(self._dense, 2 * num_qubits * [2])
+        mat_tensor = np.reshape(mat, 2 * len(qubits) * [2])
+        indices = [num_qubits - 1 - qubit for qubit in qubits]
+        new = Operator._einsum_matmul(tensor, mat_tensor, indices)
+        self._record_peak(new.nbytes)
+        self._dense = np.reshape(new, (self._dim, self._dim))
+
+    def _to_sparse(self):
+        """Convert the permutation format to the sparse format."""
+        self._sparse = _permutation_to_csr(self._rows, self._values, self._dim)
+        self._record_peak(_csr_nbytes(self._sparse))
+        self._rows = self._values = None
+        self._format = 'sparse'
+
+    def _to_permutation(self):
+        """Convert a sparse unitary with one non-zero per column to the permutation format."""
+        mat = self._sparse.tocsc()
+        mat.sort_indices()
+        self._rows = mat.indices.astype(np.int64)
+        self._values = mat.data
+        self._sparse = None
+        self._format = 'permutation'
+
+    def _to_dense(self):
+        """Convert the sparse format to the dense format."""
+        self._dense = self._sparse.toarray()
+        self._record_peak(_csr_nbytes(self._sparse))
+        self._sparse = None
+        self._format = 'dense'
+
+
+def _csr_nbytes(mat):
+    """Return the number of bytes of a CSR matrix."""
+    return mat.data.nbytes + mat.indices.nbytes + mat.indptr.nbytes
+
+
+def _permutation_to_csr(rows, values, dim):
+    """Convert a permutation times diagonal unitary to a CSR matrix."""
+    mat = sparse.csc_matrix((values, rows, np.arange(dim + 1)), shape=(dim, dim))
+    return mat.tocsr()
+
+
+def _extract(indices, qubits):
+    """Return the integer value of the bits of indices on qubits."""
+    sub = np.zeros_like(indices)
+    for pos, qubit in enumerate(qubits):
+        sub |= ((indices >> qubit) & 1) << pos
+    return sub
+
+
+def _deposit_table(qubits):
+    """Return the table mapping K-bit gate indices onto N-bit indices.
+
+    The final entry (for the all ones gate index) is the mask of all qubits.
+    """
+    table = np.zeros(2 ** len(qubits), dtype=np.int64)
+    for pos, qubit in enumerate(qubits):
+        table[(np.arange(len(table)) >> pos) & 1 == 1] |= 1 << qubit
+    return table
+
+
+def _monomial_form(mat, atol):
+    """Return (rows, values) if a matrix has one non-zero per column and row."""
+    nonzero = np.abs(mat) > atol
+    if not np.all(np.sum(nonzero, axis=0) == 1) or not np.all(np.sum(nonzero, axis=1) == 1):
+        return None
+    rows = np.argmax(nonzero, axis=0)
+    values = mat[rows, np.arange(len(mat))]
+    return rows, values
+
+
+def _embedded_csr(mat, qubits, num_qubits, atol):
+    """Return the CSR matrix of a gate acting on a subset of N qubits."""
+    deposit = _deposit_table(qubits)
+    indices = np.arange(2 ** num_qubits, dtype=np.int64)
+    free = indices[(indices & deposit[-1]) == 0]
+    gate_rows, gate_cols = np.nonzero(np.abs(mat) > atol)
+    rows = (free[None, :] | deposit[gate_rows][:, None]).ravel()
+    cols = (free[None, :] | deposit[gate_cols][:, None]).ravel()
+    vals = np.repeat(mat[gate_rows, gate_cols], len(free))
+    dim = 2 ** num_qubits
+    return sparse.csr_matrix((vals, (rows, cols)), shape=(dim, dim))
@@ -14,12 +14,16 @@
 
 # pylint: disable=unused-import
 from qiskit.quantum_info.operators.random import (random_unitary,
+                                                  random_unitaries,
                                                   random_quantum_channel,
                                                   random_hermitian,
                                                   random_pauli,
                                                   random_clifford,
+                                                  random_cliffords,
                                                   random_pauli_table,
                                                   random_stabilizer_table)
 
 from qiskit.quantum_info.states.random import (random_statevector,
-                                               random_density_matrix)
+                                               random_statevectors,
+                                               random_density_matrix,
+                                               random_density_matrices)
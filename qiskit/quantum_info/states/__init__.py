@@ -14,6 +14,8 @@
 
 from .statevector import Statevector
 from .densitymatrix import DensityMatrix
+from .stabilizerstate import StabilizerState
+from .evolution import EvolutionProgram
 from .utils import partial_trace, shannon_entropy
 from .measures import (state_fidelity, purity, entropy, concurrence,
                        mutual_information, entanglement_of_formation)
@@ -25,12 +25,15 @@ from qiskit.quantum_info.states.quantum_state import QuantumState
 from qiskit.quantum_info.operators.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.lazy_operator import LazyOperator
 from qiskit.quantum_info.operators.scalar_op import ScalarOp
 from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
 from qiskit.quantum_info.operators.predicates import is_positive_semidefinite_matrix
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.superop import SuperOp
 from qiskit.quantum_info.states.statevector import Statevector
+from qiskit.quantum_info.states.evolution import EvolutionProgram, evolve_matrix
+from qiskit.quantum_info.states.pauli_expectation import pauli_expectation_value
 
 
 class DensityMatrix(QuantumState, TolerancesMixin):
@@ -241,9 +244,13 @@ class DensityMatrix(QuantumState, TolerancesMixin):
     def evolve(self, other, qargs=None):
         """Evolve a quantum state by an operator.
 
+        Circuits and instructions on qubit states are compiled to an
+        :class:`~qiskit.quantum_info.states.EvolutionProgram`, which applies
+        their gates to a single copy of the density matrix in place.
+
         Args:
-            other (Operator or QuantumChannel
-                   or Instruction or Circuit): The operator to evolve by.
+            other (Operator or QuantumChannel or Instruction or Circuit
+                   or EvolutionProgram): The operator to evolve by.
             qargs (list): a list of QuantumState subsystem positions to apply
                            the operator on.
 
@@ -259,7 +266,11 @@ class DensityMatrix(QuantumState, TolerancesMixin):
 
         # Evolution by a circuit or instruction
         if isinstance(other, (QuantumCircuit, Instruction)):
-            return self._evolve_instruction(other, qargs=qargs)
+            if self.num_qubits is None:
+                return self._evolve_instruction(other, qargs=qargs)
+            other = EvolutionProgram(other)
+        if isinstance(other, EvolutionProgram):
+            return other.evolve(self, qargs=qargs)
 
         # Evolution by a QuantumChannel
         if hasattr(other, 'to_quantumchannel'):
@@ -270,6 +281,13 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         # Unitary evolution by an Operator
         if not isinstance(other, Operator):
             other = Operator(other)
+        if isinstance(other, LazyOperator) and self.num_qubits is not None:
+            # Contract the gate network with the columns of rho and then of
+            # (U rho)^dagger to return (U (U rho)^dagger)^dagger = U rho U^dagger
+            ret = copy.copy(self)
+            data = other._evolve_vector(self._data, qargs=qargs)
+            ret._data = np.conj(other._evolve_vector(np.conj(data.T), qargs=qargs).T)
+            return ret
         return self._evolve_operator(other, qargs=qargs)
 
     def reverse_qargs(self):
@@ -296,16 +314,33 @@ class DensityMatrix(QuantumState, TolerancesMixin):
     def expectation_value(self, oper, qargs=None):
         """Compute the expectation value of an operator.
 
+        For a :class:`~qiskit.quantum_info.Pauli` or
+        :class:`~qiskit.quantum_info.SparsePauliOp` on qubits the expectation
+        value is computed from the density matrix elements gathered at the
+        columns flipped by the `X` bits of the Paulis, without forming any
+        matrix products.
+
         Args:
-            oper (Operator): an operator to evaluate expval.
+            oper (Operator or Pauli or SparsePauliOp): an operator to evaluate expval.
             qargs (None or list): subsystems to apply the operator on.
 
         Returns:
             complex: the expectation value.
         """
+        if self.num_qubits is not None:
+            value = pauli_expectation_value(self, oper, qargs=qargs)
+            if value is not None:
+                return value
         if not isinstance(oper, Operator):
             oper = Operator(oper)
-        return np.trace(Operator(self).dot(oper.adjoint(), qargs=qargs).data)
+        if self.num_qubits is not None and oper.input_dims() == oper.output_dims() \
+                and self.dims(qargs) == oper.input_dims():
+            # Left multiply a copy of the qubit density matrix in place
+            ret = copy.copy(self)
+            ret._data = np.array(self._data, dtype=complex)
+            evolve_matrix(ret, oper.data, qargs=qargs, left=True)
+            return np.trace(ret._data)
+        return np.trace(Operator(self).dot(oper, qargs=qargs).data)
 
     def probabilities(self, qargs=None, decimals=None):
         """Return the subsystem measurement probability vector.
@@ -490,8 +525,7 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         init = np.zeros((2**num_qubits, 2**num_qubits), dtype=complex)
         init[0, 0] = 1
         vec = DensityMatrix(init, dims=num_qubits * (2, ))
-        vec._append_instruction(instruction)
-        return vec
+        return EvolutionProgram(instruction).evolve(vec, inplace=True)
 
     def to_dict(self, decimals=None):
         r"""Convert the density matrix to dictionary form.
@@ -565,6 +599,12 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         new_shape._num_qargs_r = new_shape._num_qargs_l
 
         ret = copy.copy(self)
+        if qargs is not None and self.num_qubits is not None and \
+                other.input_dims() == other.output_dims():
+            # Update a copy of the qubit density matrix in place
+            ret._data = np.array(self._data, dtype=complex)
+            evolve_matrix(ret, other.data, qargs=qargs)
+            return ret
         if qargs is None:
             # Evolution on full matrix
             op_mat = other.data
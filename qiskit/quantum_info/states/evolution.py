@@ -0,0 +1,403 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+In-place evolution of qubit states by compiled instructions.
+"""
+
+import copy
+from numbers import Number
+
+import numpy as np
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.barrier import Barrier
+from qiskit.circuit.reset import Reset
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.operator import Operator
+
+# Matrices of standard gates keyed by gate class, name and parameters
+_MATRIX_CACHE = {}
+_MATRIX_CACHE_SIZE = 4096
+
+# Largest number of qubits of a non-diagonal gate applied by the slice kernel
+_MAX_SLICE_QUBITS = 2
+
+
+class EvolutionProgram:
+    """A compiled instruction for repeated in-place evolution of qubit states.
+
+    The instruction is flattened once into a list of operations on its
+    qubits: diagonal gates, stored as their diagonals, other gates, stored as
+    their matrices, global phases, and instructions without a matrix or
+    definition, such as resets, which are applied by the state itself. The
+    matrices of standard gates are cached and shared between programs.
+
+    A program evolves :class:`~qiskit.quantum_info.Statevector` and
+    :class:`~qiskit.quantum_info.DensityMatrix` states of qubits in place.
+    Diagonal gates multiply the state by a broadcast diagonal, and 1 and 2
+    qubit gates update the slices of the state for every value of the gate
+    qubits from copies of those slices in work buffers, skipping the zero
+    entries of the gate matrix and the rows of controlled gates where it acts
+    as the identity. The work buffers are allocated on the first evolution of
+    a state of a given size and reused afterwards, so evolving many states by
+    the same program does not allocate memory beyond the output states.
+
+    .. jupyter-execute::
+
+        from qiskit import QuantumCircuit
+        from qiskit.quantum_info import Statevector
+        from qiskit.quantum_info.states import EvolutionProgram
+
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cx(0, 1)
+        program = EvolutionProgram(circ)
+        print(Statevector.from_label('00').evolve(program))
+    """
+
+    def __init__(self, instruction):
+        """Compile an instruction.
+
+        Args:
+            instruction (qiskit.circuit.Instruction or QuantumCircuit): the
+                instruction or circuit to compile.
+
+        Raises:
+            QiskitError: if the instruction contains classical registers or
+                         has an invalid definition.
+        """
+        if isinstance(instruction, QuantumCircuit):
+            instruction = instruction.to_instruction()
+        if not isinstance(instruction, Instruction):
+            raise QiskitError('Input is not an instruction.')
+        self._num_qubits = instruction.num_qubits
+        self._ops = []
+        self._compile(instruction, list(range(self._num_qubits)))
+        # Operations bound to the qubits of a state keyed by layout
+        self._plans = {}
+        # Work buffers keyed by the size of the state data
+        self._buffers = {}
+
+    @property
+    def num_qubits(self):
+        """Return the number of qubits of the instruction."""
+        return self._num_qubits
+
+    def __len__(self):
+        """Return the number of compiled operations."""
+        return len(self._ops)
+
+    def evolve(self, state, qargs=None, inplace=False):
+        """Evolve a qubit state by the compiled instruction.
+
+        Args:
+            state (Statevector or DensityMatrix): the state to evolve.
+            qargs (list or None): the state qubits to apply the instruction on.
+                Only the qubits used by the instruction need to be given.
+            inplace (bool): if True update the data of the input state
+                            instead of a copy [Default: False].
+
+        Returns:
+            Statevector or DensityMatrix: the evolved state.
+
+        Raises:
+            QiskitError: if the state is not a qubit state, or the qubits do
+                         not match the instruction.
+        """
+        num_qubits = state.num_qubits
+        if num_qubits is None:
+            raise QiskitError("Cannot apply an instruction to a non-qubit state.")
+        if qargs is None and num_qubits != self._num_qubits:
+            raise QiskitError(
+                "Instruction on {} qubits cannot be applied to a {}-qubit state.".format(
+                    self._num_qubits, num_qubits))
+
+        if inplace:
+            state._data = np.ascontiguousarray(state._data, dtype=complex)
+        else:
+            state = copy.copy(state)
+            state._data = np.array(state._data, dtype=complex)
+
+        density = state._data.ndim == 2
+        plan = self._plan(num_qubits, qargs, density)
+        buffers = self._work_buffers(state._data.size) if plan.work else None
+        for kernel, args in plan.ops:
+            kernel(state, buffers, *args)
+        return state
+
+    def _compile(self, obj, qubits):
+        """Append the operations of an instruction on qubits."""
+        if isinstance(obj, Barrier):
+            return
+        op = gate_operation(obj)
+        if op is not None:
+            self._ops.append(op + (tuple(qubits),))
+            return
+        if isinstance(obj, Reset) or obj.definition is None:
+            # Applied by the state, which raises if it is not supported
+            self._ops.append(('instruction', obj, tuple(qubits)))
+            return
+        if not isinstance(obj.definition, QuantumCircuit):
+            raise QiskitError('{} instruction definition is {}; expected QuantumCircuit'.format(
+                obj.name, type(obj.definition)))
+        if obj.definition.global_phase:
+            self._ops.append(('phase', np.exp(1j * float(obj.definition.global_phase)), ()))
+        index = {qubit: i for i, qubit in enumerate(obj.definition.qubits)}
+        for instr, qregs, cregs in obj.definition:
+            if cregs:
+                raise QiskitError(
+                    'Cannot apply instruction with classical registers: {}'.format(
+                        instr.name))
+            self._compile(instr, [qubits[index[tup]] for tup in qregs])
+
+    def _plan(self, num_qubits, qargs, density):
+        """Return the operations bound to the qubits of a state."""
+        key = (num_qubits, None if qargs is None else tuple(qargs), density)
+        plan = self._plans.get(key)
+        if plan is None:
+            layout = list(range(num_qubits)) if qargs is None else list(qargs)
+            plan = _Plan(self._ops, layout, num_qubits, density)
+            self._plans[key] = plan
+        return plan
+
+    def _work_buffers(self, size):
+        """Return the work buffers for state data of a given size."""
+        buffers = self._buffers.get(size)
+        if buffers is None:
+            buffers = (np.empty(size, dtype=complex),
+                       np.empty(max(1, size // 2), dtype=complex))
+            self._buffers[size] = buffers
+        return buffers
+
+
+class _Plan:
+    """Kernels and arguments of compiled operations on the qubits of a state."""
+
+    def __init__(self, ops, layout, num_qubits, density):
+        # A density matrix is evolved as a vector of 2N qubits, where qubit
+        # j of the rows is qubit N + j and qubit j of the columns is qubit j
+        size = 2 * num_qubits if density else num_qubits
+        shape = size * (2,)
+        self.ops = []
+        self.work = False
+        for kind, data, qubits in ops:
+            if any(qubit >= len(layout) for qubit in qubits):
+                raise QiskitError("Instruction qubits {} are not in qargs {}.".format(
+                    list(qubits), layout))
+            qubits = [layout[qubit] for qubit in qubits]
+            if kind == 'phase':
+                if not density:
+                    self.ops.append((_apply_phase, (data,)))
+            elif kind == 'diagonal':
+                diag = _broadcast_diagonal(data, qubits, size)
+                if density:
+                    rows = _broadcast_diagonal(data, [num_qubits + q for q in qubits], size)
+                    diag = rows * diag.conj()
+                self.ops.append((_apply_diagonal, (shape, diag)))
+            elif kind == 'matrix':
+                if density:
+                    self._append_matrix(data, [num_qubits + q for q in qubits], shape)
+                    self._append_matrix(data.conj(), qubits, shape)
+                else:
+                    self._append_matrix(data, qubits, shape)
+            else:
+                self.ops.append((_apply_instruction, (data, qubits)))
+
+    def _append_matrix(self, mat, qubits, shape):
+        """Append the kernel of a non-diagonal gate."""
+        if len(qubits) <= _MAX_SLICE_QUBITS:
+            self.ops.append((_apply_slices, _slice_args(mat, qubits, shape)))
+            self.work = True
+        else:
+            mat_tensor = np.reshape(mat, 2 * len(qubits) * (2,))
+            indices = [len(shape) - 1 - qubit for qubit in qubits]
+            self.ops.append((_apply_dense, (shape, mat_tensor, indices)))
+
+
+def gate_operation(obj):
+    """Return the compiled operation of an instruction with a matrix.
+
+    Args:
+        obj (Instruction): an instruction.
+
+    Returns:
+        tuple or None: ``('diagonal', diag)`` for a diagonal matrix,
+        ``('matrix', mat)`` for other matrices, or None if the instruction
+        does not define a matrix. The arrays of standard gates with numeric
+        parameters are cached and must not be modified.
+    """
+    key = _cache_key(obj)
+    if key is not None:
+        op = _MATRIX_CACHE.get(key)
+        if op is not None:
+            return op
+    mat = Operator._instruction_to_matrix(obj)
+    if mat is None:
+        return None
+    op = _matrix_operation(np.array(mat, dtype=complex))
+    if key is not None:
+        op[1].setflags(write=False)
+        if len(_MATRIX_CACHE) >= _MATRIX_CACHE_SIZE:
+            _MATRIX_CACHE.clear()
+        _MATRIX_CACHE[key] = op
+    return op
+
+
+def evolve_matrix(state, mat, qargs=None, left=False):
+    """Evolve the data of a qubit state in place by a matrix.
+
+    Args:
+        state (Statevector or DensityMatrix): the qubit state to update.
+        mat (np.ndarray): a square matrix on the qubits of qargs.
+        qargs (list or None): the state qubits of the matrix, or all qubits if None.
+        left (bool): if True only left multiply a density matrix by the
+                     matrix [Default: False].
+    """
+    num_qubits = state.num_qubits
+    state._data = np.ascontiguousarray(state._data, dtype=complex)
+    density = state._data.ndim == 2
+    layout = list(range(num_qubits)) if qargs is None else list(qargs)
+    if density and left:
+        layout = [num_qubits + qubit for qubit in layout]
+        num_qubits *= 2
+        density = False
+    op = _matrix_operation(np.asarray(mat, dtype=complex))
+    plan = _Plan([op + (tuple(range(len(layout))),)], layout, num_qubits, density)
+    buffers = None
+    if plan.work:
+        buffers = (np.empty(state._data.size, dtype=complex),
+                   np.empty(max(1, state._data.size // 2), dtype=complex))
+    for kernel, args in plan.ops:
+        kernel(state, buffers, *args)
+
+
+def _matrix_operation(mat):
+    """Return the diagonal or matrix operation of a complex matrix."""
+    diag = np.diagonal(mat).copy()
+    if np.count_nonzero(mat) == np.count_nonzero(diag):
+        return ('diagonal', diag)
+    return ('matrix', mat)
+
+
+def _cache_key(obj):
+    """Return the matrix cache key of a standard gate with numeric parameters.
+
+    Multi-controlled gates share names and parameters for any number of
+    controls, so the number of qubits is part of the key.
+    """
+    if not type(obj).__module__.startswith('qiskit.circuit.library.standard_gates'):
+        return None
+    params = []
+    for param in obj.params:
+        if not isinstance(param, Number):
+            return None
+        params.append(complex(param))
+    return (type(obj), obj.name, obj.num_qubits, getattr(obj, 'ctrl_state', None),
+            tuple(params))
+
+
+def _broadcast_diagonal(diag, qubits, size):
+    """Reshape a diagonal on qubits to broadcast against a state tensor of size qubits."""
+    num = len(qubits)
+    # Axis a of the reshaped diagonal is qubit qubits[num - 1 - a], which is
+    # axis size - 1 - qubit of the state tensor
+    axes = [size - 1 - qubits[num - 1 - a] for a in range(num)]
+    tensor = np.transpose(np.reshape(diag, num * (2,)), np.argsort(axes))
+    shape = size * [1]
+    for qubit in qubits:
+        shape[size - 1 - qubit] = 2
+    return np.reshape(tensor, shape)
+
+
+def _slice_args(mat, qubits, shape):
+    """Return the arguments of the slice kernel of a gate matrix on qubits.
+
+    Every row of the matrix is classified as the identity, which is skipped,
+    as a scalar multiple of its own slice, which is scaled in place, or as a
+    linear combination of copied input slices.
+    """
+    size = len(shape)
+    slices = []
+    for index in range(len(mat)):
+        slc = size * [slice(None)]
+        for pos, qubit in enumerate(qubits):
+            slc[size - 1 - qubit] = (index >> pos) & 1
+        # The trailing ellipsis keeps the slices of a gate on every qubit
+        # of the state as 0-d array views instead of scalars
+        slices.append(tuple(slc) + (Ellipsis,))
+    rows = []
+    inputs = []
+    for i, row in enumerate(mat):
+        cols = np.flatnonzero(row)
+        if len(cols) == 1 and cols[0] == i:
+            if row[i] != 1:
+                rows.append((slices[i], row[i], None))
+            continue
+        terms = []
+        for j in cols:
+            if j not in inputs:
+                inputs.append(j)
+            terms.append((inputs.index(j), row[j]))
+        rows.append((slices[i], None, terms))
+    sub_shape = shape[len(qubits):]
+    return (shape, sub_shape, [slices[j] for j in inputs], rows)
+
+
+def _apply_phase(state, _, phase):
+    """Multiply a state by a global phase."""
+    state._data *= phase
+
+
+def _apply_diagonal(state, _, shape, diag):
+    """Multiply a state tensor by a broadcast diagonal."""
+    tensor = state._data.reshape(shape)
+    np.multiply(tensor, diag, out=tensor)
+
+
+def _apply_slices(state, buffers, shape, sub_shape, inputs, rows):
+    """Apply a gate to the slices of a state tensor for every value of its qubits."""
+    tensor = state._data.reshape(shape)
+    sub_size = int(np.prod(sub_shape))
+    work = buffers[0][:len(inputs) * sub_size].reshape((len(inputs),) + sub_shape)
+    tmp = buffers[1][:sub_size].reshape(sub_shape)
+    for slot, slc in enumerate(inputs):
+        np.copyto(work[slot, ...], tensor[slc])
+    for slc, scale, terms in rows:
+        out = tensor[slc]
+        if terms is None:
+            out *= scale
+            continue
+        if not terms:
+            out.fill(0)
+            continue
+        slot, coeff = terms[0]
+        if coeff == 1:
+            np.copyto(out, work[slot, ...])
+        else:
+            np.multiply(work[slot, ...], coeff, out=out)
+        for slot, coeff in terms[1:]:
+            np.multiply(work[slot, ...], coeff, out=tmp)
+            out += tmp
+
+
+def _apply_dense(state, _, shape, mat_tensor, indices):
+    """Contract a gate on three or more qubits with a state tensor."""
+    tensor = state._data.reshape(shape)
+    np.copyto(tensor, Operator._einsum_matmul(tensor, mat_tensor, indices))
+
+
+def _apply_instruction(state, _, obj, qubits):
+    """Apply an instruction without a matrix using the method of the state."""
+    state._append_instruction(obj, qargs=qubits)
+    state._data = np.ascontiguousarray(state._data, dtype=complex)
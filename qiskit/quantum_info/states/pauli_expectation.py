@@ -0,0 +1,89 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+r"""
+Expectation values of sums of Paulis without operator matrices.
+
+A Pauli with symplectic bits :math:`(x, z)` acts on a basis state as
+:math:`P|b\rangle = i^{|x \wedge z|} (-1)^{z \cdot b} |b \oplus x\rangle`, so that
+
+.. math::
+
+    \mathrm{Tr}[\rho P] = i^{|x \wedge z|} \sum_b (-1)^{z \cdot b} \rho_{b, b \oplus x}.
+
+The terms of a sum are grouped by their ``x`` bits with
+:func:`~qiskit.quantum_info.operators.symplectic.sparse_pauli_linear_operator.pauli_groups`.
+The elements :math:`\rho_{b, b \oplus x}` of every group are gathered once, from
+the amplitudes :math:`\psi_b \psi^*_{b \oplus x}` of a statevector or the entries
+of a density matrix, and summed with the signed diagonal of the group from
+:func:`~qiskit.quantum_info.operators.symplectic.sparse_pauli_linear_operator.group_diagonal`.
+"""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.symplectic.sparse_pauli_linear_operator import (
+    pauli_groups, group_diagonal)
+
+
+def pauli_expectation_value(state, oper, qargs=None):
+    """Return the expectation value of a Pauli or SparsePauliOp in a qubit state.
+
+    Args:
+        state (Statevector or DensityMatrix): a qubit state.
+        oper (object): an operator.
+        qargs (list or None): the state qubits of the Pauli qubits.
+
+    Returns:
+        complex or None: the expectation value, or None if the operator is not a
+        :class:`~qiskit.quantum_info.Pauli` or :class:`~qiskit.quantum_info.SparsePauliOp`.
+
+    Raises:
+        QiskitError: if the number of qubits of the Paulis does not match qargs.
+    """
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info.operators.symplectic import Pauli, SparsePauliOp
+
+    if isinstance(oper, Pauli):
+        x_bits, z_bits = oper.x[None, :], oper.z[None, :]
+        coeffs = np.array([(-1j) ** oper.phase], dtype=complex)
+    elif isinstance(oper, SparsePauliOp):
+        x_bits, z_bits = oper.table.X, oper.table.Z
+        coeffs = np.asarray(oper.coeffs, dtype=complex)
+    else:
+        return None
+    num_qubits = state.num_qubits
+    if qargs is None:
+        qargs = range(num_qubits)
+    qargs = list(qargs)
+    if x_bits.shape[1] != len(qargs):
+        raise QiskitError("Number of Pauli qubits does not match the state qargs.")
+    # Embed the Paulis in all qubits of the state
+    state_x = np.zeros((len(coeffs), num_qubits), dtype=bool)
+    state_z = np.zeros((len(coeffs), num_qubits), dtype=bool)
+    state_x[:, qargs] = x_bits
+    state_z[:, qargs] = z_bits
+
+    data = state.data
+    powers = 1 << np.arange(num_qubits, dtype=np.int64)
+    indices = np.arange(2 ** num_qubits, dtype=np.int64)
+    total = 0j
+    for x_row, group_z, group_coeffs in pauli_groups(state_x, state_z, coeffs):
+        x_int = int(x_row.astype(np.int64) @ powers) if num_qubits else 0
+        if data.ndim == 2:
+            values = data.ravel()[indices * len(data) + (indices ^ x_int)]
+        elif x_int:
+            values = data * np.conj(data[indices ^ x_int])
+        else:
+            values = np.abs(data) ** 2
+        total += np.dot(values, group_diagonal(group_z, group_coeffs, num_qubits))
+    return total
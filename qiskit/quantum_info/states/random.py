@@ -14,11 +14,15 @@
 Random state generation.
 """
 
+import functools
+
 import numpy as np
 from numpy.random import default_rng
 
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.random import random_unitary
+from qiskit.quantum_info.operators.random import _ginibre_stack, _haar_unitaries
+from qiskit.quantum_info.operators.random_batch import RandomBatch
 from .statevector import Statevector
 from .densitymatrix import DensityMatrix
 
@@ -54,6 +58,44 @@ def random_statevector(dims, seed=None):
     return Statevector(np.sqrt(x / sumx) * np.exp(1j * phases), dims=dims)
 
 
+def random_statevectors(dims, size, seed=None):
+    """Generate a batch of random Statevectors.
+
+    The statevectors are sampled from the uniform (Haar) measure as in
+    :func:`random_statevector`, with the random numbers of all of them drawn
+    at once. The ``(size, dim)`` array of the vectors is the ``data`` of the
+    returned batch, and a :class:`Statevector` is only constructed when an
+    element of the batch is accessed. For a fixed seed the first ``k``
+    vectors of a batch do not depend on its size.
+
+    Args:
+        dims (int or tuple): the dimensions of the states.
+        size (int): the number of states.
+        seed (int or np.random.Generator): Optional. Set a fixed seed or
+                                           generator for RNG.
+
+    Returns:
+        RandomBatch: the batch of random statevectors.
+    """
+    if seed is None:
+        rng = np.random.default_rng()
+    elif isinstance(seed, np.random.Generator):
+        rng = seed
+    else:
+        rng = default_rng(seed)
+
+    dim = int(np.product(dims))
+
+    # Random arrays over interval (0, 1] of the weights and phases
+    x = rng.random((size, 2, dim))
+    phases = x[:, 1] * 2.0 * np.pi
+    x = x[:, 0]
+    x += x == 0
+    x = -np.log(x)
+    vecs = np.sqrt(x / np.sum(x, axis=1)[:, None]) * np.exp(1j * phases)
+    return RandomBatch([vecs], functools.partial(Statevector, dims=dims))
+
+
 def random_density_matrix(dims, rank=None, method='Hilbert-Schmidt',
                           seed=None):
     """Generator a random DensityMatrix.
@@ -88,6 +130,60 @@ def random_density_matrix(dims, rank=None, method='Hilbert-Schmidt',
     return DensityMatrix(rho, dims=dims)
 
 
+def random_density_matrices(dims, size, rank=None, method='Hilbert-Schmidt',
+                            seed=None):
+    """Generate a batch of random DensityMatrices.
+
+    The density matrices are sampled as in :func:`random_density_matrix`
+    from stacks of random matrices drawn at once. The ``(size, dim, dim)``
+    array of the matrices is the ``data`` of the returned batch, and a
+    :class:`DensityMatrix` is only constructed when an element of the batch is
+    accessed. For a fixed seed the first ``k`` matrices of a batch do not
+    depend on its size.
+
+    Args:
+        dims (int or tuple): the dimensions of the DensityMatrices.
+        size (int): the number of DensityMatrices.
+        rank (int or None): Optional, the rank of the density matrices.
+                            The default value is full-rank.
+        method (string): Optional. The method to use.
+            'Hilbert-Schmidt': (Default) sample from the Hilbert-Schmidt metric.
+            'Bures': sample from the Bures metric.
+        seed (int or np.random.Generator): Optional. Set a fixed seed or
+                                           generator for RNG.
+
+    Returns:
+        RandomBatch: the batch of random density matrices.
+
+    Raises:
+        QiskitError: if the method is not valid.
+    """
+    if seed is None:
+        rng = np.random.default_rng()
+    elif isinstance(seed, np.random.Generator):
+        rng = seed
+    else:
+        rng = default_rng(seed)
+
+    dim = int(np.product(dims))
+    if rank is None:
+        rank = dim  # Use full rank
+
+    if method == 'Hilbert-Schmidt':
+        mats = _ginibre_stack(rng, size, dim, rank)
+    elif method == 'Bures':
+        # Draw the unitary and the Ginibre matrix of each density matrix together
+        ginibre = _ginibre_stack(rng, size, dim, dim + rank)
+        mats = _haar_unitaries(ginibre[:, :, :dim])
+        mats[:, range(dim), range(dim)] += 1
+        mats = np.matmul(mats, ginibre[:, :, dim:])
+    else:
+        raise QiskitError('Error: unrecognized method {}'.format(method))
+    rhos = np.matmul(mats, np.conj(np.swapaxes(mats, 1, 2)))
+    rhos /= np.trace(rhos, axis1=1, axis2=2)[:, None, None]
+    return RandomBatch([rhos], functools.partial(DensityMatrix, dims=dims))
+
+
 def _ginibre_matrix(nrow, ncol, seed):
     """Return a normally distributed complex random matrix.
 
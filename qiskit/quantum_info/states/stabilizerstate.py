@@ -0,0 +1,664 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Stabilizer state class.
+"""
+# pylint: disable=invalid-name
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.circuit import QuantumCircuit, Instruction
+from qiskit.quantum_info.operators.op_shape import OpShape
+from qiskit.quantum_info.operators.symplectic import Clifford, Pauli, StabilizerTable
+from qiskit.quantum_info.operators.symplectic.bit_packing import (
+    pack_bits, unpack_bits, popcount)
+from qiskit.quantum_info.operators.symplectic.clifford import _gf2_matmul
+from qiskit.quantum_info.operators.symplectic.clifford_circuits import (
+    _circuit_program, _evolve_columns, _columns_to_ints, _ints_to_columns,
+    _is_basis_instruction)
+from qiskit.quantum_info.states.quantum_state import QuantumState
+from qiskit.quantum_info.states.statevector import Statevector
+
+_ONE = np.uint64(1)
+
+
+class StabilizerState(QuantumState):  # pylint: disable=abstract-method
+    """StabilizerState class.
+
+    A stabilizer state is the state :math:`C|0\\rangle^{\\otimes n}` prepared by a
+    :class:`~qiskit.quantum_info.Clifford` :math:`C`. It is stored as the Clifford tableau of
+    :math:`C`, whose stabilizer rows generate the group of Paulis that stabilize the state and
+    whose destabilizer rows are used to compute measurement outcomes [1].
+
+    The rows of the tableau are packed into 64-bit words and updated in place, so that every
+    Clifford gate is applied in :math:`O(n)` and every single qubit measurement in
+    :math:`O(n^2)` word operations. Circuits of thousands of qubits can be simulated.
+
+    .. code-block:: python
+
+        from qiskit import QuantumCircuit
+        from qiskit.quantum_info import StabilizerState, Pauli
+
+        circ = QuantumCircuit(3)
+        circ.h(0)
+        circ.cx(0, 1)
+        circ.cx(1, 2)
+        stab = StabilizerState(circ)
+
+        print(stab.probabilities_dict())
+        print(stab.expectation_value(Pauli('ZZI')))
+        print(stab.sample_counts(1000))
+
+    .. parsed-literal::
+
+        {'000': 0.5, '111': 0.5}
+        (1+0j)
+        {'000': 491, '111': 509}
+
+    References:
+        1. S. Aaronson, D. Gottesman, *Improved Simulation of Stabilizer Circuits*,
+           Phys. Rev. A 70, 052328 (2004).
+           `arXiv:quant-ph/0406196 <https://arxiv.org/abs/quant-ph/0406196>`_
+    """
+
+    def __init__(self, data, validate=True):
+        """Initialize a StabilizerState object.
+
+        Args:
+            data (StabilizerState or Clifford or QuantumCircuit or Instruction or int):
+                the data of the state. An integer is the number of qubits of the
+                :math:`|0\\rangle` state.
+            validate (bool): validate that a Clifford table is symplectic (Default: True).
+
+        Raises:
+            QiskitError: if the input data is not a valid stabilizer state.
+        """
+        if isinstance(data, StabilizerState):
+            num_qubits = data.num_qubits
+            self._x = data._x.copy()
+            self._z = data._z.copy()
+            self._phase = data._phase.copy()
+        elif isinstance(data, (QuantumCircuit, Instruction, int, np.integer)):
+            num_qubits = data if isinstance(data, (int, np.integer)) else data.num_qubits
+            self._x, self._z, self._phase = _identity_tableau(num_qubits)
+            if not isinstance(data, (int, np.integer)):
+                _append_instruction(self, data, list(range(num_qubits)))
+        else:
+            if not isinstance(data, Clifford):
+                data = Clifford(data, validate=validate)
+            num_qubits = data.num_qubits
+            self._x = pack_bits(data.table.X)
+            self._z = pack_bits(data.table.Z)
+            self._phase = data.table.phase.copy()
+        super().__init__(op_shape=OpShape.auto(num_qubits_l=num_qubits, num_qubits_r=0))
+
+    def __eq__(self, other):
+        num_qubits = self.num_qubits
+        return (isinstance(other, StabilizerState) and num_qubits == other.num_qubits and
+                np.array_equal(self._x[num_qubits:], other._x[num_qubits:]) and
+                np.array_equal(self._z[num_qubits:], other._z[num_qubits:]) and
+                np.array_equal(self._phase[num_qubits:], other._phase[num_qubits:]))
+
+    def __repr__(self):
+        return 'StabilizerState(StabilizerTable: {})'.format(
+            self.clifford.stabilizer.to_labels())
+
+    @property
+    def clifford(self):
+        """Return the Clifford of the stabilizer state."""
+        num_qubits = self.num_qubits
+        array = np.hstack([unpack_bits(self._x, num_qubits), unpack_bits(self._z, num_qubits)])
+        return Clifford(StabilizerTable(array, self._phase.copy()), validate=False)
+
+    def is_valid(self, atol=None, rtol=None):
+        """Return True if a valid stabilizer state."""
+        return self.clifford.is_unitary()
+
+    def to_operator(self):
+        """Convert state to the matrix operator of its density matrix."""
+        return Statevector.from_instruction(self.clifford.to_circuit()).to_operator()
+
+    def conjugate(self):
+        """Return the conjugate of the stabilizer state."""
+        ret = self.copy()
+        # The complex conjugate of a Hermitian Pauli has the sign (-1)^(number of Ys)
+        ret._phase ^= (popcount(ret._x & ret._z) % 2).astype(bool)
+        return ret
+
+    def purity(self):
+        """Return the purity of the quantum state, which is 1 for stabilizer states."""
+        return 1.0
+
+    def trace(self):
+        """Return the trace of the stabilizer state as a density matrix, which is 1."""
+        return 1.0
+
+    def tensor(self, other):
+        if not isinstance(other, StabilizerState):
+            other = StabilizerState(other)
+        return StabilizerState(self.clifford.tensor(other.clifford), validate=False)
+
+    def expand(self, other):
+        if not isinstance(other, StabilizerState):
+            other = StabilizerState(other)
+        return StabilizerState(self.clifford.expand(other.clifford), validate=False)
+
+    def evolve(self, other, qargs=None):
+        """Evolve a stabilizer state by a Clifford operator.
+
+        Args:
+            other (Clifford or Pauli or QuantumCircuit or Instruction): the Clifford
+                operator to evolve by.
+            qargs (list): a list of qubits to apply the Clifford operator on.
+
+        Returns:
+            StabilizerState: the output stabilizer state.
+
+        Raises:
+            QiskitError: if other is not a Clifford operator or the number of qubits
+                of the operator does not match the specified qubits.
+        """
+        if qargs is None:
+            qargs = getattr(other, 'qargs', None)
+        if isinstance(other, (Clifford, Pauli)):
+            other = other.to_instruction()
+        elif not isinstance(other, (QuantumCircuit, Instruction)):
+            other = Clifford(other).to_instruction()
+        if qargs is None:
+            qargs = list(range(other.num_qubits))
+        if len(qargs) != other.num_qubits or other.num_qubits > self.num_qubits:
+            raise QiskitError('Number of qubits of the operator does not match qargs.')
+        ret = self.copy()
+        _append_instruction(ret, other, list(qargs))
+        return ret
+
+    def expectation_value(self, oper, qargs=None):
+        """Compute the expectation value of a Pauli operator.
+
+        Args:
+            oper (Pauli or str): a Pauli operator to evaluate the expectation value of.
+            qargs (None or list): subsystems to apply the operator on.
+
+        Returns:
+            complex: the expectation value, which is 0 or :math:`\\pm 1` times the phase
+            of the Pauli.
+
+        Raises:
+            QiskitError: if oper is not a Pauli operator.
+        """
+        if not isinstance(oper, Pauli):
+            try:
+                oper = Pauli(oper)
+            except QiskitError as ex:
+                raise QiskitError(
+                    'StabilizerState expectation values are only defined for Paulis.') from ex
+        num_qubits = self.num_qubits
+        if qargs is None:
+            qargs = list(range(oper.num_qubits))
+        if len(qargs) != oper.num_qubits:
+            raise QiskitError('Number of qubits of the Pauli does not match qargs.')
+        pauli_x = np.zeros((1, num_qubits), dtype=bool)
+        pauli_z = np.zeros((1, num_qubits), dtype=bool)
+        pauli_x[0, qargs] = oper.x
+        pauli_z[0, qargs] = oper.z
+        pauli_x = pack_bits(pauli_x)
+        pauli_z = pack_bits(pauli_z)
+        anticommute = popcount((self._x & pauli_z) ^ (self._z & pauli_x)) % 2 == 1
+        # A Pauli anticommuting with a stabilizer has expectation value 0
+        if np.any(anticommute[num_qubits:]):
+            return 0
+        # Otherwise it is the product of the stabilizers of the anticommuting destabilizers
+        rows = num_qubits + np.flatnonzero(anticommute[:num_qubits])
+        sign = _product_sign(self._x[rows], self._z[rows], self._phase[rows, None])
+        return (-1j) ** int(oper.phase) * (-1) ** int(sign[0])
+
+    def equiv(self, other):
+        """Return True if the two generating sets generate the same stabilizer group.
+
+        Args:
+            other (StabilizerState): another stabilizer state.
+
+        Returns:
+            bool: True if other has the same stabilizer group as the state.
+        """
+        if not isinstance(other, StabilizerState):
+            try:
+                other = StabilizerState(other)
+            except QiskitError:
+                return False
+        if self.num_qubits != other.num_qubits:
+            return False
+        return all(self.expectation_value(pauli) == 1
+                   for pauli in other.clifford.stabilizer.to_labels())
+
+    def probabilities(self, qargs=None, decimals=None):
+        """Return the subsystem measurement probability vector.
+
+        Measurement probabilities are with respect to measurement in the
+        computation (diagonal) basis. The vector has length :math:`2^k` for
+        :math:`k` measured qubits, and should only be used for small subsets of
+        the qubits.
+
+        Args:
+            qargs (None or list): subsystems to return probabilities for,
+                if None return for all subsystems (Default: None).
+            decimals (None or int): the number of decimal places to round
+                values. If None no rounding is done (Default: None).
+
+        Returns:
+            np.array: The Numpy vector array of probabilities.
+        """
+        qargs = list(range(self.num_qubits)) if qargs is None else list(qargs)
+        outcomes, probability = self._outcome_space(qargs)
+        probs = np.zeros(2 ** len(qargs))
+        probs[_outcome_indices(outcomes)] = probability
+        if decimals is not None:
+            probs = probs.round(decimals=decimals)
+        return probs
+
+    def probabilities_dict(self, qargs=None, decimals=None):
+        """Return the subsystem measurement probability dictionary.
+
+        Measurement probabilities are with respect to measurement in the
+        computation (diagonal) basis. The outcomes of a stabilizer state are
+        uniformly distributed over an affine subspace, and only the outcomes in
+        this subspace are enumerated.
+
+        Args:
+            qargs (None or list): subsystems to return probabilities for,
+                if None return for all subsystems (Default: None).
+            decimals (None or int): the number of decimal places to round
+                values. If None no rounding is done (Default: None).
+
+        Returns:
+            dict: The measurement probabilities in dict (ket) form.
+        """
+        qargs = list(range(self.num_qubits)) if qargs is None else list(qargs)
+        outcomes, probability = self._outcome_space(qargs)
+        if decimals is not None:
+            probability = round(probability, decimals)
+        return dict.fromkeys(_outcome_labels(outcomes), probability)
+
+    def reset(self, qargs=None):
+        """Reset state or subsystems to the 0-state.
+
+        Args:
+            qargs (list or None): subsystems to reset, if None all
+                                  subsystems will be reset to their 0-state
+                                  (Default: None).
+
+        Returns:
+            StabilizerState: the reset state.
+        """
+        if qargs is None:
+            return StabilizerState(self.num_qubits)
+        ret = self.copy()
+        for qubit in qargs:
+            ret._reset_qubit(qubit)
+        return ret
+
+    def measure(self, qargs=None):
+        """Measure subsystems and return outcome and post-measure state.
+
+        Note that this function uses the QuantumStates internal random
+        number generator for sampling the measurement outcome. The RNG
+        seed can be set using the :meth:`seed` method.
+
+        Args:
+            qargs (list or None): subsystems to sample measurements for,
+                                  if None sample measurement of all
+                                  subsystems (Default: None).
+
+        Returns:
+            tuple: the pair ``(outcome, state)`` where ``outcome`` is the
+                   measurement outcome string label, and ``state`` is the
+                   collapsed post-measurement state for the corresponding
+                   outcome.
+        """
+        qargs = list(range(self.num_qubits)) if qargs is None else list(qargs)
+        ret = self.copy()
+        outcome = [ret._measure_qubit(qubit) for qubit in qargs]
+        return ''.join(str(bit) for bit in reversed(outcome)), ret
+
+    def sample_memory(self, shots, qargs=None):
+        """Sample a list of qubit measurement outcomes in the computational basis.
+
+        Args:
+            shots (int): number of samples to generate.
+            qargs (None or list): subsystems to sample measurements for,
+                                if None sample measurement of all
+                                subsystems (Default: None).
+
+        Returns:
+            np.array: list of sampled counts if the order sampled.
+
+        Additional Information:
+
+            The measurement of the qubits is simulated once, with the outcomes
+            of random measurements kept as free variables. All shots are then
+            sampled together by substituting random bits for the variables,
+            without simulating the measurements again. The state is not modified.
+
+            The seed for random number generator used for sampling can be
+            set to a fixed value by using the stats :meth:`seed` method.
+        """
+        qargs = list(range(self.num_qubits)) if qargs is None else list(qargs)
+        return _outcome_labels(self._sample_outcomes(shots, qargs))
+
+    def _sample_outcomes(self, shots, qargs):
+        """Return a ``(shots, len(qargs))`` boolean array of sampled outcomes."""
+        offset, generators = self._affine_outcomes(qargs)
+        bits = self._rng.choice(2, size=(shots, len(generators))).astype(bool)
+        return offset ^ _gf2_matmul(bits, generators)
+
+    def _outcome_space(self, qargs):
+        """Return all outcomes of measuring qargs and their common probability."""
+        offset, generators = self._affine_outcomes(qargs)
+        num_generators = len(generators)
+        # Bit j of the integer i is the value of the variable j
+        bits = (np.arange(2 ** num_generators)[:, None] >> np.arange(num_generators)) & 1
+        outcomes = offset ^ _gf2_matmul(bits.astype(bool), generators)
+        return outcomes, 0.5 ** num_generators
+
+    def _affine_outcomes(self, qargs):
+        """Return the outcomes of measuring qargs as an affine function of random bits.
+
+        The qubits are measured on a copy of the tableau whose phases are affine
+        functions of the outcomes of random measurements, packed into uint64 words:
+        bit 0 of the phases is the constant term and bit ``j > 0`` the coefficient
+        of the outcome of the ``j``-th random measurement.
+
+        Returns:
+            tuple: the pair ``(offset, generators)`` of the boolean constant outcomes
+            and the ``(m, len(qargs))`` boolean coefficients of ``m`` uniformly random
+            bits, such that the outcomes are ``offset ^ bits . generators``.
+        """
+        x = self._x.copy()
+        z = self._z.copy()
+        num_bits = len(qargs) + 1
+        phase = np.zeros((len(x), -(-num_bits // 64)), dtype=np.uint64)
+        phase[:, 0] = self._phase
+        signs = []
+        num_variables = 0
+        for qubit in qargs:
+            variable = np.zeros(phase.shape[1], dtype=np.uint64)
+            variable[(num_variables + 1) >> 6] = _ONE << np.uint64((num_variables + 1) & 63)
+            random, sign = _measure_tableau(x, z, phase, qubit, variable)
+            num_variables += random
+            signs.append(sign)
+        signs = unpack_bits(np.array(signs, dtype=np.uint64).reshape(len(qargs), -1), num_bits)
+        return signs[:, 0], signs[:, 1:num_variables + 1].T.copy()
+
+    def _measure_qubit(self, qubit):
+        """Measure a qubit in place and return the integer outcome."""
+        sign = np.array([self._rng.choice(2)], dtype=bool)
+        _, sign = _measure_tableau(self._x, self._z, self._phase[:, None], qubit, sign)
+        return int(sign[0])
+
+    def _reset_qubit(self, qubit):
+        """Reset a qubit in place to the 0-state."""
+        if self._measure_qubit(qubit):
+            _apply_x(self._x, self._z, self._phase, qubit)
+
+
+# ---------------------------------------------------------------------
+# Bit-packed tableau helper functions
+# ---------------------------------------------------------------------
+
+def _identity_tableau(num_qubits):
+    """Return the packed ``(x, z, phase)`` tableau of the identity Clifford."""
+    eye = pack_bits(np.eye(num_qubits, dtype=bool))
+    zero = np.zeros_like(eye)
+    return np.vstack([eye, zero]), np.vstack([zero, eye]), np.zeros(2 * num_qubits, dtype=bool)
+
+
+def _rowsum(x, z, phase, rows, pivot):
+    """Multiply rows of a packed tableau by the pivot row in place.
+
+    The phase of the product of Paulis :math:`P_r P_p` with
+    :math:`P = i^{x \\cdot z} X^x Z^z` is :math:`i^e` with
+    :math:`e = x_r \\cdot z_r + x_p \\cdot z_p + 2 z_r \\cdot x_p - x \\cdot z` for the
+    product bits :math:`x, z`. Column 0 of the phases is the constant sign.
+    """
+    x_rows = x[rows]
+    z_rows = z[rows]
+    x_prod = x_rows ^ x[pivot]
+    z_prod = z_rows ^ z[pivot]
+    exponent = (popcount(x_rows & z_rows) + popcount(x[pivot] & z[pivot]) +
+                2 * popcount(z_rows & x[pivot]) - popcount(x_prod & z_prod))
+    x[rows] = x_prod
+    z[rows] = z_prod
+    phase[rows] ^= phase[pivot]
+    phase[rows, 0] ^= (exponent % 4 >= 2).astype(phase.dtype)
+
+
+def _product_sign(x_rows, z_rows, phase_rows):
+    """Return the sign of the ordered product of commuting Paulis.
+
+    The product :math:`P_1 \\cdots P_k` has the phase
+    :math:`i^{\\sum_j x_j \\cdot z_j - x \\cdot z} (-1)^{\\sum_{a < b} z_a \\cdot x_b}`,
+    where the parity of the pairs is computed from the prefix XOR of the ``z`` rows.
+    """
+    if len(x_rows) == 0:
+        return np.zeros(phase_rows.shape[1], dtype=phase_rows.dtype)
+    sign = np.bitwise_xor.reduce(phase_rows, axis=0)
+    z_before = np.zeros_like(z_rows)
+    z_before[1:] = np.bitwise_xor.accumulate(z_rows[:-1], axis=0)
+    x_prod = np.bitwise_xor.reduce(x_rows, axis=0)
+    z_prod = np.bitwise_xor.reduce(z_rows, axis=0)
+    exponent = (np.sum(popcount(x_rows & z_rows)) + 2 * np.sum(popcount(x_rows & z_before)) -
+                popcount(x_prod & z_prod))
+    sign[0] ^= phase_rows.dtype.type(exponent % 4 >= 2)
+    return sign
+
+
+def _measure_tableau(x, z, phase, qubit, sign):
+    """Measure a qubit of a packed tableau in the Z basis in place.
+
+    Args:
+        x (np.ndarray): the packed ``x`` bits of the tableau.
+        z (np.ndarray): the packed ``z`` bits of the tableau.
+        phase (np.ndarray): the ``(2n, m)`` phases of the tableau, either booleans or
+            bits packed into uint64 words. Bit 0 is the sign of the row.
+        qubit (int): the qubit to measure.
+        sign (np.ndarray): the ``m`` phases of the outcome if it is random.
+
+    Returns:
+        tuple: the pair ``(random, sign)`` of whether the outcome was random and the
+        phase bits of the outcome.
+    """
+    num_qubits = len(x) // 2
+    word, bit = qubit >> 6, np.uint64(qubit & 63)
+    x_col = ((x[:, word] >> bit) & _ONE).astype(bool)
+    stabilizers = np.flatnonzero(x_col[num_qubits:])
+    if stabilizers.size:
+        # The outcome is random and the anticommuting stabilizer is replaced by +-Z
+        pivot = num_qubits + stabilizers[0]
+        rows = np.flatnonzero(x_col)
+        _rowsum(x, z, phase, rows[rows != pivot], pivot)
+        x[pivot - num_qubits] = x[pivot]
+        z[pivot - num_qubits] = z[pivot]
+        phase[pivot - num_qubits] = phase[pivot]
+        x[pivot] = 0
+        z[pivot] = 0
+        z[pivot, word] = _ONE << bit
+        phase[pivot] = sign
+        return True, sign.copy()
+    # Otherwise Z is the product of the stabilizers of the anticommuting destabilizers
+    rows = num_qubits + np.flatnonzero(x_col[:num_qubits])
+    return False, _product_sign(x[rows], z[rows], phase[rows])
+
+
+def _column(array, qubit):
+    """Return the bits of a qubit of all rows as a uint64 array of 0 and 1."""
+    return (array[:, qubit >> 6] >> np.uint64(qubit & 63)) & _ONE
+
+
+def _flip(array, qubit, bits):
+    """Flip the bits of a qubit of the rows where bits is 1."""
+    array[:, qubit >> 6] ^= bits << np.uint64(qubit & 63)
+
+
+def _apply_i(x, z, phase, qubit):
+    # pylint: disable=unused-argument
+    pass
+
+
+def _apply_x(x, z, phase, qubit):
+    # pylint: disable=unused-argument
+    phase ^= _column(z, qubit).astype(bool)
+
+
+def _apply_y(x, z, phase, qubit):
+    phase ^= (_column(x, qubit) ^ _column(z, qubit)).astype(bool)
+
+
+def _apply_z(x, z, phase, qubit):
+    # pylint: disable=unused-argument
+    phase ^= _column(x, qubit).astype(bool)
+
+
+def _apply_h(x, z, phase, qubit):
+    x_col = _column(x, qubit)
+    z_col = _column(z, qubit)
+    phase ^= (x_col & z_col).astype(bool)
+    _flip(x, qubit, x_col ^ z_col)
+    _flip(z, qubit, x_col ^ z_col)
+
+
+def _apply_s(x, z, phase, qubit):
+    x_col = _column(x, qubit)
+    phase ^= (x_col & _column(z, qubit)).astype(bool)
+    _flip(z, qubit, x_col)
+
+
+def _apply_sdg(x, z, phase, qubit):
+    x_col = _column(x, qubit)
+    phase ^= (x_col & ~_column(z, qubit)).astype(bool)
+    _flip(z, qubit, x_col)
+
+
+def _apply_v(x, z, phase, qubit):
+    # pylint: disable=unused-argument
+    x_col = _column(x, qubit)
+    z_col = _column(z, qubit)
+    _flip(x, qubit, z_col)
+    _flip(z, qubit, x_col ^ z_col)
+
+
+def _apply_w(x, z, phase, qubit):
+    # pylint: disable=unused-argument
+    x_col = _column(x, qubit)
+    z_col = _column(z, qubit)
+    _flip(x, qubit, x_col ^ z_col)
+    _flip(z, qubit, x_col)
+
+
+def _apply_cx(x, z, phase, control, target):
+    x0 = _column(x, control)
+    z0 = _column(z, control)
+    x1 = _column(x, target)
+    z1 = _column(z, target)
+    phase ^= ((x1 ^ z0 ^ _ONE) & z1 & x0).astype(bool)
+    _flip(x, target, x0)
+    _flip(z, control, z1)
+
+
+def _apply_cz(x, z, phase, control, target):
+    x0 = _column(x, control)
+    z0 = _column(z, control)
+    x1 = _column(x, target)
+    z1 = _column(z, target)
+    phase ^= (x0 & x1 & (z0 ^ z1)).astype(bool)
+    _flip(z, target, x0)
+    _flip(z, control, x1)
+
+
+def _apply_swap(x, z, phase, qubit0, qubit1):
+    # pylint: disable=unused-argument
+    for array in (x, z):
+        diff = _column(array, qubit0) ^ _column(array, qubit1)
+        _flip(array, qubit0, diff)
+        _flip(array, qubit1, diff)
+
+
+_BASIS_1Q = {
+    'i': _apply_i, 'id': _apply_i, 'iden': _apply_i,
+    'x': _apply_x, 'y': _apply_y, 'z': _apply_z, 'h': _apply_h,
+    's': _apply_s, 'sdg': _apply_sdg, 'sinv': _apply_sdg,
+    'v': _apply_v, 'w': _apply_w
+}
+
+_BASIS_2Q = {
+    'cx': _apply_cx, 'cz': _apply_cz, 'swap': _apply_swap
+}
+
+
+def _append_instruction(state, instruction, qargs):
+    """Apply a Clifford gate, gate name or circuit to a stabilizer state in place.
+
+    Args:
+        state (StabilizerState): the stabilizer state to update.
+        instruction (QuantumCircuit or Instruction or str): the Clifford to apply.
+        qargs (list): the qubits of the state to apply the Clifford to.
+
+    Raises:
+        QiskitError: if the instruction cannot be decomposed into Clifford gates.
+    """
+    name = instruction if isinstance(instruction, str) else instruction.name
+    basis = isinstance(instruction, str) or _is_basis_instruction(instruction)
+    if isinstance(instruction, QuantumCircuit):
+        _apply_program(state, _circuit_program(instruction, qargs))
+        return
+    elif name == 'barrier':
+        return
+    elif name in _BASIS_1Q and basis:
+        if len(qargs) != 1:
+            raise QiskitError('Invalid qubits for 1-qubit gate.')
+        _BASIS_1Q[name](state._x, state._z, state._phase, qargs[0])
+        return
+    elif name in _BASIS_2Q and basis:
+        if len(qargs) != 2:
+            raise QiskitError('Invalid qubits for 2-qubit gate.')
+        _BASIS_2Q[name](state._x, state._z, state._phase, qargs[0], qargs[1])
+        return
+    elif isinstance(instruction, str):
+        raise QiskitError('Invalid Clifford gate name string {}'.format(name))
+    elif instruction.definition is None:
+        raise QiskitError('Cannot apply Instruction: {}'.format(name))
+    else:
+        _append_instruction(state, instruction.definition, qargs)
+
+
+def _apply_program(state, program):
+    """Apply a program of Clifford basis gates to the columns of a stabilizer state."""
+    num_rows = len(state._phase)
+    num_qubits = num_rows // 2
+    x_cols = _columns_to_ints(unpack_bits(state._x, num_qubits))
+    z_cols = _columns_to_ints(unpack_bits(state._z, num_qubits))
+    phase = _columns_to_ints(state._phase[:, None])[0]
+    phase = _evolve_columns(x_cols, z_cols, phase, program)
+    state._x[:] = pack_bits(_ints_to_columns(x_cols, num_rows))
+    state._z[:] = pack_bits(_ints_to_columns(z_cols, num_rows))
+    state._phase[:] = _ints_to_columns([phase], num_rows)[:, 0]
+
+
+def _outcome_labels(outcomes):
+    """Return the bitstrings of a boolean array of outcomes, with qargs[0] rightmost."""
+    chars = np.ascontiguousarray(outcomes[:, ::-1], dtype=np.uint8) + ord('0')
+    return chars.view('S{}'.format(max(1, outcomes.shape[1]))).ravel().astype(str)
+
+
+def _outcome_indices(outcomes):
+    """Return the integer indices of a boolean array of outcomes."""
+    return outcomes.astype(np.int64) @ (1 << np.arange(outcomes.shape[1], dtype=np.int64))
@@ -24,8 +24,11 @@ from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.states.quantum_state import QuantumState
+from qiskit.quantum_info.states.evolution import EvolutionProgram, evolve_matrix
+from qiskit.quantum_info.states.pauli_expectation import pauli_expectation_value
 from qiskit.quantum_info.operators.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.lazy_operator import LazyOperator
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.predicates import matrix_equal
 
@@ -225,8 +228,17 @@ class Statevector(QuantumState, TolerancesMixin):
     def evolve(self, other, qargs=None):
         """Evolve a quantum state by the operator.
 
+        Circuits and instructions are compiled to an
+        :class:`~qiskit.quantum_info.states.EvolutionProgram`, which applies
+        their gates to a single copy of the statevector in place. A compiled
+        program can also be passed directly to evolve many states by the same
+        instruction.
+
         Args:
-            other (Operator): The operator to evolve by.
+            other (Operator or QuantumCircuit or Instruction or EvolutionProgram):
+                The operator to evolve by. A
+                :class:`~qiskit.quantum_info.LazyOperator` is contracted with
+                the statevector without computing its matrix.
             qargs (list): a list of Statevector subsystem positions to apply
                            the operator on.
 
@@ -240,16 +252,16 @@ class Statevector(QuantumState, TolerancesMixin):
         if qargs is None:
             qargs = getattr(other, 'qargs', None)
 
-        # Get return vector
-        ret = copy.copy(self)
-
         # Evolution by a circuit or instruction
-        if isinstance(other, QuantumCircuit):
-            other = other.to_instruction()
-        if isinstance(other, Instruction):
+        if isinstance(other, (QuantumCircuit, Instruction)):
             if self.num_qubits is None:
                 raise QiskitError("Cannot apply QuantumCircuit to non-qubit Statevector.")
-            return self._evolve_instruction(ret, other, qargs=qargs)
+            other = EvolutionProgram(other)
+        if isinstance(other, EvolutionProgram):
+            return other.evolve(self, qargs=qargs)
+
+        # Get return vector
+        ret = copy.copy(self)
 
         # Evolution by an Operator
         if not isinstance(other, Operator):
@@ -260,6 +272,16 @@ class Statevector(QuantumState, TolerancesMixin):
             raise QiskitError(
                 "Operator input dimensions are not equal to statevector subsystem dimensions."
             )
+        if isinstance(other, LazyOperator) and self.num_qubits is not None:
+            # Contract the gate network of the operator with the statevector
+            ret._data = other._evolve_vector(self._data, qargs=qargs)
+            return ret
+        if qargs is not None and self.num_qubits is not None and \
+                other.input_dims() == other.output_dims():
+            # Update a copy of the qubit statevector in place
+            ret._data = np.array(self._data, dtype=complex)
+            evolve_matrix(ret, other.data, qargs=qargs)
+            return ret
         return Statevector._evolve_operator(ret, other, qargs=qargs)
 
     def equiv(self, other, rtol=None, atol=None):
@@ -316,16 +338,24 @@ class Statevector(QuantumState, TolerancesMixin):
     def expectation_value(self, oper, qargs=None):
         """Compute the expectation value of an operator.
 
+        For a :class:`~qiskit.quantum_info.Pauli` or
+        :class:`~qiskit.quantum_info.SparsePauliOp` on qubits the expectation
+        value is computed from the amplitudes gathered at the indices flipped
+        by the `X` bits of the Paulis, without evolving the state.
+
         Args:
-            oper (Operator): an operator to evaluate expval of.
+            oper (Operator or Pauli or SparsePauliOp): an operator to evaluate expval of.
             qargs (None or list): subsystems to apply operator on.
 
         Returns:
             complex: the expectation value.
         """
+        if self.num_qubits is not None:
+            value = pauli_expectation_value(self, oper, qargs=qargs)
+            if value is not None:
+                return value
         val = self.evolve(oper, qargs=qargs)
-        conj = self.conjugate()
-        return np.dot(conj.data, val.data)
+        return np.vdot(self.data, val.data)
 
     def probabilities(self, qargs=None, decimals=None):
         """Return the subsystem measurement probability vector.
@@ -559,7 +589,7 @@ class Statevector(QuantumState, TolerancesMixin):
         init = np.zeros(2 ** instruction.num_qubits, dtype=complex)
         init[0] = 1.0
         vec = Statevector(init, dims=instruction.num_qubits * (2,))
-        return Statevector._evolve_instruction(vec, instruction)
+        return EvolutionProgram(instruction).evolve(vec, inplace=True)
 
     def to_dict(self, decimals=None):
         r"""Convert the statevector to dictionary form.
@@ -657,6 +687,10 @@ class Statevector(QuantumState, TolerancesMixin):
         statevec._op_shape = new_shape
         return statevec
 
+    def _append_instruction(self, obj, qargs=None):
+        """Update the current Statevector by applying an instruction."""
+        Statevector._evolve_instruction(self, obj, qargs=qargs)
+
     @staticmethod
     def _evolve_instruction(statevec, obj, qargs=None):
         """Update the current Statevector by applying an instruction."""
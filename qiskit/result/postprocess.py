@@ -12,7 +12,10 @@
 
 """Post-processing of raw result."""
 
+from itertools import repeat
+
 import numpy as np
+from scipy import sparse
 
 from qiskit.exceptions import QiskitError
 
@@ -74,6 +77,121 @@ def format_counts_memory(shot_memory, header=None):
     return shot_memory
 
 
+def _packed_width(memory_slots):
+    """Return the number of bytes of a packed memory_slots bitstring."""
+    return max(1, -(-memory_slots // 8))
+
+
+def _packed_to_ints(packed):
+    """Return the list of Python integers of a packed memory array."""
+    if packed.ndim == 1:
+        return packed.tolist()
+    data = packed.tobytes()
+    width = packed.shape[1]
+    return [int.from_bytes(data[i:i + width], 'big') for i in range(0, len(data), width)]
+
+
+def _unique(memory, **kwargs):
+    """Return the unique outcomes of a packed memory array."""
+    if memory.ndim == 1:
+        return np.unique(memory, **kwargs)
+    return np.unique(memory, axis=0, **kwargs)
+
+
+def _packed_to_bits(packed, memory_slots):
+    """Convert a packed memory array to a (shots, memory_slots) bit matrix.
+
+    The first column of the returned matrix is the most significant bit.
+    """
+    if packed.ndim == 1:
+        packed = packed.astype('>u8').view(np.uint8).reshape(len(packed), 8)
+    bits = np.unpackbits(packed, axis=1)
+    return bits[:, bits.shape[1] - memory_slots:]
+
+
+def _bits_to_strings(bits, creg_sizes=None):
+    """Convert a bit matrix to a list of bitstrings separated by register."""
+    chars = bits.astype(np.uint8) + ord('0')
+    if creg_sizes:
+        positions = np.cumsum([size for _, size in reversed(creg_sizes)])[:-1]
+        chars = np.insert(chars, positions, ord(' '), axis=1)
+    if chars.shape[1] == 0:
+        return len(chars) * ['']
+    chars = np.ascontiguousarray(chars)
+    return chars.view('S{}'.format(chars.shape[1])).ravel().astype(str).tolist()
+
+
+def memory_to_array(memory, memory_slots=None):
+    """Convert level 2 memory to a packed unsigned integer array.
+
+    The outcome of each shot is stored as an unsigned integer where bit ``i``
+    is the value of memory slot ``i``. Experiments with up to 64 memory slots
+    return a ``uint64`` array of shape ``(shots,)``. Larger experiments return
+    a ``uint8`` array of shape ``(shots, ceil(memory_slots / 8))`` with the
+    big-endian bytes of each outcome.
+
+    Args:
+        memory (list[str] or np.ndarray): the hexadecimal readouts of each shot,
+            or an already packed memory array.
+        memory_slots (int): the number of memory slots. If None it is
+            inferred from the largest outcome.
+
+    Returns:
+        np.ndarray: the packed memory array.
+    """
+    if isinstance(memory, np.ndarray) and memory.dtype.kind == 'u':
+        return memory
+    ints = [int(shot, 16) for shot in memory]
+    if memory_slots is None:
+        memory_slots = max(ints + [1]).bit_length()
+    if memory_slots <= 64:
+        return np.array(ints, dtype=np.uint64)
+    width = _packed_width(memory_slots)
+    packed = np.frombuffer(b''.join(val.to_bytes(width, 'big') for val in ints),
+                           dtype=np.uint8)
+    return packed.reshape(len(ints), width)
+
+
+def format_memory_array(memory, header=None):
+    """Format a packed memory array as a list of bitstrings.
+
+    Each distinct outcome is formatted once and the result is expanded to
+    all the shots.
+
+    Args:
+        memory (np.ndarray): a packed memory array as returned by
+            :func:`memory_to_array`.
+        header (dict): the experiment header dictionary containing
+            useful information for postprocessing.
+
+    Returns:
+        list[str]: List of bitstrings
+    """
+    header = header or {}
+    memory_slots = header.get('memory_slots', None)
+    creg_sizes = header.get('creg_sizes', None) if memory_slots else None
+    unique, inverse = _unique(memory, return_inverse=True)
+    if memory_slots is None:
+        memory_slots = max(_packed_to_ints(unique) + [1]).bit_length()
+    strings = np.asarray(_bits_to_strings(_packed_to_bits(unique, memory_slots), creg_sizes),
+                         dtype=object)
+    return strings[inverse.ravel()].tolist()
+
+
+def counts_from_memory_array(memory):
+    """Return the hexadecimal counts dictionary of a packed memory array.
+
+    Args:
+        memory (np.ndarray): a packed memory array as returned by
+            :func:`memory_to_array`.
+
+    Returns:
+        dict: the counts of each outcome keyed by hexadecimal string.
+    """
+    unique, counts = _unique(memory, return_counts=True)
+    return dict(zip(map(hex, _packed_to_ints(unique)), counts.tolist()))
+
+
 def _list_to_complex_array(complex_list):
     """Convert nested list of shape (..., 2) to complex numpy array with shape (...)
 
@@ -146,6 +264,11 @@ def format_level_2_memory(memory, header=None):
     Returns:
         list[str]: List of bitstrings
     """
+    if isinstance(memory, np.ndarray) and memory.dtype.kind == 'u':
+        return format_memory_array(memory, header)
+    if header and header.get('memory_slots', None) and len(memory) and \
+            all(map(str.startswith, memory, repeat('0x'))):
+        return format_memory_array(memory_to_array(memory, header['memory_slots']), header)
     memory_list = []
     for shot_memory in memory:
         memory_list.append(format_counts_memory(shot_memory, header))
@@ -164,6 +287,13 @@ def format_counts(counts, header=None):
     Returns:
         dict: a formatted counts
     """
+    if header and header.get('memory_slots', None) and counts and \
+            all(map(str.startswith, counts, repeat('0x'))):
+        keys = _bits_to_strings(
+            _packed_to_bits(memory_to_array(list(counts), header['memory_slots']),
+                            header['memory_slots']),
+            header.get('creg_sizes', None))
+        return dict(zip(keys, counts.values()))
     counts_dict = {}
     for key, val in counts.items():
         key = format_counts_memory(key, header)
@@ -208,8 +338,14 @@ def format_unitary(mat, decimals=None):
             If None, no rounding is done.
 
     Returns:
-        list[list[complex]]: a matrix of complex numbers
+        list[list[complex]]: a matrix of complex numbers. Scipy sparse
+        matrices are returned in their sparse format.
     """
+    if sparse.issparse(mat):
+        if decimals:
+            mat = mat.copy()
+            mat.data = np.around(mat.data, decimals=decimals)
+        return mat
     if isinstance(mat, np.ndarray):
         if decimals:
             return np.around(mat, decimals=decimals)
@@ -15,6 +15,8 @@
 import copy
 import warnings
 
+import numpy as np
+
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.pulse.schedule import Schedule
 from qiskit.exceptions import QiskitError
@@ -182,7 +184,7 @@ class Result:
         except (KeyError, TypeError):
             raise QiskitError('No data for experiment "{}"'.format(repr(experiment)))
 
-    def get_memory(self, experiment=None):
+    def get_memory(self, experiment=None, as_array=False):
         """Get the sequence of memory states (readouts) for each shot
         The data from the experiment is a list of format
         ['00000', '01000', '10100', '10100', '11101', '11100', '00101', ..., '01010']
@@ -190,6 +192,14 @@ class Result:
         Args:
             experiment (str or QuantumCircuit or Schedule or int or None): the index of the
                 experiment, as specified by ``data()``.
+            as_array (bool): for ``meas_level=2`` return the memory as a packed
+                unsigned integer array instead of a list of bitstrings. Bit ``i``
+                of each outcome is the value of memory slot ``i``. Up to 64
+                memory slots a ``uint64`` array of shape ``(shots,)`` is
+                returned, otherwise a ``uint8`` array of shape
+                ``(shots, ceil(memory_slots / 8))`` of big-endian bytes. The
+                array can be formatted as bitstrings with
+                :func:`~qiskit.result.postprocess.format_memory_array`.
 
         Returns:
             List[str] or np.ndarray: Either the list of each outcome, formatted according to
@@ -203,6 +213,8 @@ class Result:
                 1             `single`       np.ndarray[shots, memory_slots]
                 1             `avg`          np.ndarray[memory_slots]
                 2             `memory=True`  list
+                2             `as_array`     np.ndarray[shots] or
+                                             np.ndarray[shots, memory_bytes]
                 ============  =============  =====
 
         Raises:
@@ -220,6 +232,9 @@ class Result:
             memory = self.data(experiment)['memory']
 
             if meas_level == MeasLevel.CLASSIFIED:
+                if as_array:
+                    memory_slots = header.get('memory_slots', None) if header else None
+                    return postprocess.memory_to_array(memory, memory_slots)
                 return postprocess.format_level_2_memory(memory, header)
             elif meas_level == MeasLevel.KERNELED:
                 return postprocess.format_level_1_memory(memory)
@@ -266,14 +281,19 @@ class Result:
             except (AttributeError, QiskitError):  # header is not available
                 header = None
 
+            if header:
+                counts_header = {
+                    k: v for k, v in header.items() if k in {
+                        'time_taken', 'creg_sizes', 'memory_slots'}}
+            else:
+                counts_header = {}
+            memory = self.data(key).get('memory', None)
             if 'counts' in self.data(key).keys():
-                if header:
-                    counts_header = {
-                        k: v for k, v in header.items() if k in {
-                            'time_taken', 'creg_sizes', 'memory_slots'}}
-                else:
-                    counts_header = {}
                 dict_list.append(Counts(self.data(key)['counts'], **counts_header))
+            elif isinstance(memory, np.ndarray) and memory.dtype.kind == 'u':
+                # Histogram a packed memory array without formatting each shot
+                counts = postprocess.counts_from_memory_array(memory)
+                dict_list.append(Counts(counts, **counts_header))
             elif 'statevector' in self.data(key).keys():
                 vec = postprocess.format_statevector(self.data(key)['statevector'])
                 dict_list.append(statevector.Statevector(vec).probabilities_dict(decimals=15))
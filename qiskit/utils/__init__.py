@@ -54,6 +54,17 @@ runtime parameters controlling circuit compilation and execution. Quantum
 are run on a device or simulator by passing a QuantumInstance setup with the desired
 backend etc.
 
+Measurement Error Mitigation
+============================
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   LocalMeasFitter
+   LocalMeasFilter
+   local_meas_cal
+
 """
 
 from .quantum_instance import QuantumInstance
@@ -69,10 +80,14 @@ from .entangler_map import get_entangler_map, validate_entangler_map
 from .backend_utils import has_ibmq, has_aer
 from .name_unnamed_args import name_args
 from .aqua_globals import aqua_globals
+from .local_mitigation import LocalMeasFitter, LocalMeasFilter, local_meas_cal
 
 
 __all__ = [
     'QuantumInstance',
+    'LocalMeasFitter',
+    'LocalMeasFilter',
+    'local_meas_cal',
     'summarize_circuits',
     'get_entangler_map',
     'validate_entangler_map',
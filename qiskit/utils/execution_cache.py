@@ -0,0 +1,395 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Cache of transpiled and assembled circuits for repeated execution.
+
+Variational algorithms execute the same circuits many times with different parameter values.
+The :class:`ExecutionCache` of a :class:`~qiskit.utils.QuantumInstance` keeps, for each set of
+circuits, the transpiled circuits with parameters in place of the parameter values, the qobj
+assembled from them once, and the measured qubits used by the measurement error mitigation.
+Later executions only write the new parameter values into a copy of the assembled experiments.
+
+Circuits are looked up by
+
+* identity, for parameterized circuits executed with a list of parameter bindings, and
+* structure, for bound circuits: the instructions, with generic instructions replaced by
+  their definitions, their qubits and clbits and all non-numeric parameters. The numeric
+  gate parameters are replaced by the elements of a :class:`~qiskit.circuit.ParameterVector`
+  before the circuits are transpiled.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import copy
+import logging
+import uuid
+
+import numpy as np
+
+from qiskit.circuit import (ControlledGate, Gate, Instruction, Parameter,
+                            ParameterExpression, ParameterVector, QuantumCircuit)
+from qiskit.qobj import QasmQobj, QasmQobjExperiment
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitTemplate:
+    """The parameter slots of a transpiled circuit.
+
+    A slot is a ``(gate_index, param_index)`` position in ``circuit.data`` holding a
+    ``ParameterExpression``. The values of every slot are evaluated for all parameter bindings
+    at once, with each expression compiled to a numpy function.
+    """
+
+    def __init__(self, circuit: QuantumCircuit) -> None:
+        self.slots = []  # type: List[Tuple[int, int]]
+        self._functions = []  # type: List[Tuple[List[Parameter], Any]]
+        for gate_index, (inst, _, _) in enumerate(circuit.data):
+            for param_index, inst_param in enumerate(inst.params):
+                if isinstance(inst_param, ParameterExpression) and inst_param.parameters:
+                    self.slots.append((gate_index, param_index))
+                    self._functions.append(compile_expression(inst_param))
+        self._num_instructions = len(circuit.data)
+        self._phase_function = None
+        if isinstance(circuit.global_phase, ParameterExpression) \
+                and circuit.global_phase.parameters:
+            self._phase_function = compile_expression(circuit.global_phase)
+
+    def _evaluate(self, function, param_bindings):
+        """Return the values of a compiled expression for each parameter binding."""
+        params, func = function
+        try:
+            args = [np.array([binding[param] for binding in param_bindings])
+                    for param in params]
+        except KeyError as ex:
+            raise ValueError('unexpected parameter: {0}'.format(ex.args[0])) from ex
+        values = np.broadcast_to(func(*args), (len(param_bindings),))
+        if np.iscomplexobj(values) and not np.any(np.imag(values)):
+            values = np.real(values)
+        return values.tolist()
+
+    def parameter_tables(self, param_bindings: List[Dict[Parameter, float]]
+                         ) -> List[Tuple[Tuple[int, int], List[float]]]:
+        """Return the values of each slot for all parameter bindings."""
+        return [(slot, self._evaluate(function, param_bindings))
+                for slot, function in zip(self.slots, self._functions)]
+
+    def matches(self, experiment: QasmQobjExperiment) -> bool:
+        """Return whether the instructions of an assembled experiment map to the circuit data."""
+        if len(experiment.instructions) != self._num_instructions:
+            return False
+        for gate_index, param_index in self.slots:
+            params = getattr(experiment.instructions[gate_index], 'params', ())
+            if param_index >= len(params):
+                return False
+        return True
+
+    def bind_experiments(self, experiment: QasmQobjExperiment,
+                         param_bindings: List[Dict[Parameter, float]]
+                         ) -> List[QasmQobjExperiment]:
+        """Return a copy of an assembled experiment for each parameter binding."""
+        gates = {}  # type: Dict[int, List[Tuple[int, List[float]]]]
+        for (gate_index, param_index), values in self.parameter_tables(param_bindings):
+            gates.setdefault(gate_index, []).append((param_index, values))
+        phases = None
+        if self._phase_function is not None:
+            phases = self._evaluate(self._phase_function, param_bindings)
+
+        experiments = []
+        for i in range(len(param_bindings)):
+            instructions = list(experiment.instructions)
+            for gate_index, gate_values in gates.items():
+                instruction = copy.copy(instructions[gate_index])
+                instruction.params = list(instruction.params)
+                for param_index, values in gate_values:
+                    instruction.params[param_index] = values[i]
+                instructions[gate_index] = instruction
+            header = experiment.header
+            if phases is not None:
+                header = copy.copy(header)
+                header.global_phase = float(np.real(phases[i]))
+            experiments.append(QasmQobjExperiment(config=experiment.config, header=header,
+                                                  instructions=instructions))
+        return experiments
+
+
+def compile_expression(expr: ParameterExpression) -> Tuple[List[Parameter], Any]:
+    """Return the parameters of an expression and a numpy function evaluating it."""
+    # pylint: disable=import-outside-toplevel
+    from sympy import lambdify
+
+    params = sorted(expr.parameters, key=lambda param: param.name)
+    if isinstance(expr, Parameter):
+        return params, lambda values: values
+    symbols = [expr._parameter_symbols[param] for param in params]
+    return params, lambdify(symbols, expr._symbol_expr, 'numpy')
+
+
+class CachedExecution:
+    """The transpiled templates and assembled skeleton of a list of circuits."""
+
+    def __init__(self, sources: List[QuantumCircuit], circuits: List[QuantumCircuit],
+                 skeleton: QasmQobj, config: Any,
+                 parameters: Optional[ParameterVector] = None) -> None:
+        """
+        Args:
+            sources: the circuits passed to the quantum instance.
+            circuits: the transpiled parameterized circuits.
+            skeleton: the qobj assembled from the circuits bound to any parameter values.
+            config: the configuration of the quantum instance the qobj was assembled with.
+            parameters: the parameters in place of the numeric gate parameters of bound
+                circuits, see :func:`parameterize`.
+        """
+        self.sources = sources
+        self.circuits = circuits
+        self.templates = [CircuitTemplate(circuit) for circuit in circuits]
+        self.skeleton = skeleton
+        self.config = config
+        self.parameters = parameters
+        self.validated = False
+        self._measured_qubits = None  # type: Optional[Tuple[List[int], Dict[str, List[int]]]]
+
+    def matches(self) -> bool:
+        """Return whether every skeleton experiment maps to its template."""
+        return len(self.skeleton.experiments) == len(self.templates) and \
+            all(template.matches(experiment)
+                for template, experiment in zip(self.templates, self.skeleton.experiments))
+
+    def qobj(self, param_bindings: List[Dict[Parameter, float]]) -> QasmQobj:
+        """Return a new qobj with the experiments of each template for each binding.
+
+        The experiments are ordered by circuit, then by parameter binding.
+        """
+        experiments = []
+        for template, experiment in zip(self.templates, self.skeleton.experiments):
+            experiments.extend(template.bind_experiments(experiment, param_bindings))
+        # The qobj config is updated with the backend options when it is run
+        return QasmQobj(qobj_id=str(uuid.uuid4()), config=copy.copy(self.skeleton.config),
+                        experiments=experiments, header=self.skeleton.header)
+
+    def measured_qubits(self, num_bindings: int) -> Tuple[List[int], Dict[str, List[int]]]:
+        """Return the measured qubits of the experiments of :meth:`qobj`.
+
+        Returns:
+            The sorted measured qubits, and the indices of the experiments keyed by the
+            measured qubits joined by ``'_'``, as :func:`get_measured_qubits_from_qobj`.
+        """
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from .measurement_error_mitigation import get_measured_qubits_from_qobj
+
+        if self._measured_qubits is None:
+            self._measured_qubits = get_measured_qubits_from_qobj(self.skeleton)
+        qubit_index, qubit_mappings = self._measured_qubits
+        return qubit_index, {qubits: [index * num_bindings + j
+                                      for index in indices for j in range(num_bindings)]
+                             for qubits, indices in qubit_mappings.items()}
+
+
+class ExecutionCache:
+    """Least recently used cache of the executions of a quantum instance."""
+
+    def __init__(self, max_size: int = 32) -> None:
+        """
+        Args:
+            max_size: the maximum number of cached circuit lists.
+        """
+        self._max_size = max_size
+        self._entries = OrderedDict()  # type: OrderedDict
+
+    def __len__(self) -> int:
+        return sum(entry is not None for entry in self._entries.values())
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def get(self, key: Any, config: Any) -> Tuple[bool, Optional[CachedExecution]]:
+        """Return whether a key is cached, and its entry if it can be reused.
+
+        Entries assembled with a different configuration are removed.
+        """
+        if key not in self._entries:
+            return False, None
+        entry = self._entries[key]
+        if entry is not None and not _equal(entry.config, config):
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry
+
+    def put(self, key: Any, entry: Optional[CachedExecution]) -> None:
+        """Add an entry, or ``None`` for circuits that cannot be cached."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+def identity_key(circuits: List[QuantumCircuit], had_transpiled: bool) -> Tuple:
+    """Return the cache key of parameterized circuits executed with parameter bindings."""
+    return ('identity', had_transpiled) + tuple(id(circuit) for circuit in circuits)
+
+
+def structure_key(circuits: List[QuantumCircuit], had_transpiled: bool
+                  ) -> Optional[Tuple[Tuple, List[float]]]:
+    """Return the cache key of bound circuits and the values of their numeric gate parameters.
+
+    Returns:
+        The key and the parameter values in the order of :func:`parameterize`, or ``None`` if
+        the circuits have unbound parameters or parameters that cannot be compared.
+    """
+    key = ['structure', had_transpiled]
+    values = []  # type: List[float]
+    for circuit in circuits:
+        if circuit.calibrations:
+            return None
+        phases = []  # type: List[Any]
+        instructions = list(_flatten(circuit, phases))
+        if any(isinstance(phase, ParameterExpression) and phase.parameters for phase in phases):
+            return None
+        phase = float(sum(float(phase) for phase in phases))
+        key.append((tuple((reg.name, reg.size) for reg in circuit.qregs),
+                    tuple((reg.name, reg.size) for reg in circuit.cregs),
+                    phase == 0))
+        if phase != 0:
+            values.append(phase)
+        for inst, qargs, cargs in instructions:
+            params = []
+            for param in inst.params:
+                if _is_slot(inst, param):
+                    params.append(None)
+                    values.append(float(param))
+                else:
+                    param = _hashable(param)
+                    if param is None:
+                        return None
+                    params.append(param)
+            condition = None
+            if inst.condition is not None:
+                condition = (repr(inst.condition[0]), inst.condition[1])
+            # Opaque generic instructions are only identified by the instruction itself
+            identity = id(inst) if type(inst) in _GENERIC_TYPES else None
+            key.append((type(inst), inst.name, identity, tuple(params), tuple(qargs),
+                        tuple(cargs), condition, getattr(inst, 'ctrl_state', None),
+                        getattr(inst, 'label', None)))
+    return tuple(key), values
+
+
+def parameterize(circuits: List[QuantumCircuit], num_values: int
+                 ) -> Tuple[List[QuantumCircuit], ParameterVector]:
+    """Return copies of bound circuits with parameters in place of the numeric gate parameters.
+
+    The generic instructions and gates of the circuits, such as those of library circuits, are
+    replaced by their definitions.
+
+    Args:
+        circuits: the circuits, for which :func:`structure_key` returned ``num_values`` values.
+        num_values: the number of numeric gate parameters and non-zero global phases.
+
+    Returns:
+        The parameterized circuits, and the parameters in the order of the values.
+    """
+    vector = ParameterVector('θ', num_values)
+    parameters = iter(vector)
+    parameterized = []
+    for circuit in circuits:
+        new_circuit = QuantumCircuit(*circuit.qregs, *circuit.cregs, name=circuit.name,
+                                     metadata=circuit.metadata)
+        phases = []  # type: List[Any]
+        instructions = list(_flatten(circuit, phases))
+        if sum(float(phase) for phase in phases) != 0:
+            new_circuit.global_phase = next(parameters)
+        for inst, qargs, cargs in instructions:
+            if any(_is_slot(inst, param) for param in inst.params):
+                inst = inst.copy()
+                inst._definition = None
+                inst.params = [next(parameters) if _is_slot(inst, param) else param
+                               for param in inst.params]
+            new_circuit._append(inst, [new_circuit.qubits[qubit] for qubit in qargs],
+                                [new_circuit.clbits[clbit] for clbit in cargs])
+        parameterized.append(new_circuit)
+    return parameterized, vector
+
+
+def bind_circuit(circuit: QuantumCircuit, binding: Dict[Parameter, float]) -> QuantumCircuit:
+    """Return a copy of a circuit bound to the values of its parameters in a binding.
+
+    Unlike :meth:`~qiskit.circuit.QuantumCircuit.assign_parameters` the parameters of the
+    binding which are not in the circuit are ignored, and parameters which only occur in the
+    global phase are bound.
+    """
+    bound = circuit.assign_parameters({param: value for param, value in binding.items()
+                                       if param in circuit.parameters})
+    if isinstance(bound.global_phase, ParameterExpression) and bound.global_phase.parameters:
+        bound.global_phase = bound.global_phase.bind(
+            {param: binding[param] for param in bound.global_phase.parameters})
+    return bound
+
+
+_GENERIC_TYPES = (Instruction, Gate, ControlledGate)
+
+
+def _flatten(circuit: QuantumCircuit, phases: List[Any], qubits: Optional[List[int]] = None,
+             clbits: Optional[List[int]] = None):
+    """Yield the instructions of a circuit with the qubit and clbit indices they act on.
+
+    Unconditional generic instructions with a definition are replaced by their definitions,
+    and the global phases of the circuit and of these definitions are appended to ``phases``.
+    """
+    qubit_indices = {bit: index if qubits is None else qubits[index]
+                     for index, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: index if clbits is None else clbits[index]
+                     for index, bit in enumerate(circuit.clbits)}
+    phases.append(circuit.global_phase)
+    for inst, qargs, cargs in circuit.data:
+        qargs = [qubit_indices[qubit] for qubit in qargs]
+        cargs = [clbit_indices[clbit] for clbit in cargs]
+        if type(inst) in _GENERIC_TYPES and inst.condition is None \
+                and inst.definition is not None:
+            yield from _flatten(inst.definition, phases, qargs, cargs)
+        else:
+            yield inst, qargs, cargs
+
+
+def _is_slot(inst: Instruction, param: Any) -> bool:
+    """Return whether an instruction parameter is replaced by a parameter in a template."""
+    if isinstance(param, ParameterExpression):
+        numeric = not param.parameters
+    else:
+        numeric = isinstance(param, (int, float, np.integer, np.floating)) \
+            and not isinstance(param, (bool, np.bool_))
+    # The definitions of gates without their own ``_define`` do not depend on the parameters
+    return numeric and isinstance(inst, Gate) and type(inst)._define is not Instruction._define
+
+
+def _hashable(param: Any) -> Any:
+    """Return a hashable and comparable representation of an instruction parameter."""
+    if isinstance(param, ParameterExpression):
+        return None if param.parameters else ('expression', complex(param))
+    if isinstance(param, np.ndarray):
+        return ('ndarray', param.dtype.str, param.shape, param.tobytes())
+    if isinstance(param, (list, tuple)):
+        items = [_hashable(item) for item in param]
+        if any(item is None for item in items):
+            return None
+        return (type(param).__name__,) + tuple(items)
+    if isinstance(param, (str, int, float, complex, np.number)):
+        return (type(param).__name__, param)
+    return None
+
+
+def _equal(first: Any, second: Any) -> bool:
+    """Return whether two configurations are equal, and False if they cannot be compared."""
+    try:
+        return bool(first == second)
+    except Exception:  # pylint: disable=broad-except
+        return False
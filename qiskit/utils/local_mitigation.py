@@ -0,0 +1,530 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Local measurement error mitigation for many qubits.
+
+The readout errors of independent qubits, or groups of qubits, are described by one assignment
+matrix :math:`A_g[m, p]`, the probability to measure ``m`` when ``p`` is prepared, per group.
+The calibration needs ``2 ** k`` circuits for groups of at most ``k`` qubits, and the assignment
+matrix of all qubits is the tensor product :math:`A = \\bigotimes_g A_g`, which is never built.
+
+The counts are mitigated by solving :math:`A x = y` for the observed probabilities ``y`` on the
+observed bitstrings only: the matrix :math:`A` restricted to these bitstrings, and to pairs of
+bitstrings within a given Hamming distance, is built as a sparse matrix with renormalized
+columns and the system is solved by GMRES.
+"""
+
+import copy
+import logging
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+from scipy.special import comb
+from scipy.sparse.linalg import gmres
+
+from qiskit.exceptions import QiskitError
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of elements of the temporary pairwise distance and lookup matrices.
+_MAX_BLOCK_SIZE = 2 ** 20
+
+
+def local_meas_cal(qubit_list: Sequence[int],
+                   qubit_groups: Optional[Sequence[Sequence[int]]] = None,
+                   circlabel: str = '') -> Tuple[List, List[str]]:
+    """Return the calibration circuits of a local measurement error mitigation.
+
+    Every circuit prepares a basis state of each group of qubits, the ``j``-th circuit the
+    state ``j mod 2 ** len(group)``, so that ``2 ** k`` circuits prepare all states of groups
+    of at most ``k`` qubits.
+
+    Args:
+        qubit_list: The qubits to calibrate, qubit ``qubit_list[i]`` is measured to clbit ``i``.
+        qubit_groups: The groups of qubits of ``qubit_list`` with correlated readout errors.
+            If None, every qubit is a group.
+        circlabel: A prefix of the circuit names.
+
+    Returns:
+        The calibration circuits and their state labels, the bitstrings of the prepared states
+        with the bit of ``qubit_list[i]`` at position ``i`` from the right.
+
+    Raises:
+        QiskitError: If the groups are not a partition of the qubits.
+    """
+    # pylint: disable=cyclic-import,import-outside-toplevel
+    from qiskit.circuit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+    qubit_list = list(qubit_list)
+    groups = _group_positions(qubit_list, qubit_groups)
+    num_circuits = 2 ** max(len(group) for group in groups)
+    qreg = QuantumRegister(max(qubit_list) + 1)
+    creg = ClassicalRegister(len(qubit_list))
+    circuits = []
+    state_labels = []
+    for state in range(num_circuits):
+        bits = ['0'] * len(qubit_list)
+        for group in groups:
+            group_state = state % 2 ** len(group)
+            for j, pos in enumerate(group):
+                if (group_state >> j) & 1:
+                    bits[pos] = '1'
+        label = ''.join(reversed(bits))
+        circuit = QuantumCircuit(qreg, creg, name='{}cal_{}'.format(circlabel, label))
+        for pos, bit in enumerate(bits):
+            if bit == '1':
+                circuit.x(qreg[qubit_list[pos]])
+        circuit.barrier(qreg)
+        for pos, qubit in enumerate(qubit_list):
+            circuit.measure(qreg[qubit], creg[pos])
+        circuits.append(circuit)
+        state_labels.append(label)
+    return circuits, state_labels
+
+
+class LocalMeasFitter:
+    """Measurement error mitigation fitter with one assignment matrix per group of qubits.
+
+    The fitter can be used as ``measurement_error_mitigation_cls`` of a
+    :class:`~qiskit.utils.QuantumInstance`, which then calibrates each measured qubit with two
+    circuits. Unlike the complete calibration of Qiskit Ignis, the number of calibration
+    circuits and the cost of the mitigation do not grow exponentially with the number of
+    measured qubits.
+    """
+
+    def __init__(self,
+                 results: Union['Result', List['Result']],
+                 state_labels: List[str],
+                 qubit_list: Optional[List[int]] = None,
+                 circlabel: str = '',
+                 qubit_groups: Optional[List[List[int]]] = None,
+                 distance: Optional[int] = 3) -> None:
+        """
+        Args:
+            results: The results of the circuits of :func:`local_meas_cal`.
+            state_labels: The state labels of the calibration circuits.
+            qubit_list: The calibrated qubits, bit ``i`` of the measured bitstrings is
+                ``qubit_list[i]``. If None, ``range(len(state_labels[0]))``.
+            circlabel: The prefix of the calibration circuit names.
+            qubit_groups: The groups of qubits of ``qubit_list`` with correlated readout errors,
+                as given to :func:`local_meas_cal`. If None, every qubit is a group.
+            distance: The maximum Hamming distance of the bitstrings mixed by readout errors
+                in the mitigation. If None, all observed bitstrings are mixed.
+
+        Raises:
+            QiskitError: If a state of a group is not prepared by any calibration circuit.
+        """
+        if qubit_list is None:
+            qubit_list = list(range(len(state_labels[0])))
+        qubit_list = list(qubit_list)
+        groups = _group_positions(qubit_list, qubit_groups)
+        if not isinstance(results, list):
+            results = [results]
+
+        matrices = [np.zeros((2 ** len(group), 2 ** len(group))) for group in groups]
+        for label in state_labels:
+            counts = _calibration_counts(results, '{}cal_{}'.format(circlabel, label))
+            bits = _outcome_bits(list(counts.keys()), len(qubit_list))
+            shots = np.array(list(counts.values()), dtype=float)
+            for group, matrix in zip(groups, matrices):
+                prepared = sum(int(label[-1 - pos]) << j for j, pos in enumerate(group))
+                measured = bits[:, group] @ (1 << np.arange(len(group)))
+                matrix[:, prepared] += np.bincount(measured, weights=shots,
+                                                   minlength=len(matrix))
+        for group, matrix in zip(groups, matrices):
+            totals = matrix.sum(axis=0)
+            if np.any(totals == 0):
+                qubits = [qubit_list[pos] for pos in group]
+                raise QiskitError('Not all states of the qubits {} are prepared by the '
+                                  'calibration circuits.'.format(qubits))
+            matrix /= totals
+        self._setup(qubit_list, groups, matrices, distance)
+
+    @classmethod
+    def from_assignment_matrices(cls,
+                                 assignment_matrices: List[np.ndarray],
+                                 qubit_groups: List[List[int]],
+                                 qubit_list: Optional[List[int]] = None,
+                                 distance: Optional[int] = 3) -> 'LocalMeasFitter':
+        """Return a fitter of given assignment matrices, for example from the readout errors
+        of the backend properties.
+
+        Args:
+            assignment_matrices: The column stochastic assignment matrix of each group, where
+                bit ``j`` of the state indices is the ``j``-th qubit of the group.
+            qubit_groups: The groups of qubits of ``qubit_list``.
+            qubit_list: The qubits, bit ``i`` of the measured bitstrings is ``qubit_list[i]``.
+                If None, the sorted qubits of the groups.
+            distance: The maximum Hamming distance of the bitstrings mixed by readout errors.
+
+        Returns:
+            The fitter.
+
+        Raises:
+            QiskitError: If a matrix does not match the size of its group.
+        """
+        if qubit_list is None:
+            qubit_list = sorted(qubit for group in qubit_groups for qubit in group)
+        qubit_list = list(qubit_list)
+        groups = _group_positions(qubit_list, qubit_groups)
+        matrices = [np.asarray(matrix, dtype=float) for matrix in assignment_matrices]
+        if len(matrices) != len(groups) \
+                or any(matrix.shape != (2 ** len(group),) * 2
+                       for matrix, group in zip(matrices, groups)):
+            raise QiskitError('The assignment matrices do not match the qubit groups.')
+        fitter = cls.__new__(cls)
+        fitter._setup(qubit_list, groups, matrices, distance)
+        return fitter
+
+    def _setup(self, qubit_list, groups, matrices, distance):
+        self._qubit_list = qubit_list
+        self._groups = groups
+        self._matrices = matrices
+        self._distance = distance
+        self._filter = LocalMeasFilter(matrices, groups, len(qubit_list), distance)
+
+    @property
+    def qubit_list(self) -> List[int]:
+        """Returns the calibrated qubits."""
+        return self._qubit_list
+
+    @property
+    def qubit_groups(self) -> List[List[int]]:
+        """Returns the groups of qubits with one assignment matrix each."""
+        return [[self._qubit_list[pos] for pos in group] for group in self._groups]
+
+    @property
+    def cal_matrices(self) -> List[np.ndarray]:
+        """Returns the assignment matrix of each group of qubits."""
+        return self._matrices
+
+    @property
+    def cal_matrix(self) -> List[np.ndarray]:
+        """Returns the assignment matrix of each group of qubits, the full matrix is their
+        tensor product."""
+        return self._matrices
+
+    @property
+    def filter(self) -> 'LocalMeasFilter':
+        """Returns the filter mitigating counts with the assignment matrices."""
+        return self._filter
+
+    def readout_fidelity(self) -> float:
+        """Returns the average probability to measure the prepared state of all qubits."""
+        return float(np.prod([np.mean(np.diag(matrix)) for matrix in self._matrices]))
+
+    def subset_fitter(self, qubit_sublist: List[int]) -> 'LocalMeasFitter':
+        """Return the fitter of a subset of the qubits.
+
+        The assignment matrix of a group which is only partially in the subset is averaged
+        over the prepared states, and summed over the measured states, of the other qubits.
+
+        Args:
+            qubit_sublist: The qubits of the new fitter, bit ``i`` of the measured bitstrings
+                is ``qubit_sublist[i]``.
+
+        Returns:
+            The fitter of the subset.
+
+        Raises:
+            QiskitError: If a qubit of the subset is not calibrated by this fitter.
+        """
+        qubit_sublist = list(qubit_sublist)
+        if not set(qubit_sublist).issubset(self._qubit_list):
+            raise QiskitError('The qubits {} are not a subset of the calibrated qubits '
+                              '{}.'.format(qubit_sublist, self._qubit_list))
+        new_positions = {qubit: pos for pos, qubit in enumerate(qubit_sublist)}
+        groups = []
+        matrices = []
+        for group, matrix in zip(self._groups, self._matrices):
+            kept = [j for j, pos in enumerate(group) if self._qubit_list[pos] in new_positions]
+            if not kept:
+                continue
+            groups.append([qubit_sublist[new_positions[self._qubit_list[group[j]]]]
+                           for j in kept])
+            matrices.append(_marginal_matrix(matrix, len(group), kept))
+        return self.from_assignment_matrices(matrices, groups, qubit_sublist, self._distance)
+
+
+class LocalMeasFilter:
+    """Mitigate measurement errors of counts with one assignment matrix per group of qubits."""
+
+    def __init__(self,
+                 assignment_matrices: List[np.ndarray],
+                 groups: List[List[int]],
+                 num_qubits: int,
+                 distance: Optional[int] = 3) -> None:
+        """
+        Args:
+            assignment_matrices: The assignment matrix of each group of bits.
+            groups: The positions of the bits of each group in the bitstrings.
+            num_qubits: The number of bits of the bitstrings.
+            distance: The maximum Hamming distance of the bitstrings mixed by readout errors.
+                If None, all observed bitstrings are mixed.
+        """
+        self._groups = groups
+        self._num_qubits = num_qubits
+        self.distance = distance
+        # The log-probabilities of all groups padded to the size of the largest group
+        size = max(len(matrix) for matrix in assignment_matrices)
+        self._log_matrices = np.full((len(groups), size, size), -np.inf)
+        with np.errstate(divide='ignore'):
+            for i, matrix in enumerate(assignment_matrices):
+                self._log_matrices[i, :len(matrix), :len(matrix)] = np.log(matrix)
+
+    def apply(self,
+              raw_data: Union['Result', Dict[str, float]],
+              method: str = 'least_squares') -> Union['Result', Dict[str, float]]:
+        """Apply the measurement error mitigation to counts.
+
+        Args:
+            raw_data: A result, whose counts are mitigated experiment by experiment, or the
+                counts of one experiment keyed by binary or hexadecimal bitstrings.
+            method: ``'least_squares'`` returns the counts of the probability distribution
+                closest to the solution, ``'pseudo_inverse'`` the solution, which may have
+                negative counts.
+
+        Returns:
+            The mitigated result or counts. Only the observed bitstrings have counts.
+
+        Raises:
+            QiskitError: If the method is unknown or the bitstrings have bits which are not
+                calibrated.
+        """
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from qiskit.result import Result
+
+        if method not in ('least_squares', 'pseudo_inverse'):
+            raise QiskitError('Unknown mitigation method: {}'.format(method))
+        if isinstance(raw_data, Result):
+            new_result = copy.deepcopy(raw_data)
+            for experiment in new_result.results:
+                counts = experiment.data.to_dict().get('counts')
+                if counts:
+                    experiment.data.counts = self._apply_counts(counts, method)
+            return new_result
+        return self._apply_counts(raw_data, method)
+
+    def _apply_counts(self, counts, method):
+        keys = list(counts.keys())
+        outcomes = [int(key, 16) if key.startswith('0x') else int(key.replace(' ', ''), 2)
+                    for key in keys]
+        if keys[0].startswith('0x'):
+            new_keys = [hex(outcome) for outcome in outcomes]
+        else:
+            new_keys = [format(outcome, '0{}b'.format(self._num_qubits))
+                        for outcome in outcomes]
+        if max(outcomes) >> self._num_qubits:
+            raise QiskitError('The counts have more bits than the {} calibrated '
+                              'qubits.'.format(self._num_qubits))
+        values = np.array([counts[key] for key in keys], dtype=float)
+        shots = values.sum()
+        quasi = self.mitigate(_outcome_bits(outcomes, self._num_qubits), values / shots)
+        if method == 'least_squares':
+            quasi = _nearest_probabilities(quasi)
+        return {key: value * shots for key, value in zip(new_keys, quasi.tolist())
+                if value != 0}
+
+    def mitigate(self, bits: np.ndarray, probabilities: np.ndarray) -> np.ndarray:
+        """Return the mitigated quasi-probabilities of the observed bitstrings.
+
+        Args:
+            bits: The ``(M, n)`` bit-matrix of the observed bitstrings, column ``i`` is bit ``i``.
+            probabilities: The ``M`` observed probabilities.
+
+        Returns:
+            The ``M`` quasi-probabilities :math:`x` solving :math:`A x = y` on the bitstrings.
+        """
+        num_outcomes = len(bits)
+        rows, cols = _close_pairs(bits, self.distance)
+        powers = 1 << np.arange(self._log_matrices.shape[1].bit_length() - 1)
+        logs = np.zeros(len(rows))
+        for group, log_matrix in zip(self._groups, self._log_matrices):
+            indices = bits[:, group] @ powers[:len(group)]
+            logs += log_matrix[indices[rows], indices[cols]]
+        values = np.exp(logs)
+        # Renormalize the columns to the probability of the bitstrings kept
+        totals = np.bincount(cols, weights=values, minlength=num_outcomes)
+        values /= totals[cols]
+        matrix = sparse.csr_matrix((values, (rows, cols)), shape=(num_outcomes, num_outcomes))
+        diagonal = matrix.diagonal()
+        if np.all(diagonal > 0):
+            preconditioner = sparse.diags(1 / diagonal)
+        else:
+            preconditioner = None
+        solution, info = gmres(matrix, probabilities, tol=1e-10, atol=0,
+                               M=preconditioner, maxiter=100)
+        if info != 0:
+            logger.warning('The mitigation did not converge (%s), the solution is not exact.',
+                           info)
+        return solution
+
+
+def _group_positions(qubit_list, qubit_groups):
+    """Return the groups of qubits as positions in the qubit list."""
+    if qubit_groups is None:
+        return [[pos] for pos in range(len(qubit_list))]
+    positions = {qubit: pos for pos, qubit in enumerate(qubit_list)}
+    groups = [[positions.get(qubit) for qubit in group] for group in qubit_groups]
+    flat = sorted(pos for group in groups for pos in group if pos is not None)
+    if flat != list(range(len(qubit_list))):
+        raise QiskitError('The qubit groups {} are not a partition of the qubits '
+                          '{}.'.format(qubit_groups, qubit_list))
+    return groups
+
+
+def _marginal_matrix(matrix, num_bits, kept):
+    """Return the assignment matrix of the bits ``kept`` of a group, in this order.
+
+    The probabilities are summed over the measured states, and averaged over the prepared
+    states, of the other bits.
+    """
+    letters = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    # Bit j of the state indices is axis num_bits - 1 - j of the measured and prepared axes
+    measured = [letters[2 * j] for j in reversed(range(num_bits))]
+    prepared = [letters[2 * j + 1] for j in reversed(range(num_bits))]
+    output = [letters[2 * j] for j in reversed(kept)] + [letters[2 * j + 1] for j in reversed(kept)]
+    subscripts = '{}->{}'.format(''.join(measured + prepared), ''.join(output))
+    marginal = np.einsum(subscripts, matrix.reshape([2] * (2 * num_bits)))
+    return marginal.reshape(2 ** len(kept), 2 ** len(kept)) / 2 ** (num_bits - len(kept))
+
+
+def _calibration_counts(results, name):
+    """Return the counts of a calibration circuit keyed by integer outcomes."""
+    for result in results:
+        for experiment in result.results:
+            if getattr(experiment.header, 'name', None) == name:
+                counts = experiment.data.to_dict().get('counts', {})
+                return {int(key, 16): value for key, value in counts.items()}
+    raise QiskitError('No counts of the calibration circuit {}.'.format(name))
+
+
+def _outcome_bits(outcomes, num_bits):
+    """Return the ``(M, n)`` bit-matrix of integer outcomes, column ``i`` is bit ``i``."""
+    num_bytes = max(1, (num_bits + 7) // 8)
+    data = b''.join(outcome.to_bytes(num_bytes, 'little') for outcome in outcomes)
+    packed = np.frombuffer(data, dtype=np.uint8).reshape(len(outcomes), num_bytes)
+    return np.unpackbits(packed, axis=1, bitorder='little')[:, :num_bits].astype(np.int64)
+
+
+def _close_pairs(bits, distance):
+    """Return the row and column indices of the pairs of bitstrings within a Hamming distance.
+
+    The bitstrings are packed to 64-bit words. When there are fewer bitstrings than XOR masks
+    of at most ``distance`` bits, the distances of a block of bitstrings to all others are the
+    population counts of their XOR. Otherwise, the neighbours of all bitstrings are found by
+    looking up the bitstrings XOR-ed with each mask in the sorted bitstrings, which scales
+    linearly with the number of bitstrings.
+    """
+    num_outcomes, num_bits = bits.shape
+    if distance is None or distance >= num_bits:
+        indices = np.arange(num_outcomes)
+        return np.repeat(indices, num_outcomes), np.tile(indices, num_outcomes)
+    words = _packed_words(bits)
+    num_masks = sum(comb(num_bits, weight, exact=True) for weight in range(distance + 1))
+    if num_outcomes <= num_masks:
+        return _dense_close_pairs(words, distance)
+    return _masked_close_pairs(words, num_bits, distance)
+
+
+def _packed_words(bits):
+    """Return the ``(M, w)`` array of 64-bit words of the bitstrings of a bit-matrix."""
+    num_words = max(1, (bits.shape[1] + 63) // 64)
+    packed = np.packbits(bits.astype(np.uint8), axis=1, bitorder='little')
+    packed = np.pad(packed, ((0, 0), (0, 8 * num_words - packed.shape[1])))
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def _dense_close_pairs(words, distance):
+    """Return the pairs within a Hamming distance by comparing all pairs of packed bitstrings."""
+    num_outcomes, num_words = words.shape
+    block = max(1, _MAX_BLOCK_SIZE // num_outcomes)
+    rows = []
+    cols = []
+    for start in range(0, num_outcomes, block):
+        stop = min(start + block, num_outcomes)
+        dist = np.zeros((stop - start, num_outcomes), dtype=np.uint64)
+        for word in range(num_words):
+            dist += _popcount(words[start:stop, word, None] ^ words[None, :, word])
+        row, col = np.nonzero(dist <= distance)
+        rows.append(row + start)
+        cols.append(col)
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def _masked_close_pairs(words, num_bits, distance):
+    """Return the pairs within a Hamming distance by looking up the XOR-ed packed bitstrings.
+
+    The masks of at most ``distance`` set bits are enumerated, and each bitstring XOR-ed with a
+    mask is searched in the sorted keys of the bitstrings.
+    """
+    num_outcomes, num_words = words.shape
+    mask_bits = [np.zeros((1, num_bits), dtype=np.uint8)]
+    for weight in range(1, distance + 1):
+        positions = np.array(list(combinations(range(num_bits), weight)))
+        weight_bits = np.zeros((len(positions), num_bits), dtype=np.uint8)
+        weight_bits[np.arange(len(positions))[:, None], positions] = 1
+        mask_bits.append(weight_bits)
+    masks = _packed_words(np.concatenate(mask_bits))
+    if num_words == 1:
+        keys = words[:, 0]
+        masks = masks[:, 0]
+    else:
+        # Multi-word bitstrings are compared as opaque byte strings
+        key_type = np.dtype((np.void, 8 * num_words))
+        keys = words.view(key_type)[:, 0]
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    block = max(1, _MAX_BLOCK_SIZE // num_outcomes)
+    rows = []
+    cols = []
+    for start in range(0, len(masks), block):
+        flipped = words[None, :, :] ^ masks[start:start + block].reshape(-1, 1, num_words)
+        if num_words == 1:
+            found = np.searchsorted(sorted_keys, flipped[:, :, 0])
+        else:
+            found = np.searchsorted(sorted_keys, flipped.view(key_type)[:, :, 0])
+        found = order[np.minimum(found, num_outcomes - 1)]
+        row = np.nonzero(np.all(words[found] == flipped, axis=2))
+        rows.append(row[1])
+        cols.append(found[row])
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def _popcount(values):
+    """Return the number of set bits of each 64-bit unsigned integer."""
+    values = values - ((values >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    values = (values & np.uint64(0x3333333333333333)) \
+        + ((values >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    values = (values + (values >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (values * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def _nearest_probabilities(quasi):
+    """Return the probability distribution closest in the 2-norm to quasi-probabilities.
+
+    The smallest quasi-probabilities are set to zero, and their sum spread over the others,
+    while the smallest remaining one would become negative, following Smolin, Gambetta and
+    Smith, Phys. Rev. Lett. 108, 070502 (2012).
+    """
+    quasi = quasi / quasi.sum()
+    order = np.argsort(quasi)
+    values = quasi[order]
+    remaining = len(values) - np.arange(len(values))
+    cumulative = np.concatenate([[0.], np.cumsum(values)[:-1]])
+    # The number of zeroed values is the first k with values[k] + sum(values[:k]) / (M - k) >= 0
+    first = int(np.argmax(values + cumulative / remaining >= 0))
+    probabilities = np.zeros_like(quasi)
+    probabilities[order[first:]] = values[first:] + cumulative[first] / remaining[first]
+    return probabilities
@@ -17,6 +17,7 @@ import logging
 
 from qiskit import compiler
 from ..exceptions import QiskitError, MissingOptionalLibraryError
+from .local_mitigation import LocalMeasFitter, local_meas_cal
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,7 @@ def build_measurement_error_mitigation_qobj(qubit_list, fitter_cls, backend,
     """
         Args:
             qubit_list (list[int]): list of ordered qubits used in the algorithm
-            fitter_cls (callable): CompleteMeasFitter or TensoredMeasFitter
+            fitter_cls (callable): LocalMeasFitter, CompleteMeasFitter or TensoredMeasFitter
             backend (BaseBackend): backend instance
             backend_config (dict, optional): configuration for backend
             compile_config (dict, optional): configuration for compilation
@@ -118,28 +119,33 @@ def build_measurement_error_mitigation_qobj(qubit_list, fitter_cls, backend,
             QiskitError: when the fitter_cls is not recognizable.
             MissingOptionalLibraryError: Qiskit-Ignis not installed
         """
-    try:
-        from qiskit.ignis.mitigation.measurement import (complete_meas_cal,
-                                                         CompleteMeasFitter, TensoredMeasFitter)
-    except ImportError as ex:
-        raise MissingOptionalLibraryError(
-            libname='qiskit-ignis',
-            name='build_measurement_error_mitigation_qobj',
-            pip_install='pip install qiskit-ignis') from ex
-
     circlabel = 'mcal'
 
     if not qubit_list:
         raise QiskitError("The measured qubit list can not be [].")
 
-    if fitter_cls == CompleteMeasFitter:
+    if isinstance(fitter_cls, type) and issubclass(fitter_cls, LocalMeasFitter):
         meas_calibs_circuits, state_labels = \
-            complete_meas_cal(qubit_list=range(len(qubit_list)), circlabel=circlabel)
-    elif fitter_cls == TensoredMeasFitter:
-        # TODO support different calibration
-        raise QiskitError("Does not support TensoredMeasFitter yet.")
+            local_meas_cal(qubit_list=range(len(qubit_list)), circlabel=circlabel)
     else:
-        raise QiskitError("Unknown fitter {}".format(fitter_cls))
+        try:
+            from qiskit.ignis.mitigation.measurement import (complete_meas_cal,
+                                                             CompleteMeasFitter,
+                                                             TensoredMeasFitter)
+        except ImportError as ex:
+            raise MissingOptionalLibraryError(
+                libname='qiskit-ignis',
+                name='build_measurement_error_mitigation_qobj',
+                pip_install='pip install qiskit-ignis') from ex
+
+        if fitter_cls == CompleteMeasFitter:
+            meas_calibs_circuits, state_labels = \
+                complete_meas_cal(qubit_list=range(len(qubit_list)), circlabel=circlabel)
+        elif fitter_cls == TensoredMeasFitter:
+            # TODO support different calibration
+            raise QiskitError("Does not support TensoredMeasFitter yet.")
+        else:
+            raise QiskitError("Unknown fitter {}".format(fitter_cls))
 
     # the provided `qubit_list` would be used as the initial layout to
     # assure the consistent qubit mapping used in the main circuits.
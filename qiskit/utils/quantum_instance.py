@@ -12,13 +12,13 @@
 
 """ Quantum Instance module """
 
-from typing import Optional, List, Union, Dict, Callable, Tuple
+from typing import Optional, List, Union, Dict, Callable, Tuple, Any
 import copy
 import logging
 import time
 import numpy as np
 
-from qiskit.qobj import Qobj
+from qiskit.qobj import Qobj, QasmQobj, PulseQobj
 from qiskit.utils import circuit_utils
 from qiskit.exceptions import QiskitError
 from .backend_utils import (is_ibmq_provider,
@@ -72,7 +72,8 @@ class QuantumInstance:
                  measurement_error_mitigation_cls: Optional[Callable] = None,
                  cals_matrix_refresh_period: int = 30,
                  measurement_error_mitigation_shots: Optional[int] = None,
-                 job_callback: Optional[Callable] = None) -> None:
+                 job_callback: Optional[Callable] = None,
+                 execution_cache: bool = False) -> None:
         """
         Quantum Instance holds a Qiskit Terra backend as well as configuration for circuit
         transpilation and execution. When provided to an Aqua algorithm the algorithm will
@@ -103,7 +104,9 @@ class QuantumInstance:
             skip_qobj_validation: Bypass Qobj validation to decrease circuit
                 processing time during submission to backend.
             measurement_error_mitigation_cls: The approach to mitigate
-                measurement errors. Qiskit Ignis provides fitter classes for this functionality
+                measurement errors. :class:`~qiskit.utils.LocalMeasFitter` calibrates every
+                measured qubit independently with two circuits and scales to many qubits.
+                Qiskit Ignis provides fitter classes for this functionality
                 and CompleteMeasFitter from qiskit.ignis.mitigation.measurement module can be used
                 here. (TensoredMeasFitter is not supported).
             cals_matrix_refresh_period: How often to refresh the calibration
@@ -114,6 +117,13 @@ class QuantumInstance:
                 to monitor job progress as jobs are submitted for processing by an Aqua algorithm.
                 The callback is provided the following arguments: `job_id, job_status,
                 queue_position, job`
+            execution_cache: Whether to also keep the transpiled and assembled circuits of
+                executions of bound circuits, and only update their numeric parameter values
+                when circuits with the same structure are executed again. The cached circuits
+                are transpiled with parameters in place of the numeric values, which can change
+                the transpiled circuits, and their qobjs skip the schema validation after the
+                first run. Parameterized circuits executed with ``parameter_bindings`` are
+                always cached. See :class:`~qiskit.utils.execution_cache.ExecutionCache`.
 
         Raises:
             QiskitError: the shots exceeds the maximum number of shots
@@ -191,6 +201,7 @@ class QuantumInstance:
         else:
             self._meas_error_mitigation_cls = measurement_error_mitigation_cls
         self._meas_error_mitigation_fitters: Dict[str, Tuple[np.ndarray, float]] = {}
+        self._meas_error_mitigation_subsets: Dict[str, Tuple[Any, Any]] = {}
         # TODO: support different fitting method in error mitigation?
         self._meas_error_mitigation_method = 'least_squares'
         self._cals_matrix_refresh_period = cals_matrix_refresh_period
@@ -216,6 +227,10 @@ class QuantumInstance:
         self._circuit_summary = False
         self._job_callback = job_callback
         self._time_taken = 0.
+        # pylint: disable=cyclic-import
+        from .execution_cache import ExecutionCache
+        self._execution_cache = ExecutionCache()
+        self._cache_bound_circuits = execution_cache
         logger.info(self)
 
     def __str__(self) -> str:
@@ -275,14 +290,18 @@ class QuantumInstance:
 
     def execute(self,
                 circuits,
-                had_transpiled: bool = False):
+                had_transpiled: bool = False,
+                parameter_bindings: Optional[List[Dict]] = None):
         """
         A wrapper to interface with quantum backend.
 
         Args:
-            circuits (Union['QuantumCircuit', List['QuantumCircuit']]):
-                        circuits to execute
+            circuits (Union['QuantumCircuit', List['QuantumCircuit'], Qobj]):
+                        circuits to execute, or an already assembled qobj
             had_transpiled: whether or not circuits had been transpiled
+            parameter_bindings: If given, each circuit is executed once for each of these
+                dictionaries mapping the circuit parameters to values, and the results are
+                ordered by circuit, then by parameter binding.
 
         Returns:
             Result: result object
@@ -295,16 +314,37 @@ class QuantumInstance:
 
         from qiskit.utils.measurement_error_mitigation import \
             (get_measured_qubits_from_qobj, build_measurement_error_mitigation_qobj)
+        from qiskit.utils.execution_cache import bind_circuit
 
-        # maybe compile
-        if not had_transpiled:
-            circuits = self.transpile(circuits)
-
-        # assemble
-        qobj = self.assemble(circuits)
+        entry = None
+        if isinstance(circuits, (QasmQobj, PulseQobj)):
+            qobj = circuits
+        else:
+            if not isinstance(circuits, list):
+                circuits = [circuits]
+            qobj, entry = self._cached_qobj(circuits, had_transpiled, parameter_bindings)
+            if qobj is None:
+                if parameter_bindings is not None:
+                    circuits = [bind_circuit(circuit, binding)
+                                for circuit in circuits for binding in parameter_bindings]
+
+                # maybe compile
+                if not had_transpiled:
+                    circuits = self.transpile(circuits)
+
+                # assemble
+                qobj = self.assemble(circuits)
+        num_circuits = len(qobj.experiments)
+        # the experiments of a cached execution were validated when it was first run
+        skip_qobj_validation = self._skip_qobj_validation or \
+            (entry is not None and entry.validated)
 
         if self._meas_error_mitigation_cls is not None:
-            qubit_index, qubit_mappings = get_measured_qubits_from_qobj(qobj)
+            if entry is not None:
+                qubit_index, qubit_mappings = \
+                    entry.measured_qubits(num_circuits // len(entry.templates))
+            else:
+                qubit_index, qubit_mappings = get_measured_qubits_from_qobj(qobj)
             qubit_index_str = '_'.join([str(x) for x in qubit_index]) + \
                 "_{}".format(self._meas_error_mitigation_shots or self._run_config.shots)
             meas_error_mitigation_fitter, timestamp = \
@@ -322,9 +362,8 @@ class QuantumInstance:
                             # the qubit used in current job is the subset and shots are the same
                             meas_error_mitigation_fitter, timestamp = \
                                 self._meas_error_mitigation_fitters.get(key, (None, 0.))
-                            meas_error_mitigation_fitter = \
-                                meas_error_mitigation_fitter.subset_fitter(
-                                    qubit_sublist=qubit_index)
+                            meas_error_mitigation_fitter = self._subset_fitter(
+                                meas_error_mitigation_fitter, qubit_index)
                             logger.info("The qubits used in the current job is the subset of "
                                         "previous jobs, "
                                         "reusing the calibration matrix if it is not out-of-date.")
@@ -356,14 +395,14 @@ class QuantumInstance:
                     self._time_taken += cals_result.time_taken
                     result = run_qobj(qobj, self._backend, self._qjob_config,
                                       self._backend_options, self._noise_config,
-                                      self._skip_qobj_validation, self._job_callback)
+                                      skip_qobj_validation, self._job_callback)
                     self._time_taken += result.time_taken
                 else:
                     # insert the calibration circuit into main qobj if the shots are the same
                     qobj.experiments[0:0] = cals_qobj.experiments
                     result = run_qobj(qobj, self._backend, self._qjob_config,
                                       self._backend_options, self._noise_config,
-                                      self._skip_qobj_validation, self._job_callback)
+                                      skip_qobj_validation, self._job_callback)
                     self._time_taken += result.time_taken
                     cals_result = result
 
@@ -378,12 +417,12 @@ class QuantumInstance:
             else:
                 result = run_qobj(qobj, self._backend, self._qjob_config,
                                   self._backend_options, self._noise_config,
-                                  self._skip_qobj_validation, self._job_callback)
+                                  skip_qobj_validation, self._job_callback)
                 self._time_taken += result.time_taken
 
             if meas_error_mitigation_fitter is not None:
                 logger.info("Performing measurement error mitigation.")
-                skip_num_circuits = len(result.results) - len(circuits)
+                skip_num_circuits = len(result.results) - num_circuits
                 #  remove the calibration counts from result object to assure the length of
                 #  ExperimentalResult is equal length to input circuits
                 result.results = result.results[skip_num_circuits:]
@@ -394,7 +433,8 @@ class QuantumInstance:
                     if curr_qubit_index == qubit_index:
                         tmp_fitter = meas_error_mitigation_fitter
                     else:
-                        tmp_fitter = meas_error_mitigation_fitter.subset_fitter(curr_qubit_index)
+                        tmp_fitter = self._subset_fitter(meas_error_mitigation_fitter,
+                                                         curr_qubit_index)
                     tmp_result = tmp_fitter.filter.apply(
                         tmp_result, self._meas_error_mitigation_method
                     )
@@ -404,14 +444,106 @@ class QuantumInstance:
         else:
             result = run_qobj(qobj, self._backend, self._qjob_config,
                               self._backend_options, self._noise_config,
-                              self._skip_qobj_validation, self._job_callback)
+                              skip_qobj_validation, self._job_callback)
             self._time_taken += result.time_taken
 
+        if entry is not None:
+            entry.validated = True
+
         if self._circuit_summary:
             self._circuit_summary = False
 
         return result
 
+    def _cached_qobj(self, circuits, had_transpiled, parameter_bindings):
+        """Return the qobj of circuits built from the execution cache, and its cache entry.
+
+        Bound circuits are only looked up by their structure if the ``execution_cache``
+        option is enabled.
+
+        Returns:
+            Tuple[Optional[QasmQobj], Optional[CachedExecution]]: the qobj and the entry, or
+            ``(None, None)`` if the circuits cannot be executed from a cache entry.
+        """
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from .execution_cache import identity_key, structure_key
+
+        cache = self._execution_cache
+        if getattr(self._run_config, 'parameterizations', None) \
+                or (parameter_bindings is None and not self._cache_bound_circuits) \
+                or parameter_bindings == []:
+            return None, None
+        values = None
+        if parameter_bindings is not None:
+            key = identity_key(circuits, had_transpiled)
+        else:
+            structure = structure_key(circuits, had_transpiled)
+            if structure is None:
+                return None, None
+            key, values = structure
+
+        config = (self._run_config.to_dict(), dict(self._backend_config),
+                  dict(self._compile_config), self._pass_manager)
+        cached, entry = cache.get(key, config)
+        if cached and entry is not None and parameter_bindings is not None \
+                and any(source is not circuit for source, circuit in zip(entry.sources, circuits)):
+            cached = False
+        if not cached:
+            entry = self._build_cache_entry(circuits, had_transpiled, parameter_bindings,
+                                            values, config)
+            cache.put(key, entry)
+        if entry is None:
+            return None, None
+
+        if parameter_bindings is not None:
+            return entry.qobj(parameter_bindings), entry
+        qobj = entry.qobj([dict(zip(entry.parameters, values))])
+        # the structure of circuits does not include their names and metadata
+        for experiment, circuit in zip(qobj.experiments, circuits):
+            metadata = circuit.metadata or {}
+            if experiment.header.name != circuit.name \
+                    or getattr(experiment.header, 'metadata', metadata) != metadata:
+                experiment.header = copy.copy(experiment.header)
+                experiment.header.name = circuit.name
+                experiment.header.metadata = metadata
+        return qobj, entry
+
+    def _build_cache_entry(self, circuits, had_transpiled, parameter_bindings, values, config):
+        """Transpile and assemble the templates of circuits for the execution cache.
+
+        Returns:
+            Optional[CachedExecution]: the entry, or None if the circuits cannot be cached.
+        """
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from .execution_cache import CachedExecution, bind_circuit, parameterize
+
+        parameters = None
+        if parameter_bindings is None:
+            templates, parameters = parameterize(circuits, len(values))
+            binding = dict(zip(parameters, values))
+        else:
+            templates, binding = circuits, parameter_bindings[0]
+        try:
+            if not had_transpiled:
+                templates = self.transpile(templates)
+            skeleton = self.assemble([bind_circuit(circuit, binding) for circuit in templates])
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.debug('The circuits are executed without the execution cache: %s', ex)
+            return None
+        if not isinstance(skeleton, QasmQobj):
+            return None
+        entry = CachedExecution(circuits, templates, skeleton, config, parameters)
+        return entry if entry.matches() else None
+
+    def _subset_fitter(self, fitter, qubit_index: List[int]):
+        """Return the fitter of a subset of the qubits of a fitter, building it once."""
+        key = '_'.join([str(x) for x in qubit_index])
+        parent, subset_fitter = self._meas_error_mitigation_subsets.get(key, (None, None))
+        if parent is not fitter:
+            subset_fitter = fitter.subset_fitter(qubit_sublist=qubit_index)
+            self._meas_error_mitigation_subsets[key] = (fitter, subset_fitter)
+        return subset_fitter
+
     def set_config(self, **kwargs):
         """Set configurations for the quantum instance."""
         for k, v in kwargs.items():
@@ -448,6 +580,8 @@ class QuantumInstance:
             else:
                 raise ValueError("unknown setting for the key ({}).".format(k))
 
+        self._execution_cache.clear()
+
     @property
     def time_taken(self) -> float:
         """Accumulated time taken for execution."""
@@ -552,6 +686,11 @@ class QuantumInstance:
         """Return True if backend is a local backend."""
         return is_local_backend(self._backend)
 
+    @property
+    def execution_cache(self):
+        """Return the execution cache."""
+        return self._execution_cache
+
     @property
     def skip_qobj_validation(self):
         """ checks if skip qobj validation """
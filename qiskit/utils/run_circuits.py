@@ -12,6 +12,8 @@
 
 """ run circuits functions """
 
+from concurrent import futures
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Callable, List, Union, Tuple
 import sys
 import logging
@@ -37,6 +39,11 @@ from .backend_utils import (is_aer_provider,
 MAX_CIRCUITS_PER_JOB = os.environ.get('QISKIT_AQUA_MAX_CIRCUITS_PER_JOB', None)
 MAX_GATES_PER_JOB = os.environ.get('QISKIT_AQUA_MAX_GATES_PER_JOB', None)
 
+# The first interval in seconds between the job status queries of a pipelined run
+_MIN_POLL_WAIT = 0.05
+# The number of threads querying the job status and retrieving the results of a pipelined run
+_MAX_POLL_WORKERS = 8
+
 logger = logging.getLogger(__name__)
 
 
@@ -202,13 +209,155 @@ def _safe_get_job_status(job: BaseJob, job_id: str) -> JobStatus:
     return job_status
 
 
+def _get_job_result(job: BaseJob, job_id: str, backend: Union[Backend, BaseBackend],
+                    qjob_config: Dict) -> Result:
+    """Return the result of a done job, retrieving the job again until it is successful."""
+    while True:
+        result = job.result(**qjob_config)
+        if result.success:
+            return result
+
+        logger.warning("FAILURE: Job id: %s", job_id)
+        logger.warning("Job (%s) is completed anyway, retrieve result "
+                       "from backend again.", job_id)
+        job = backend.retrieve_job(job_id)
+
+
+def _failed_job_qobj(job: BaseJob, job_id: str, job_status: JobStatus) -> QasmQobj:
+    """Return the qobj of a job in a final state other than done, to submit it again."""
+    # get back the qobj first to avoid for job is consumed
+    qobj = job.qobj()
+    if job_status == JobStatus.CANCELLED:
+        logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.",
+                       job_id)
+    elif job_status == JobStatus.ERROR:
+        logger.warning("FAILURE: Job id: %s encounters the error. "
+                       "Error is : %s. Re-submit the Qobj.",
+                       job_id, job.error_message())
+    else:
+        logging.warning("FAILURE: Job id: %s. Unknown status: %s. "
+                        "Re-submit the Qobj.", job_id, job_status)
+    return qobj
+
+
+def _run_qobjs_pipelined(qobjs: List[QasmQobj],
+                         backend: Union[Backend, BaseBackend],
+                         qjob_config: Dict,
+                         backend_options: Dict,
+                         noise_config: Dict,
+                         skip_qobj_validation: bool,
+                         job_callback: Optional[Callable],
+                         result_callback: Optional[Callable[[int, Result], None]],
+                         max_pending_jobs: Optional[int],
+                         with_autorecover: bool) -> List[Result]:
+    """Run the qobjs of a split qobj, submitting, polling and retrieving their jobs concurrently.
+
+    The qobjs are submitted in order by a background thread, while at most ``max_pending_jobs``
+    jobs wait for their results. In each round, the status of all outstanding jobs is queried
+    by a thread pool, which also retrieves the results of the done jobs. The rounds are
+    separated by intervals doubling from ``_MIN_POLL_WAIT`` up to ``qjob_config['wait']``
+    seconds, and reset whenever a job changes status. The callbacks are called from the
+    calling thread.
+
+    Returns:
+        The results of the qobjs, in the order of the qobjs.
+    """
+    max_wait = qjob_config.get('wait', 5.)
+    wait = min(_MIN_POLL_WAIT, max_wait)
+    results = [None] * len(qobjs)  # type: List[Optional[Result]]
+    submissions = {}  # type: Dict[int, Future]
+    running = {}  # type: Dict[int, Tuple[BaseJob, str, Optional[JobStatus]]]
+    retrievals = {}  # type: Dict[int, Future]
+    next_index = 0
+    submitter = ThreadPoolExecutor(max_workers=1)
+    poller = ThreadPoolExecutor(max_workers=min(_MAX_POLL_WORKERS, len(qobjs)))
+
+    def submit(qobj):
+        return submitter.submit(_safe_submit_qobj, qobj, backend, backend_options,
+                                noise_config, skip_qobj_validation)
+
+    def job_state(job, job_id):
+        job_status = _safe_get_job_status(job, job_id)
+        queue_position = 0
+        if job_status == JobStatus.QUEUED and with_autorecover:
+            queue_position = job.queue_position()
+        return job_status, queue_position
+
+    try:
+        while next_index < len(qobjs) or submissions or running or retrievals:
+            progress = False
+            while next_index < len(qobjs) and (
+                    max_pending_jobs is None
+                    or len(submissions) + len(running) + len(retrievals) < max_pending_jobs):
+                submissions[next_index] = submit(qobjs[next_index])
+                next_index += 1
+
+            for idx, future in list(submissions.items()):
+                if future.done():
+                    job, job_id = future.result()
+                    logger.info("Submitted the %s-th qobj, job id: %s", idx, job_id)
+                    del submissions[idx]
+                    running[idx] = (job, job_id, None)
+                    progress = True
+
+            states = {idx: poller.submit(job_state, job, job_id)
+                      for idx, (job, job_id, _) in running.items()}
+            for idx, state in states.items():
+                job, job_id, last_status = running[idx]
+                job_status, queue_position = state.result()
+                if job_callback is not None:
+                    job_callback(job_id, job_status, queue_position, job)
+                if job_status != last_status:
+                    logger.info("Job id: %s, status: %s", job_id, job_status)
+                    progress = True
+                running[idx] = (job, job_id, job_status)
+                if job_status not in JOB_FINAL_STATES:
+                    continue
+                del running[idx]
+                if job_status == JobStatus.DONE and with_autorecover:
+                    retrievals[idx] = poller.submit(_get_job_result, job, job_id, backend,
+                                                    qjob_config)
+                elif with_autorecover:
+                    submissions[idx] = submit(_failed_job_qobj(job, job_id, job_status))
+                else:
+                    retrievals[idx] = poller.submit(job.result, **qjob_config)
+
+            for idx, future in list(retrievals.items()):
+                if future.done():
+                    del retrievals[idx]
+                    results[idx] = future.result()
+                    logger.info("COMPLETED the %s-th qobj", idx)
+                    if result_callback is not None:
+                        result_callback(idx, results[idx])
+                    progress = True
+
+            if progress:
+                wait = min(_MIN_POLL_WAIT, max_wait)
+            elif submissions or retrievals:
+                # wake up as soon as a submission or a result retrieval completes
+                futures.wait(list(submissions.values()) + list(retrievals.values()),
+                             timeout=wait, return_when=futures.FIRST_COMPLETED)
+                wait = min(2 * wait, max_wait)
+            elif running:
+                time.sleep(wait)
+                wait = min(2 * wait, max_wait)
+    finally:
+        submitter.shutdown(wait=False)
+        poller.shutdown(wait=False)
+
+    return results
+
+
 def run_qobj(qobj: QasmQobj,
              backend: Union[Backend, BaseBackend],
              qjob_config: Optional[Dict] = None,
              backend_options: Optional[Dict] = None,
              noise_config: Optional[Dict] = None,
              skip_qobj_validation: bool = False,
-             job_callback: Optional[Callable] = None) -> Result:
+             job_callback: Optional[Callable] = None,
+             pipelined: bool = False,
+             result_callback: Optional[Callable[[int, Result], None]] = None,
+             max_pending_jobs: Optional[int] = None) -> Result:
     """
     An execution wrapper with Qiskit-Terra, with job auto recover capability.
 
@@ -226,6 +375,16 @@ def run_qobj(qobj: QasmQobj,
         job_callback: callback used in querying info of the submitted job, and
                                            providing the following arguments:
                                             job_id, job_status, queue_position, job
+        pipelined: If True, the jobs of a qobj split into several jobs are submitted by a
+            background thread while the earlier jobs run, the status of all outstanding jobs is
+            queried concurrently, with intervals growing exponentially from 0.05 seconds to
+            ``qjob_config['wait']`` seconds while no job changes status, and the result of each
+            job is retrieved as soon as the job is done.
+        result_callback: callback called with the index of each job of the split qobj and its
+            result, as soon as the result is retrieved in a pipelined run, and in the order
+            of the jobs otherwise.
+        max_pending_jobs: The maximum number of submitted jobs of a pipelined run without a
+            retrieved result. If None, all jobs are submitted at once.
 
     Returns:
         Result object
@@ -254,6 +413,12 @@ def run_qobj(qobj: QasmQobj,
     # split qobj if it exceeds the payload of the backend
 
     qobjs = _split_qobj_to_qobjs(qobj, max_circuits_per_job)
+    if pipelined:
+        results = _run_qobjs_pipelined(qobjs, backend, qjob_config, backend_options,
+                                       noise_config, skip_qobj_validation, job_callback,
+                                       result_callback, max_pending_jobs, with_autorecover)
+        return _combine_results(results)
+
     jobs = []
     job_ids = []
     for qob in qobjs:
@@ -292,33 +457,15 @@ def run_qobj(qobj: QasmQobj,
 
                 # get result after the status is DONE
                 if job_status == JobStatus.DONE:
-                    while True:
-                        result = job.result(**qjob_config)
-                        if result.success:
-                            results.append(result)
-                            logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
-                            break
-
-                        logger.warning("FAILURE: Job id: %s", job_id)
-                        logger.warning("Job (%s) is completed anyway, retrieve result "
-                                       "from backend again.", job_id)
-                        job = backend.retrieve_job(job_id)
+                    results.append(_get_job_result(job, job_id, backend, qjob_config))
+                    logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
+                    if result_callback is not None:
+                        result_callback(idx, results[-1])
                     break
                 # for other cases, resubmit the qobj until the result is available.
                 # since if there is no result returned, there is no way algorithm can do any process
                 # get back the qobj first to avoid for job is consumed
-                qobj = job.qobj()
-                if job_status == JobStatus.CANCELLED:
-                    logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.",
-                                   job_id)
-                elif job_status == JobStatus.ERROR:
-                    logger.warning("FAILURE: Job id: %s encounters the error. "
-                                   "Error is : %s. Re-submit the Qobj.",
-                                   job_id, job.error_message())
-                else:
-                    logging.warning("FAILURE: Job id: %s. Unknown status: %s. "
-                                    "Re-submit the Qobj.", job_id, job_status)
-
+                qobj = _failed_job_qobj(job, job_id, job_status)
                 job, job_id = _safe_submit_qobj(qobj, backend,
                                                 backend_options,
                                                 noise_config, skip_qobj_validation)
@@ -326,9 +473,16 @@ def run_qobj(qobj: QasmQobj,
                 job_ids[idx] = job_id
     else:
         results = []
-        for job in jobs:
+        for idx, job in enumerate(jobs):
             results.append(job.result(**qjob_config))
+            if result_callback is not None:
+                result_callback(idx, results[-1])
+
+    return _combine_results(results)
+
 
+def _combine_results(results: List[Result]) -> Result:
+    """Combine the results of the jobs of a split qobj and check they succeeded."""
     result = _combine_result_objects(results) if results else None
 
     # If result was not successful then raise an exception with either the status msg or
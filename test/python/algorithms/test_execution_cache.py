@@ -0,0 +1,127 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the execution cache of the QuantumInstance """
+
+import unittest
+from unittest.mock import patch
+from test.python.algorithms import QiskitAlgorithmsTestCase
+
+import numpy as np
+
+from qiskit import BasicAer, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import EfficientSU2
+from qiskit.quantum_info import Statevector
+from qiskit.utils import QuantumInstance
+
+
+class TestExecutionCache(QiskitAlgorithmsTestCase):
+    """ Test the execution cache of the QuantumInstance """
+
+    def setUp(self):
+        super().setUp()
+        self.seed = 50
+        self.ansatz = EfficientSU2(3, reps=1)
+        self.rng = np.random.default_rng(self.seed)
+
+    def _statevector_instance(self, **kwargs):
+        return QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                               seed_transpiler=self.seed, **kwargs)
+
+    def test_bound_circuits(self):
+        """ Test bound circuits with the same structure are executed from one entry """
+        quantum_instance = self._statevector_instance(execution_cache=True)
+        for _ in range(3):
+            values = self.rng.uniform(-np.pi, np.pi, self.ansatz.num_parameters)
+            circuit = self.ansatz.assign_parameters(values)
+            circuit.global_phase = values[0]
+            result = quantum_instance.execute(circuit)
+            np.testing.assert_allclose(result.get_statevector(circuit),
+                                       Statevector(circuit).data, atol=1e-10)
+        self.assertEqual(len(quantum_instance.execution_cache), 1)
+
+    def test_parameter_bindings(self):
+        """ Test parameterized circuits executed with parameter bindings """
+        quantum_instance = self._statevector_instance()
+        circuits = quantum_instance.transpile([self.ansatz, self.ansatz.inverse()])
+        bindings = [dict(zip(self.ansatz.parameters, values))
+                    for values in self.rng.uniform(-np.pi, np.pi,
+                                                   (4, self.ansatz.num_parameters))]
+        for _ in range(2):
+            result = quantum_instance.execute(circuits, had_transpiled=True,
+                                              parameter_bindings=bindings)
+            for i, circuit in enumerate([self.ansatz, self.ansatz.inverse()]):
+                for j, binding in enumerate(bindings):
+                    np.testing.assert_allclose(
+                        result.get_statevector(i * len(bindings) + j),
+                        Statevector(circuit.assign_parameters(binding)).data, atol=1e-10)
+        self.assertEqual(len(quantum_instance.execution_cache), 1)
+
+    def test_names_and_counts(self):
+        """ Test the results of cached circuits are found by the circuit names """
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=100,
+                                           seed_simulator=self.seed,
+                                           seed_transpiler=self.seed,
+                                           execution_cache=True)
+        for angle in [0, np.pi]:
+            circuit = QuantumCircuit(1, 1, name='rx_{}'.format(angle))
+            circuit.rx(angle, 0)
+            circuit.measure(0, 0)
+            result = quantum_instance.execute(circuit)
+            self.assertEqual(result.get_counts(circuit), {str(int(angle > 0)): 100})
+        self.assertEqual(len(quantum_instance.execution_cache), 1)
+
+        quantum_instance.set_config(shots=10)
+        self.assertEqual(len(quantum_instance.execution_cache), 0)
+        result = quantum_instance.execute(circuit)
+        self.assertEqual(result.get_counts(circuit), {'1': 10})
+
+    def test_custom_gates(self):
+        """ Test custom gates with the same name are not mixed up """
+        quantum_instance = self._statevector_instance(execution_cache=True)
+        for gate in ['x', 'h']:
+            definition = QuantumCircuit(1, name='custom')
+            getattr(definition, gate)(0)
+            circuit = QuantumCircuit(1)
+            circuit.append(definition.to_gate(), [0])
+            result = quantum_instance.execute(circuit)
+            np.testing.assert_allclose(result.get_statevector(circuit),
+                                       Statevector(definition).data, atol=1e-10)
+
+    def test_cache_disabled(self):
+        """ Test bound circuits are not cached by default """
+        quantum_instance = self._statevector_instance()
+        values = self.rng.uniform(-np.pi, np.pi, self.ansatz.num_parameters)
+        circuit = self.ansatz.assign_parameters(values)
+        with patch.object(quantum_instance, 'transpile',
+                          wraps=quantum_instance.transpile) as transpile:
+            for _ in range(2):
+                result = quantum_instance.execute(circuit)
+        self.assertEqual(transpile.call_count, 2)
+        self.assertEqual(transpile.call_args[0][0], [circuit])
+        self.assertEqual(len(quantum_instance.execution_cache), 0)
+        np.testing.assert_allclose(result.get_statevector(circuit),
+                                   Statevector(circuit).data, atol=1e-10)
+
+        theta = Parameter('θ')
+        circuit = QuantumCircuit(1)
+        circuit.ry(2 * theta, 0)
+        result = quantum_instance.execute(circuit, parameter_bindings=[{theta: 0.},
+                                                                       {theta: np.pi / 2}])
+        np.testing.assert_allclose(result.get_statevector(0), [1, 0], atol=1e-10)
+        np.testing.assert_allclose(result.get_statevector(1), [0, 1], atol=1e-10)
+        self.assertEqual(len(quantum_instance.execution_cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the local measurement error mitigation """
+
+import unittest
+from test.python.algorithms import QiskitAlgorithmsTestCase
+
+import numpy as np
+
+from qiskit import BasicAer, QuantumCircuit
+from qiskit.result import Result
+from qiskit.utils import LocalMeasFitter, QuantumInstance, local_meas_cal
+from qiskit.utils import local_mitigation
+
+
+def _readout_matrix(p01, p10):
+    return np.array([[1 - p01, p10], [p01, 1 - p10]])
+
+
+def _noisy_distribution(probabilities, matrices, groups, num_qubits):
+    """Return the distribution measured with the assignment matrices of the groups."""
+    tensor = np.reshape(probabilities, [2] * num_qubits)
+    for group, matrix in zip(groups, matrices):
+        axes = [num_qubits - 1 - pos for pos in group]
+        matrix = matrix.reshape([2] * (2 * len(group)))
+        # bit j of the group state indices is the axis of the j-th qubit of the group
+        meas = [len(group) - 1 - j for j in range(len(group))]
+        prep = [2 * len(group) - 1 - j for j in range(len(group))]
+        tensor = np.tensordot(matrix, tensor, axes=(prep, axes))
+        tensor = np.moveaxis(tensor, meas, axes)
+    return tensor.ravel()
+
+
+def _result(counts):
+    """Return a result of experiments with the given names and integer keyed counts."""
+    return Result.from_dict({
+        'backend_name': 'test', 'backend_version': '0.0.0', 'qobj_id': '', 'job_id': '',
+        'success': True,
+        'results': [{'shots': int(sum(values.values())), 'success': True,
+                     'data': {'counts': {hex(key): value for key, value in values.items()}},
+                     'header': {'name': name}}
+                    for name, values in counts.items()]})
+
+
+class TestLocalMitigation(QiskitAlgorithmsTestCase):
+    """ Test the local measurement error mitigation """
+
+    def setUp(self):
+        super().setUp()
+        self.rng = np.random.default_rng(50)
+        self.groups = [[0, 1], [2], [3]]
+        correlated = self.rng.uniform(0, 0.05, (4, 4)) + np.eye(4)
+        self.matrices = [correlated / correlated.sum(axis=0),
+                         _readout_matrix(0.02, 0.05), _readout_matrix(0.03, 0.08)]
+
+    def _calibration_result(self, qubit_groups, shots=10000):
+        circuits, state_labels = local_meas_cal(range(4), qubit_groups, circlabel='mcal')
+        counts = {}
+        for circuit, label in zip(circuits, state_labels):
+            distribution = np.zeros(16)
+            distribution[int(label, 2)] = 1
+            noisy = _noisy_distribution(distribution, self.matrices, self.groups, 4)
+            counts[circuit.name] = dict(enumerate(noisy * shots))
+        return _result(counts), state_labels
+
+    def test_calibration_circuits(self):
+        """ Test the calibration circuits prepare all states of each group """
+        circuits, state_labels = local_meas_cal([0, 2, 3])
+        self.assertEqual(state_labels, ['000', '111'])
+        self.assertEqual(circuits[1].count_ops(), {'x': 3, 'barrier': 1, 'measure': 3})
+        _, state_labels = local_meas_cal([0, 2, 3], qubit_groups=[[0, 2], [3]])
+        self.assertEqual(state_labels, ['000', '101', '010', '111'])
+
+    def test_fitter(self):
+        """ Test the assignment matrices are estimated from the calibration counts """
+        result, state_labels = self._calibration_result(self.groups)
+        fitter = LocalMeasFitter(result, state_labels, qubit_list=[1, 3, 4, 6], circlabel='mcal',
+                                 qubit_groups=[[1, 3], [4], [6]])
+        self.assertEqual(fitter.qubit_groups, [[1, 3], [4], [6]])
+        for matrix, expected in zip(fitter.cal_matrices, self.matrices):
+            np.testing.assert_allclose(matrix, expected, atol=1e-12)
+
+    def test_mitigation(self):
+        """ Test the counts of all observed bitstrings are mitigated exactly """
+        fitter = LocalMeasFitter.from_assignment_matrices(self.matrices, self.groups,
+                                                          distance=None)
+        probabilities = np.zeros(16)
+        probabilities[[0b0000, 0b1011, 0b1111]] = [0.5, 0.2, 0.3]
+        noisy = _noisy_distribution(probabilities, self.matrices, self.groups, 4)
+        counts = {format(i, '04b'): 1000 * value for i, value in enumerate(noisy)}
+        for method in ['least_squares', 'pseudo_inverse']:
+            with self.subTest(method=method):
+                mitigated = fitter.filter.apply(counts, method)
+                values = np.array([mitigated.get(format(i, '04b'), 0) for i in range(16)])
+                np.testing.assert_allclose(values, 1000 * probabilities, atol=1e-6)
+
+        result = fitter.filter.apply(_result({'circuit': dict(enumerate(noisy * 1000))}))
+        mitigated = result.get_counts('circuit')
+        self.assertAlmostEqual(mitigated['1011'], 200, places=6)
+
+    def test_subset_fitter(self):
+        """ Test the fitter of a subset of the qubits in a different order """
+        fitter = LocalMeasFitter.from_assignment_matrices(
+            [np.kron(self.matrices[2], self.matrices[1]), self.matrices[0]],
+            [[3, 5], [7, 8]], qubit_list=[3, 5, 7, 8])
+        subset = fitter.subset_fitter([7, 3])
+        self.assertEqual(subset.qubit_list, [7, 3])
+        self.assertEqual(subset.qubit_groups, [[3], [7]])
+        np.testing.assert_allclose(subset.cal_matrices[0], self.matrices[1], atol=1e-12)
+        np.testing.assert_allclose(subset.cal_matrices[1],
+                                   _noisy_marginal(self.matrices[0]), atol=1e-12)
+
+    def test_many_qubits(self):
+        """ Test the mitigation of sampled counts of a GHZ state of 20 qubits """
+        num_qubits = 20
+        p01 = self.rng.uniform(0.01, 0.04, num_qubits)
+        p10 = self.rng.uniform(0.02, 0.06, num_qubits)
+        fitter = LocalMeasFitter.from_assignment_matrices(
+            [_readout_matrix(*errors) for errors in zip(p01, p10)],
+            [[qubit] for qubit in range(num_qubits)])
+        states = np.repeat(self.rng.integers(0, 2, (4000, 1)), num_qubits, axis=1)
+        flips = self.rng.random(states.shape) < np.where(states == 0, p01, p10)
+        counts = {}
+        for row in states ^ flips:
+            key = ''.join(str(bit) for bit in row[::-1])
+            counts[key] = counts.get(key, 0) + 1
+        mitigated = fitter.filter.apply(counts)
+        ghz = ['0' * num_qubits, '1' * num_qubits]
+        self.assertLess(sum(counts[key] for key in ghz), 3000)
+        self.assertGreater(sum(mitigated[key] for key in ghz), 3800)
+        self.assertAlmostEqual(sum(mitigated.values()), 4000)
+        self.assertTrue(all(value >= 0 for value in mitigated.values()))
+
+    def test_close_pairs(self):
+        """ Test the masked lookup of close bitstrings against all pairwise distances """
+        for num_bits, distance in [(12, 2), (70, 1)]:
+            with self.subTest(num_bits=num_bits, distance=distance):
+                # Flip few bits of few bitstrings so that there are close pairs
+                bits = np.repeat(self.rng.integers(0, 2, (40, num_bits)), 10, axis=0)
+                bits ^= self.rng.random(bits.shape) < 0.05
+                bits = np.unique(bits, axis=0).astype(np.int64)
+                words = local_mitigation._packed_words(bits)
+                expected = set(zip(*local_mitigation._dense_close_pairs(words, distance)))
+                pairs = set(zip(*local_mitigation._masked_close_pairs(words, num_bits,
+                                                                      distance)))
+                self.assertEqual(pairs, expected)
+                self.assertGreater(len(pairs), len(bits))
+
+    def test_quantum_instance(self):
+        """ Test the fitter as mitigation class of a QuantumInstance without Ignis """
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=100,
+                                           seed_simulator=50, seed_transpiler=50,
+                                           measurement_error_mitigation_cls=LocalMeasFitter)
+        circuit = QuantumCircuit(3, 3)
+        circuit.x(0)
+        circuit.measure(range(3), range(3))
+        result = quantum_instance.execute(circuit)
+        self.assertEqual(result.get_counts(circuit), {'001': 100})
+        matrices, _ = quantum_instance.cals_matrix([0, 1, 2])
+        self.assertEqual(len(matrices), 3)
+        for matrix in matrices:
+            np.testing.assert_allclose(matrix, np.eye(2))
+
+
+def _noisy_marginal(matrix):
+    """Return the assignment matrix of the first qubit of a two qubit group."""
+    return matrix.reshape(2, 2, 2, 2).sum(axis=0).mean(axis=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
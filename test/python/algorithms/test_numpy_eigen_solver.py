@@ -50,6 +50,26 @@ class TestNumPyEigensolver(QiskitAlgorithmsTestCase):
         np.testing.assert_array_almost_equal(result.eigenvalues.real,
                                              [-1.85727503, -1.24458455, -0.88272215, -0.22491125])
 
+    def test_ce_matrix_free(self):
+        """ Test sums of Paulis are solved without their matrix """
+        rng = np.random.default_rng(50)
+        labels = [''.join(rng.choice(['I', 'X', 'Y', 'Z'], size=8)) for _ in range(30)]
+        coeffs = rng.uniform(-1, 1, size=30)
+        for operator in [PauliSumOp.from_list(list(zip(labels, coeffs))),
+                         PauliSumOp.from_list(list(zip(labels, coeffs))).to_pauli_op()]:
+            with self.subTest(operator=type(operator).__name__):
+                algo = NumPyEigensolver(k=3)
+                result = algo.compute_eigenvalues(operator=operator, aux_operators=[operator])
+                matrix = operator.to_matrix()
+                np.testing.assert_array_almost_equal(result.eigenvalues.real,
+                                                     np.linalg.eigvalsh(matrix)[:3])
+                for eigenstate, eigenvalue, aux_value in zip(result.eigenstates,
+                                                             result.eigenvalues,
+                                                             result.aux_operator_eigenvalues):
+                    vector = eigenstate.to_matrix()
+                    np.testing.assert_array_almost_equal(matrix @ vector, eigenvalue * vector)
+                    self.assertAlmostEqual(aux_value[0][0], eigenvalue.real)
+
     def test_ce_k4_filtered(self):
         """ Test for k=4 eigenvalues with filter """
 
@@ -13,13 +13,15 @@
 """ Test Optimizers """
 
 import unittest
+import time
 from test.python.algorithms import QiskitAlgorithmsTestCase
+from concurrent.futures import ThreadPoolExecutor
 from scipy.optimize import rosen
 import numpy as np
 
 from qiskit.utils import aqua_globals
 from qiskit.algorithms.optimizers import (ADAM, CG, COBYLA, L_BFGS_B, P_BFGS, NELDER_MEAD,
-                                          POWELL, SLSQP, SPSA, TNC, GSLS)
+                                          POWELL, SLSQP, SPSA, TNC, GSLS, MultiStart)
 
 
 class TestOptimizers(QiskitAlgorithmsTestCase):
@@ -65,6 +67,63 @@ class TestOptimizers(QiskitAlgorithmsTestCase):
         res = self._optimize(optimizer)
         self.assertLessEqual(res[2], 10000)
 
+    def test_p_bfgs_executor(self):
+        """ parallel l_bfgs_b in a thread pool test """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            optimizer = P_BFGS(maxfun=1000, max_processes=2, executor=executor)
+            res = self._optimize(optimizer)
+            res2 = self._optimize(optimizer)
+        self.assertLessEqual(res[2], 3 * 10000)
+        self.assertEqual(res[1], res2[1])
+
+    def test_multistart(self):
+        """ multi-start test """
+        optimizer = MultiStart(COBYLA(maxiter=100000, tol=1e-06), num_starts=3)
+        res = self._optimize(optimizer)
+        self.assertEqual(len(optimizer.results), 3)
+        self.assertEqual(res[1], min(value for _, value, _ in optimizer.results))
+        self.assertEqual(res[2], sum(nfev for _, _, nfev in optimizer.results))
+
+    def test_multistart_serialized_objective(self):
+        """ multi-start test with objective evaluations from one thread at a time """
+        active = []
+        overlaps = []
+
+        def objective(x):
+            active.append(x)
+            overlaps.append(len(active))
+            time.sleep(1e-4)
+            active.pop()
+            return rosen(x)
+
+        with MultiStart(COBYLA(maxiter=200), num_starts=4) as optimizer:
+            optimizer.optimize(5, objective, initial_point=[1.3, 0.7, 0.8, 1.9, 1.2])
+            executor = optimizer.executor
+        self.assertEqual(max(overlaps), 1)
+        self.assertEqual(len(optimizer.results), 4)
+        with self.assertRaises(RuntimeError):
+            executor.submit(int)
+        self.assertIsNot(optimizer.executor, executor)
+        optimizer.close()
+
+    def test_multistart_batched_objective(self):
+        """ multi-start test with batched objective evaluations """
+        num_points = []
+
+        def objective(x):
+            points = np.reshape(x, (-1, 5))
+            num_points.append(len(points))
+            values = [rosen(point) for point in points]
+            return values if len(values) > 1 else values[0]
+
+        optimizer = MultiStart(L_BFGS_B(maxfun=1000), num_starts=4, batch_objective=True)
+        x_0 = [1.3, 0.7, 0.8, 1.9, 1.2]
+        res = optimizer.optimize(len(x_0), objective, initial_point=x_0)
+        np.testing.assert_array_almost_equal(res[0], [1.0] * len(x_0), decimal=2)
+        self.assertEqual(res[2], sum(num_points))
+        self.assertGreater(max(num_points), 1)
+        self.assertLess(len(num_points), res[2])
+
     def test_nelder_mead(self):
         """ nelder mead test """
         optimizer = NELDER_MEAD(maxfev=10000, tol=1e-06)
@@ -90,6 +149,27 @@ class TestOptimizers(QiskitAlgorithmsTestCase):
         res = self._optimize(optimizer)
         self.assertLessEqual(res[2], 100000)
 
+    def test_spsa_batched(self):
+        """ spsa test with all points of an iteration evaluated at once """
+        num_points = []
+
+        def objective(x):
+            points = np.reshape(x, (-1, 2))
+            num_points.append(len(points))
+            values = [np.sum((point - 1) ** 2) for point in points]
+            return values if len(values) > 1 else values[0]
+
+        for second_order in [False, True]:
+            num_points.clear()
+            optimizer = SPSA(maxiter=100, resamplings=2, second_order=second_order)
+            optimizer.set_max_evals_grouped(100)
+            res = optimizer.optimize(2, objective, initial_point=[0.0, 0.0])
+            np.testing.assert_array_almost_equal(res[0], [1.0, 1.0], decimal=1)
+            # calibration, iterations and final evaluation
+            self.assertEqual(len(num_points), 102)
+            self.assertEqual(num_points[1], 8 if second_order else 4)
+            self.assertEqual(res[2], sum(num_points))
+
     def test_tnc(self):
         """ tnc test """
         optimizer = TNC(maxiter=1000, tol=1e-06)
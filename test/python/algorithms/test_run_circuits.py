@@ -0,0 +1,163 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test run_qobj with jobs split over a backend with latency """
+
+import threading
+import time
+import unittest
+import uuid
+from test.python.algorithms import QiskitAlgorithmsTestCase
+
+from qiskit import BasicAer, QuantumCircuit, assemble, transpile
+from qiskit.providers import BackendV1, JobV1, JobStatus, Options
+from qiskit.providers.models import QasmBackendConfiguration
+from qiskit.utils.run_circuits import run_qobj
+
+
+class _LatencyJob(JobV1):
+    """A job which is done a given time after its submission."""
+
+    def __init__(self, backend, qobj, latency, fail):
+        super().__init__(backend, str(uuid.uuid4()))
+        self._qobj = qobj
+        self._done_time = time.time() + latency
+        self._fail = fail
+
+    def submit(self):
+        pass
+
+    def status(self):
+        if time.time() < self._done_time:
+            return JobStatus.RUNNING
+        return JobStatus.ERROR if self._fail else JobStatus.DONE
+
+    def result(self, timeout=None, wait=5):
+        # pylint: disable=arguments-differ,unused-argument
+        self.backend().release(self)
+        return self.backend().simulator.run(self._qobj).result()
+
+    def cancel(self):
+        pass
+
+    def qobj(self):
+        """Return the qobj of the job."""
+        return self._qobj
+
+    def error_message(self):
+        """Return the error message of the job."""
+        return 'failed'
+
+    def queue_position(self):
+        """Return the position of the job in the queue."""
+        return 0
+
+
+class _LatencyBackend(BackendV1):
+    """A remote backend running two experiments per job with a given latency per job."""
+
+    def __init__(self, latencies, submit_latency=0., failures=0):
+        self.simulator = BasicAer.get_backend('qasm_simulator')
+        config = self.simulator.configuration().to_dict()
+        config.update(backend_name='latency_backend', simulator=False, local=False,
+                      max_experiments=2)
+        super().__init__(QasmBackendConfiguration.from_dict(config))
+        self._latencies = list(latencies)
+        self._submit_latency = submit_latency
+        self._failures = failures
+        self._lock = threading.Lock()
+        self._pending = set()
+        self.num_runs = 0
+        self.max_pending = 0
+
+    @classmethod
+    def _default_options(cls):
+        return Options(shots=1024)
+
+    def run(self, run_input, **options):
+        time.sleep(self._submit_latency)
+        with self._lock:
+            fail = self.num_runs < self._failures
+            latency = self._latencies[self.num_runs % len(self._latencies)]
+            self.num_runs += 1
+            job = _LatencyJob(self, run_input, latency, fail)
+            if not fail:
+                self._pending.add(job.job_id())
+                self.max_pending = max(self.max_pending, len(self._pending))
+        return job
+
+    def release(self, job):
+        """Mark the result of a job as retrieved."""
+        with self._lock:
+            self._pending.discard(job.job_id())
+
+
+class TestRunQobj(QiskitAlgorithmsTestCase):
+    """ Test run_qobj with jobs split over a backend with latency """
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = []
+        for i in range(6):
+            circuit = QuantumCircuit(3, 3, name='circuit_{}'.format(i))
+            for qubit in range(3):
+                if (i >> qubit) & 1:
+                    circuit.x(qubit)
+            circuit.measure(range(3), range(3))
+            self.circuits.append(circuit)
+        self.qobj = assemble(transpile(self.circuits, BasicAer.get_backend('qasm_simulator')),
+                             shots=10)
+        self.qjob_config = {'timeout': None, 'wait': 0.5}
+
+    def _check_counts(self, result):
+        for i, circuit in enumerate(self.circuits):
+            self.assertEqual(result.get_counts(circuit), {format(i, '03b'): 10})
+
+    def test_pipelined_streams_results(self):
+        """ Test results are passed to the callback in the order the jobs are done """
+        backend = _LatencyBackend(latencies=[0.6, 0.05, 0.3])
+        done = []
+        result = run_qobj(self.qobj, backend, self.qjob_config, pipelined=True,
+                          result_callback=lambda index, result: done.append(index))
+        self.assertEqual(done, [1, 2, 0])
+        self._check_counts(result)
+
+    def test_max_pending_jobs(self):
+        """ Test the number of outstanding jobs is limited """
+        backend = _LatencyBackend(latencies=[0.1], submit_latency=0.05)
+        done = []
+        result = run_qobj(self.qobj, backend, self.qjob_config, pipelined=True,
+                          result_callback=lambda index, result: done.append(index),
+                          max_pending_jobs=1)
+        self.assertEqual(done, [0, 1, 2])
+        self.assertEqual(backend.max_pending, 1)
+        self._check_counts(result)
+
+    def test_failed_jobs_resubmitted(self):
+        """ Test jobs in the error state are submitted again """
+        backend = _LatencyBackend(latencies=[0.05], failures=2)
+        result = run_qobj(self.qobj, backend, self.qjob_config, pipelined=True)
+        self.assertEqual(backend.num_runs, 5)
+        self._check_counts(result)
+
+    def test_sequential_result_callback(self):
+        """ Test the callback is called in order without pipelining """
+        backend = _LatencyBackend(latencies=[0.2, 0.05, 0.05])
+        done = []
+        result = run_qobj(self.qobj, backend, self.qjob_config,
+                          result_callback=lambda index, result: done.append(index))
+        self.assertEqual(done, [0, 1, 2])
+        self._check_counts(result)
+
+
+if __name__ == '__main__':
+    unittest.main()
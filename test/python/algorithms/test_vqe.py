@@ -13,6 +13,7 @@
 """ Test VQE """
 
 import unittest
+from unittest.mock import patch
 from test.python.algorithms import QiskitAlgorithmsTestCase
 import numpy as np
 from ddt import ddt, unpack, data
@@ -24,7 +25,7 @@ from qiskit.exceptions import MissingOptionalLibraryError
 from qiskit.opflow import (PrimitiveOp, X, Z, I,
                            AerPauliExpectation, PauliExpectation,
                            MatrixExpectation, ExpectationBase)
-from qiskit.algorithms.optimizers import L_BFGS_B, COBYLA, SPSA, SLSQP
+from qiskit.algorithms.optimizers import L_BFGS_B, COBYLA, SPSA, SLSQP, MultiStart
 from qiskit.algorithms import VQE, AlgorithmError
 
 
@@ -122,6 +123,7 @@ class TestVQE(QiskitAlgorithmsTestCase):
     @data(
         (SLSQP(maxiter=50), 5, 4),
         (SPSA(maxiter=150), 3, 2),  # max_evals_grouped=n or =2 if n>2
+        (SPSA(maxiter=150, resamplings=2, second_order=True), 3, 8),
     )
     @unpack
     def test_max_evals_grouped(self, optimizer, places, max_evals_grouped):
@@ -133,6 +135,19 @@ class TestVQE(QiskitAlgorithmsTestCase):
         result = vqe.compute_minimum_eigenvalue(operator=self.h2_op)
         self.assertAlmostEqual(result.eigenvalue.real, self.h2_energy, places=places)
 
+    def test_multistart_batches(self):
+        """Test the VQE batches the energy evaluations of concurrent multi-start runs."""
+        optimizer = MultiStart(SLSQP(maxiter=50), num_starts=3, batch_objective=True)
+        vqe = VQE(var_form=self.ryrz_wavefunction,
+                  optimizer=optimizer,
+                  quantum_instance=self.statevector_simulator)
+        with patch.object(self.statevector_simulator, 'execute',
+                          wraps=self.statevector_simulator.execute) as execute:
+            result = vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+        self.assertAlmostEqual(result.eigenvalue.real, self.h2_energy, places=5)
+        self.assertEqual(len(optimizer.results), 3)
+        self.assertLess(execute.call_count, result.cost_function_evals)
+
     def test_basic_aer_qasm(self):
         """Test the VQE on BasicAer's QASM simulator."""
         optimizer = SPSA(maxiter=300, last_avg=5)
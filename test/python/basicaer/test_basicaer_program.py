@@ -0,0 +1,137 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for running circuits directly on the BasicAer simulators."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import BasicAer
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit import execute, transpile
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import QuantumVolume
+from qiskit.providers.basicaer import BasicAerError
+from qiskit.providers.basicaer.basicaerprogram import (compile_circuit, OP_U, OP_CX,
+                                                       OP_MEASURE, OP_RESET)
+from qiskit.test import QiskitTestCase
+
+
+class TestBasicAerProgram(QiskitTestCase):
+    """Test compiling circuits to basic aer programs."""
+
+    def test_compile_opcodes(self):
+        """Test circuits are lowered to opcode and parameter arrays."""
+        qc = QuantumCircuit(2, 1)
+        qc.u3(0.1, 0.2, 0.3, 0)
+        qc.u2(0.4, 0.5, 1)
+        qc.barrier()
+        qc.cx(0, 1)
+        qc.reset(0)
+        qc.measure(1, 0)
+        program = compile_circuit(qc)
+        self.assertEqual(program.opcodes.tolist(),
+                         [OP_U, OP_U, OP_CX, OP_RESET, OP_MEASURE])
+        self.assertEqual([qubits for _, qubits in program.instructions()],
+                         [[0], [1], [0, 1], [0], [1]])
+        np.testing.assert_allclose(program.params[:2],
+                                   [[0.1, 0.2, 0.3], [np.pi / 2, 0.4, 0.5]])
+        self.assertEqual(program.clbits.tolist(), [-1, -1, -1, -1, 0])
+        self.assertFalse(program.allows_measure_sampling())
+
+    def test_unbound_parameters_raise(self):
+        """Test compiling a circuit with unbound parameters raises."""
+        qc = QuantumCircuit(1)
+        qc.u1(Parameter('a'), 0)
+        self.assertRaises(BasicAerError, compile_circuit, qc)
+
+    def test_unsupported_instruction_raises(self):
+        """Test compiling a circuit with an unknown instruction raises."""
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        self.assertRaises(BasicAerError, compile_circuit, qc)
+
+
+class TestBasicAerCircuitRun(QiskitTestCase):
+    """Test running circuits on the BasicAer simulators without a qobj."""
+
+    def setUp(self):
+        super().setUp()
+        self.seed = 42
+
+    def test_qasm_simulator_counts(self):
+        """Test qasm simulator counts match the qobj path."""
+        backend = BasicAer.get_backend('qasm_simulator')
+        qr = QuantumRegister(3, 'q')
+        cr0 = ClassicalRegister(2, 'c0')
+        cr1 = ClassicalRegister(1, 'c1')
+        qc = QuantumCircuit(qr, cr0, cr1)
+        qc.h(qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.measure(qr[0], cr0[0])
+        qc.measure(qr[1], cr0[1])
+        qc.x(qr[2]).c_if(cr0, 3)
+        qc.measure(qr[2], cr1[0])
+        circuit = transpile(qc, backend)
+        target = execute(circuit, backend, shots=500,
+                         seed_simulator=self.seed).result().get_counts()
+        result = backend.run(circuit, shots=500, seed_simulator=self.seed).result()
+        self.assertEqual(result.get_counts(qc), target)
+        self.assertEqual(set(target), {'0 00', '1 11'})
+
+    def test_qasm_simulator_memory(self):
+        """Test qasm simulator memory with measure sampling."""
+        backend = BasicAer.get_backend('qasm_simulator')
+        qc = QuantumCircuit(2, 2)
+        qc.x(0)
+        qc.measure([0, 1], [0, 1])
+        circuit = transpile(qc, backend)
+        result = backend.run([circuit, circuit], shots=10, memory=True).result()
+        self.assertEqual(result.get_memory(0), 10 * ['01'])
+        self.assertEqual(result.get_counts(1), {'01': 10})
+
+    def test_statevector_simulator(self):
+        """Test statevector simulator matches the qobj path."""
+        backend = BasicAer.get_backend('statevector_simulator')
+        circuit = transpile(QuantumVolume(4, seed=self.seed), backend)
+        target = execute(circuit, backend).result().get_statevector()
+        result = backend.run(circuit, shots=10).result()
+        np.testing.assert_allclose(result.get_statevector(), target)
+
+    def test_unitary_simulator(self):
+        """Test unitary simulator matches the qobj path."""
+        backend = BasicAer.get_backend('unitary_simulator')
+        circuit = transpile(QuantumVolume(3, seed=self.seed), backend)
+        circuit.global_phase = 0.5
+        target = execute(circuit, backend).result().get_unitary()
+        result = backend.run([circuit]).result()
+        np.testing.assert_allclose(result.get_unitary(circuit), target)
+
+    def test_unitary_simulator_measure_raises(self):
+        """Test unitary simulator rejects measurements."""
+        backend = BasicAer.get_backend('unitary_simulator')
+        qc = QuantumCircuit(1, 1)
+        qc.measure(0, 0)
+        job = backend.run(qc)
+        self.assertRaises(BasicAerError, job.result)
+
+    def test_empty_list_raises(self):
+        """Test running an empty list of circuits raises."""
+        for name in ['qasm_simulator', 'statevector_simulator', 'unitary_simulator']:
+            with self.subTest(backend=name):
+                backend = BasicAer.get_backend(name)
+                self.assertRaises(BasicAerError, backend.run, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
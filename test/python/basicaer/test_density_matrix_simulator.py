@@ -0,0 +1,108 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test DensityMatrixSimulatorPy."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import BasicAer, QuantumCircuit, execute, transpile
+from qiskit.circuit import Instruction
+from qiskit.providers.basicaer import DensityMatrixSimulatorPy, BasicAerError
+from qiskit.quantum_info import DensityMatrix, Kraus, SuperOp
+from qiskit.quantum_info.random import random_unitary, random_quantum_channel
+from qiskit.test import ReferenceCircuits
+from qiskit.test import providers
+
+
+class DensityMatrixSimulatorTest(providers.BackendTestCase):
+    """Test BasicAer density matrix simulator."""
+
+    backend_cls = DensityMatrixSimulatorPy
+    circuit = ReferenceCircuits.bell()
+
+    def setUp(self):
+        super().setUp()
+        self.seed = 88
+
+    def test_bell_counts(self):
+        """Test counts of a bell circuit."""
+        result = execute(self.circuit, self.backend, shots=1000,
+                         seed_simulator=self.seed).result()
+        counts = result.get_counts(self.circuit)
+        self.assertEqual(set(counts), {'00', '11'})
+        self.assertEqual(sum(counts.values()), 1000)
+
+    def test_noisy_circuit_density_matrix(self):
+        """Test gates and channels against DensityMatrix evolution."""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.append(random_unitary(4, seed=self.seed), [0, 2])
+        circuit.append(Kraus(random_quantum_channel(2, seed=self.seed)).to_instruction(), [1])
+        target = DensityMatrix.from_label('000').evolve(circuit)
+        superop = SuperOp(random_quantum_channel(4, seed=self.seed + 1))
+        circuit.append(Instruction('superop', 2, 0, [superop.data]), [2, 0])
+        target = target.evolve(superop, qargs=[2, 0])
+        circuit.reset(1)
+        circuit.cx(1, 2)
+        target = target.evolve(circuit.data[-2][0], qargs=[1])
+        target = target.evolve(circuit.data[-1][0], qargs=[1, 2])
+        circuit = transpile(circuit, self.backend)
+        for rho in [execute(circuit, self.backend).result().data(0)['density_matrix'],
+                    self.backend.run(circuit).result().data(0)['density_matrix']]:
+            np.testing.assert_allclose(rho, target.data, atol=1e-12)
+
+    def test_sampled_counts(self):
+        """Test sampled counts match the noisy output distribution."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.append(Kraus(random_quantum_channel(2, seed=self.seed)).to_instruction(), [1])
+        target = DensityMatrix.from_label('00').evolve(circuit).probabilities_dict()
+        circuit.measure_all()
+        shots = 10000
+        result = self.backend.run(transpile(circuit, self.backend), shots=shots,
+                                  seed_simulator=self.seed).result()
+        counts = result.get_counts()
+        for key, prob in target.items():
+            self.assertAlmostEqual(counts.get(key, 0) / shots, prob, delta=0.03)
+
+    def test_mid_circuit_measure(self):
+        """Test measurements followed by gates are simulated per shot."""
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        circuit.cx(0, 1)
+        circuit.measure(1, 1)
+        result = execute(circuit, self.backend, shots=100, memory=True,
+                         seed_simulator=self.seed).result()
+        self.assertEqual(set(result.get_counts()), {'00', '11'})
+        self.assertEqual(len(result.get_memory()), 100)
+
+    def test_conditional_raises(self):
+        """Test conditional instructions are rejected."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        circuit.x(0).c_if(circuit.cregs[0], 1)
+        job = self.backend.run(transpile(circuit, self.backend))
+        self.assertRaises(BasicAerError, job.result)
+
+    def test_channel_on_statevector_simulator_raises(self):
+        """Test channels are rejected by the statevector simulators."""
+        circuit = QuantumCircuit(1)
+        circuit.append(Kraus(random_quantum_channel(2, seed=self.seed)).to_instruction(), [0])
+        job = BasicAer.get_backend('statevector_simulator').run(circuit)
+        self.assertRaises(BasicAerError, job.result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test StabilizerSimulatorPy."""
+
+import unittest
+
+from qiskit import BasicAer, QuantumCircuit, execute, transpile
+from qiskit.providers.basicaer import StabilizerSimulatorPy, BasicAerError
+from qiskit.quantum_info import StabilizerState
+from qiskit.quantum_info.random import random_clifford
+from qiskit.test import ReferenceCircuits
+from qiskit.test import providers
+
+
+class StabilizerSimulatorTest(providers.BackendTestCase):
+    """Test BasicAer stabilizer simulator."""
+
+    backend_cls = StabilizerSimulatorPy
+    circuit = ReferenceCircuits.bell()
+
+    def setUp(self):
+        super().setUp()
+        self.seed = 88
+
+    def test_bell_counts(self):
+        """Test counts of a bell circuit."""
+        result = execute(self.circuit, self.backend, shots=1000,
+                         seed_simulator=self.seed).result()
+        counts = result.get_counts(self.circuit)
+        self.assertEqual(set(counts), {'00', '11'})
+        self.assertEqual(sum(counts.values()), 1000)
+
+    def test_sampled_counts(self):
+        """Test sampled counts match the probabilities of the stabilizer state."""
+        circuit = random_clifford(4, seed=self.seed).to_circuit()
+        target = StabilizerState(circuit).probabilities_dict()
+        circuit.measure_all()
+        shots = 4000
+        circuit = transpile(circuit, self.backend)
+        for result in [execute(circuit, self.backend, shots=shots,
+                               seed_simulator=self.seed).result(),
+                       self.backend.run(circuit, shots=shots, seed_simulator=self.seed).result()]:
+            counts = result.get_counts()
+            self.assertEqual(set(counts), set(target))
+            for key, prob in target.items():
+                self.assertAlmostEqual(counts[key] / shots, prob, delta=0.05)
+
+    def test_ghz_many_qubits(self):
+        """Test a GHZ circuit of many qubits measured into a subset of clbits."""
+        num_qubits = 1000
+        circuit = QuantumCircuit(num_qubits, 3)
+        circuit.h(0)
+        for qubit in range(1, num_qubits):
+            circuit.cx(qubit - 1, qubit)
+        circuit.measure([0, 500, num_qubits - 1], [2, 0, 1])
+        result = self.backend.run(circuit, shots=100, memory=True,
+                                  seed_simulator=self.seed).result()
+        self.assertEqual(set(result.get_counts()), {'000', '111'})
+        self.assertEqual(len(result.get_memory()), 100)
+
+    def test_mid_circuit_measure_reset(self):
+        """Test measurements and resets followed by gates are simulated per shot."""
+        circuit = QuantumCircuit(3, 3)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        circuit.cx(0, 1)
+        circuit.reset(0)
+        circuit.x(2)
+        circuit.measure([0, 1, 2], [0, 1, 2])
+        result = execute(circuit, self.backend, shots=200, seed_simulator=self.seed).result()
+        counts = result.get_counts()
+        self.assertEqual(set(counts), {'100', '110'})
+        self.assertEqual(sum(counts.values()), 200)
+
+    def test_stabilizer_output(self):
+        """Test circuits without measurements return the stabilizer generators."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        result = self.backend.run(circuit).result()
+        self.assertEqual(result.data(0)['stabilizer'], ['+XX', '+ZZ'])
+
+    def test_non_clifford_raises(self):
+        """Test conditional and non-Clifford instructions are rejected."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        circuit.x(0).c_if(circuit.cregs[0], 1)
+        with self.assertRaises(BasicAerError):
+            self.backend.run(circuit)
+        circuit = QuantumCircuit(1)
+        circuit.t(0)
+        job = BasicAer.get_backend('stabilizer_simulator').run(circuit)
+        self.assertRaises(BasicAerError, job.result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,7 @@
 import unittest
 
 import numpy as np
+from scipy import sparse
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
@@ -117,6 +118,35 @@ class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
                 fidelity = process_fidelity(unitary_target, unitary_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_sparse_method(self):
+        """Test the sparse unitary accumulation method."""
+        circuit = QuantumCircuit(5, global_phase=0.5)
+        circuit.x(0)
+        circuit.cx(0, 3)
+        circuit.t(4)
+        circuit.swap(1, 4)
+        circuit.cz(2, 3)
+        result = execute(circuit, self.backend, method='sparse').result()
+        unitary = result.get_unitary(circuit)
+        self.assertTrue(sparse.isspmatrix_csr(unitary))
+        np.testing.assert_allclose(unitary.toarray(), Operator(circuit).data, atol=1e-12)
+        metadata = result.results[0].metadata
+        self.assertEqual(metadata['method'], 'sparse')
+        self.assertEqual(metadata['unitary_format'], 'permutation')
+        dense = execute(circuit, self.backend).result().results[0].metadata
+        self.assertLess(metadata['peak_memory'], dense['peak_memory'])
+
+    def test_sparse_method_dense_fill_in(self):
+        """Test the sparse method switches to a dense unitary when required."""
+        qr = QuantumRegister(3)
+        circuit = QuantumCircuit(qr)
+        circuit.unitary(random_unitary(8, seed=7), qr)
+        circuit.cx(qr[0], qr[2])
+        result = execute(circuit, self.backend, method='sparse').result()
+        self.assertEqual(result.results[0].metadata['unitary_format'], 'dense')
+        np.testing.assert_allclose(result.get_unitary(circuit), Operator(circuit).data,
+                                   atol=1e-12)
+
 
 if __name__ == '__main__':
     unittest.main()
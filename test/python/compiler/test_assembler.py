@@ -230,6 +230,37 @@ class TestCircuitAssembler(QiskitTestCase):
         self.assertEqual(qobj.experiments[0].instructions[0].memory, [3, 0])
         self.assertEqual(qobj.experiments[0].instructions[0].params, [0.5, 0.4])
 
+    def test_assemble_shared_instructions(self):
+        """Test shared, labelled and conditional instructions assemble independently."""
+        qr = QuantumRegister(2, name='q')
+        cr = ClassicalRegister(2, name='c')
+        circ = QuantumCircuit(qr, cr, name='circ')
+        shared = Gate('shared', 1, [])
+        circ.append(shared, [qr[0]])
+        circ.append(shared, [qr[1]])
+        circ.append(Gate('shared', 1, [], label='lab'), [qr[0]])
+        circ.rz(0.5, qr[1])
+        circ.x(qr[0]).c_if(cr, 1)
+        circ.x(qr[1])
+        circ.snapshot('snap', qubits=[qr[0]])
+        circ.measure(qr, cr)
+
+        instructions = assemble(circ).experiments[0].instructions
+        expected = [('shared', [0]), ('shared', [1]), ('shared', [0]), ('rz', [1]),
+                    ('bfunc', None), ('x', [0]), ('x', [1]), ('snapshot', [0]),
+                    ('measure', [0]), ('measure', [1])]
+        self.assertEqual([(inst.name, getattr(inst, 'qubits', None))
+                          for inst in instructions], expected)
+        self.assertFalse(hasattr(instructions[0], 'label'))
+        self.assertEqual(instructions[2].label, 'lab')
+        self.assertEqual(instructions[3].params, [0.5])
+        self.assertEqual(instructions[5].conditional, 2)
+        self.assertFalse(hasattr(instructions[6], 'conditional'))
+        self.assertEqual(instructions[7].snapshot_type, 'statevector')
+        self.assertEqual(instructions[9].register, [1])
+        instructions[0].qubits.append(1)
+        self.assertEqual(instructions[1].qubits, [1])
+
     def test_assemble_unroll_parametervector(self):
         """Verfiy that assemble unrolls parametervectors ref #5467"""
         pv1 = ParameterVector('pv1', 3)
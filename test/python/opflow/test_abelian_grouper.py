@@ -16,9 +16,13 @@ import random
 import unittest
 from test.python.opflow import QiskitOpflowTestCase
 from itertools import combinations
+from unittest.mock import patch
 from ddt import ddt, data
+import numpy as np
 
-from qiskit.opflow import (X, Y, Z, I, Zero, Plus, AbelianGrouper, OpflowError)
+from qiskit.opflow import (X, Y, Z, I, Zero, Plus, AbelianGrouper, OpflowError, PauliSumOp)
+from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info.random import random_pauli_table
 
 
 @ddt
@@ -73,6 +77,21 @@ class TestAbelianGrouper(QiskitOpflowTestCase):
             self.assertListEqual([str(op[0].primitive) for op in grouped_sum], ['X', 'Y', 'Z'])
             self.assertListEqual([op[0].coeff for op in grouped_sum], [1, 2, 3])
 
+    def test_group_subops_pauli_sum_op(self):
+        """Test grouping a PauliSumOp without expanding it into PauliOps"""
+        table = random_pauli_table(6, 40, seed=5)
+        paulis = PauliSumOp(SparsePauliOp(table, np.linspace(1, 2, 40) * (1 + 1j)), coeff=0.5)
+        target = AbelianGrouper.group_subops(paulis.to_pauli_op())
+        with patch.object(PauliSumOp, 'to_pauli_op') as to_pauli_op:
+            grouped_sum = AbelianGrouper.group_subops(paulis)
+        to_pauli_op.assert_not_called()
+        self.assertEqual(grouped_sum.coeff, 0.5)
+        self.assertEqual(len(grouped_sum), len(target))
+        for group, target_group in zip(grouped_sum, target):
+            self.assertTrue(group.abelian)
+            self.assertListEqual([(op.primitive, op.coeff) for op in group],
+                                 [(op.primitive, op.coeff) for op in target_group])
+
     def test_abelian_grouper_random(self):
         """Abelian grouper test with random paulis"""
         random.seed(1234)
@@ -91,6 +110,66 @@ class TestAbelianGrouper(QiskitOpflowTestCase):
                 for op_1, op_2 in combinations(group, 2):
                     self.assertTrue(op_1.commutes(op_2))
 
+    @data(*AbelianGrouper.STRATEGIES)
+    def test_strategies(self, strategy):
+        """Abelian grouper test with each coloring strategy"""
+        table = random_pauli_table(8, 100, seed=4321)
+        paulis = PauliSumOp(SparsePauliOp(table, np.arange(1, 101)))
+        grouped_sum = AbelianGrouper(strategy=strategy).convert(paulis)
+        self.assertEqual(sum(len(group) for group in grouped_sum), 100)
+        for group in grouped_sum:
+            for op_1, op_2 in combinations(group, 2):
+                self.assertTrue(op_1.commutes(op_2))
+        np.testing.assert_allclose(grouped_sum.to_matrix(), paulis.to_matrix())
+
+    def test_invalid_strategy(self):
+        """Abelian grouper test with an invalid strategy"""
+        with self.assertRaises(OpflowError):
+            AbelianGrouper(strategy='random')
+
+    @data(True, False)
+    def test_group_indices(self, qubit_wise):
+        """Test group indices of a SparsePauliOp"""
+        op = SparsePauliOp(random_pauli_table(70, 50, seed=1234))
+        labels = op.table.to_labels()
+        for strategy in AbelianGrouper.STRATEGIES:
+            with self.subTest(strategy=strategy):
+                groups = AbelianGrouper.group_indices(op, qubit_wise=qubit_wise,
+                                                      strategy=strategy)
+                self.assertListEqual(sorted(np.concatenate(groups).tolist()), list(range(50)))
+                self.assertListEqual([group[0] for group in groups],
+                                     sorted(group[0] for group in groups))
+                for group in groups:
+                    for idx_1, idx_2 in combinations(group, 2):
+                        commutes = op.table[int(idx_1)].commutes(op.table[int(idx_2)])[0]
+                        if qubit_wise:
+                            commutes = all(
+                                'I' in (label_1, label_2) or label_1 == label_2
+                                for label_1, label_2 in zip(labels[idx_1], labels[idx_2]))
+                        self.assertTrue(commutes)
+
+    def test_group_indices_full_commutation(self):
+        """Test full commutation grouping of Paulis that do not commute qubit-wise"""
+        op = SparsePauliOp.from_list([('XX', 1), ('YY', 1), ('ZZ', 1), ('XI', 1)])
+        qubit_wise = AbelianGrouper.group_indices(op)
+        self.assertEqual(len(qubit_wise), 3)
+        groups = AbelianGrouper.group_indices(op, qubit_wise=False)
+        self.assertEqual(len(groups), 2)
+        for group in groups:
+            for idx_1, idx_2 in combinations(group, 2):
+                self.assertTrue(op.table[int(idx_1)].commutes(op.table[int(idx_2)])[0])
+
+    def test_group_indices_chunked(self):
+        """Test groups do not depend on the chunk size"""
+        op = SparsePauliOp(random_pauli_table(10, 200, seed=99))
+        for strategy in AbelianGrouper.STRATEGIES:
+            with self.subTest(strategy=strategy):
+                groups = AbelianGrouper.group_indices(op, strategy=strategy)
+                chunked = AbelianGrouper.group_indices(op, strategy=strategy,
+                                                       max_chunk_bytes=1)
+                self.assertEqual([group.tolist() for group in groups],
+                                 [group.tolist() for group in chunked])
+
 
 if __name__ == '__main__':
     unittest.main()
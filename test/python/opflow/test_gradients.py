@@ -869,6 +869,36 @@ class TestGradients(QiskitOpflowTestCase):
             result = prob_grad(value)
             np.testing.assert_array_almost_equal(result, correct_values[i], decimal=1)
 
+    @data('param_shift', 'fin_diff')
+    def test_gradient_wrapper_expectation(self, method):
+        """Test the batched gradient wrapper of an expectation value matches the gradient
+        operator for shared parameters and parameter expressions"""
+        a = Parameter('a')
+        b = Parameter('b')
+        c = Parameter('c')
+        params = [a, b, c]
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.rx(a + b, 0)
+        qc.ry(2 * a, 1)
+        qc.cx(0, 1)
+        qc.rz(a * b, 1)
+        qc.crx(c, 0, 1)
+        qc.rzz(b, 0, 1)
+        op = ~StateFn((X ^ Z) + 0.5 * (Y ^ Y) - 0.3 * (I ^ X)) @ StateFn(qc)
+
+        grad = Gradient(grad_method=method)
+        q_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        grad_fn = grad.gradient_wrapper(op, bind_params=params)
+        sampled_grad_fn = grad.gradient_wrapper(op, bind_params=params, backend=q_instance)
+        single_grad_fn = grad.gradient_wrapper(op, bind_params=params, grad_params=b)
+        for values in [[0.3, -0.7, 1.1], [np.pi / 4, np.pi / 2, 0]]:
+            value_dict = dict(zip(params, values))
+            correct = np.real(grad.convert(op, params).assign_parameters(value_dict).eval())
+            np.testing.assert_array_almost_equal(grad_fn(values), correct, decimal=5)
+            np.testing.assert_array_almost_equal(sampled_grad_fn(values), correct, decimal=5)
+            self.assertAlmostEqual(single_grad_fn(values), correct[1], places=5)
+
     @slow_test
     def test_vqe(self):
         """Test VQE with gradients"""
@@ -27,6 +27,7 @@ from qiskit.opflow import (
     OperatorStateFn,
     PauliSumOp,
     SummedOp,
+    VectorStateFn,
     X,
     Y,
     Z,
@@ -87,7 +88,7 @@ class TestPauliSumOp(QiskitOpflowTestCase):
     def test_adjoint(self):
         """ adjoint test """
         pauli_sum = PauliSumOp(SparsePauliOp(Pauli("XYZX"), coeffs=[2]), coeff=3)
-        expected = PauliSumOp(SparsePauliOp(Pauli("XYZX")), coeff=-6)
+        expected = PauliSumOp(SparsePauliOp(Pauli("XYZX")), coeff=6)
 
         self.assertEqual(pauli_sum.adjoint(), expected)
 
@@ -164,10 +165,21 @@ class TestPauliSumOp(QiskitOpflowTestCase):
         """ eval test """
         target0 = (2 * (X ^ Y ^ Z) + 3 * (X ^ X ^ Z)).eval("000")
         target1 = (2 * (X ^ Y ^ Z) + 3 * (X ^ X ^ Z)).eval(Zero ^ 3)
-        expected = DictStateFn({"011": (2 + 3j)})
+        expected = DictStateFn({"110": (3 + 2j)})
         self.assertEqual(target0, expected)
         self.assertEqual(target1, expected)
 
+    def test_eval_dict_and_vector(self):
+        """ eval test on DictStateFn and VectorStateFn with several basis states """
+        op = 2 * (X ^ Y ^ Z) + 3 * (X ^ X ^ Z) - (I ^ Z ^ Z)
+        front = DictStateFn({"000": 0.6, "011": 0.8j, "110": -0.2})
+        vector = front.to_matrix()
+        target = op.eval(front)
+        self.assertIsInstance(target, DictStateFn)
+        np.testing.assert_allclose(target.to_matrix(), op.to_matrix() @ vector)
+        target = op.eval(VectorStateFn(vector, coeff=2))
+        np.testing.assert_allclose(target.to_matrix(), 2 * op.to_matrix() @ vector)
+
     def test_exp_i(self):
         """ exp_i test """
         # TODO: add tests when special methods are added
@@ -16,10 +16,14 @@ import unittest
 from test.python.opflow import QiskitOpflowTestCase
 import numpy
 
+from qiskit import BasicAer
 from qiskit.circuit import QuantumCircuit, Parameter
+from qiskit.quantum_info import Statevector, SparsePauliOp
+from qiskit.quantum_info.random import random_pauli_table, random_statevector
 from qiskit.utils import QuantumInstance
 from qiskit.opflow import (
-    StateFn, Zero, One, H, X, I, Z, Plus, Minus, CircuitSampler, ListOp
+    StateFn, Zero, One, H, X, I, Z, Plus, Minus, CircuitSampler, ListOp, PauliSumOp,
+    DictStateFn
 )
 
 
@@ -124,6 +128,52 @@ class TestStateOpMeasEvals(QiskitOpflowTestCase):
 
         self.assertTrue(all(len(op.parameters) == 0 for op in sampled.oplist))
 
+    def test_template_parameter_binding(self):
+        """Test binding many parameterizations through the circuit templates."""
+        x, y = Parameter('x'), Parameter('y')
+        circuit1 = QuantumCircuit(2)
+        circuit1.h(0)
+        circuit1.rx(2 * x + y, 0)
+        circuit1.cx(0, 1)
+        circuit1.rz(x * y, 1)
+        circuit2 = QuantumCircuit(2)
+        circuit2.ry(y, 1)
+        circuit2.p(0.3, 0)
+        listop = ListOp([StateFn(circuit1), StateFn(circuit2)])
+
+        x_values, y_values = [0.1, -0.5, 1.2], [0.7, 0.0, -2.3]
+        q_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                                     basis_gates=['u3', 'cx'])
+        sampler = CircuitSampler(q_instance)
+        sampled = sampler.convert(listop, params={x: x_values, y: y_values})
+        self.assertEqual(len(sampled), 3)
+        for i, (x_value, y_value) in enumerate(zip(x_values, y_values)):
+            for circuit, state in zip([circuit1, circuit2], sampled[i]):
+                bound = circuit.assign_parameters(
+                    {param: {x: x_value, y: y_value}[param] for param in circuit.parameters})
+                numpy.testing.assert_allclose(state.primitive.data,
+                                              Statevector(bound).data, atol=1e-8)
+
+    def test_pauli_sum_expectation(self):
+        """Test vectorized expectation values of Pauli sums on dict and vector states."""
+        rng = numpy.random.default_rng(42)
+        coeffs = rng.normal(size=30)
+        op = PauliSumOp(SparsePauliOp(random_pauli_table(4, 30, seed=42), coeffs), coeff=0.5)
+        vector = random_statevector(16, seed=42).data
+        outcomes = rng.choice(16, size=6, replace=False)
+        sparse_vector = numpy.zeros(16, dtype=complex)
+        sparse_vector[outcomes] = vector[outcomes]
+        dict_state = DictStateFn({format(i, '04b'): vector[i] for i in outcomes}, coeff=2)
+        matrix = op.to_matrix()
+        for state, target_vector in [(dict_state, 2 * sparse_vector),
+                                     (StateFn(vector), vector)]:
+            target = numpy.vdot(target_vector, matrix @ target_vector)
+            for measurement in [op, op.to_pauli_op()]:
+                with self.subTest(state=state.primitive_strings(),
+                                  measurement=type(measurement).__name__):
+                    value = (~StateFn(measurement)).eval(state)
+                    self.assertAlmostEqual(value, target)
+
 
 if __name__ == '__main__':
     unittest.main()
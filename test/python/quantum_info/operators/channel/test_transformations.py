@@ -652,6 +652,82 @@ class TestTransformations(ChannelTestCase):
             chan2 = PTM(chan1)
             self.assertEqual(chan1, chan2)
 
+    def test_memoized_conversions(self):
+        """Test conversions are memoized until the channel data changes."""
+        chan = Kraus(self.depol_kraus(0.5))
+        sop = SuperOp(chan)
+        self.assertIn('SuperOp', chan._conversions)
+        self.assertIs(chan._convert('SuperOp'), chan._convert('SuperOp'))
+        self.assertIs(chan._convert('Choi'), chan._convert('Choi'))
+        self.assertEqual(sop, SuperOp(self.depol_sop(0.5)))
+        chan2 = 0.5 * chan
+        self.assertEqual(SuperOp(chan2), 0.5 * sop)
+        self.assertNotIn('SuperOp', chan2._conversions)
+
+    def test_memoized_conversions_not_shared(self):
+        """Test modifying a converted channel does not change later conversions."""
+        chan = Choi(self.depol_choi(0.5))
+        for rep in [SuperOp, PTM, Chi]:
+            with self.subTest(rep=rep.__name__):
+                target = rep(chan).data.copy()
+                rep(chan).data[0, 0] = 123
+                np.testing.assert_array_equal(rep(chan).data, target)
+        kraus = Kraus(chan)
+        target = [mat.copy() for mat in kraus.data]
+        kraus.data[0][0, 0] = 123
+        for mat, expected in zip(Kraus(chan).data, target):
+            np.testing.assert_array_equal(mat, expected)
+        unitary = SuperOp(Operator(self.UH))
+        unitary.to_operator().data[0, 0] = 123
+        self.assertEqual(unitary.to_operator(), Operator(self.UH))
+
+    def test_memoized_conversions_in_place(self):
+        """Test memoized conversions are discarded when the data is modified in place."""
+        chan = SuperOp(self.depol_sop(0.5))
+        self.assertEqual(Choi(chan), Choi(self.depol_choi(0.5)))
+        chan.data[:] = self.depol_sop(0.2)
+        self.assertEqual(Choi(chan), Choi(self.depol_choi(0.2)))
+        # A tensor product is no longer converted factor-wise after its data changed
+        prod = Choi(self.depol_choi(0.3)).tensor(Choi(chan))
+        prod.data[:] = np.kron(self.depol_choi(0.6), self.depol_choi(0.1))
+        target = Choi(np.kron(self.depol_choi(0.6), self.depol_choi(0.1)),
+                      prod.input_dims(), prod.output_dims())
+        self.assertEqual(SuperOp(prod), SuperOp(target))
+
+    def test_tensor_factors(self):
+        """Test tensor products are converted factor-wise."""
+        chan1 = Choi(self.depol_choi(0.3))
+        chan2 = SuperOp(Operator(self.UH))
+        chan = chan1.tensor(chan2)
+        kraus = Kraus(chan)
+        self.assertIn('Kraus', chan1._conversions)
+        self.assertEqual(len(kraus.data), 4)
+        self.assertEqual(SuperOp(kraus), SuperOp(chan))
+        self.assertEqual(Chi(chan), Chi(self.depol_chi(0.3)).tensor(Operator(self.UH)))
+        expand = chan2.expand(chan1)
+        self.assertEqual(Stinespring(expand), Stinespring(chan))
+        unitary = SuperOp(Operator(self.UX)).expand(Operator(self.UH))
+        self.assertTrue(unitary.to_operator().equiv(Operator(np.kron(self.UH, self.UX))))
+        # Factors of an N-qubit channel that are not N-qubit channels
+        chan = Choi(Kraus(self.rand_kraus(2, 4, 2))).tensor(Kraus(self.rand_kraus(4, 2, 2)))
+        target = Choi(chan.data, chan.input_dims(), chan.output_dims())
+        self.assertEqual(PTM(chan), PTM(target))
+
+    def test_from_channels(self):
+        """Test batch conversion of lists of channels."""
+        chans = [Kraus(self.depol_kraus(0.2)), Kraus(self.depol_kraus(0.7)),
+                 Kraus(self.rand_kraus(2, 2, 3)),
+                 Kraus((self.rand_kraus(2, 2, 2), self.rand_kraus(2, 2, 2))),
+                 Choi(self.depol_choi(0.4)), Chi(self.depol_chi(0.1)),
+                 PTM(self.depol_ptm(0.9)), Stinespring(self.depol_stine(0.5)),
+                 Operator(self.UH)]
+        for rep in [SuperOp, Choi, Chi, PTM, Kraus]:
+            with self.subTest(rep=rep.__name__):
+                values = rep.from_channels(chans)
+                for value, chan in zip(values, chans):
+                    self.assertIsInstance(value, rep)
+                    self.assertEqual(SuperOp(value), SuperOp(rep(chan)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -25,7 +25,7 @@ from qiskit.circuit import Gate, QuantumRegister, QuantumCircuit
 from qiskit.circuit.library import (IGate, XGate, YGate, ZGate, HGate,
                                     SGate, SdgGate, CXGate, CZGate,
                                     SwapGate)
-from qiskit.quantum_info.operators import Clifford, Operator
+from qiskit.quantum_info.operators import Clifford, Operator, StabilizerTable
 from qiskit.quantum_info.operators.symplectic.clifford_circuits import _append_circuit
 from qiskit.quantum_info.synthesis.clifford_decompose import (
     decompose_clifford_ag, decompose_clifford_bm)
@@ -103,6 +103,41 @@ def random_clifford_circuit(num_qubits, num_gates, gates='all', seed=None):
     return circ
 
 
+def compose_reference(first, second):
+    """Return first.compose(second) with the phases of the Pauli products computed qubit by
+    qubit, as by the original implementation of Clifford composition."""
+    table1 = second.table
+    table2 = first.table
+    num_qubits = first.num_qubits
+    array1 = table1.array.astype(int)
+    phase1 = table1.phase.astype(int)
+    array2 = table2.array.astype(int)
+    phase2 = table2.phase.astype(int)
+    pauli = StabilizerTable(array2.dot(array1) % 2)
+    phase = np.mod(array2.dot(phase1) + phase2, 2)
+    ifacts = np.zeros(2 * num_qubits, dtype=int)
+    for k in range(2 * num_qubits):
+        row2 = array2[k]
+        ifacts[k] += np.sum(table2.X[k] & table2.Z[k])
+        for j in range(num_qubits):
+            x = 0
+            z = 0
+            for i in range(2 * num_qubits):
+                if row2[i]:
+                    x1 = array1[i, j]
+                    z1 = array1[i, j + num_qubits]
+                    if (x | z) & (x1 | z1):
+                        val = np.mod(np.abs(3 * z1 - x1) - np.abs(3 * z - x) - 1, 3)
+                        if val == 0:
+                            ifacts[k] += 1
+                        elif val == 1:
+                            ifacts[k] -= 1
+                    x = np.mod(x + x1, 2)
+                    z = np.mod(z + z1, 2)
+    phase = np.mod(phase + np.mod(ifacts, 4) // 2, 2)
+    return Clifford(StabilizerTable(pauli, phase), validate=False)
+
+
 @ddt
 class TestCliffordGates(QiskitTestCase):
     """Tests for clifford append gate functions."""
@@ -351,6 +386,54 @@ class TestCliffordGates(QiskitTestCase):
             cliff = _append_circuit(cliff, 'sdg', [0])
             self.assertEqual(cliff, cliff1)
 
+    @combine(num_qubits=[1, 2, 3, 5, 20])
+    def test_from_circuit_gate_by_gate(self, num_qubits):
+        """Test Clifford from a {num_qubits}-qubit circuit matches appending gate by gate"""
+        rng = np.random.default_rng(1234)
+        for _ in range(10):
+            circ = random_clifford_circuit(num_qubits, 10 * num_qubits, seed=rng)
+            target = Clifford(np.eye(2 * num_qubits))
+            for instr, qargs, _ in circ.data:
+                if instr.name in ['v', 'w']:
+                    # Basis gate names are applied directly by the gate functions
+                    _append_circuit(target, instr.name, [circ.qubits.index(q) for q in qargs])
+                else:
+                    _append_circuit(target, instr, [circ.qubits.index(q) for q in qargs])
+            self.assertEqual(Clifford(circ), target)
+
+    def test_from_circuit_definitions(self):
+        """Test Clifford from a circuit of library gates and repeated custom gates"""
+        sub = QuantumCircuit(2, name='sub')
+        sub.h(0)
+        sub.cy(0, 1)
+        sub.sx(1)
+        gate = sub.to_gate()
+        qr1 = QuantumRegister(2, 'a')
+        qr2 = QuantumRegister(2, 'b')
+        circ = QuantumCircuit(qr1, qr2)
+        circ.append(gate, [qr2[1], qr1[0]])
+        circ.append(gate, [qr1[1], qr2[0]])
+        circ.append(CXGate(ctrl_state=0), [qr1[0], qr2[1]])
+        circ.cx(qr1[0], qr2[1])
+        circ.barrier()
+        circ.append(gate, [qr1[0], qr1[1]])
+        value = Clifford(circ)
+        self.assertEqual(value, Clifford(circ.decompose()))
+        self.assertTrue(Operator(value).equiv(Operator(circ)))
+
+    def test_from_circuit_non_clifford(self):
+        """Test Clifford from a circuit with non-Clifford gates raises"""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.t(1)
+        with self.assertRaises(QiskitError):
+            Clifford(circ)
+        circ = QuantumCircuit(2, 1)
+        circ.h(0)
+        circ.measure(0, 0)
+        with self.assertRaises(QiskitError):
+            Clifford(circ)
+
 
 @ddt
 class TestCliffordSynthesis(QiskitTestCase):
@@ -602,6 +685,17 @@ class TestCliffordOperators(QiskitTestCase):
             target = Clifford(circ1.extend(circ2))
             self.assertEqual(target, value)
 
+    @combine(num_qubits=[1, 2, 3, 5, 8, 20])
+    def test_compose_reference(self, num_qubits):
+        """Test compose method against the qubit-wise phase computation"""
+        samples = 10
+        rng = np.random.default_rng(1234 + num_qubits)
+        for _ in range(samples):
+            cliff1 = Clifford(random_clifford_circuit(num_qubits, 5 * num_qubits, seed=rng))
+            cliff2 = Clifford(random_clifford_circuit(num_qubits, 5 * num_qubits, seed=rng))
+            self.assertEqual(cliff1.compose(cliff2), compose_reference(cliff1, cliff2))
+            self.assertEqual(cliff1.dot(cliff2), compose_reference(cliff2, cliff1))
+
     @combine(num_qubits=[1, 2, 3])
     def test_dot_method(self, num_qubits):
         """Test dot method"""
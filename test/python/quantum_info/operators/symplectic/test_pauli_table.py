@@ -1229,5 +1229,113 @@ class TestPauliTableMethods(QiskitTestCase):
             self.assertEqual(value, target)
 
 
+@ddt
+class TestPauliTablePacked(QiskitTestCase):
+    """Tests for PauliTable packed storage"""
+
+    @staticmethod
+    def random_table(num_paulis, num_qubits, seed):
+        """Return a random PauliTable with repeated rows."""
+        rng = np.random.default_rng(seed)
+        array = rng.integers(2, size=(num_paulis, 2 * num_qubits)).astype(bool)
+        return PauliTable(np.vstack([array, array[::3]]))
+
+    @staticmethod
+    def argsort_reference(table, weight=False):
+        """Return the lexicographic order of the table by sorting one qubit at a time."""
+        order = 1 * (table.X & ~table.Z) + 2 * (table.X & table.Z) + 3 * (~table.X & table.Z)
+        indices = np.arange(table.size)
+        for i in range(table.num_qubits):
+            sort_inds = order[:, i].argsort(kind='stable')
+            order = order[sort_inds]
+            indices = indices[sort_inds]
+        if weight:
+            weights = np.sum(table.X | table.Z, axis=1)[indices]
+            indices = indices[weights.argsort(kind='stable')]
+        return indices
+
+    @combine(num_qubits=[1, 3, 64, 70, 130])
+    def test_packed_round_trip(self, num_qubits):
+        """Test from_packed and to_packed with {num_qubits} qubits."""
+        table = self.random_table(20, num_qubits, 1)
+        x, z = table.to_packed()
+        self.assertEqual(x.shape, (table.size, -(-num_qubits // 64)))
+        packed = PauliTable.from_packed(x, z, num_qubits)
+        self.assertEqual(packed, table)
+        self.assertEqual(packed.shape, table.shape)
+        self.assertEqual(packed.to_labels(), table.to_labels())
+        self.assertEqual(packed[3:7], table[3:7])
+        self.assertEqual(packed[5], table[5])
+        np.testing.assert_array_equal(packed.X, table.X)
+        # The boolean array is a view of the table after unpacking
+        packed.X[0] = ~packed.X[0]
+        self.assertNotEqual(packed, table)
+        np.testing.assert_array_equal(packed.to_packed()[0][1:], x[1:])
+
+    def test_from_packed_invalid(self):
+        """Test from_packed raises for invalid shapes."""
+        words = np.zeros((2, 1), dtype=np.uint64)
+        with self.assertRaises(QiskitError):
+            PauliTable.from_packed(words, words, 65)
+        with self.assertRaises(QiskitError):
+            PauliTable.from_packed(words, words[:1], 3)
+
+    @combine(num_qubits=[1, 3, 64, 70], packed=[True, False])
+    def test_argsort(self, num_qubits, packed):
+        """Test argsort of {num_qubits} qubits matches sorting qubit by qubit."""
+        table = self.random_table(100, num_qubits, 2)
+        target = PauliTable(table.array.copy())
+        if packed:
+            table = PauliTable.from_packed(*table.to_packed(), num_qubits)
+        for weight in [False, True]:
+            np.testing.assert_array_equal(table.argsort(weight=weight),
+                                          self.argsort_reference(target, weight=weight))
+        self.assertEqual(table.sort(), target[self.argsort_reference(target)])
+
+    @combine(num_qubits=[1, 3, 64, 70], packed=[True, False])
+    def test_unique_rows(self, num_qubits, packed):
+        """Test unique of {num_qubits} qubits matches np.unique."""
+        table = self.random_table(100, num_qubits, 3)
+        _, index, counts = np.unique(table.array, return_index=True, return_counts=True,
+                                     axis=0)
+        sort_inds = index.argsort()
+        if packed:
+            table = PauliTable.from_packed(*table.to_packed(), num_qubits)
+        unique, value_index, value_counts = table.unique(return_index=True,
+                                                         return_counts=True)
+        np.testing.assert_array_equal(value_index, index[sort_inds])
+        np.testing.assert_array_equal(value_counts, counts[sort_inds])
+        self.assertEqual(unique, table[index[sort_inds]])
+
+    @combine(num_qubits=[1, 3, 64, 70], packed=[True, False])
+    def test_commutes_with_all_packed(self, num_qubits, packed):
+        """Test commutation of {num_qubits} qubits matches the symplectic product."""
+        table = self.random_table(50, num_qubits, 4)
+        other = self.random_table(2, num_qubits, 5)[:2]
+        symp = (table.X.astype(int) @ other.Z.T.astype(int) +
+                table.Z.astype(int) @ other.X.T.astype(int)) % 2
+        if packed:
+            table = PauliTable.from_packed(*table.to_packed(), num_qubits)
+        np.testing.assert_array_equal(table.commutes(other[0]), symp[:, 0] == 0)
+        np.testing.assert_array_equal(table.commutes_with_all(other),
+                                      np.flatnonzero(np.all(symp == 0, axis=1)))
+        np.testing.assert_array_equal(table.anticommutes_with_all(other),
+                                      np.flatnonzero(np.all(symp == 1, axis=1)))
+
+    @combine(num_qubits=[1, 3, 70])
+    def test_compose_add_packed(self, num_qubits):
+        """Test compose and add of packed tables of {num_qubits} qubits."""
+        table1 = self.random_table(5, num_qubits, 6)
+        table2 = self.random_table(3, num_qubits, 7)
+        packed1 = PauliTable.from_packed(*table1.to_packed(), num_qubits)
+        target = PauliTable(np.hstack([
+            np.repeat(table1.X, table2.size, axis=0) ^ np.tile(table2.X, (table1.size, 1)),
+            np.repeat(table1.Z, table2.size, axis=0) ^ np.tile(table2.Z, (table1.size, 1))]))
+        self.assertEqual(table1.compose(table2), target)
+        self.assertEqual(packed1.compose(table2), target)
+        self.assertEqual(table2.dot(packed1), PauliTable(table2).dot(table1))
+        self.assertEqual(packed1 + table2, table1 + table2)
+
+
 if __name__ == '__main__':
     unittest.main()
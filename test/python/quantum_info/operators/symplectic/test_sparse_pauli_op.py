@@ -15,6 +15,7 @@
 
 import unittest
 import itertools as it
+from unittest.mock import patch
 from test import combine
 from ddt import ddt
 import numpy as np
@@ -23,6 +24,7 @@ from qiskit import QiskitError
 from qiskit.test import QiskitTestCase
 from qiskit.quantum_info.random import random_unitary
 from qiskit.quantum_info.operators import Operator, SparsePauliOp, PauliTable
+from qiskit.quantum_info.operators.symplectic import sparse_pauli_op
 
 
 def pauli_mat(label):
@@ -344,6 +346,33 @@ class TestSparsePauliOpMethods(QiskitTestCase):
         value = (spp_op / value).to_operator()
         self.assertEqual(value, target)
 
+    @combine(num_qubits=[1, 2, 3, 4], num_terms=[1, 3, 10])
+    def test_to_matrix_sparse(self, num_qubits, num_terms):
+        """Test sparse to_matrix method for {num_qubits} qubits and {num_terms} terms."""
+        spp_op = self.random_spp_op(num_qubits, num_terms)
+        target = sum(coeff * pauli_mat(label) for label, coeff in spp_op.to_list())
+        np.testing.assert_allclose(spp_op.to_matrix(sparse=True).toarray(), target)
+
+    @combine(num_qubits=[1, 2, 3, 4], num_terms=[1, 3, 10])
+    def test_to_linear_operator(self, num_qubits, num_terms):
+        """Test to_linear_operator method for {num_qubits} qubits and {num_terms} terms."""
+        spp_op = self.random_spp_op(num_qubits, num_terms)
+        target = spp_op.to_matrix()
+        linear_op = spp_op.to_linear_operator()
+        vectors = (self.RNG.normal(size=(2 ** num_qubits, 3))
+                   + 1j * self.RNG.normal(size=(2 ** num_qubits, 3)))
+        np.testing.assert_allclose(linear_op.matvec(vectors[:, 0]), target @ vectors[:, 0])
+        np.testing.assert_allclose(linear_op.matmat(vectors), target @ vectors)
+        np.testing.assert_allclose(linear_op.rmatvec(vectors[:, 0]),
+                                   target.conj().T @ vectors[:, 0])
+
+    def test_to_linear_operator_real(self):
+        """Test to_linear_operator method of an operator with a real matrix."""
+        spp_op = SparsePauliOp.from_list([('XX', 1), ('YY', 0.5), ('ZI', -2), ('IY', 1j)])
+        linear_op = spp_op.to_linear_operator()
+        self.assertEqual(linear_op.dtype, float)
+        np.testing.assert_allclose(linear_op.matmat(np.eye(4)), spp_op.to_matrix())
+
     def test_simplify(self):
         """Test simplify method"""
         coeffs = [3 + 1j, -3 - 1j, 0, 4, -5, 2.2, -1.1j]
@@ -356,6 +385,44 @@ class TestSparsePauliOpMethods(QiskitTestCase):
             PauliTable.from_labels(target_labels), target_coeffs)
         self.assertEqual(value, target)
 
+    def test_simplify_order(self):
+        """Test simplify sorts the unique Paulis of the boolean table"""
+        spp_op = self.random_spp_op(70, 50)
+        spp_op = spp_op + spp_op[::2]
+        value = spp_op.simplify()
+        target_table = np.unique(spp_op.table.array, axis=0)
+        np.testing.assert_array_equal(value.table.array, target_table)
+        coeffs = {label: 0 for label in spp_op.table.to_labels()}
+        for label, coeff in spp_op.label_iter():
+            coeffs[label] += coeff
+        for label, coeff in value.label_iter():
+            self.assertAlmostEqual(coeff, coeffs[label])
+
+    def test_simplify_zero(self):
+        """Test simplify of a SparsePauliOp with zero sum"""
+        value = SparsePauliOp.from_list([('XY', 1), ('XY', -1)]).simplify()
+        target = SparsePauliOp.from_list([('II', 0)])
+        self.assertEqual(value, target)
+
+    @combine(num_qubits=[1, 2, 3], front=[False, True])
+    def test_compose_simplify(self, num_qubits, front):
+        """Test {num_qubits}-qubit compose with simplify and front={front}."""
+        spp_op1 = self.random_spp_op(num_qubits, 2 ** (num_qubits + 1))
+        spp_op2 = self.random_spp_op(num_qubits, 2 ** (num_qubits + 1))
+        target = Operator(spp_op1).compose(Operator(spp_op2), front=front)
+        value = spp_op1.compose(spp_op2, front=front, simplify=True)
+        self.assertEqual(value.to_operator(), target)
+        self.assertEqual(value, spp_op1.compose(spp_op2, front=front).simplify())
+
+    def test_compose_simplify_chunks(self):
+        """Test compose with simplify merging several chunks of products"""
+        spp_op1 = self.random_spp_op(3, 40)
+        spp_op2 = self.random_spp_op(3, 7)
+        target = spp_op1.dot(spp_op2).simplify()
+        with patch.object(sparse_pauli_op, '_COMPOSE_CHUNK_SIZE', 5):
+            value = spp_op1.dot(spp_op2, simplify=True)
+        self.assertEqual(value, target)
+
 
 if __name__ == '__main__':
     unittest.main()
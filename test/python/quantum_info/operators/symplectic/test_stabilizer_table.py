@@ -15,6 +15,8 @@
 """Tests for StabilizerTable class."""
 
 import unittest
+from test import combine
+from ddt import ddt
 import numpy as np
 from scipy.sparse import csr_matrix
 
@@ -1075,5 +1077,51 @@ class TestStabilizerTableMethods(QiskitTestCase):
             self.assertEqual(value, target)
 
 
+@ddt
+class TestStabilizerTablePacked(QiskitTestCase):
+    """Tests for StabilizerTable packed storage"""
+
+    @staticmethod
+    def random_table(num_paulis, num_qubits, seed):
+        """Return a random StabilizerTable with repeated rows."""
+        rng = np.random.default_rng(seed)
+        array = rng.integers(2, size=(num_paulis, 2 * num_qubits)).astype(bool)
+        phase = rng.integers(2, size=num_paulis).astype(bool)
+        return StabilizerTable(np.vstack([array, array[::3]]),
+                               np.hstack([phase, ~phase[::3]]))
+
+    @combine(num_qubits=[1, 3, 70])
+    def test_packed_methods(self, num_qubits):
+        """Test methods of a packed StabilizerTable of {num_qubits} qubits."""
+        table = self.random_table(20, num_qubits, 1)
+        packed = StabilizerTable.from_packed(*table.to_packed(), num_qubits, table.phase)
+        self.assertEqual(packed, table)
+        self.assertEqual(packed.to_labels(), table.to_labels())
+        self.assertEqual(packed[2:5], table[2:5])
+        self.assertEqual(packed.copy(), table)
+        self.assertEqual(packed + table, table + table)
+        self.assertEqual(packed.unique(), table.unique())
+        self.assertEqual(len(packed.unique()), len(np.unique(
+            np.hstack([table.array, table.phase[:, None]]), axis=0)))
+
+    @combine(num_qubits=[1, 3, 70])
+    def test_packed_compose(self, num_qubits):
+        """Test compose and dot of packed tables of {num_qubits} qubits."""
+        table1 = self.random_table(6, num_qubits, 2)
+        table2 = self.random_table(4, num_qubits, 3)
+        packed1 = StabilizerTable.from_packed(*table1.to_packed(), num_qubits, table1.phase)
+        qargs = list(range(num_qubits))[::-1]
+        # Composition on reversed qargs of reversed tables is the composition on all qubits
+        reverse1 = StabilizerTable(np.hstack([table1.X[:, ::-1], table1.Z[:, ::-1]]),
+                                   table1.phase)
+        for front in [False, True]:
+            target = reverse1.compose(table2, qargs=qargs, front=front)
+            target = StabilizerTable(np.hstack([target.X[:, ::-1], target.Z[:, ::-1]]),
+                                     target.phase)
+            self.assertEqual(table1.compose(table2, front=front), target)
+            self.assertEqual(packed1.compose(table2, front=front), target)
+        self.assertEqual(packed1.dot(table2), table1.dot(table2))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for LazyOperator."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QuantumCircuit, QiskitError, transpile
+from qiskit.circuit.library import QFT
+from qiskit.test import QiskitTestCase
+from qiskit.quantum_info import Operator, LazyOperator, Statevector, DensityMatrix
+from qiskit.quantum_info.random import random_unitary, random_statevector
+from qiskit.quantum_info.random import random_density_matrix
+
+
+class TestLazyOperator(QiskitTestCase):
+    """Tests for LazyOperator."""
+
+    @staticmethod
+    def mixed_circuit():
+        """Return a 4-qubit circuit of 1, 2 and 3-qubit gates on 3 of its qubits."""
+        circ = QuantumCircuit(4, global_phase=0.3)
+        circ.h(0)
+        circ.rz(0.4, 1)
+        circ.cx(0, 3)
+        circ.ry(1.2, 3)
+        circ.crx(0.5, 3, 0)
+        circ.append(random_unitary(8, seed=4), [3, 0, 1])
+        circ.append(QFT(2), [3, 1])
+        return circ
+
+    def test_data(self):
+        """Test the contracted matrix of a circuit."""
+        circ = self.mixed_circuit()
+        lazy = Operator.from_circuit(circ, method='lazy')
+        self.assertIsInstance(lazy, LazyOperator)
+        self.assertIsNone(lazy._dense)
+        np.testing.assert_allclose(lazy.data, Operator(circ).data, atol=1e-12)
+        self.assertEqual(lazy.to_operator(), Operator(circ))
+
+    def test_compose(self):
+        """Test lazy composition on subsystems."""
+        circ = self.mixed_circuit()
+        unitary = random_unitary(4, seed=5)
+        lazy = LazyOperator(circ)
+        for front in [False, True]:
+            with self.subTest(front=front):
+                value = lazy.compose(unitary, qargs=[2, 0], front=front)
+                target = Operator(circ).compose(unitary, qargs=[2, 0], front=front)
+                self.assertIsInstance(value, LazyOperator)
+                np.testing.assert_allclose(value.data, target.data, atol=1e-12)
+        value = lazy.dot(LazyOperator(circ).adjoint())
+        np.testing.assert_allclose(value.data, np.eye(16), atol=1e-12)
+
+    def test_tensor_power(self):
+        """Test lazy tensor products, powers and scalar multiplication."""
+        circ = self.mixed_circuit()
+        lazy = LazyOperator(circ)
+        unitary = random_unitary(2, seed=6)
+        np.testing.assert_allclose(lazy.tensor(unitary).data,
+                                   Operator(circ).tensor(unitary).data, atol=1e-12)
+        np.testing.assert_allclose(lazy.expand(unitary).data,
+                                   Operator(circ).expand(unitary).data, atol=1e-12)
+        np.testing.assert_allclose(lazy.power(3).data,
+                                   Operator(circ).power(3).data, atol=1e-12)
+        np.testing.assert_allclose((2j * lazy).data, 2j * Operator(circ).data, atol=1e-12)
+        np.testing.assert_allclose((lazy + lazy).data, 2 * Operator(circ).data, atol=1e-12)
+
+    def test_trace(self):
+        """Test the trace of a network with an idle qubit."""
+        circ = self.mixed_circuit()
+        lazy = LazyOperator(circ)
+        self.assertAlmostEqual(lazy.trace(), np.trace(Operator(circ).data))
+        self.assertIsNone(lazy._dense)
+        self.assertAlmostEqual(LazyOperator(QuantumCircuit(3)).trace(), 8)
+
+    def test_evolve(self):
+        """Test evolving states by contracting the network."""
+        circ = self.mixed_circuit()
+        lazy = LazyOperator(circ)
+        oper = Operator(circ)
+        qargs = [5, 0, 3, 2]
+        psi = random_statevector(64, seed=7)
+        self.assertEqual(psi.evolve(lazy, qargs=qargs), psi.evolve(oper, qargs=qargs))
+        rho = random_density_matrix(64, seed=8)
+        self.assertEqual(rho.evolve(lazy, qargs=qargs), rho.evolve(oper, qargs=qargs))
+        self.assertEqual(Statevector.from_label('0000').evolve(lazy),
+                         Statevector.from_label('0000').evolve(oper))
+        self.assertEqual(DensityMatrix.from_label('0000').evolve(lazy),
+                         DensityMatrix.from_label('0000').evolve(oper))
+        self.assertIsNone(lazy._dense)
+        with self.assertRaises(QiskitError):
+            psi.evolve(lazy, qargs=[0, 1])
+
+    def test_equiv_transpiled(self):
+        """Test equivalence of a circuit and its transpiled circuit by their action on vectors."""
+        circ = QFT(12)
+        transpiled = transpile(circ, basis_gates=['u', 'cx'], optimization_level=1)
+        lazy = LazyOperator(circ)
+        self.assertTrue(lazy.equiv(transpiled))
+        transpiled.rz(1e-3, 5)
+        self.assertFalse(lazy.equiv(transpiled))
+        self.assertIsNone(lazy._dense)
+        self.assertFalse(lazy.equiv(QFT(11)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,7 @@ from qiskit.circuit.library import HGate, CHGate, CXGate
 from qiskit.test import QiskitTestCase
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.predicates import matrix_equal
+from qiskit.quantum_info.random import random_unitary
 
 logger = logging.getLogger(__name__)
 
@@ -195,6 +196,25 @@ class TestOperator(OperatorTestCase):
         circuit = self.simple_circuit_with_measure()
         self.assertRaises(QiskitError, Operator, circuit)
 
+    def test_from_circuit_sparse(self):
+        """Test from_circuit with the sparse accumulation method."""
+        circuit = QuantumCircuit(4, global_phase=0.3)
+        circuit.x(0)
+        circuit.ccx(0, 1, 3)
+        circuit.t(3)
+        circuit.swap(1, 2)
+        self.assertEqual(Operator.from_circuit(circuit, method='sparse'), Operator(circuit))
+        circuit.h(2)
+        circuit.ch(2, 0)
+        circuit.unitary(random_unitary(4, seed=11), [3, 1])
+        self.assertEqual(Operator.from_circuit(circuit, method='sparse'), Operator(circuit))
+
+    def test_from_circuit_sparse_except(self):
+        """Test from_circuit with the sparse method raises exceptions."""
+        circuit = self.simple_circuit_with_measure()
+        self.assertRaises(QiskitError, Operator.from_circuit, circuit, method='sparse')
+        self.assertRaises(QiskitError, Operator.from_circuit, QuantumCircuit(1), method='csr')
+
     def test_equal(self):
         """Test __eq__ method"""
         mat = self.rand_matrix(2, 2, real=True)
@@ -20,10 +20,10 @@ import numpy as np
 from qiskit.test import QiskitTestCase
 from qiskit.quantum_info import Operator, Stinespring, Choi
 from qiskit.quantum_info import Clifford, PauliTable, StabilizerTable
-from qiskit.quantum_info.random import random_unitary
+from qiskit.quantum_info.random import random_unitary, random_unitaries
 from qiskit.quantum_info.random import random_hermitian
 from qiskit.quantum_info.random import random_quantum_channel
-from qiskit.quantum_info.random import random_clifford
+from qiskit.quantum_info.random import random_clifford, random_cliffords
 from qiskit.quantum_info.random import random_pauli_table
 from qiskit.quantum_info.random import random_stabilizer_table
 from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
@@ -69,6 +69,55 @@ class TestRandomUnitary(QiskitTestCase):
         self.assertFalse(np.all(rng_before == rng_after))
 
 
+@ddt
+class TestRandomUnitaries(QiskitTestCase):
+    """Testing random_unitaries function."""
+
+    @combine(dims=[2, 5, (2, 3), (2, 2), (4, 4)])
+    def test_valid(self, dims):
+        """Test random unitaries are valid with dims {dims}."""
+        batch = random_unitaries(dims, 20, seed=12)
+        dim = np.product(dims)
+        self.assertEqual(len(batch), 20)
+        self.assertEqual(batch.data.shape, (20, dim, dim))
+        np.testing.assert_allclose(
+            np.matmul(batch.data, np.conj(np.swapaxes(batch.data, 1, 2))),
+            np.broadcast_to(np.eye(dim), (20, dim, dim)), atol=1e-10)
+        value = batch[-1]
+        self.assertIsInstance(value, Operator)
+        self.assertTrue(value.is_unitary())
+        self.assertEqual(np.product(value.input_dims()), dim)
+        np.testing.assert_array_equal(value.data, batch.data[19])
+
+    def test_haar_moments(self):
+        """Test the moments of the entries of random unitaries."""
+        batch = random_unitaries(4, 20000, seed=13)
+        values = np.abs(batch.data[:, 1, 2]) ** 2
+        self.assertAlmostEqual(np.mean(values), 1 / 4, delta=0.01)
+        self.assertAlmostEqual(np.mean(values ** 2), 1 / 10, delta=0.01)
+
+    def test_fixed_seed(self):
+        """Test fixing seed fixes output and the prefix of larger batches"""
+        value1 = random_unitaries(4, 10, seed=1532)
+        value2 = random_unitaries(4, 30, seed=1532)
+        np.testing.assert_array_equal(value1.data, value2.data[:10])
+        self.assertEqual(value1[3], value2[3])
+        np.testing.assert_array_equal(value2[10:].data, value2.data[10:])
+        value1 = random_unitaries(16, 3, seed=1532)
+        value2 = random_unitaries(16, 5, seed=1532)
+        np.testing.assert_array_equal(value1.data, value2.data[:3])
+
+    def test_not_global_seed(self):
+        """Test fixing random_unitaries seed is locally scoped."""
+        seed = 314159
+        test_cases = 100
+        random_unitaries(2, 5, seed=seed)
+        rng_before = np.random.randint(1000, size=test_cases)
+        random_unitaries(2, 5, seed=seed)
+        rng_after = np.random.randint(1000, size=test_cases)
+        self.assertFalse(np.all(rng_before == rng_after))
+
+
 @ddt
 class TestRandomHermitian(QiskitTestCase):
     """Testing random_hermitian function."""
@@ -190,6 +239,58 @@ class TestRandomClifford(QiskitTestCase):
         self.assertFalse(np.all(rng_before == rng_after))
 
 
+@ddt
+class TestRandomCliffords(QiskitTestCase):
+    """Testing random_cliffords function."""
+
+    @combine(num_qubits=[1, 2, 3, 5, 10, 70])
+    def test_valid(self, num_qubits):
+        """Test random_cliffords {num_qubits}-qubits."""
+        batch = random_cliffords(num_qubits, 8, seed=213)
+        self.assertEqual(len(batch), 8)
+        for value in batch:
+            self.assertIsInstance(value, Clifford)
+            self.assertEqual(value.num_qubits, num_qubits)
+            self.assertTrue(Clifford._is_symplectic(value.table.array))
+
+    def test_packed_data(self):
+        """Test the packed tables of random_cliffords."""
+        batch = random_cliffords(3, 5, seed=214)
+        x, z, phase = batch.data
+        self.assertEqual(x.shape, (5, 6, 1))
+        self.assertEqual(z.shape, (5, 6, 1))
+        self.assertEqual(phase.shape, (5, 6))
+        target = StabilizerTable.from_packed(x[2], z[2], 3, phase[2])
+        self.assertEqual(batch[2].table, target)
+
+    def test_uniform(self):
+        """Test random_cliffords samples all single-qubit Cliffords uniformly."""
+        batch = random_cliffords(1, 2400, seed=215)
+        x, z, phase = batch.data
+        keys = 4 * x[:, :, 0].astype(int) + 2 * z[:, :, 0].astype(int) + phase
+        _, counts = np.unique(keys[:, 0] * 8 + keys[:, 1], return_counts=True)
+        self.assertEqual(len(counts), 24)
+        self.assertGreater(counts.min(), 60)
+
+    def test_fixed_seed(self):
+        """Test fixing seed fixes output and the prefix of larger batches"""
+        value1 = random_cliffords(4, 10, seed=1532)
+        value2 = random_cliffords(4, 30, seed=1532)
+        for array1, array2 in zip(value1.data, value2.data):
+            np.testing.assert_array_equal(array1, array2[:10])
+        self.assertEqual(value1[7], value2[7])
+
+    def test_not_global_seed(self):
+        """Test fixing random_cliffords seed is locally scoped."""
+        seed = 314159
+        test_cases = 100
+        random_cliffords(2, 5, seed=seed)
+        rng_before = np.random.randint(1000, size=test_cases)
+        random_cliffords(2, 5, seed=seed)
+        rng_after = np.random.randint(1000, size=test_cases)
+        self.assertFalse(np.all(rng_before == rng_after))
+
+
 @ddt
 class TestRandomPauliTable(QiskitTestCase):
     """Testing random_pauli_table function."""
@@ -0,0 +1,81 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for UnitaryAccumulator."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QiskitError
+from qiskit.circuit.library import CCXGate, HGate, SwapGate, TGate
+from qiskit.test import QiskitTestCase
+from qiskit.quantum_info.operators import Operator
+from qiskit.quantum_info.operators.unitary_accumulator import UnitaryAccumulator
+from qiskit.quantum_info.random import random_unitary
+
+
+class TestUnitaryAccumulator(QiskitTestCase):
+    """Tests for UnitaryAccumulator."""
+
+    def assertAccumulated(self, accumulator, gates):
+        """Assert the accumulated unitary matches Operator composition."""
+        target = Operator(np.eye(2 ** accumulator.num_qubits))
+        for mat, qubits in gates:
+            target = target.compose(Operator(mat), qargs=qubits)
+        np.testing.assert_allclose(accumulator.to_matrix(), target.data, atol=1e-12)
+
+    def test_format_transitions(self):
+        """Test the permutation, sparse and dense formats."""
+        accumulator = UnitaryAccumulator(4, density_threshold=0.2)
+        gates = [(CCXGate().to_matrix(), [3, 0, 2]),
+                 (TGate().to_matrix(), [1]),
+                 (SwapGate().to_matrix(), [2, 1])]
+        for mat, qubits in gates:
+            accumulator.apply(mat, qubits)
+        self.assertEqual(accumulator.format, 'permutation')
+        self.assertAccumulated(accumulator, gates)
+
+        gates.append((HGate().to_matrix(), [2]))
+        accumulator.apply(*gates[-1])
+        self.assertEqual(accumulator.format, 'sparse')
+        self.assertAccumulated(accumulator, gates)
+
+        gates.append((HGate().to_matrix(), [2]))
+        accumulator.apply(*gates[-1])
+        self.assertEqual(accumulator.format, 'permutation')
+        self.assertAccumulated(accumulator, gates)
+
+        gates.append((random_unitary(4, seed=5).data, [0, 3]))
+        accumulator.apply(*gates[-1])
+        self.assertEqual(accumulator.format, 'dense')
+        gates.append((CCXGate().to_matrix(), [1, 2, 3]))
+        accumulator.apply(*gates[-1])
+        self.assertAccumulated(accumulator, gates)
+
+    def test_peak_memory(self):
+        """Test peak memory of a permutation circuit is linear in dimension."""
+        accumulator = UnitaryAccumulator(10)
+        for qubit in range(9):
+            accumulator.apply(SwapGate().to_matrix(), [qubit, qubit + 1])
+        self.assertEqual(accumulator.format, 'permutation')
+        self.assertLessEqual(accumulator.peak_memory, 3 * accumulator.nbytes)
+        self.assertLess(accumulator.peak_memory, 16 * 4 ** 10 / 100)
+
+    def test_invalid_shape(self):
+        """Test applying a matrix of the wrong shape raises."""
+        accumulator = UnitaryAccumulator(2)
+        self.assertRaises(QiskitError, accumulator.apply, np.eye(2), [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
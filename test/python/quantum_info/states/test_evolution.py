@@ -0,0 +1,172 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for in-place evolution of quantum states by compiled instructions."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QuantumCircuit, QiskitError
+from qiskit.circuit.library import CXGate, RZGate, QFT
+from qiskit.test import QiskitTestCase
+from qiskit.quantum_info import Operator, Statevector, DensityMatrix
+from qiskit.quantum_info.random import random_unitary, random_hermitian, random_statevector
+from qiskit.quantum_info.random import random_density_matrix
+from qiskit.quantum_info.states import EvolutionProgram
+from qiskit.quantum_info.states.evolution import gate_operation
+
+
+class TestEvolutionProgram(QiskitTestCase):
+    """Tests for EvolutionProgram."""
+
+    @staticmethod
+    def mixed_circuit():
+        """Return a 4-qubit circuit of diagonal, 1, 2 and 3-qubit gates."""
+        circ = QuantumCircuit(4, global_phase=0.3)
+        circ.h(0)
+        circ.rz(0.4, 1)
+        circ.cx(0, 2)
+        circ.cp(0.7, 3, 1)
+        circ.ry(1.2, 3)
+        circ.swap(1, 2)
+        circ.crx(0.5, 2, 0)
+        circ.ccx(0, 3, 1)
+        circ.append(random_unitary(8, seed=4), [2, 0, 3])
+        circ.barrier()
+        circ.append(QFT(2), [3, 1])
+        circ.t(2)
+        return circ
+
+    def test_statevector(self):
+        """Test evolving a Statevector by a program."""
+        circ = self.mixed_circuit()
+        state = random_statevector(16, seed=1)
+        target = Statevector(Operator(circ).data.dot(state.data))
+        value = state.evolve(EvolutionProgram(circ))
+        self.assertEqual(value, target)
+        self.assertEqual(state.evolve(circ), target)
+
+    def test_density_matrix(self):
+        """Test evolving a DensityMatrix by a program."""
+        circ = self.mixed_circuit()
+        state = random_density_matrix(16, seed=2)
+        mat = Operator(circ).data
+        target = DensityMatrix(mat.dot(state.data).dot(mat.T.conj()))
+        value = state.evolve(EvolutionProgram(circ))
+        self.assertEqual(value, target)
+        self.assertEqual(state.evolve(circ), target)
+
+    def test_qargs(self):
+        """Test evolving subsystems by a program."""
+        circ = self.mixed_circuit()
+        program = EvolutionProgram(circ)
+        qargs = [5, 0, 3, 2]
+        psi = random_statevector(64, seed=3)
+        rho = random_density_matrix(64, seed=3)
+        oper = Operator(circ)
+        self.assertEqual(psi.evolve(program, qargs=qargs), psi.evolve(oper, qargs=qargs))
+        self.assertEqual(rho.evolve(program, qargs=qargs), rho.evolve(oper, qargs=qargs))
+
+    def test_repeated_evolution(self):
+        """Test a program evolves many states and reuses its buffers."""
+        circ = self.mixed_circuit()
+        program = EvolutionProgram(circ)
+        oper = Operator(circ)
+        buffers = None
+        for seed in range(3):
+            state = random_statevector(16, seed=seed)
+            self.assertEqual(program.evolve(state), state.evolve(oper))
+            if buffers is None:
+                buffers = program._buffers[16]
+            self.assertIs(program._buffers[16], buffers)
+
+    def test_inplace(self):
+        """Test evolving a state in place."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cx(0, 1)
+        state = Statevector.from_label('00')
+        data = state.data
+        target = Statevector(np.array([1, 0, 0, 1]) / np.sqrt(2))
+        value = EvolutionProgram(circ).evolve(state, inplace=True)
+        self.assertIs(value, state)
+        self.assertIs(state.data, data)
+        self.assertEqual(state, target)
+
+        state = Statevector.from_label('00')
+        value = EvolutionProgram(circ).evolve(state)
+        self.assertEqual(state, Statevector.from_label('00'))
+        self.assertEqual(value, target)
+
+    def test_full_width_gates(self):
+        """Test gates acting on every qubit of the state."""
+        circ = QuantumCircuit(1)
+        circ.h(0)
+        circ.s(0)
+        self.assertEqual(Statevector.from_instruction(circ),
+                         Statevector(np.array([1, 1j]) / np.sqrt(2)))
+        circ = QuantumCircuit(2, global_phase=0.2)
+        circ.h(0)
+        circ.cx(0, 1)
+        circ.swap(0, 1)
+        circ.cz(1, 0)
+        target = Statevector.from_label('00').evolve(Operator(circ))
+        self.assertEqual(Statevector.from_instruction(circ), target)
+        self.assertEqual(EvolutionProgram(circ).evolve(Statevector.from_label('00')), target)
+        self.assertEqual(DensityMatrix.from_instruction(circ), DensityMatrix(target))
+
+    def test_reset(self):
+        """Test programs apply resets through the state."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.reset(0)
+        circ.x(1)
+        program = EvolutionProgram(circ)
+        psi = Statevector.from_label('00')
+        psi.seed(5)
+        self.assertEqual(psi.evolve(program), Statevector.from_label('10'))
+        rho = DensityMatrix.from_label('00')
+        self.assertEqual(rho.evolve(program), DensityMatrix.from_label('10'))
+
+    def test_num_qubits_mismatch(self):
+        """Test an error is raised for the wrong number of qubits."""
+        program = EvolutionProgram(QFT(2))
+        with self.assertRaises(QiskitError):
+            program.evolve(Statevector.from_label('000'))
+        with self.assertRaises(QiskitError):
+            program.evolve(Statevector.from_label('000'), qargs=[0])
+
+    def test_gate_cache(self):
+        """Test standard gate matrices are cached by gate and parameters."""
+        kind, diag = gate_operation(RZGate(0.5))
+        self.assertEqual(kind, 'diagonal')
+        self.assertIs(gate_operation(RZGate(0.5))[1], diag)
+        self.assertIsNot(gate_operation(RZGate(0.6))[1], diag)
+        self.assertFalse(diag.flags.writeable)
+        # Open and closed controls share names and parameters
+        np.testing.assert_array_equal(gate_operation(CXGate(ctrl_state=0))[1],
+                                      Operator(CXGate(ctrl_state=0)).data)
+        np.testing.assert_array_equal(gate_operation(CXGate())[1], Operator(CXGate()).data)
+
+    def test_expectation_value(self):
+        """Test expectation values on subsystems."""
+        oper = random_hermitian(4, seed=6)
+        psi = random_statevector(8, seed=7)
+        target = np.dot(psi.data.conj(), psi.evolve(oper, qargs=[2, 0]).data)
+        self.assertAlmostEqual(psi.expectation_value(oper, qargs=[2, 0]), target)
+        rho = DensityMatrix(psi)
+        self.assertAlmostEqual(rho.expectation_value(oper, qargs=[2, 0]), target)
+
+
+if __name__ == '__main__':
+    unittest.main()
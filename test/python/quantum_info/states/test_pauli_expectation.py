@@ -0,0 +1,108 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for expectation values of Paulis and sums of Paulis in quantum states."""
+
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from qiskit.test import QiskitTestCase
+from qiskit.quantum_info import Operator, Pauli, SparsePauliOp, PauliTable
+from qiskit.quantum_info import Statevector, DensityMatrix
+from qiskit.quantum_info.random import random_statevector, random_density_matrix
+
+
+def random_sparse_pauli_op(num_qubits, num_terms, seed):
+    """Return a SparsePauliOp with random Paulis and complex coefficients."""
+    rng = np.random.default_rng(seed)
+    table = PauliTable(rng.integers(2, size=(num_terms, 2 * num_qubits)).astype(bool))
+    coeffs = rng.normal(size=num_terms) + 1j * rng.normal(size=num_terms)
+    return SparsePauliOp(table, coeffs)
+
+
+@ddt
+class TestPauliExpectationValue(QiskitTestCase):
+    """Tests for Pauli expectation values of Statevector and DensityMatrix."""
+
+    @data('IXYZ', 'Y', '-iXY', 'ZIZY', 'iIIIIX')
+    def test_pauli(self, label):
+        """Test expectation value of Pauli {label}."""
+        pauli = Pauli(label)
+        num_qubits = pauli.num_qubits
+        psi = random_statevector(2 ** num_qubits, seed=1)
+        rho = random_density_matrix(2 ** num_qubits, seed=2)
+        mat = pauli.to_matrix()
+        self.assertAlmostEqual(psi.expectation_value(pauli),
+                               np.vdot(psi.data, mat.dot(psi.data)))
+        self.assertAlmostEqual(rho.expectation_value(pauli), np.trace(rho.data.dot(mat)))
+
+    @data(3, 10, 40)
+    def test_sparse_pauli_op(self, num_terms):
+        """Test expectation value of a SparsePauliOp with {num_terms} terms."""
+        oper = random_sparse_pauli_op(4, num_terms, seed=num_terms)
+        oper = oper + oper[:1].compose(SparsePauliOp.from_list([('YYYY', 1)]))
+        psi = random_statevector(16, seed=3)
+        rho = random_density_matrix(16, seed=4)
+        mat = oper.to_matrix()
+        self.assertAlmostEqual(psi.expectation_value(oper),
+                               np.vdot(psi.data, mat.dot(psi.data)))
+        self.assertAlmostEqual(rho.expectation_value(oper), np.trace(rho.data.dot(mat)))
+
+    def test_shared_x_terms(self):
+        """Test expectation value of more terms with the same X bits than qubits."""
+        oper = random_sparse_pauli_op(4, 30, seed=10)
+        array = oper.table.array.copy()
+        array[:, :4] = [True, False, True, False]
+        oper = SparsePauliOp(PauliTable(array), oper.coeffs)
+        psi = random_statevector(16, seed=11)
+        rho = random_density_matrix(16, seed=12)
+        mat = oper.to_matrix()
+        self.assertAlmostEqual(psi.expectation_value(oper),
+                               np.vdot(psi.data, mat.dot(psi.data)))
+        self.assertAlmostEqual(rho.expectation_value(oper), np.trace(rho.data.dot(mat)))
+
+    def test_qargs(self):
+        """Test expectation value of a SparsePauliOp on subsystems."""
+        oper = random_sparse_pauli_op(3, 12, seed=5)
+        qargs = [4, 0, 2]
+        psi = random_statevector(32, seed=6)
+        rho = random_density_matrix(32, seed=7)
+        target = psi.expectation_value(Operator(oper), qargs=qargs)
+        self.assertAlmostEqual(psi.expectation_value(oper, qargs=qargs), target)
+        target = rho.expectation_value(Operator(oper), qargs=qargs)
+        self.assertAlmostEqual(rho.expectation_value(oper, qargs=qargs), target)
+
+    def test_bell_state(self):
+        """Test expectation values of Paulis in a Bell state."""
+        psi = Statevector([1, 0, 0, 1]) / np.sqrt(2)
+        rho = DensityMatrix(psi)
+        for label, target in [
+                ('II', 1), ('XX', 1), ('YY', -1), ('ZZ', 1),
+                ('IX', 0), ('YZ', 0), ('ZX', 0), ('YI', 0), ('-XX', -1), ('iZZ', 1j)]:
+            with self.subTest(msg="<{}>".format(label)):
+                self.assertAlmostEqual(psi.expectation_value(Pauli(label)), target)
+                self.assertAlmostEqual(rho.expectation_value(Pauli(label)), target)
+
+    def test_density_matrix_non_hermitian(self):
+        """Test DensityMatrix expectation value of a non-Hermitian operator."""
+        oper = Operator(random_sparse_pauli_op(2, 4, seed=8))
+        psi = random_statevector(4, seed=9)
+        target = np.vdot(psi.data, oper.data.dot(psi.data))
+        self.assertAlmostEqual(DensityMatrix(psi).expectation_value(oper), target)
+        self.assertAlmostEqual(DensityMatrix(psi).expectation_value(oper, qargs=[1, 0]),
+                               psi.expectation_value(oper, qargs=[1, 0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,10 +17,11 @@ from test import combine
 from ddt import ddt
 import numpy as np
 
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 from qiskit.quantum_info import Statevector, DensityMatrix
-from qiskit.quantum_info.random import random_statevector
-from qiskit.quantum_info.random import random_density_matrix
+from qiskit.quantum_info.random import random_statevector, random_statevectors
+from qiskit.quantum_info.random import random_density_matrix, random_density_matrices
 
 
 @ddt
@@ -61,6 +62,72 @@ class TestRandomStatevector(QiskitTestCase):
         self.assertFalse(np.all(rng_before == rng_after))
 
 
+@ddt
+class TestRandomStatevectors(QiskitTestCase):
+    """Testing random_statevectors function."""
+
+    @combine(dims=[2, 5, (2, 3), (2, 2)])
+    def test_valid(self, dims):
+        """Test random statevectors are valid with dims {dims}."""
+        batch = random_statevectors(dims, 20, seed=12)
+        dim = np.product(dims)
+        self.assertEqual(len(batch), 20)
+        self.assertEqual(batch.data.shape, (20, dim))
+        np.testing.assert_allclose(np.linalg.norm(batch.data, axis=1), np.ones(20))
+        value = batch[4]
+        self.assertIsInstance(value, Statevector)
+        self.assertTrue(value.is_valid())
+        self.assertEqual(np.product(value.dims()), dim)
+
+    def test_fixed_seed(self):
+        """Test fixing seed fixes output and the prefix of larger batches"""
+        value1 = random_statevectors(4, 10, seed=1532)
+        value2 = random_statevectors(4, 30, seed=1532)
+        np.testing.assert_array_equal(value1.data, value2.data[:10])
+        self.assertEqual(value1[3], value2[3])
+
+    def test_not_global_seed(self):
+        """Test fixing random_statevectors seed is locally scoped."""
+        seed = 314159
+        test_cases = 100
+        random_statevectors(2, 5, seed=seed)
+        rng_before = np.random.randint(1000, size=test_cases)
+        random_statevectors(2, 5, seed=seed)
+        rng_after = np.random.randint(1000, size=test_cases)
+        self.assertFalse(np.all(rng_before == rng_after))
+
+
+@ddt
+class TestRandomDensityMatrices(QiskitTestCase):
+    """Testing random_density_matrices function."""
+
+    @combine(dims=[2, 5, (2, 3)],
+             rank=[None, 1, 2],
+             method=['Hilbert-Schmidt', 'Bures'])
+    def test_valid(self, dims, rank, method):
+        """Test random_density_matrices {method} method is valid with dims {dims}."""
+        batch = random_density_matrices(dims, 10, rank=rank, method=method, seed=12)
+        dim = np.product(dims)
+        self.assertEqual(batch.data.shape, (10, dim, dim))
+        for value in batch:
+            self.assertIsInstance(value, DensityMatrix)
+            self.assertTrue(value.is_valid())
+            self.assertEqual(np.linalg.matrix_rank(value.data, tol=1e-10), rank or dim)
+
+    @combine(method=['Hilbert-Schmidt', 'Bures'])
+    def test_fixed_seed(self, method):
+        """Test fixing seed fixes output and the prefix of larger batches ({method} method)"""
+        value1 = random_density_matrices(4, 10, method=method, seed=1532)
+        value2 = random_density_matrices(4, 30, method=method, seed=1532)
+        np.testing.assert_array_equal(value1.data, value2.data[:10])
+        self.assertEqual(value1[3], value2[3])
+
+    def test_invalid_method(self):
+        """Test random_density_matrices raises for an invalid method."""
+        with self.assertRaises(QiskitError):
+            random_density_matrices(4, 10, method='invalid')
+
+
 @ddt
 class TestRandomDensityMatrix(QiskitTestCase):
     """Testing random_density_matrix function."""
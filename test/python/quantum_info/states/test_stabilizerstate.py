@@ -0,0 +1,225 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for StabilizerState quantum state class."""
+
+import unittest
+import itertools
+
+import numpy as np
+from ddt import ddt
+
+from qiskit.test import QiskitTestCase
+from qiskit import QiskitError, QuantumCircuit
+from qiskit.quantum_info import Clifford, Pauli, StabilizerState, Statevector
+from qiskit.quantum_info.random import random_clifford
+from test import combine  # pylint: disable=wrong-import-order
+
+
+def random_clifford_circuit(num_qubits, num_gates, seed=None):
+    """Return a random circuit of Clifford gates, including gates unrolled by definition."""
+    rng = np.random.default_rng(seed)
+    gates_1q = ['h', 's', 'sdg', 'x', 'y', 'z', 'sx']
+    gates_2q = ['cx', 'cz', 'swap', 'cy']
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        if num_qubits == 1 or rng.integers(2):
+            getattr(circuit, rng.choice(gates_1q))(int(rng.integers(num_qubits)))
+        else:
+            qubits = rng.choice(num_qubits, 2, replace=False)
+            getattr(circuit, rng.choice(gates_2q))(int(qubits[0]), int(qubits[1]))
+    return circuit
+
+
+@ddt
+class TestStabilizerState(QiskitTestCase):
+    """Tests for StabilizerState class."""
+
+    samples = 10
+
+    @combine(num_qubits=[1, 2, 3, 5])
+    def test_init_circuit(self, num_qubits):
+        """Test initialization from a circuit matches the Clifford of the circuit"""
+        for seed in range(self.samples):
+            circuit = random_clifford_circuit(num_qubits, 10 * num_qubits, seed=seed)
+            state = StabilizerState(circuit)
+            self.assertEqual(state.clifford, Clifford(circuit))
+            self.assertEqual(state, StabilizerState(Clifford(circuit)))
+            self.assertTrue(state.is_valid())
+
+    @combine(num_qubits=[1, 2, 3, 4])
+    def test_probabilities(self, num_qubits):
+        """Test probabilities match the statevector"""
+        for seed in range(self.samples):
+            circuit = random_clifford_circuit(num_qubits, 10 * num_qubits, seed=seed)
+            state = StabilizerState(circuit)
+            target = Statevector.from_instruction(circuit)
+            for qargs in [None, [0], list(range(num_qubits))[::-1]]:
+                np.testing.assert_allclose(state.probabilities(qargs),
+                                           target.probabilities(qargs), atol=1e-12)
+            probs = state.probabilities_dict()
+            target_probs = target.probabilities_dict(decimals=12)
+            self.assertEqual(set(probs), {key for key, val in target_probs.items() if val})
+            for key, val in probs.items():
+                self.assertAlmostEqual(val, target_probs[key])
+
+    @combine(num_qubits=[1, 2, 3])
+    def test_expectation_value(self, num_qubits):
+        """Test expectation values of all Paulis match the statevector"""
+        for seed in range(self.samples):
+            circuit = random_clifford_circuit(num_qubits, 10 * num_qubits, seed=seed)
+            state = StabilizerState(circuit)
+            target = Statevector.from_instruction(circuit)
+            for label in itertools.product('IXYZ', repeat=num_qubits):
+                for phase in ['', '-i']:
+                    pauli = Pauli(phase + ''.join(label))
+                    self.assertAlmostEqual(state.expectation_value(pauli),
+                                           target.expectation_value(pauli))
+
+    def test_expectation_value_qargs(self):
+        """Test expectation values of Paulis on a subset of qubits"""
+        circuit = QuantumCircuit(3)
+        circuit.h(2)
+        circuit.cx(2, 0)
+        state = StabilizerState(circuit)
+        self.assertEqual(state.expectation_value(Pauli('XX'), [0, 2]), 1)
+        self.assertEqual(state.expectation_value('ZZ', [2, 0]), 1)
+        self.assertEqual(state.expectation_value(Pauli('Z'), [1]), 1)
+        self.assertEqual(state.expectation_value(Pauli('Z'), [0]), 0)
+        with self.assertRaises(QiskitError):
+            state.expectation_value(Pauli('ZZ'), [0])
+
+    @combine(num_qubits=[2, 3, 4])
+    def test_measure(self, num_qubits):
+        """Test the post-measurement state is the projected statevector"""
+        for seed in range(self.samples):
+            circuit = random_clifford_circuit(num_qubits, 10 * num_qubits, seed=seed)
+            state = StabilizerState(circuit)
+            state.seed(seed)
+            qargs = [num_qubits - 1, 0]
+            outcome, post = state.measure(qargs)
+            target = Statevector.from_instruction(circuit)
+            self.assertGreater(target.probabilities_dict(qargs).get(outcome, 0), 0)
+            # Project the statevector onto the outcome
+            indices = np.arange(2 ** num_qubits)
+            keep = np.ones(len(indices), dtype=bool)
+            for qubit, bit in zip(qargs, reversed(outcome)):
+                keep &= (indices >> qubit) & 1 == int(bit)
+            projected = np.where(keep, target.data, 0)
+            projected /= np.linalg.norm(projected)
+            post_vec = Statevector.from_instruction(post.clifford.to_circuit())
+            self.assertAlmostEqual(abs(np.vdot(projected, post_vec.data)), 1)
+            # The outcome of repeated measurements is deterministic
+            self.assertEqual(post.measure(qargs)[0], outcome)
+
+    def test_reset(self):
+        """Test reset of subsystems"""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.x(2)
+        state = StabilizerState(circuit)
+        state.seed(10)
+        reset = state.reset([0, 2])
+        self.assertEqual(reset.probabilities_dict([0, 2]), {'00': 1})
+        self.assertEqual(len(reset.probabilities_dict([1])), 1)
+        self.assertEqual(state.reset(), StabilizerState(3))
+
+    def test_sample_counts(self):
+        """Test sampled counts of a GHZ state and a product state"""
+        num_qubits = 200
+        circuit = QuantumCircuit(num_qubits)
+        circuit.h(0)
+        for qubit in range(1, num_qubits):
+            circuit.cx(0, qubit)
+        circuit.h(num_qubits - 1)
+        state = StabilizerState(circuit)
+        state.seed(20)
+        shots = 2000
+        counts = state.sample_counts(shots, qargs=[0, 1, num_qubits - 1])
+        self.assertEqual(set(counts), {'000', '011', '100', '111'})
+        for value in counts.values():
+            self.assertAlmostEqual(value / shots, 0.25, delta=0.05)
+        memory = state.sample_memory(10)
+        self.assertEqual(len(memory), 10)
+        for label in memory:
+            self.assertEqual(len(label), num_qubits)
+            self.assertEqual(set(label[1:]), {label[-1]})
+
+    def test_sample_memory_large(self):
+        """Test sampled outcomes of many qubits satisfy the stabilizer parities"""
+        num_qubits = 300
+        rng = np.random.default_rng(30)
+        circuit = QuantumCircuit(num_qubits)
+        for _ in range(4):
+            for qubit in range(num_qubits):
+                if rng.integers(2):
+                    circuit.h(qubit)
+                else:
+                    circuit.s(qubit)
+            pairs = rng.permutation(num_qubits)
+            for i in range(0, num_qubits - 1, 2):
+                circuit.cx(int(pairs[i]), int(pairs[i + 1]))
+        state = StabilizerState(circuit)
+        state.seed(30)
+        stabilizers = state.clifford.stabilizer
+        # Every product of Z stabilizers fixes the parity of the outcomes
+        z_only = ~np.any(stabilizers.X, axis=1)
+        for label in state.sample_memory(20):
+            bits = np.array([int(bit) for bit in reversed(label)], dtype=bool)
+            parities = np.sum(stabilizers.Z[z_only] & bits, axis=1) % 2
+            np.testing.assert_array_equal(parities, stabilizers.phase[z_only])
+
+    def test_evolve(self):
+        """Test evolution by Cliffords and circuits on subsystems"""
+        cliff = random_clifford(2, seed=40)
+        state = StabilizerState(QuantumCircuit(3)).evolve(cliff, qargs=[2, 0])
+        target = Statevector.from_label('000').evolve(cliff.to_operator(), qargs=[2, 0])
+        np.testing.assert_allclose(state.probabilities(), target.probabilities(), atol=1e-12)
+        with self.assertRaises(QiskitError):
+            circuit = QuantumCircuit(1)
+            circuit.t(0)
+            state.evolve(circuit, qargs=[1])
+
+    def test_equiv(self):
+        """Test equivalence of different generators of the same state"""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        state = StabilizerState(circuit)
+        circuit = QuantumCircuit(2)
+        circuit.h(1)
+        circuit.cx(1, 0)
+        other = StabilizerState(circuit)
+        self.assertNotEqual(state, other)
+        self.assertTrue(state.equiv(other))
+        self.assertTrue(state.equiv(other.evolve(Pauli('ZZ'))))
+        self.assertFalse(state.equiv(other.evolve(Pauli('ZI'))))
+
+    def test_conjugate_tensor(self):
+        """Test conjugate and tensor products"""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.s(0)
+        circuit.cx(0, 1)
+        state = StabilizerState(circuit)
+        target = Statevector.from_instruction(circuit)
+        self.assertAlmostEqual(state.conjugate().expectation_value('YX'),
+                               target.conjugate().expectation_value(Pauli('YX')))
+        tensor = state.tensor(StabilizerState(Clifford.from_label('X')))
+        self.assertEqual(tensor.expectation_value('IIZ'), -1)
+        self.assertEqual(tensor.expectation_value('XYI'), 1)
+        self.assertEqual(state.expand(StabilizerState(1)).num_qubits, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
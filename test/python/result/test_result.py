@@ -15,6 +15,7 @@
 import numpy as np
 
 from qiskit.result import models
+from qiskit.result import postprocess
 from qiskit.result import marginal_counts
 from qiskit.result import Result
 from qiskit.qobj import QobjExperimentHeader
@@ -265,6 +266,56 @@ class TestResultOperations(QiskitTestCase):
 
         self.assertEqual(result.get_memory(0), no_header_processed_memory)
 
+    def test_memory_as_array(self):
+        """Test level 2 memory is returned as a packed array."""
+        raw_memory = ['0x0', '0x0', '0x2', '0xa', '0x2']
+        data = models.ExperimentResultData(memory=raw_memory)
+        exp_result_header = QobjExperimentHeader(
+            creg_sizes=[['c0', 2], ['c0', 1], ['c1', 1]], memory_slots=4)
+        exp_result = models.ExperimentResult(shots=5, success=True, meas_level=2,
+                                             memory=True, data=data,
+                                             header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+        memory = result.get_memory(0, as_array=True)
+        self.assertEqual(memory.dtype, np.uint64)
+        np.testing.assert_array_equal(memory, [0, 0, 2, 10, 2])
+        self.assertEqual(postprocess.format_memory_array(memory, exp_result_header.to_dict()),
+                         ['0 0 00', '0 0 00', '0 0 10', '1 0 10', '0 0 10'])
+
+    def test_memory_as_array_wide(self):
+        """Test memory with more than 64 memory slots is packed as bytes."""
+        raw_memory = [hex(2 ** 69 + 5), '0x0', hex(2 ** 64)]
+        data = models.ExperimentResultData(memory=raw_memory)
+        exp_result_header = QobjExperimentHeader(
+            creg_sizes=[['c0', 60], ['c1', 10]], memory_slots=70)
+        exp_result = models.ExperimentResult(shots=3, success=True, meas_level=2,
+                                             memory=True, data=data,
+                                             header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+        memory = result.get_memory(0, as_array=True)
+        self.assertEqual(memory.dtype, np.uint8)
+        self.assertEqual(memory.shape, (3, 9))
+        expected = [postprocess.format_counts_memory(shot, exp_result_header.to_dict())
+                    for shot in raw_memory]
+        self.assertEqual(result.get_memory(0), expected)
+        self.assertEqual(postprocess.format_memory_array(memory, exp_result_header.to_dict()),
+                         expected)
+
+    def test_counts_from_memory_array(self):
+        """Test counts are computed from packed memory array data."""
+        memory = np.array([0, 2, 2, 10, 2], dtype=np.uint64)
+        data = models.ExperimentResultData(memory=memory)
+        exp_result_header = QobjExperimentHeader(
+            creg_sizes=[['c0', 2], ['c0', 1], ['c1', 1]], memory_slots=4)
+        exp_result = models.ExperimentResult(shots=5, success=True, meas_level=2,
+                                             memory=True, data=data,
+                                             header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+        self.assertEqual(result.get_counts(0), {'0 0 00': 1, '0 0 10': 3, '1 0 10': 1})
+        self.assertEqual(result.get_memory(0),
+                         ['0 0 00', '0 0 10', '0 0 10', '1 0 10', '0 0 10'])
+        self.assertIs(result.get_memory(0, as_array=True), memory)
+
     def test_meas_level_1_avg(self):
         """Test measurement level 1 average result."""
         # 3 qubits